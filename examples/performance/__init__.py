@@ -7,6 +7,11 @@ profile and associated implications:
 * individual inserts, with or without transactions
 * fetching large numbers of rows
 * running lots of short queries
+* compiling Core and ORM statements
+* flushing graphs of related objects with the unit of work
+* relationship eager loading strategies
+* connection pool checkouts, with and without thread contention
+* schema reflection
 
 All suites include a variety of use patterns illustrating both Core
 and ORM use, and are generally sorted in order of performance from worst
@@ -19,12 +24,16 @@ individual suites to be run::
     $ python -m examples.performance --help
     usage: python -m examples.performance [-h] [--test TEST] [--dburl DBURL]
                                           [--num NUM] [--profile] [--dump]
-                                          [--runsnake] [--echo]
+                                          [--callers] [--runsnake] [--echo]
+                                          [--warmup WARMUP] [--repeat REPEAT]
+                                          [--memory] [--seed SEED]
+                                          [--json FILE] [--baseline FILE]
+                                          [--threshold THRESHOLD]
 
-                                          {bulk_inserts,large_resultsets,single_inserts}
+                                          {bulk_inserts,bulk_updates,compile_statements,eager_loading,large_resultsets,orm_flush,pool_checkout,reflection,short_selects,single_inserts}
 
     positional arguments:
-      {bulk_inserts,large_resultsets,single_inserts}
+      {bulk_inserts,bulk_updates,compile_statements,eager_loading,large_resultsets,orm_flush,pool_checkout,reflection,short_selects,single_inserts}
                             suite to run
 
     optional arguments:
@@ -35,8 +44,24 @@ individual suites to be run::
                             default is module-specific
       --profile             run profiling and dump call counts
       --dump                dump full call profile (implies --profile)
+      --callers             print callers as well (implies --dump)
       --runsnake            invoke runsnakerun (implies --profile)
       --echo                Echo SQL output
+      --warmup WARMUP       Number of untimed runs of each test before
+                            timing; default 0
+      --repeat REPEAT       Number of timed runs of each test; default 1
+      --memory              measure peak memory of each test using
+                            tracemalloc, in an additional run
+      --seed SEED           seed the random module with this value before
+                            each run
+      --json FILE           write results to the given file as JSON
+      --baseline FILE       compare results to a JSON file written by
+                            --json; exits with status 1 if a regression is
+                            detected
+      --threshold THRESHOLD
+                            percentage by which a result may exceed the
+                            baseline before it's considered a regression;
+                            default 10
 
 An example run looks like::
 
@@ -85,6 +110,38 @@ This is the default form of run::
     test_dbapi_raw_w_pool : Individual INSERT/COMMIT pairs w/ DBAPI +
         connection pool (10000 iterations); total time 8.001813 sec
 
+Repeated Runs, JSON Output and Baselines
+----------------------------------------
+
+A single timed run is easily skewed by caches warming up and by other
+activity on the machine.  The ``--warmup`` option runs each test a number of
+times before timing it, and ``--repeat`` times it a number of times, reporting
+the median along with the spread of the individual runs.  ``--memory`` adds
+one more run under ``tracemalloc`` to report peak memory use, and ``--seed``
+seeds the ``random`` module before each run::
+
+    $ python -m examples.performance short_selects --test test_orm_query \
+        --warmup 1 --repeat 5 --memory
+    Tests to run: test_orm_query
+    test_orm_query : test a straight ORM query of the full entity.
+        (10000 iterations); median time 4.231590 sec (min 4.190137,
+        max 4.402712, stdev 0.087615, 5 runs); cpu time 4.224468 sec;
+        peak memory 322 KiB
+
+The results of a run, along with the Python version, platform, SQLAlchemy
+version and whether the C extensions are in use, can be written to a file
+using ``--json``.  A later run may then be compared against that file using
+``--baseline``; median wall time, median CPU time and peak memory that exceed
+the baseline by more than ``--threshold`` percent are reported as
+regressions, and the command exits with status 1, so that it may be used
+in a continuous integration job::
+
+    $ python -m examples.performance short_selects --repeat 5 \
+        --json baseline.json
+    # ... apply changes ...
+    $ python -m examples.performance short_selects --repeat 5 \
+        --baseline baseline.json --threshold 5
+
 Dumping Profiles for Individual Tests
 --------------------------------------
 
@@ -220,12 +277,27 @@ As well as see RunSnake output for an individual test::
 """  # noqa
 import argparse
 import cProfile
+import json
 import os
+import platform
 import pstats
+import random
 import re
 import sys
 import time
 
+import sqlalchemy
+from sqlalchemy.engine.url import make_url
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+_wall_clock = getattr(time, "perf_counter", time.time)
+_cpu_clock = getattr(time, "process_time", None) or time.clock
+
 
 class Profiler(object):
     tests = []
@@ -244,7 +316,15 @@ class Profiler(object):
         self.callers = options.callers
         self.num = options.num
         self.echo = options.echo
+        self.warmup = options.warmup
+        self.repeat = options.repeat
+        self.memory = options.memory
+        self.seed = options.seed
+        self.json = options.json
+        self.baseline = options.baseline
+        self.threshold = options.threshold
         self.stats = []
+        self.regressions = []
 
     @classmethod
     def init(cls, name, num):
@@ -292,11 +372,21 @@ class Profiler(object):
             self._run_test(test)
             self.stats[-1].report()
 
+        if self.json:
+            self._write_json(self.json)
+        if self.baseline:
+            self._compare_baseline(self.baseline)
+
+    def _call(self, fn):
+        if self.seed is not None:
+            random.seed(self.seed)
+        return fn(self.num)
+
     def _run_with_profile(self, fn):
         pr = cProfile.Profile()
         pr.enable()
         try:
-            result = fn(self.num)
+            result = self._call(fn)
         finally:
             pr.disable()
 
@@ -306,21 +396,110 @@ class Profiler(object):
         return result
 
     def _run_with_time(self, fn):
-        now = time.time()
-        try:
-            return fn(self.num)
-        finally:
-            total = time.time() - now
-            self.stats.append(TestResult(self, fn, total_time=total))
+        for i in range(self.warmup):
+            self._setup_test()
+            self._call(fn)
+
+        wall_times = []
+        cpu_times = []
+        for i in range(self.repeat):
+            self._setup_test()
+            wall, cpu = _wall_clock(), _cpu_clock()
+            self._call(fn)
+            wall_times.append(_wall_clock() - wall)
+            cpu_times.append(_cpu_clock() - cpu)
+
+        peak_memory = None
+        if self.memory:
+            # run separately, as tracing allocations slows down the test
+            # considerably
+            self._setup_test()
+            tracemalloc.start()
+            try:
+                self._call(fn)
+                peak_memory = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        self.stats.append(
+            TestResult(
+                self,
+                fn,
+                wall_times=wall_times,
+                cpu_times=cpu_times,
+                peak_memory=peak_memory,
+            )
+        )
 
-    def _run_test(self, fn):
+    def _setup_test(self):
         if self._setup:
             self._setup(self.dburl, self.echo, self.num)
+
+    def _run_test(self, fn):
         if self.profile or self.runsnake or self.dump:
+            self._setup_test()
             self._run_with_profile(fn)
         else:
             self._run_with_time(fn)
 
+    def _results(self):
+        return {
+            "suite": self.name,
+            "num": self.num,
+            "warmup": self.warmup,
+            "repeat": self.repeat,
+            "seed": self.seed,
+            "dburl": repr(make_url(self.dburl)),
+            "environment": {
+                "python": platform.python_version(),
+                "python_implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+                "sqlalchemy": sqlalchemy.__version__,
+                "cextensions": _has_cextensions(),
+            },
+            "tests": dict(
+                (result.test.__name__, result.as_dict())
+                for result in self.stats
+            ),
+        }
+
+    def _write_json(self, filename):
+        with open(filename, "w") as file_:
+            json.dump(self._results(), file_, indent=2, sort_keys=True)
+        print("Results written to %s" % filename)
+
+    def _compare_baseline(self, filename):
+        with open(filename) as file_:
+            baseline = json.load(file_)
+
+        if baseline.get("num") != self.num:
+            print(
+                "Warning: baseline %s was run with --num %s, "
+                "current run uses %s"
+                % (filename, baseline.get("num"), self.num)
+            )
+
+        print(
+            "Comparing against baseline %s, threshold %s%%"
+            % (filename, self.threshold)
+        )
+        for result in self.stats:
+            name = result.test.__name__
+            if name not in baseline["tests"]:
+                print("%s : not present in baseline" % name)
+                continue
+            for line, regression in result.compare(
+                baseline["tests"][name], self.threshold
+            ):
+                print("%s : %s" % (name, line))
+                if regression:
+                    self.regressions.append((name, line))
+
+        if self.regressions:
+            print("%d regression(s) detected" % len(self.regressions))
+        else:
+            print("No regressions detected")
+
     @classmethod
     def main(cls):
 
@@ -376,15 +555,70 @@ class Profiler(object):
         parser.add_argument(
             "--echo", action="store_true", help="Echo SQL output"
         )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=0,
+            help="Number of untimed runs of each test before timing; "
+            "default 0",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=1,
+            help="Number of timed runs of each test; default 1",
+        )
+        parser.add_argument(
+            "--memory",
+            action="store_true",
+            help="measure peak memory of each test using tracemalloc, "
+            "in an additional run",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=None,
+            help="seed the random module with this value before each run",
+        )
+        parser.add_argument(
+            "--json",
+            type=str,
+            metavar="FILE",
+            help="write results to the given file as JSON",
+        )
+        parser.add_argument(
+            "--baseline",
+            type=str,
+            metavar="FILE",
+            help="compare results to a JSON file written by --json; "
+            "exits with status 1 if a regression is detected",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=10.0,
+            help="percentage by which a result may exceed the baseline "
+            "before it's considered a regression; default 10",
+        )
         args = parser.parse_args()
 
         args.dump = args.dump or args.callers
         args.profile = args.profile or args.dump or args.runsnake
 
+        if args.repeat < 1:
+            parser.error("--repeat must be at least 1")
+        if args.memory and tracemalloc is None:
+            parser.error("--memory requires the tracemalloc module")
+        if args.profile and (args.json or args.baseline):
+            parser.error("--json and --baseline can't be used with profiling")
+
         if cls.name is None:
             __import__(__name__ + "." + args.name)
 
-        Profiler(args).run()
+        profiler = Profiler(args)
+        profiler.run()
+        if profiler.regressions:
+            sys.exit(1)
 
     @classmethod
     def _suite_names(cls):
@@ -396,12 +630,62 @@ class Profiler(object):
         return suites
 
 
+def _has_cextensions():
+    try:
+        from sqlalchemy import cprocessors  # noqa
+    except ImportError:
+        return False
+    else:
+        return True
+
+
+def _statistics(values):
+    values = sorted(values)
+    count = len(values)
+    mean = sum(values) / count
+    if count % 2:
+        median = values[count // 2]
+    else:
+        median = (values[count // 2 - 1] + values[count // 2]) / 2
+    if count > 1:
+        stdev = (
+            sum((value - mean) ** 2 for value in values) / (count - 1)
+        ) ** 0.5
+    else:
+        stdev = 0.0
+    return {
+        "min": values[0],
+        "max": values[-1],
+        "mean": mean,
+        "median": median,
+        "stdev": stdev,
+        "runs": count,
+    }
+
+
 class TestResult(object):
-    def __init__(self, profile, test, stats=None, total_time=None):
+    def __init__(
+        self,
+        profile,
+        test,
+        stats=None,
+        wall_times=None,
+        cpu_times=None,
+        peak_memory=None,
+    ):
         self.profile = profile
         self.test = test
         self.stats = stats
-        self.total_time = total_time
+        self.wall_times = wall_times
+        self.cpu_times = cpu_times
+        self.peak_memory = peak_memory
+
+    @property
+    def total_time(self):
+        if self.wall_times:
+            return _statistics(self.wall_times)["median"]
+        else:
+            return None
 
     def report(self):
         print(self._summary())
@@ -414,12 +698,86 @@ class TestResult(object):
             self.test.__doc__,
             self.profile.num,
         )
-        if self.total_time:
-            summary += "; total time %f sec" % self.total_time
+        if self.wall_times:
+            if len(self.wall_times) == 1:
+                summary += "; total time %f sec" % self.wall_times[0]
+            else:
+                wall = _statistics(self.wall_times)
+                summary += (
+                    "; median time %f sec (min %f, max %f, stdev %f, "
+                    "%d runs)"
+                    % (
+                        wall["median"],
+                        wall["min"],
+                        wall["max"],
+                        wall["stdev"],
+                        wall["runs"],
+                    )
+                )
+            summary += (
+                "; cpu time %f sec" % _statistics(self.cpu_times)["median"]
+            )
+        if self.peak_memory is not None:
+            summary += "; peak memory %d KiB" % (self.peak_memory // 1024)
         if self.stats:
             summary += "; total fn calls %d" % self.stats.total_calls
         return summary
 
+    def as_dict(self):
+        return {
+            "description": self.test.__doc__,
+            "wall_time": _statistics(self.wall_times),
+            "cpu_time": _statistics(self.cpu_times),
+            "peak_memory": self.peak_memory,
+        }
+
+    def compare(self, baseline, threshold):
+        """Compare to a baseline result as produced by as_dict().
+
+        Yields (message, is_regression) tuples for the median wall time,
+        the median cpu time and, if measured in both runs, the peak
+        memory.
+
+        """
+        current = self.as_dict()
+        for key, label in (
+            ("wall_time", "wall time"),
+            ("cpu_time", "cpu time"),
+        ):
+            yield self._compare_value(
+                label,
+                current[key]["median"],
+                baseline[key]["median"],
+                threshold,
+                "%f sec",
+            )
+        if (
+            current["peak_memory"] is not None
+            and baseline.get("peak_memory") is not None
+        ):
+            yield self._compare_value(
+                "peak memory",
+                current["peak_memory"],
+                baseline["peak_memory"],
+                threshold,
+                "%d bytes",
+            )
+
+    def _compare_value(self, label, value, baseline_value, threshold, fmt):
+        if baseline_value:
+            change = (value - baseline_value) * 100.0 / baseline_value
+        else:
+            change = 0.0
+        regression = change > threshold
+        message = ("%s " + fmt + " vs. baseline " + fmt + " (%+.1f%%)%s") % (
+            label,
+            value,
+            baseline_value,
+            change,
+            " REGRESSION" if regression else "",
+        )
+        return message, regression
+
     def report_stats(self):
         if self.profile.runsnake:
             self._runsnake()
@@ -0,0 +1,154 @@
+"""This series of tests illustrates the time spent compiling Core and ORM
+statements into SQL strings, independently of executing them.
+
+"""
+from sqlalchemy import and_
+from sqlalchemy import bindparam
+from sqlalchemy import Column
+from sqlalchemy import create_engine
+from sqlalchemy import ForeignKey
+from sqlalchemy import func
+from sqlalchemy import Integer
+from sqlalchemy import or_
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session
+from . import Profiler
+
+
+Base = declarative_base()
+dialect = None
+
+
+class Customer(Base):
+    __tablename__ = "customer"
+    id = Column(Integer, primary_key=True)
+    name = Column(String(255))
+    description = Column(String(255))
+    orders = relationship("Order", back_populates="customer")
+
+
+class Order(Base):
+    __tablename__ = "order"
+    id = Column(Integer, primary_key=True)
+    customer_id = Column(ForeignKey("customer.id"))
+    amount = Column(Integer)
+    status = Column(String(20))
+    customer = relationship("Customer", back_populates="orders")
+    items = relationship("Item")
+
+
+class Item(Base):
+    __tablename__ = "item"
+    id = Column(Integer, primary_key=True)
+    order_id = Column(ForeignKey("order.id"))
+    name = Column(String(255))
+    price = Column(Integer)
+
+
+customer = Customer.__table__
+order = Order.__table__
+item = Item.__table__
+
+
+Profiler.init("compile_statements", num=5000)
+
+
+@Profiler.setup_once
+def setup_once(dburl, echo, num):
+    global dialect
+    dialect = create_engine(dburl, echo=echo).dialect
+
+
+@Profiler.profile
+def test_core_insert(n):
+    """Compile a Core INSERT statement"""
+    stmt = customer.insert()
+    for i in range(n):
+        stmt.compile(dialect=dialect)
+
+
+@Profiler.profile
+def test_core_update(n):
+    """Compile a Core UPDATE statement with WHERE criteria"""
+    stmt = (
+        customer.update()
+        .where(customer.c.id == bindparam("cid"))
+        .values(name=bindparam("cname"))
+    )
+    for i in range(n):
+        stmt.compile(dialect=dialect)
+
+
+@Profiler.profile
+def test_core_select_simple(n):
+    """Compile a Core SELECT of a single table by primary key"""
+    stmt = select([customer]).where(customer.c.id == bindparam("id"))
+    for i in range(n):
+        stmt.compile(dialect=dialect)
+
+
+@Profiler.profile
+def test_core_select_complex(n):
+    """Compile a Core SELECT with joins, a subquery, GROUP BY and ORDER BY"""
+    totals = (
+        select([order.c.customer_id, func.sum(item.c.price).label("total")])
+        .select_from(order.join(item))
+        .group_by(order.c.customer_id)
+        .alias("totals")
+    )
+    stmt = (
+        select([customer.c.id, customer.c.name, totals.c.total])
+        .select_from(customer.join(totals))
+        .where(
+            and_(
+                customer.c.name.like(bindparam("name")),
+                or_(totals.c.total > 100, customer.c.description.is_(None)),
+            )
+        )
+        .order_by(totals.c.total.desc(), customer.c.name)
+        .limit(10)
+    )
+    for i in range(n):
+        stmt.compile(dialect=dialect)
+
+
+@Profiler.profile
+def test_orm_query(n):
+    """Compile an ORM Query with filter criteria"""
+    session = Session()
+    for i in range(n):
+        session.query(Customer).filter(
+            Customer.name == "c%d" % i
+        ).statement.compile(dialect=dialect)
+
+
+@Profiler.profile
+def test_orm_query_joinedload(n):
+    """Compile an ORM Query with nested joined eager loading"""
+    session = Session()
+    for i in range(n):
+        session.query(Customer).options(
+            joinedload(Customer.orders).joinedload(Order.items)
+        ).filter(Customer.id == i).statement.compile(dialect=dialect)
+
+
+@Profiler.profile
+def test_orm_query_aliased_join(n):
+    """Compile an ORM Query joining to an aliased entity"""
+    session = Session()
+    order_alias = aliased(Order)
+    for i in range(n):
+        session.query(Customer, order_alias.amount).join(
+            order_alias, Customer.orders
+        ).filter(order_alias.status == "shipped").statement.compile(
+            dialect=dialect
+        )
+
+
+if __name__ == "__main__":
+    Profiler.main()
@@ -0,0 +1,136 @@
+"""This series of tests illustrates the different relationship loading
+strategies when loading a set of parent objects along with two levels of
+related collections.
+
+"""
+from sqlalchemy import Column
+from sqlalchemy import create_engine
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import batchload
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import lazyload
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import subqueryload
+from . import Profiler
+
+
+Base = declarative_base()
+engine = None
+session = None
+
+
+class Parent(Base):
+    __tablename__ = "parent"
+    id = Column(Integer, primary_key=True)
+    data = Column(String(255))
+    children = relationship("Child")
+
+
+class Child(Base):
+    __tablename__ = "child"
+    id = Column(Integer, primary_key=True)
+    parent_id = Column(ForeignKey("parent.id"))
+    data = Column(String(255))
+    grandchildren = relationship("GrandChild")
+
+
+class GrandChild(Base):
+    __tablename__ = "grandchild"
+    id = Column(Integer, primary_key=True)
+    child_id = Column(ForeignKey("child.id"))
+    data = Column(String(255))
+
+
+Profiler.init("eager_loading", num=500)
+
+
+@Profiler.setup_once
+def setup_once(dburl, echo, num):
+    global engine
+    engine = create_engine(dburl, echo=echo)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    sess = Session(engine)
+    sess.add_all(
+        [
+            Parent(
+                data="parent %d" % i,
+                children=[
+                    Child(
+                        data="child %d" % j,
+                        grandchildren=[
+                            GrandChild(data="grandchild %d" % k)
+                            for k in range(3)
+                        ],
+                    )
+                    for j in range(10)
+                ],
+            )
+            for i in range(num)
+        ]
+    )
+    sess.commit()
+
+
+@Profiler.setup
+def setup(dburl, echo, num):
+    global session
+    session = Session(engine)
+    # pre-connect so this part isn't profiled
+    session.connection()
+
+
+def _load(option):
+    for parent in session.query(Parent).options(option):
+        for child in parent.children:
+            child.grandchildren
+
+
+@Profiler.profile
+def test_lazyload(n):
+    """Load all parents, children and grandchildren with lazy loading"""
+    _load(lazyload(Parent.children).lazyload(Child.grandchildren))
+
+
+@Profiler.profile
+def test_joinedload(n):
+    """Load all parents, children and grandchildren with joined
+    eager loading"""
+    _load(joinedload(Parent.children).joinedload(Child.grandchildren))
+
+
+@Profiler.profile
+def test_subqueryload(n):
+    """Load all parents, children and grandchildren with subquery
+    eager loading"""
+    _load(subqueryload(Parent.children).subqueryload(Child.grandchildren))
+
+
+@Profiler.profile
+def test_selectinload(n):
+    """Load all parents, children and grandchildren with select IN
+    eager loading"""
+    _load(selectinload(Parent.children).selectinload(Child.grandchildren))
+
+
+@Profiler.profile
+def test_batchload(n):
+    """Load all parents, children and grandchildren with batched
+    lazy loading"""
+    _load(batchload(Parent.children).batchload(Child.grandchildren))
+
+
+@Profiler.profile
+def test_joinedload_selectinload(n):
+    """Load all parents with joined eager loading of children and
+    select IN eager loading of grandchildren"""
+    _load(joinedload(Parent.children).selectinload(Child.grandchildren))
+
+
+if __name__ == "__main__":
+    Profiler.main()
@@ -0,0 +1,185 @@
+"""This series of tests illustrates the unit of work flushing graphs of
+related objects, covering inserts, updates and deletes across one-to-many,
+self-referential and many-to-many relationships.
+
+"""
+from sqlalchemy import Column
+from sqlalchemy import create_engine
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session
+from . import Profiler
+
+
+Base = declarative_base()
+engine = None
+
+
+class Parent(Base):
+    __tablename__ = "parent"
+    id = Column(Integer, primary_key=True)
+    data = Column(String(255))
+    children = relationship("Child", cascade="all, delete-orphan")
+
+
+class Child(Base):
+    __tablename__ = "child"
+    id = Column(Integer, primary_key=True)
+    parent_id = Column(ForeignKey("parent.id"))
+    data = Column(String(255))
+    grandchildren = relationship("GrandChild", cascade="all, delete-orphan")
+
+
+class GrandChild(Base):
+    __tablename__ = "grandchild"
+    id = Column(Integer, primary_key=True)
+    child_id = Column(ForeignKey("child.id"))
+    data = Column(String(255))
+
+
+class Node(Base):
+    __tablename__ = "node"
+    id = Column(Integer, primary_key=True)
+    parent_id = Column(ForeignKey("node.id"))
+    data = Column(String(255))
+    children = relationship("Node")
+
+
+keyword_association = Table(
+    "keyword_association",
+    Base.metadata,
+    Column("item_id", ForeignKey("item.id"), primary_key=True),
+    Column("keyword_id", ForeignKey("keyword.id"), primary_key=True),
+)
+
+
+class Item(Base):
+    __tablename__ = "item"
+    id = Column(Integer, primary_key=True)
+    data = Column(String(255))
+    keywords = relationship("Keyword", secondary=keyword_association)
+
+
+class Keyword(Base):
+    __tablename__ = "keyword"
+    id = Column(Integer, primary_key=True)
+    name = Column(String(255))
+
+
+Profiler.init("orm_flush", num=1000)
+
+
+@Profiler.setup
+def setup_database(dburl, echo, num):
+    global engine
+    engine = create_engine(dburl, echo=echo)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+
+def _parents(n):
+    return [
+        Parent(
+            data="parent %d" % i,
+            children=[
+                Child(
+                    data="child %d" % j,
+                    grandchildren=[
+                        GrandChild(data="grandchild %d" % k) for k in range(2)
+                    ],
+                )
+                for j in range(5)
+            ],
+        )
+        for i in range(n)
+    ]
+
+
+@Profiler.profile
+def test_flush_insert_graph(n):
+    """Flush a three level one-to-many graph of new objects at once"""
+    session = Session(engine)
+    session.add_all(_parents(n))
+    session.commit()
+
+
+@Profiler.profile
+def test_flush_insert_graph_batches(n):
+    """Flush a three level one-to-many graph of new objects in batches
+    of 10 parents"""
+    session = Session(engine)
+    for chunk in range(0, n, 10):
+        session.add_all(_parents(min(10, n - chunk)))
+        session.flush()
+    session.commit()
+
+
+@Profiler.profile
+def test_flush_self_referential(n):
+    """Flush a self-referential tree of new objects"""
+    session = Session(engine)
+    for i in range(n // 10):
+        root = Node(data="root %d" % i)
+        root.children = [
+            Node(
+                data="node %d" % j,
+                children=[Node(data="leaf %d" % k) for k in range(3)],
+            )
+            for j in range(3)
+        ]
+        session.add(root)
+    session.commit()
+
+
+@Profiler.profile
+def test_flush_many_to_many(n):
+    """Flush new objects associated with a shared set of objects through
+    a many-to-many relationship"""
+    session = Session(engine)
+    keywords = [Keyword(name="keyword %d" % i) for i in range(20)]
+    session.add_all(
+        [
+            Item(
+                data="item %d" % i,
+                keywords=[keywords[(i + j) % 20] for j in range(5)],
+            )
+            for i in range(n)
+        ]
+    )
+    session.commit()
+
+
+@Profiler.profile
+def test_flush_update_graph(n):
+    """Load a three level graph, modify every object and flush"""
+    session = Session(engine)
+    session.add_all(_parents(n))
+    session.commit()
+
+    for parent in session.query(Parent):
+        parent.data += " updated"
+        for child in parent.children:
+            child.data += " updated"
+            for grandchild in child.grandchildren:
+                grandchild.data += " updated"
+    session.commit()
+
+
+@Profiler.profile
+def test_flush_delete_graph(n):
+    """Load a three level graph and delete it with cascades"""
+    session = Session(engine)
+    session.add_all(_parents(n))
+    session.commit()
+
+    for parent in session.query(Parent):
+        session.delete(parent)
+    session.commit()
+
+
+if __name__ == "__main__":
+    Profiler.main()
@@ -0,0 +1,125 @@
+"""This series of tests illustrates the overhead of checking connections
+out of and back into the connection pool, both from a single thread and
+from many threads contending for a limited number of connections.
+
+"""
+import threading
+
+from sqlalchemy import create_engine
+from sqlalchemy import pool
+from sqlalchemy.engine.url import make_url
+from . import Profiler
+
+
+Profiler.init("pool_checkout", num=10000)
+
+dburl = None
+echo = False
+threads = 10
+
+
+@Profiler.setup
+def setup_database(url, echo_, num):
+    global dburl, echo
+    dburl = url
+    echo = echo_
+
+
+def _engine(poolclass, **kw):
+    connect_args = {}
+    if make_url(dburl).get_backend_name() == "sqlite":
+        # connections are shared among threads by the pool
+        connect_args["check_same_thread"] = False
+    return create_engine(
+        dburl,
+        echo=echo,
+        poolclass=poolclass,
+        connect_args=connect_args,
+        **kw
+    )
+
+
+def _run_threads(n, fn):
+    per_thread = n // threads
+    workers = [
+        threading.Thread(target=fn, args=(per_thread,))
+        for i in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+def _checkout(engine):
+    def go(n):
+        for i in range(n):
+            conn = engine.raw_connection()
+            conn.close()
+
+    return go
+
+
+@Profiler.profile
+def test_queuepool_single_thread(n):
+    """Individual raw connection checkouts from QueuePool,
+    single thread"""
+    engine = _engine(pool.QueuePool)
+    _checkout(engine)(n)
+    engine.dispose()
+
+
+@Profiler.profile
+def test_queuepool_threads(n):
+    """Raw connection checkouts from QueuePool, 10 threads contending
+    for 5 connections"""
+    engine = _engine(pool.QueuePool, pool_size=5, max_overflow=0)
+    _run_threads(n, _checkout(engine))
+    engine.dispose()
+
+
+@Profiler.profile
+def test_queuepool_threads_overflow(n):
+    """Raw connection checkouts from QueuePool, 10 threads using
+    overflow connections"""
+    engine = _engine(pool.QueuePool, pool_size=2, max_overflow=threads)
+    _run_threads(n, _checkout(engine))
+    engine.dispose()
+
+
+@Profiler.profile
+def test_queuepool_threads_pre_ping(n):
+    """Raw connection checkouts from QueuePool with pre ping, 10 threads
+    contending for 5 connections"""
+    engine = _engine(
+        pool.QueuePool, pool_size=5, max_overflow=0, pool_pre_ping=True
+    )
+    _run_threads(n, _checkout(engine))
+    engine.dispose()
+
+
+@Profiler.profile
+def test_singletonthreadpool_threads(n):
+    """Raw connection checkouts from SingletonThreadPool, 10 threads"""
+    engine = _engine(pool.SingletonThreadPool, pool_size=threads)
+    _run_threads(n, _checkout(engine))
+    engine.dispose()
+
+
+@Profiler.profile
+def test_engine_connect_threads(n):
+    """Engine.connect() / Connection.close() pairs with QueuePool,
+    10 threads contending for 5 connections"""
+    engine = _engine(pool.QueuePool, pool_size=5, max_overflow=0)
+
+    def go(n):
+        for i in range(n):
+            conn = engine.connect()
+            conn.close()
+
+    _run_threads(n, go)
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    Profiler.main()
@@ -0,0 +1,95 @@
+"""This series of tests illustrates the cost of reflecting a schema of
+related tables, using both :class:`.MetaData` reflection and the
+:class:`.Inspector` interface directly.
+
+"""
+from sqlalchemy import Column
+from sqlalchemy import create_engine
+from sqlalchemy import ForeignKey
+from sqlalchemy import Index
+from sqlalchemy import inspect
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import UniqueConstraint
+from . import Profiler
+
+
+engine = None
+table_names = []
+
+
+Profiler.init("reflection", num=100)
+
+
+@Profiler.setup_once
+def setup_once(dburl, echo, num):
+    global engine, table_names
+    engine = create_engine(dburl, echo=echo)
+
+    metadata = MetaData()
+    metadata.reflect(engine)
+    metadata.drop_all(engine)
+
+    metadata = MetaData()
+    table_names = ["table_%d" % i for i in range(num)]
+    for i, name in enumerate(table_names):
+        columns = [
+            Column("id", Integer, primary_key=True),
+            Column("name", String(50), nullable=False),
+            Column("description", String(255)),
+            Column("q", Integer),
+            Column("p", Integer),
+        ]
+        if i:
+            columns.append(
+                Column("parent_id", ForeignKey("%s.id" % table_names[i - 1]))
+            )
+        table = Table(
+            name, metadata, *(columns + [UniqueConstraint("name", "q")])
+        )
+        Index("ix_%s_p" % name, table.c.p)
+    metadata.create_all(engine)
+
+
+@Profiler.profile
+def test_metadata_reflect(n):
+    """Reflect all tables with MetaData.reflect()"""
+    metadata = MetaData()
+    metadata.reflect(engine)
+
+
+@Profiler.profile
+def test_table_autoload(n):
+    """Reflect each table individually with autoload, into a single
+    MetaData"""
+    metadata = MetaData()
+    for name in table_names:
+        Table(name, metadata, autoload=True, autoload_with=engine)
+
+
+@Profiler.profile
+def test_inspector_columns(n):
+    """Reflect the columns of each table using a single Inspector"""
+    with engine.connect() as conn:
+        insp = inspect(conn)
+        for name in insp.get_table_names():
+            insp.get_columns(name)
+
+
+@Profiler.profile
+def test_inspector_constraints(n):
+    """Reflect the primary keys, foreign keys, unique constraints and
+    indexes of each table using a single Inspector"""
+    with engine.connect() as conn:
+        insp = inspect(conn)
+        for name in insp.get_table_names():
+            insp.get_pk_constraint(name)
+            insp.get_foreign_keys(name)
+            insp.get_unique_constraints(name)
+            insp.get_indexes(name)
+
+
+if __name__ == "__main__":
+    Profiler.main()
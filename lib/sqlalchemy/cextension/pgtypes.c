@@ -0,0 +1,534 @@
+/*
+pgtypes.c
+Copyright (C) 2019 the SQLAlchemy authors and contributors <see AUTHORS file>
+
+This module is part of SQLAlchemy and is released under
+the MIT License: http://www.opensource.org/licenses/mit-license.php
+*/
+
+#include <Python.h>
+
+#define MODULE_NAME "cpgtypes"
+#define MODULE_DOC "Module containing C versions of PostgreSQL type " \
+                   "parsing and serialization functions."
+
+/*
+    Character access is abstracted so that the same parsing code runs
+    against PEP 393 strings on Python 3 and Py_UNICODE buffers on
+    Python 2.
+ */
+#if PY_MAJOR_VERSION >= 3
+
+typedef Py_UCS4 pg_char;
+
+#define PG_READ(data, kind, i) PyUnicode_READ(kind, data, i)
+#define PG_FROM_BUFFER(buf, len) \
+    PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND, buf, len)
+
+#else
+
+typedef Py_UNICODE pg_char;
+
+#define PG_READ(data, kind, i) (((Py_UNICODE *)(data))[i])
+#define PG_FROM_BUFFER(buf, len) PyUnicode_FromUnicode(buf, len)
+
+#endif
+
+static int
+get_unicode_data(PyObject *str, void **data, int *kind, Py_ssize_t *length)
+{
+#if PY_MAJOR_VERSION >= 3
+#if PY_VERSION_HEX < 0x030C0000
+	if (PyUnicode_READY(str) == -1) {
+		return -1;
+	}
+#endif
+	*data = PyUnicode_DATA(str);
+	*kind = PyUnicode_KIND(str);
+	*length = PyUnicode_GET_LENGTH(str);
+#else
+	*data = PyUnicode_AS_UNICODE(str);
+	*kind = 0;
+	*length = PyUnicode_GET_SIZE(str);
+#endif
+	return 0;
+}
+
+/*
+    A growable character buffer used to assemble unescaped and
+    escaped strings.
+ */
+typedef struct {
+	pg_char *chars;
+	Py_ssize_t length;
+	Py_ssize_t allocated;
+} charbuf;
+
+static int
+charbuf_reserve(charbuf *buf, Py_ssize_t extra)
+{
+	Py_ssize_t needed = buf->length + extra;
+	pg_char *chars;
+
+	if (needed <= buf->allocated) {
+		return 0;
+	}
+	if (needed < buf->allocated * 2) {
+		needed = buf->allocated * 2;
+	}
+	if (needed < 64) {
+		needed = 64;
+	}
+	chars = PyMem_Realloc(buf->chars, needed * sizeof(pg_char));
+	if (chars == NULL) {
+		PyErr_NoMemory();
+		return -1;
+	}
+	buf->chars = chars;
+	buf->allocated = needed;
+	return 0;
+}
+
+static int
+charbuf_append(charbuf *buf, pg_char c)
+{
+	if (charbuf_reserve(buf, 1) == -1) {
+		return -1;
+	}
+	buf->chars[buf->length++] = c;
+	return 0;
+}
+
+static void
+charbuf_free(charbuf *buf)
+{
+	PyMem_Free(buf->chars);
+	buf->chars = NULL;
+	buf->length = buf->allocated = 0;
+}
+
+/*
+    Scan a double-quoted hstore token beginning at *pos.  On success
+    the token's contents lie between *start and *end, *pos is advanced
+    past the closing quote and *escaped indicates whether the contents
+    contain any backslashes.
+ */
+static int
+scan_quoted(void *data, int kind, Py_ssize_t length, Py_ssize_t *pos,
+            Py_ssize_t *start, Py_ssize_t *end, int *escaped)
+{
+	Py_ssize_t i = *pos;
+	pg_char c;
+
+	if (i >= length || PG_READ(data, kind, i) != '"') {
+		return 0;
+	}
+	i++;
+	*start = i;
+	*escaped = 0;
+
+	while (i < length) {
+		c = PG_READ(data, kind, i);
+		if (c == '\\') {
+			*escaped = 1;
+			i += 2;
+		} else if (c == '"') {
+			*end = i;
+			*pos = i + 1;
+			return 1;
+		} else {
+			i++;
+		}
+	}
+	return 0;
+}
+
+static PyObject *
+unescape_quoted(PyObject *str, void *data, int kind, Py_ssize_t start,
+                Py_ssize_t end, int escaped)
+{
+	charbuf buf = {NULL, 0, 0};
+	PyObject *result;
+	Py_ssize_t i;
+	pg_char c;
+
+	if (!escaped) {
+#if PY_MAJOR_VERSION >= 3
+		return PyUnicode_Substring(str, start, end);
+#else
+		return PyUnicode_FromUnicode(
+			(Py_UNICODE *)data + start, end - start);
+#endif
+	}
+
+	if (charbuf_reserve(&buf, end - start) == -1) {
+		return NULL;
+	}
+	for (i = start; i < end; i++) {
+		c = PG_READ(data, kind, i);
+		if (c == '\\' && i + 1 < end) {
+			pg_char next = PG_READ(data, kind, i + 1);
+			if (next == '"' || next == '\\') {
+				c = next;
+				i++;
+			}
+		}
+		buf.chars[buf.length++] = c;
+	}
+	result = PG_FROM_BUFFER(buf.chars, buf.length);
+	charbuf_free(&buf);
+	return result;
+}
+
+static Py_ssize_t
+skip_spaces(void *data, int kind, Py_ssize_t length, Py_ssize_t pos)
+{
+	while (pos < length && PG_READ(data, kind, pos) == ' ') {
+		pos++;
+	}
+	return pos;
+}
+
+/*
+    Parse an hstore literal into a dictionary.  Only well-formed input
+    is accepted; anything else raises ValueError without further detail,
+    leaving error reporting to the pure Python parser.
+ */
+static PyObject *
+parse_hstore(PyObject *self, PyObject *arg)
+{
+	PyObject *result, *key, *value;
+	Py_ssize_t length, pos = 0, p, start, end;
+	void *data;
+	int kind, escaped;
+
+	if (!PyUnicode_Check(arg)) {
+		PyErr_SetString(PyExc_ValueError, "hstore value is not a string");
+		return NULL;
+	}
+	if (get_unicode_data(arg, &data, &kind, &length) == -1) {
+		return NULL;
+	}
+
+	result = PyDict_New();
+	if (result == NULL) {
+		return NULL;
+	}
+
+	while (1) {
+		p = pos;
+		if (!scan_quoted(data, kind, length, &p, &start, &end, &escaped)) {
+			break;
+		}
+		key = unescape_quoted(arg, data, kind, start, end, escaped);
+		if (key == NULL) {
+			Py_DECREF(result);
+			return NULL;
+		}
+
+		p = skip_spaces(data, kind, length, p);
+		if (p + 1 >= length || PG_READ(data, kind, p) != '=' ||
+				PG_READ(data, kind, p + 1) != '>') {
+			Py_DECREF(key);
+			break;
+		}
+		p = skip_spaces(data, kind, length, p + 2);
+
+		if (p + 3 < length &&
+				PG_READ(data, kind, p) == 'N' &&
+				PG_READ(data, kind, p + 1) == 'U' &&
+				PG_READ(data, kind, p + 2) == 'L' &&
+				PG_READ(data, kind, p + 3) == 'L') {
+			Py_INCREF(Py_None);
+			value = Py_None;
+			p += 4;
+		} else if (scan_quoted(
+				data, kind, length, &p, &start, &end, &escaped)) {
+			value = unescape_quoted(arg, data, kind, start, end, escaped);
+			if (value == NULL) {
+				Py_DECREF(key);
+				Py_DECREF(result);
+				return NULL;
+			}
+		} else {
+			Py_DECREF(key);
+			break;
+		}
+
+		if (PyDict_SetItem(result, key, value) == -1) {
+			Py_DECREF(key);
+			Py_DECREF(value);
+			Py_DECREF(result);
+			return NULL;
+		}
+		Py_DECREF(key);
+		Py_DECREF(value);
+		pos = p;
+
+		p = skip_spaces(data, kind, length, pos);
+		if (p < length && PG_READ(data, kind, p) == ',') {
+			pos = skip_spaces(data, kind, length, p + 1);
+		}
+	}
+
+	if (pos != length) {
+		Py_DECREF(result);
+		PyErr_Format(PyExc_ValueError,
+					 "could not parse hstore residual at position %zd", pos);
+		return NULL;
+	}
+	return result;
+}
+
+static int
+append_quoted(charbuf *buf, PyObject *str)
+{
+	Py_ssize_t length, i;
+	void *data;
+	int kind;
+	pg_char c;
+
+	if (get_unicode_data(str, &data, &kind, &length) == -1) {
+		return -1;
+	}
+	if (charbuf_reserve(buf, length + 2) == -1) {
+		return -1;
+	}
+	buf->chars[buf->length++] = '"';
+	for (i = 0; i < length; i++) {
+		c = PG_READ(data, kind, i);
+		if (c == '"' || c == '\\') {
+			if (charbuf_append(buf, '\\') == -1) {
+				return -1;
+			}
+		}
+		if (charbuf_append(buf, c) == -1) {
+			return -1;
+		}
+	}
+	return charbuf_append(buf, '"');
+}
+
+static int
+append_ascii(charbuf *buf, const char *s)
+{
+	while (*s) {
+		if (charbuf_append(buf, (pg_char)*s++) == -1) {
+			return -1;
+		}
+	}
+	return 0;
+}
+
+/*
+    Serialize a mapping of strings into an hstore literal.  Keys and
+    values must be unicode strings, except None for values.
+ */
+static PyObject *
+serialize_hstore(PyObject *self, PyObject *arg)
+{
+	charbuf buf = {NULL, 0, 0};
+	PyObject *items, *item, *key, *value, *result = NULL;
+	Py_ssize_t count, i;
+
+	items = PyMapping_Items(arg);
+	if (items == NULL) {
+		return NULL;
+	}
+	count = PyList_GET_SIZE(items);
+
+	for (i = 0; i < count; i++) {
+		item = PyList_GET_ITEM(items, i);
+		if (!PyTuple_Check(item) || PyTuple_GET_SIZE(item) != 2) {
+			PyErr_SetString(PyExc_ValueError,
+							"hstore items must be key/value pairs");
+			goto error;
+		}
+		key = PyTuple_GET_ITEM(item, 0);
+		value = PyTuple_GET_ITEM(item, 1);
+
+		if (!PyUnicode_Check(key)) {
+			PyErr_SetString(PyExc_ValueError, "hstore key is not a string");
+			goto error;
+		}
+		if (value != Py_None && !PyUnicode_Check(value)) {
+			PyErr_SetString(PyExc_ValueError,
+							"hstore value is not a string");
+			goto error;
+		}
+
+		if (i > 0 && append_ascii(&buf, ", ") == -1) {
+			goto error;
+		}
+		if (append_quoted(&buf, key) == -1) {
+			goto error;
+		}
+		if (append_ascii(&buf, "=>") == -1) {
+			goto error;
+		}
+		if (value == Py_None) {
+			if (append_ascii(&buf, "NULL") == -1) {
+				goto error;
+			}
+		} else if (append_quoted(&buf, value) == -1) {
+			goto error;
+		}
+	}
+
+	result = PG_FROM_BUFFER(buf.chars, buf.length);
+
+error:
+	Py_DECREF(items);
+	charbuf_free(&buf);
+	return result;
+}
+
+/*
+    Apply an item processor across a (possibly nested) array structure,
+    building each level with the given collection type.  This mirrors
+    ARRAY._proc_array().
+ */
+static PyObject *
+proc_array_impl(PyObject *arr, PyObject *itemproc, PyObject *dim,
+                PyObject *collection)
+{
+	PyObject *items, *item, *processed, *result, *subdim = NULL;
+	Py_ssize_t count, i;
+	long dimval = 0;
+	int flat;
+
+	items = PySequence_List(arr);
+	if (items == NULL) {
+		return NULL;
+	}
+	count = PyList_GET_SIZE(items);
+
+	if (dim == Py_None) {
+		flat = count == 0 || !(
+			PyList_Check(PyList_GET_ITEM(items, 0)) ||
+			PyTuple_Check(PyList_GET_ITEM(items, 0)));
+	} else {
+		dimval = PyLong_AsLong(dim);
+		if (dimval == -1 && PyErr_Occurred()) {
+			Py_DECREF(items);
+			return NULL;
+		}
+		flat = dimval == 1;
+	}
+
+	if (!flat) {
+		if (dim == Py_None) {
+			Py_INCREF(Py_None);
+			subdim = Py_None;
+		} else {
+			subdim = PyLong_FromLong(dimval - 1);
+			if (subdim == NULL) {
+				Py_DECREF(items);
+				return NULL;
+			}
+		}
+	}
+
+	for (i = 0; i < count; i++) {
+		item = PyList_GET_ITEM(items, i);
+		if (flat) {
+			if (itemproc == Py_None) {
+				continue;
+			}
+			processed = PyObject_CallFunctionObjArgs(itemproc, item, NULL);
+		} else {
+			processed = proc_array_impl(item, itemproc, subdim, collection);
+		}
+		if (processed == NULL) {
+			Py_XDECREF(subdim);
+			Py_DECREF(items);
+			return NULL;
+		}
+		/* steals the reference to processed */
+		PyList_SetItem(items, i, processed);
+	}
+	Py_XDECREF(subdim);
+
+	if (collection == (PyObject *)&PyList_Type) {
+		return items;
+	} else if (collection == (PyObject *)&PyTuple_Type) {
+		result = PyList_AsTuple(items);
+	} else {
+		result = PyObject_CallFunctionObjArgs(collection, items, NULL);
+	}
+	Py_DECREF(items);
+	return result;
+}
+
+static PyObject *
+proc_array(PyObject *self, PyObject *args)
+{
+	PyObject *arr, *itemproc, *dim, *collection;
+	int has_itemproc;
+
+	if (!PyArg_UnpackTuple(args, "proc_array", 4, 4,
+						   &arr, &itemproc, &dim, &collection)) {
+		return NULL;
+	}
+
+	has_itemproc = PyObject_IsTrue(itemproc);
+	if (has_itemproc == -1) {
+		return NULL;
+	}
+	return proc_array_impl(
+		arr, has_itemproc ? itemproc : Py_None, dim, collection);
+}
+
+static PyMethodDef module_methods[] = {
+    {"parse_hstore", parse_hstore, METH_O,
+     "Parse an hstore literal into a dictionary."},
+    {"serialize_hstore", serialize_hstore, METH_O,
+     "Serialize a dictionary into an hstore literal."},
+    {"proc_array", proc_array, METH_VARARGS,
+     "Apply an item processor across a nested array structure."},
+    {NULL, NULL, 0, NULL}        /* Sentinel */
+};
+
+#ifndef PyMODINIT_FUNC  /* declarations for DLL import/export */
+#define PyMODINIT_FUNC void
+#endif
+
+#if PY_MAJOR_VERSION >= 3
+
+#define INITERROR return NULL
+
+static struct PyModuleDef module_def = {
+    PyModuleDef_HEAD_INIT,
+    MODULE_NAME,
+    MODULE_DOC,
+    -1,
+    module_methods
+ };
+
+PyMODINIT_FUNC
+PyInit_cpgtypes(void)
+
+#else
+
+#define INITERROR return
+
+PyMODINIT_FUNC
+initcpgtypes(void)
+
+#endif
+
+{
+    PyObject *m;
+
+#if PY_MAJOR_VERSION >= 3
+    m = PyModule_Create(&module_def);
+#else
+    m = Py_InitModule3(MODULE_NAME, module_methods, MODULE_DOC);
+#endif
+    if (m == NULL)
+        INITERROR;
+
+#if PY_MAJOR_VERSION >= 3
+    return m;
+#endif
+}
@@ -32,8 +32,15 @@ typedef struct {
     PyObject *row;
     PyObject *processors;
     PyObject *keymap;
+    /* values returned by the column processors, in column order, each
+     * computed the first time the column is accessed; allocated on first
+     * use.  NULL entries have not been processed yet. */
+    PyObject **processed;
+    Py_ssize_t num_processed;
 } BaseRowProxy;
 
+static PyTypeObject BaseRowProxyType;
+
 /****************
  * BaseRowProxy *
  ****************/
@@ -70,6 +77,23 @@ safe_rowproxy_reconstructor(PyObject *self, PyObject *args)
     return (PyObject *)obj;
 }
 
+static void
+BaseRowProxy_clear_processed(BaseRowProxy *self)
+{
+    Py_ssize_t i;
+    PyObject **processed = self->processed;
+
+    if (processed == NULL)
+        return;
+
+    self->processed = NULL;
+    for (i = 0; i < self->num_processed; i++) {
+        Py_XDECREF(processed[i]);
+    }
+    self->num_processed = 0;
+    PyMem_Free(processed);
+}
+
 static int
 BaseRowProxy_init(BaseRowProxy *self, PyObject *args, PyObject *kwds)
 {
@@ -79,33 +103,141 @@ BaseRowProxy_init(BaseRowProxy *self, PyObject *args, PyObject *kwds)
                            &parent, &row, &processors, &keymap))
         return -1;
 
-    Py_INCREF(parent);
-    self->parent = parent;
-
     if (!PySequence_Check(row)) {
         PyErr_SetString(PyExc_TypeError, "row must be a sequence");
         return -1;
     }
-    Py_INCREF(row);
-    self->row = row;
 
     if (!PyList_CheckExact(processors)) {
         PyErr_SetString(PyExc_TypeError, "processors must be a list");
         return -1;
     }
-    Py_INCREF(processors);
-    self->processors = processors;
 
     if (!PyDict_CheckExact(keymap)) {
         PyErr_SetString(PyExc_TypeError, "keymap must be a dict");
         return -1;
     }
+
+    BaseRowProxy_clear_processed(self);
+
+    Py_INCREF(parent);
+    Py_XDECREF(self->parent);
+    self->parent = parent;
+
+    Py_INCREF(row);
+    Py_XDECREF(self->row);
+    self->row = row;
+
+    Py_INCREF(processors);
+    Py_XDECREF(self->processors);
+    self->processors = processors;
+
     Py_INCREF(keymap);
+    Py_XDECREF(self->keymap);
     self->keymap = keymap;
 
     return 0;
 }
 
+/* Construct a list of rows of the given class from a sequence of DBAPI
+ * rows, all of which share the same parent, processors and keymap.
+ *
+ * The arguments are checked once for the whole batch; when the class does
+ * not override __init__, rows are allocated and populated directly rather
+ * than by calling the class for each row.
+ */
+static PyObject *
+BaseRowProxy_make_rows(PyObject *cls, PyObject *args)
+{
+    PyObject *parent, *rows, *processors, *keymap;
+    PyObject *rows_fastseq, *result, *row, **rowptr;
+    PyTypeObject *type;
+    BaseRowProxy *obj;
+    Py_ssize_t num_rows, i;
+
+    if (!PyArg_UnpackTuple(args, "_make_rows", 4, 4,
+                           &parent, &rows, &processors, &keymap))
+        return NULL;
+
+    if (!PyType_Check(cls) ||
+            !PyType_IsSubtype((PyTypeObject *)cls, &BaseRowProxyType)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "_make_rows requires a BaseRowProxy subclass");
+        return NULL;
+    }
+    type = (PyTypeObject *)cls;
+
+    rows_fastseq = PySequence_Fast(rows, "rows must be a sequence");
+    if (rows_fastseq == NULL)
+        return NULL;
+
+    num_rows = PySequence_Fast_GET_SIZE(rows_fastseq);
+    result = PyList_New(num_rows);
+    if (result == NULL) {
+        Py_DECREF(rows_fastseq);
+        return NULL;
+    }
+
+    if (type->tp_init != (initproc)BaseRowProxy_init) {
+        /* a subclass with its own __init__, such as BufferedColumnRow */
+        rowptr = PySequence_Fast_ITEMS(rows_fastseq);
+        for (i = 0; i < num_rows; i++) {
+            row = PyObject_CallFunctionObjArgs(
+                cls, parent, rowptr[i], processors, keymap, NULL);
+            if (row == NULL) {
+                Py_DECREF(rows_fastseq);
+                Py_DECREF(result);
+                return NULL;
+            }
+            PyList_SET_ITEM(result, i, row);
+        }
+        Py_DECREF(rows_fastseq);
+        return result;
+    }
+
+    if (!PyList_CheckExact(processors)) {
+        PyErr_SetString(PyExc_TypeError, "processors must be a list");
+        goto fail;
+    }
+
+    if (!PyDict_CheckExact(keymap)) {
+        PyErr_SetString(PyExc_TypeError, "keymap must be a dict");
+        goto fail;
+    }
+
+    rowptr = PySequence_Fast_ITEMS(rows_fastseq);
+    for (i = 0; i < num_rows; i++) {
+        row = rowptr[i];
+        if (!PySequence_Check(row)) {
+            PyErr_SetString(PyExc_TypeError, "row must be a sequence");
+            goto fail;
+        }
+
+        obj = (BaseRowProxy *)type->tp_alloc(type, 0);
+        if (obj == NULL)
+            goto fail;
+
+        Py_INCREF(parent);
+        obj->parent = parent;
+        Py_INCREF(row);
+        obj->row = row;
+        Py_INCREF(processors);
+        obj->processors = processors;
+        Py_INCREF(keymap);
+        obj->keymap = keymap;
+
+        PyList_SET_ITEM(result, i, (PyObject *)obj);
+    }
+
+    Py_DECREF(rows_fastseq);
+    return result;
+
+fail:
+    Py_DECREF(rows_fastseq);
+    Py_DECREF(result);
+    return NULL;
+}
+
 /* We need the reduce method because otherwise the default implementation
  * does very weird stuff for pickle protocol 0 and 1. It calls
  * BaseRowProxy.__new__(RowProxy_instance) upon *pickling*.
@@ -149,6 +281,7 @@ BaseRowProxy_reduce(PyObject *self)
 static void
 BaseRowProxy_dealloc(BaseRowProxy *self)
 {
+    BaseRowProxy_clear_processed(self);
     Py_XDECREF(self->parent);
     Py_XDECREF(self->row);
     Py_XDECREF(self->processors);
@@ -245,11 +378,53 @@ BaseRowProxy_length(BaseRowProxy *self)
     return PySequence_Length(self->row);
 }
 
+/* Return the processed value for the column at the given index, calling
+ * the processor only the first time the column is accessed.
+ */
+static PyObject *
+BaseRowProxy_processed_value(BaseRowProxy *self, PyObject *processor,
+                             Py_ssize_t index)
+{
+    PyObject *value, *processed_value;
+    Py_ssize_t num_processors;
+
+    if (self->processed == NULL) {
+        num_processors = PyList_GET_SIZE(self->processors);
+        self->processed = PyMem_Malloc(
+            (num_processors ? num_processors : 1) * sizeof(PyObject *));
+        if (self->processed == NULL) {
+            PyErr_NoMemory();
+            return NULL;
+        }
+        memset(self->processed, 0, num_processors * sizeof(PyObject *));
+        self->num_processed = num_processors;
+    }
+    else if (index < self->num_processed && self->processed[index] != NULL) {
+        Py_INCREF(self->processed[index]);
+        return self->processed[index];
+    }
+
+    value = PySequence_GetItem(self->row, index);
+    if (value == NULL)
+        return NULL;
+
+    processed_value = PyObject_CallFunctionObjArgs(processor, value, NULL);
+    Py_DECREF(value);
+    if (processed_value == NULL)
+        return NULL;
+
+    if (index < self->num_processed) {
+        Py_INCREF(processed_value);
+        self->processed[index] = processed_value;
+    }
+    return processed_value;
+}
+
 static PyObject *
 BaseRowProxy_subscript(BaseRowProxy *self, PyObject *key)
 {
     PyObject *processors, *values;
-    PyObject *processor, *value, *processed_value;
+    PyObject *processor, *value;
     PyObject *row, *record, *result, *indexobject;
     PyObject *exc_module, *exception, *cstr_obj;
 #if PY_MAJOR_VERSION >= 3
@@ -368,6 +543,10 @@ BaseRowProxy_subscript(BaseRowProxy *self, PyObject *key)
     if (processor == NULL)
         return NULL;
 
+    if (processor != Py_None) {
+        return BaseRowProxy_processed_value(self, processor, index);
+    }
+
     row = self->row;
     if (PyTuple_CheckExact(row)) {
         value = PyTuple_GetItem(row, index);
@@ -381,18 +560,10 @@ BaseRowProxy_subscript(BaseRowProxy *self, PyObject *key)
     if (value == NULL)
         return NULL;
 
-    if (processor != Py_None) {
-        processed_value = PyObject_CallFunctionObjArgs(processor, value, NULL);
-        if (!tuple_check) {
-            Py_DECREF(value);
-        }
-        return processed_value;
-    } else {
-        if (tuple_check) {
-            Py_INCREF(value);
-        }
-        return value;
+    if (tuple_check) {
+        Py_INCREF(value);
     }
+    return value;
 }
 
 static PyObject *
@@ -515,6 +686,7 @@ BaseRowProxy_setrow(BaseRowProxy *self, PyObject *value, void *closure)
         return -1;
     }
 
+    BaseRowProxy_clear_processed(self);
     Py_XDECREF(self->row);
     Py_INCREF(value);
     self->row = value;
@@ -544,6 +716,7 @@ BaseRowProxy_setprocessors(BaseRowProxy *self, PyObject *value, void *closure)
         return -1;
     }
 
+    BaseRowProxy_clear_processed(self);
     Py_XDECREF(self->processors);
     Py_INCREF(value);
     self->processors = value;
@@ -605,6 +778,10 @@ static PyMethodDef BaseRowProxy_methods[] = {
      "Return the values represented by this BaseRowProxy as a list."},
     {"__reduce__",  (PyCFunction)BaseRowProxy_reduce, METH_NOARGS,
      "Pickle support method."},
+    {"_make_rows", (PyCFunction)BaseRowProxy_make_rows,
+     METH_VARARGS | METH_CLASS,
+     "Construct a list of rows sharing the given parent, processors "
+     "and keymap."},
     {NULL}  /* Sentinel */
 };
 
@@ -668,9 +845,96 @@ static PyTypeObject BaseRowProxyType = {
     0                                   /* tp_new */
 };
 
+/*
+ * Transpose a sequence of DBAPI rows into a list containing one list of
+ * values for each column, applying the result processor for each column,
+ * if any, without creating any row objects.
+ */
+static PyObject *
+columns_from_rows(PyObject *self, PyObject *args)
+{
+    PyObject *rows, *processors, *rows_fast, *procs_fast, *row_fast;
+    PyObject *columns = NULL, *column, *processor, *value;
+    PyObject **row_items, **proc_items;
+    Py_ssize_t nrows, ncols, i, j;
+
+    if (!PyArg_UnpackTuple(args, "columns_from_rows", 2, 2,
+                           &rows, &processors))
+        return NULL;
+
+    rows_fast = PySequence_Fast(rows, "rows must be a sequence");
+    if (rows_fast == NULL)
+        return NULL;
+
+    procs_fast = PySequence_Fast(processors, "processors must be a sequence");
+    if (procs_fast == NULL) {
+        Py_DECREF(rows_fast);
+        return NULL;
+    }
+
+    nrows = PySequence_Fast_GET_SIZE(rows_fast);
+    ncols = PySequence_Fast_GET_SIZE(procs_fast);
+    proc_items = PySequence_Fast_ITEMS(procs_fast);
+
+    columns = PyList_New(ncols);
+    if (columns == NULL)
+        goto error;
+
+    for (j = 0; j < ncols; j++) {
+        column = PyList_New(nrows);
+        if (column == NULL)
+            goto error;
+        PyList_SET_ITEM(columns, j, column);
+    }
+
+    for (i = 0; i < nrows; i++) {
+        row_fast = PySequence_Fast(PySequence_Fast_GET_ITEM(rows_fast, i),
+                                   "rows must contain sequences");
+        if (row_fast == NULL)
+            goto error;
+
+        if (PySequence_Fast_GET_SIZE(row_fast) < ncols) {
+            PyErr_SetString(PyExc_ValueError,
+                            "row contains fewer values than processors");
+            Py_DECREF(row_fast);
+            goto error;
+        }
+
+        row_items = PySequence_Fast_ITEMS(row_fast);
+        for (j = 0; j < ncols; j++) {
+            processor = proc_items[j];
+            if (processor == Py_None) {
+                value = row_items[j];
+                Py_INCREF(value);
+            } else {
+                value = PyObject_CallFunctionObjArgs(processor, row_items[j],
+                                                     NULL);
+                if (value == NULL) {
+                    Py_DECREF(row_fast);
+                    goto error;
+                }
+            }
+            PyList_SET_ITEM(PyList_GET_ITEM(columns, j), i, value);
+        }
+        Py_DECREF(row_fast);
+    }
+
+    Py_DECREF(rows_fast);
+    Py_DECREF(procs_fast);
+    return columns;
+
+error:
+    Py_XDECREF(columns);
+    Py_DECREF(rows_fast);
+    Py_DECREF(procs_fast);
+    return NULL;
+}
+
 static PyMethodDef module_methods[] = {
     {"safe_rowproxy_reconstructor", safe_rowproxy_reconstructor, METH_VARARGS,
      "reconstruct a RowProxy instance from its pickled form."},
+    {"columns_from_rows", columns_from_rows, METH_VARARGS,
+     "transpose DBAPI rows into processed lists of column values."},
     {NULL, NULL, 0, NULL}        /* Sentinel */
 };
 
@@ -2147,6 +2147,8 @@ class MySQLDialect(default.DefaultDialect):
     supports_sane_rowcount = True
     supports_sane_multi_rowcount = False
     supports_multivalues_insert = True
+    use_insertmanyvalues = True
+    insertmanyvalues_max_parameters = 65535
 
     supports_comments = True
     inline_comments = True
@@ -2249,6 +2251,53 @@ class MySQLDialect(default.DefaultDialect):
             val = val.decode()
         return val.upper().replace("-", " ")
 
+    def _upsert_statement(self, table, index_elements, set_keys):
+        from .dml import insert
+
+        # ON DUPLICATE KEY UPDATE has no conflict target; any unique
+        # constraint violated by the row triggers the UPDATE.  With no
+        # columns to update, assigning a key column to itself lets the
+        # duplicate row through as a no-op.
+        stmt = insert(table)
+        return stmt.on_duplicate_key_update(
+            [
+                (key, stmt.inserted[key])
+                for key in set_keys or [index_elements[0].key]
+            ]
+        )
+
+    def _json_partial_update(self, column, changes):
+        expr = column
+        for change in changes:
+            if change[0] == "append":
+                args = []
+                for value in change[1]:
+                    args.extend(["$", self._json_value(column, value)])
+                expr = sql.func.json_array_append(
+                    expr, *args, type_=column.type
+                )
+                continue
+
+            path = '$."%s"' % (
+                change[1].replace("\\", "\\\\").replace('"', '\\"')
+            )
+            if change[0] == "set":
+                expr = sql.func.json_set(
+                    expr,
+                    path,
+                    self._json_value(column, change[2]),
+                    type_=column.type,
+                )
+            else:
+                expr = sql.func.json_remove(expr, path, type_=column.type)
+        return expr
+
+    def _json_value(self, column, value):
+        if value is None:
+            value = column.type.NULL
+        # a string argument would otherwise be stored as a JSON string
+        return sql.func.json_extract(sql.literal(value, column.type), "$")
+
     def _get_server_version_info(self, connection):
         # get database server version info explicitly over the wire
         # to avoid proxy servers like MaxScale getting in the
@@ -17,6 +17,11 @@ try:
 except ImportError:
     _python_UUID = None
 
+try:
+    from sqlalchemy.cpgtypes import proc_array as _proc_array
+except ImportError:
+    _proc_array = None
+
 
 def Any(other, arrexpr, operator=operators.eq):
     """A synonym for the :meth:`.ARRAY.Comparator.any` method.
@@ -319,13 +324,13 @@ class ARRAY(sqltypes.ARRAY):
             dialect
         )
 
+        proc_array = _proc_array or self._proc_array
+
         def process(value):
             if value is None:
                 return value
             else:
-                return self._proc_array(
-                    value, item_proc, self.dimensions, list
-                )
+                return proc_array(value, item_proc, self.dimensions, list)
 
         return process
 
@@ -334,11 +339,13 @@ class ARRAY(sqltypes.ARRAY):
             dialect, coltype
         )
 
+        proc_array = _proc_array or self._proc_array
+
         def process(value):
             if value is None:
                 return value
             else:
-                return self._proc_array(
+                return proc_array(
                     value,
                     item_proc,
                     self.dimensions,
@@ -1809,7 +1809,7 @@ class PGCompiler(compiler.SQLCompiler):
                         value.type = c.type
                 value_text = self.process(value.self_group(), use_schema=False)
 
-                key_text = self.preparer.quote(col_key)
+                key_text = self.preparer.quote(c.name)
                 action_set_ops.append("%s = %s" % (key_text, value_text))
 
         # check for names that don't match columns
@@ -2393,6 +2393,8 @@ class PGDialect(default.DefaultDialect):
     supports_default_values = True
     supports_empty_insert = False
     supports_multivalues_insert = True
+    use_insertmanyvalues = True
+    insertmanyvalues_max_parameters = 32767
     default_paramstyle = "pyformat"
     ischema_names = ischema_names
     colspecs = colspecs
@@ -2689,6 +2691,58 @@ class PGDialect(default.DefaultDialect):
         cursor = connection.execute(query)
         return bool(cursor.scalar())
 
+    def _upsert_statement(self, table, index_elements, set_keys):
+        from .dml import insert
+
+        if self.server_version_info and self.server_version_info < (9, 5):
+            raise NotImplementedError(
+                "INSERT..ON CONFLICT requires PostgreSQL 9.5 or greater"
+            )
+
+        stmt = insert(table)
+        if set_keys:
+            return stmt.on_conflict_do_update(
+                index_elements=index_elements,
+                set_=dict((key, stmt.excluded[key]) for key in set_keys),
+            )
+        else:
+            return stmt.on_conflict_do_nothing(index_elements=index_elements)
+
+    def _json_partial_update(self, column, changes):
+        from .array import ARRAY
+        from .json import JSONB
+
+        # jsonb_set() and the jsonb operators have no plain JSON
+        # equivalents
+        if not isinstance(column.type, JSONB):
+            return None
+
+        expr = column
+        for change in changes:
+            if change[0] == "set":
+                # jsonb_set() is STRICT, so a SQL NULL, as would be bound
+                # for None with none_as_null, would null out the document
+                value = change[2]
+                if value is None:
+                    value = column.type.NULL
+                expr = sql.func.jsonb_set(
+                    expr,
+                    sql.cast(
+                        sql.literal([change[1]], ARRAY(TEXT)), ARRAY(TEXT)
+                    ),
+                    sql.literal(value, column.type),
+                    type_=column.type,
+                )
+            elif change[0] == "delete":
+                expr = expr.op("-", return_type=column.type)(
+                    sql.cast(sql.literal(change[1]), TEXT)
+                )
+            else:
+                expr = expr.op("||", return_type=column.type)(
+                    sql.literal(change[1], column.type)
+                )
+        return expr
+
     def _get_server_version_info(self, connection):
         v = connection.execute("select version()").scalar()
         m = re.match(
@@ -2852,18 +2906,7 @@ class PGDialect(default.DefaultDialect):
         c = connection.execute(s, table_oid=table_oid)
         rows = c.fetchall()
 
-        # dictionary with (name, ) if default search path or (schema, name)
-        # as keys
-        domains = self._load_domains(connection)
-
-        # dictionary with (name, ) if default search path or (schema, name)
-        # as keys
-        enums = dict(
-            ((rec["name"],), rec)
-            if rec["visible"]
-            else ((rec["schema"], rec["name"]), rec)
-            for rec in self._load_enums(connection, schema="*")
-        )
+        domains, enums = self._load_domains_and_enums(connection)
 
         # format columns
         columns = []
@@ -2890,6 +2933,21 @@ class PGDialect(default.DefaultDialect):
             columns.append(column_info)
         return columns
 
+    def _load_domains_and_enums(self, connection):
+        # dictionary with (name, ) if default search path or (schema, name)
+        # as keys
+        domains = self._load_domains(connection)
+
+        # dictionary with (name, ) if default search path or (schema, name)
+        # as keys
+        enums = dict(
+            ((rec["name"],), rec)
+            if rec["visible"]
+            else ((rec["schema"], rec["name"]), rec)
+            for rec in self._load_enums(connection, schema="*")
+        )
+        return domains, enums
+
     def _get_column_info(
         self,
         name,
@@ -3101,7 +3159,6 @@ class PGDialect(default.DefaultDialect):
         postgresql_ignore_search_path=False,
         **kw
     ):
-        preparer = self.identifier_preparer
         table_oid = self.get_table_oid(
             connection, table_name, schema, info_cache=kw.get("info_cache")
         )
@@ -3120,87 +3177,99 @@ class PGDialect(default.DefaultDialect):
                 n.oid = c.relnamespace
           ORDER BY 1
         """
-        # http://www.postgresql.org/docs/9.0/static/sql-createtable.html
-        FK_REGEX = re.compile(
-            r"FOREIGN KEY \((.*?)\) REFERENCES (?:(.*?)\.)?(.*?)\((.*?)\)"
-            r"[\s]?(MATCH (FULL|PARTIAL|SIMPLE)+)?"
-            r"[\s]?(ON UPDATE "
-            r"(CASCADE|RESTRICT|NO ACTION|SET NULL|SET DEFAULT)+)?"
-            r"[\s]?(ON DELETE "
-            r"(CASCADE|RESTRICT|NO ACTION|SET NULL|SET DEFAULT)+)?"
-            r"[\s]?(DEFERRABLE|NOT DEFERRABLE)?"
-            r"[\s]?(INITIALLY (DEFERRED|IMMEDIATE)+)?"
-        )
 
         t = sql.text(FK_SQL).columns(
             conname=sqltypes.Unicode, condef=sqltypes.Unicode
         )
         c = connection.execute(t, table=table_oid)
-        fkeys = []
-        for conname, condef, conschema in c.fetchall():
-            m = re.search(FK_REGEX, condef).groups()
+        return [
+            self._get_fkey_info(
+                conname,
+                condef,
+                conschema,
+                schema,
+                postgresql_ignore_search_path,
+            )
+            for conname, condef, conschema in c.fetchall()
+        ]
 
-            (
-                constrained_columns,
-                referred_schema,
-                referred_table,
-                referred_columns,
-                _,
-                match,
-                _,
-                onupdate,
-                _,
-                ondelete,
-                deferrable,
-                _,
-                initially,
-            ) = m
-
-            if deferrable is not None:
-                deferrable = True if deferrable == "DEFERRABLE" else False
-            constrained_columns = [
-                preparer._unquote_identifier(x)
-                for x in re.split(r"\s*,\s*", constrained_columns)
-            ]
-
-            if postgresql_ignore_search_path:
-                # when ignoring search path, we use the actual schema
-                # provided it isn't the "default" schema
-                if conschema != self.default_schema_name:
-                    referred_schema = conschema
-                else:
-                    referred_schema = schema
-            elif referred_schema:
-                # referred_schema is the schema that we regexp'ed from
-                # pg_get_constraintdef().  If the schema is in the search
-                # path, pg_get_constraintdef() will give us None.
-                referred_schema = preparer._unquote_identifier(referred_schema)
-            elif schema is not None and schema == conschema:
-                # If the actual schema matches the schema of the table
-                # we're reflecting, then we will use that.
-                referred_schema = schema
+    # http://www.postgresql.org/docs/9.0/static/sql-createtable.html
+    _fk_regex = re.compile(
+        r"FOREIGN KEY \((.*?)\) REFERENCES (?:(.*?)\.)?(.*?)\((.*?)\)"
+        r"[\s]?(MATCH (FULL|PARTIAL|SIMPLE)+)?"
+        r"[\s]?(ON UPDATE "
+        r"(CASCADE|RESTRICT|NO ACTION|SET NULL|SET DEFAULT)+)?"
+        r"[\s]?(ON DELETE "
+        r"(CASCADE|RESTRICT|NO ACTION|SET NULL|SET DEFAULT)+)?"
+        r"[\s]?(DEFERRABLE|NOT DEFERRABLE)?"
+        r"[\s]?(INITIALLY (DEFERRED|IMMEDIATE)+)?"
+    )
 
-            referred_table = preparer._unquote_identifier(referred_table)
-            referred_columns = [
-                preparer._unquote_identifier(x)
-                for x in re.split(r"\s*,\s", referred_columns)
-            ]
-            fkey_d = {
-                "name": conname,
-                "constrained_columns": constrained_columns,
-                "referred_schema": referred_schema,
-                "referred_table": referred_table,
-                "referred_columns": referred_columns,
-                "options": {
-                    "onupdate": onupdate,
-                    "ondelete": ondelete,
-                    "deferrable": deferrable,
-                    "initially": initially,
-                    "match": match,
-                },
-            }
-            fkeys.append(fkey_d)
-        return fkeys
+    def _get_fkey_info(
+        self, conname, condef, conschema, schema, postgresql_ignore_search_path
+    ):
+        preparer = self.identifier_preparer
+        m = re.search(self._fk_regex, condef).groups()
+
+        (
+            constrained_columns,
+            referred_schema,
+            referred_table,
+            referred_columns,
+            _,
+            match,
+            _,
+            onupdate,
+            _,
+            ondelete,
+            deferrable,
+            _,
+            initially,
+        ) = m
+
+        if deferrable is not None:
+            deferrable = True if deferrable == "DEFERRABLE" else False
+        constrained_columns = [
+            preparer._unquote_identifier(x)
+            for x in re.split(r"\s*,\s*", constrained_columns)
+        ]
+
+        if postgresql_ignore_search_path:
+            # when ignoring search path, we use the actual schema
+            # provided it isn't the "default" schema
+            if conschema != self.default_schema_name:
+                referred_schema = conschema
+            else:
+                referred_schema = schema
+        elif referred_schema:
+            # referred_schema is the schema that we regexp'ed from
+            # pg_get_constraintdef().  If the schema is in the search
+            # path, pg_get_constraintdef() will give us None.
+            referred_schema = preparer._unquote_identifier(referred_schema)
+        elif schema is not None and schema == conschema:
+            # If the actual schema matches the schema of the table
+            # we're reflecting, then we will use that.
+            referred_schema = schema
+
+        referred_table = preparer._unquote_identifier(referred_table)
+        referred_columns = [
+            preparer._unquote_identifier(x)
+            for x in re.split(r"\s*,\s", referred_columns)
+        ]
+        return {
+            "name": conname,
+            "constrained_columns": constrained_columns,
+            "referred_schema": referred_schema,
+            "referred_table": referred_table,
+            "referred_columns": referred_columns,
+            "options": {
+                "onupdate": onupdate,
+                "ondelete": ondelete,
+                "deferrable": deferrable,
+                "initially": initially,
+                "match": match,
+            },
+        }
 
     def _pg_index_any(self, col, compare_to):
         if self.server_version_info < (8, 1):
@@ -3297,11 +3366,13 @@ class PGDialect(default.DefaultDialect):
             relname=sqltypes.Unicode, attname=sqltypes.Unicode
         )
         c = connection.execute(t, table_oid=table_oid)
+        return self._get_index_info(c.fetchall())
 
+    def _get_index_info(self, rows):
         indexes = defaultdict(lambda: defaultdict(dict))
 
         sv_idx_name = None
-        for row in c.fetchall():
+        for row in rows:
             (
                 idx_name,
                 unique,
@@ -3427,9 +3498,11 @@ class PGDialect(default.DefaultDialect):
 
         t = sql.text(UNIQUE_SQL).columns(col_name=sqltypes.Unicode)
         c = connection.execute(t, table_oid=table_oid)
+        return self._get_unique_constraint_info(c.fetchall())
 
+    def _get_unique_constraint_info(self, rows):
         uniques = defaultdict(lambda: defaultdict(dict))
-        for row in c.fetchall():
+        for row in rows:
             uc = uniques[row.name]
             uc["key"] = row.key
             uc["cols"][row.col_num] = row.col_name
@@ -3476,9 +3549,11 @@ class PGDialect(default.DefaultDialect):
         """
 
         c = connection.execute(sql.text(CHECK_SQL), table_oid=table_oid)
+        return self._get_check_constraint_info(c)
 
+    def _get_check_constraint_info(self, rows):
         ret = []
-        for name, src in c:
+        for name, src in rows:
             # samples:
             # "CHECK (((a > 1) AND (a < 5)))"
             # "CHECK (((a = 1) OR ((a > 2) AND (a < 5))))"
@@ -3496,6 +3571,399 @@ class PGDialect(default.DefaultDialect):
             ret.append(entry)
         return ret
 
+    def _execute_multi(self, connection, query, schema, filter_names, **cols):
+        """Execute a catalog query on behalf of a ``get_multi_*()``
+        method.
+
+        ``%(tables)s`` within the query is replaced with a SELECT of the
+        ``oid`` and ``relname`` of each table to be reflected.
+
+        """
+        if schema is not None:
+            schema_where_clause = "n.nspname = :schema"
+        else:
+            schema_where_clause = "pg_catalog.pg_table_is_visible(c.oid)"
+        if filter_names is not None:
+            schema_where_clause += " AND c.relname IN :filter_names"
+        tables = (
+            """
+            SELECT c.oid, c.relname
+            FROM pg_catalog.pg_class c
+            LEFT JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            WHERE (%s)
+            AND c.relkind in ('r', 'v', 'm', 'f', 'p')
+        """
+            % schema_where_clause
+        )
+
+        bindparams = []
+        if schema is not None:
+            bindparams.append(
+                sql.bindparam(
+                    "schema", util.text_type(schema), type_=sqltypes.Unicode
+                )
+            )
+        if filter_names is not None:
+            bindparams.append(
+                sql.bindparam(
+                    "filter_names",
+                    [util.text_type(name) for name in filter_names],
+                    type_=sqltypes.Unicode,
+                    expanding=True,
+                )
+            )
+        t = (
+            sql.text(query % {"tables": tables})
+            .bindparams(*bindparams)
+            .columns(relname=sqltypes.Unicode, **cols)
+        )
+        return connection.execute(t).fetchall()
+
+    def get_multi_columns(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self.server_version_info < (8, 5):
+            return super(PGDialect, self).get_multi_columns(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+        if filter_names is not None and not filter_names:
+            return {}
+
+        SQL_COLS = """
+            SELECT t.relname, a.attname,
+              pg_catalog.format_type(a.atttypid, a.atttypmod),
+              (SELECT pg_catalog.pg_get_expr(d.adbin, d.adrelid)
+                FROM pg_catalog.pg_attrdef d
+               WHERE d.adrelid = a.attrelid AND d.adnum = a.attnum
+               AND a.atthasdef)
+              AS DEFAULT,
+              a.attnotnull,
+              pgd.description as comment
+            FROM (%(tables)s) t
+            LEFT JOIN pg_catalog.pg_attribute a ON (
+                a.attrelid = t.oid AND a.attnum > 0 AND NOT a.attisdropped)
+            LEFT JOIN pg_catalog.pg_description pgd ON (
+                pgd.objoid = a.attrelid AND pgd.objsubid = a.attnum)
+            ORDER BY t.relname, a.attnum
+        """
+        rows = self._execute_multi(
+            connection,
+            SQL_COLS,
+            schema,
+            filter_names,
+            attname=sqltypes.Unicode,
+            default=sqltypes.Unicode,
+        )
+
+        domains, enums = self._load_domains_and_enums(connection)
+
+        columns = {}
+        for table_name, name, format_type, default_, notnull, comment in rows:
+            table_columns = columns.setdefault(table_name, [])
+            if name is None:
+                continue
+            table_columns.append(
+                self._get_column_info(
+                    name,
+                    format_type,
+                    default_,
+                    notnull,
+                    domains,
+                    enums,
+                    schema,
+                    comment,
+                )
+            )
+        return columns
+
+    def get_multi_pk_constraint(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self.server_version_info < (8, 5):
+            return super(PGDialect, self).get_multi_pk_constraint(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+        if filter_names is not None and not filter_names:
+            return {}
+
+        PK_SQL = """
+            SELECT t.relname, a.attname, con.conname
+            FROM (%(tables)s) t
+            LEFT JOIN (
+                SELECT ix.indrelid,
+                       unnest(ix.indkey) attnum,
+                       generate_subscripts(ix.indkey, 1) ord
+                FROM pg_catalog.pg_index ix
+                WHERE ix.indisprimary
+                ) k ON k.indrelid = t.oid
+            LEFT JOIN pg_catalog.pg_attribute a
+                ON a.attrelid = k.indrelid AND a.attnum = k.attnum
+            LEFT JOIN pg_catalog.pg_constraint con
+                ON con.conrelid = t.oid AND con.contype = 'p'
+            ORDER BY t.relname, k.ord
+        """
+        rows = self._execute_multi(
+            connection,
+            PK_SQL,
+            schema,
+            filter_names,
+            attname=sqltypes.Unicode,
+            conname=sqltypes.Unicode,
+        )
+
+        pks = {}
+        for table_name, attname, conname in rows:
+            pk = pks.setdefault(
+                table_name, {"constrained_columns": [], "name": conname}
+            )
+            if attname is not None:
+                pk["constrained_columns"].append(attname)
+        return pks
+
+    def get_multi_foreign_keys(
+        self,
+        connection,
+        schema=None,
+        filter_names=None,
+        postgresql_ignore_search_path=False,
+        **kw
+    ):
+        if self.server_version_info < (8, 5):
+            return super(PGDialect, self).get_multi_foreign_keys(
+                connection,
+                schema=schema,
+                filter_names=filter_names,
+                postgresql_ignore_search_path=postgresql_ignore_search_path,
+                **kw
+            )
+        if filter_names is not None and not filter_names:
+            return {}
+
+        FK_SQL = """
+          SELECT t.relname, r.conname,
+                pg_catalog.pg_get_constraintdef(r.oid, true) as condef,
+                n.nspname as conschema
+          FROM (%(tables)s) t
+          LEFT JOIN pg_catalog.pg_constraint r
+                ON r.conrelid = t.oid AND r.contype = 'f'
+          LEFT JOIN pg_catalog.pg_class c ON c.oid = r.confrelid
+          LEFT JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+          ORDER BY t.relname, r.conname
+        """
+        rows = self._execute_multi(
+            connection,
+            FK_SQL,
+            schema,
+            filter_names,
+            conname=sqltypes.Unicode,
+            condef=sqltypes.Unicode,
+        )
+
+        fkeys = {}
+        for table_name, conname, condef, conschema in rows:
+            table_fkeys = fkeys.setdefault(table_name, [])
+            if conname is None:
+                continue
+            table_fkeys.append(
+                self._get_fkey_info(
+                    conname,
+                    condef,
+                    conschema,
+                    schema,
+                    postgresql_ignore_search_path,
+                )
+            )
+        return fkeys
+
+    def get_multi_indexes(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self.server_version_info < (8, 5):
+            return super(PGDialect, self).get_multi_indexes(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+        if filter_names is not None and not filter_names:
+            return {}
+
+        IDX_SQL = """
+          SELECT
+              t.relname, i.relname as index_name,
+              ix.indisunique, ix.indexprs, ix.indpred,
+              a.attname, a.attnum, c.conrelid, ix.indkey::varchar,
+              ix.indoption::varchar, i.reloptions, am.amname
+          FROM
+              (%(tables)s) t
+                    left outer join pg_index ix
+                        on t.oid = ix.indrelid and ix.indisprimary = 'f'
+                    left outer join pg_class i on i.oid = ix.indexrelid
+                    left outer join
+                        pg_attribute a
+                        on t.oid = a.attrelid and a.attnum = ANY(ix.indkey)
+                    left outer join
+                        pg_constraint c
+                        on (ix.indrelid = c.conrelid and
+                            ix.indexrelid = c.conindid and
+                            c.contype in ('p', 'u', 'x'))
+                    left outer join
+                        pg_am am
+                        on i.relam = am.oid
+          ORDER BY
+              t.relname,
+              i.relname
+        """
+        rows = self._execute_multi(
+            connection,
+            IDX_SQL,
+            schema,
+            filter_names,
+            index_name=sqltypes.Unicode,
+            attname=sqltypes.Unicode,
+        )
+
+        rows_by_table = {}
+        for row in rows:
+            table_rows = rows_by_table.setdefault(row[0], [])
+            if row[1] is not None:
+                table_rows.append(tuple(row[1:]))
+        return dict(
+            (table_name, self._get_index_info(table_rows))
+            for table_name, table_rows in rows_by_table.items()
+        )
+
+    def get_multi_unique_constraints(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self.server_version_info < (8, 5):
+            return super(PGDialect, self).get_multi_unique_constraints(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+        if filter_names is not None and not filter_names:
+            return {}
+
+        UNIQUE_SQL = """
+            SELECT
+                t.relname,
+                cons.conname as name,
+                cons.conkey as key,
+                a.attnum as col_num,
+                a.attname as col_name
+            FROM
+                (%(tables)s) t
+                left outer join pg_catalog.pg_constraint cons
+                  on cons.conrelid = t.oid AND cons.contype = 'u'
+                left outer join pg_attribute a
+                  on cons.conrelid = a.attrelid AND
+                    a.attnum = ANY(cons.conkey)
+        """
+        rows = self._execute_multi(
+            connection,
+            UNIQUE_SQL,
+            schema,
+            filter_names,
+            col_name=sqltypes.Unicode,
+        )
+
+        rows_by_table = {}
+        for row in rows:
+            table_rows = rows_by_table.setdefault(row.relname, [])
+            if row.name is not None:
+                table_rows.append(row)
+        return dict(
+            (table_name, self._get_unique_constraint_info(table_rows))
+            for table_name, table_rows in rows_by_table.items()
+        )
+
+    def get_multi_check_constraints(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self.server_version_info < (8, 5):
+            return super(PGDialect, self).get_multi_check_constraints(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+        if filter_names is not None and not filter_names:
+            return {}
+
+        CHECK_SQL = """
+            SELECT
+                t.relname,
+                cons.conname as name,
+                pg_get_constraintdef(cons.oid) as src
+            FROM
+                (%(tables)s) t
+                left outer join pg_catalog.pg_constraint cons
+                  on cons.conrelid = t.oid AND cons.contype = 'c'
+        """
+        rows = self._execute_multi(connection, CHECK_SQL, schema, filter_names)
+
+        rows_by_table = {}
+        for table_name, name, src in rows:
+            table_rows = rows_by_table.setdefault(table_name, [])
+            if name is not None:
+                table_rows.append((name, src))
+        return dict(
+            (table_name, self._get_check_constraint_info(table_rows))
+            for table_name, table_rows in rows_by_table.items()
+        )
+
+    def get_multi_table_comment(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self.server_version_info < (8, 5):
+            return super(PGDialect, self).get_multi_table_comment(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+        if filter_names is not None and not filter_names:
+            return {}
+
+        COMMENT_SQL = """
+            SELECT
+                t.relname,
+                pgd.description as table_comment
+            FROM
+                (%(tables)s) t
+                left outer join pg_catalog.pg_description pgd
+                  on pgd.objoid = t.oid AND pgd.objsubid = 0
+        """
+        rows = self._execute_multi(
+            connection, COMMENT_SQL, schema, filter_names
+        )
+        return dict(
+            (table_name, {"text": comment}) for table_name, comment in rows
+        )
+
+    def get_table_versions(self, connection, schema=None, **kw):
+        # the transaction ids which last modified the catalog rows of each
+        # table, its columns, constraints, indexes and comments, along with
+        # the number of those rows.  changes to types used by columns, such
+        # as the labels of an ENUM, aren't reflected in the version.
+        VERSION_SQL = """
+            SELECT t.relname, c.xmin::text || ':' || (
+                SELECT count(*) || ':' ||
+                    coalesce(max(a.xmin::text::bigint), 0)
+                FROM pg_catalog.pg_attribute a WHERE a.attrelid = t.oid
+            ) || ':' || (
+                SELECT count(*) || ':' ||
+                    coalesce(max(r.xmin::text::bigint), 0)
+                FROM pg_catalog.pg_constraint r WHERE r.conrelid = t.oid
+            ) || ':' || (
+                SELECT count(*) || ':' || coalesce(max(greatest(
+                    ix.xmin::text::bigint, i.xmin::text::bigint)), 0)
+                FROM pg_catalog.pg_index ix
+                JOIN pg_catalog.pg_class i ON i.oid = ix.indexrelid
+                WHERE ix.indrelid = t.oid
+            ) || ':' || (
+                SELECT count(*) || ':' ||
+                    coalesce(max(d.xmin::text::bigint), 0)
+                FROM pg_catalog.pg_description d WHERE d.objoid = t.oid
+            ) AS version
+            FROM (%(tables)s) t
+            JOIN pg_catalog.pg_class c ON c.oid = t.oid
+        """
+        rows = self._execute_multi(
+            connection, VERSION_SQL, schema, None, version=sqltypes.Unicode
+        )
+        return dict(rows)
+
     def _load_enums(self, connection, schema=None):
         schema = schema or self.default_schema_name
         if not self.supports_native_enum:
@@ -338,7 +338,9 @@ class _HStoreMatrixFunction(sqlfunc.GenericFunction):
 
 #
 # parsing.  note that none of this is used with the psycopg2 backend,
-# which provides its own native extensions.
+# which provides its own native extensions.  when the C extensions are
+# built, the functions here are replaced at the bottom of this module with
+# versions that use the sqlalchemy.cpgtypes module.
 #
 
 # My best guess at the parsing rules of hstore literals, since no formal
@@ -448,3 +450,29 @@ def _serialize_hstore(val):
     return ", ".join(
         "%s=>%s" % (esc(k, "key"), esc(v, "value")) for k, v in val.items()
     )
+
+
+_py_parse_hstore = _parse_hstore
+_py_serialize_hstore = _serialize_hstore
+
+try:
+    from sqlalchemy.cpgtypes import parse_hstore as _c_parse_hstore
+    from sqlalchemy.cpgtypes import serialize_hstore as _c_serialize_hstore
+except ImportError:
+    pass
+else:
+
+    def _parse_hstore(hstore_str):
+        # the C parser accepts only well-formed output as produced by
+        # PG itself; anything else is handed to the Python parser, which
+        # also produces the detailed error message
+        try:
+            return _c_parse_hstore(hstore_str)
+        except ValueError:
+            return _py_parse_hstore(hstore_str)
+
+    def _serialize_hstore(val):
+        try:
+            return _c_serialize_hstore(val)
+        except ValueError:
+            return _py_serialize_hstore(val)
@@ -705,6 +705,14 @@ class PGDialect_psycopg2(PGDialect):
         self.executemany_batch_page_size = executemany_batch_page_size
         self.executemany_values_page_size = executemany_values_page_size
 
+        # psycopg2's execute_values() takes over INSERT executemany()
+        # unless "insertmanyvalues" was requested explicitly
+        if (
+            self.executemany_mode is EXECUTEMANY_VALUES
+            and "use_insertmanyvalues" not in self.__dict__
+        ):
+            self.use_insertmanyvalues = False
+
         if self.dbapi and hasattr(self.dbapi, "__version__"):
             m = re.match(r"(\d+)\.(\d+)(?:\.(\d+))?", self.dbapi.__version__)
             if m:
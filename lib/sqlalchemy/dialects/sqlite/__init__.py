@@ -5,6 +5,7 @@
 # This module is part of SQLAlchemy and is released under
 # the MIT License: http://www.opensource.org/licenses/mit-license.php
 
+from . import aiosqlite  # noqa
 from . import base  # noqa
 from . import pysqlcipher  # noqa
 from . import pysqlite  # noqa
@@ -24,6 +25,8 @@ from .base import TEXT
 from .base import TIME
 from .base import TIMESTAMP
 from .base import VARCHAR
+from .dml import Insert
+from .dml import insert
 
 
 # default dialect
@@ -47,5 +50,7 @@ __all__ = (
     "TIMESTAMP",
     "VARCHAR",
     "REAL",
+    "Insert",
+    "insert",
     "dialect",
 )
@@ -0,0 +1,305 @@
+# sqlite/aiosqlite.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+r"""
+
+.. dialect:: sqlite+aiosqlite
+    :name: aiosqlite
+    :dbapi: aiosqlite
+    :connectstring: sqlite+aiosqlite:///file_path
+    :url: https://pypi.org/project/aiosqlite/
+
+The aiosqlite dialect provides support for the SQLAlchemy asyncio interface
+running on top of pysqlite.
+
+aiosqlite is a wrapper around pysqlite that uses a background thread for
+each connection.   It does not actually use non-blocking IO, as SQLite
+databases are not socket-based.  However it does provide a working asyncio
+interface that's useful for testing and prototyping purposes.
+
+Using a special asyncio mediation layer, the aiosqlite dialect is usable
+as the backend for the :ref:`SQLAlchemy asyncio <asyncio_toplevel>`
+extension package.
+
+This dialect should normally be used only with the
+:func:`.create_async_engine` engine creation function::
+
+    from sqlalchemy.ext.asyncio import create_async_engine
+    engine = create_async_engine("sqlite+aiosqlite:///filename")
+
+The URL passes through all arguments to the ``pysqlite`` driver, so all
+connection arguments are the same as they are for that of :ref:`pysqlite`.
+
+.. versionadded:: 1.3.12
+
+"""  # noqa
+
+import collections
+
+from .base import SQLiteExecutionContext
+from .pysqlite import SQLiteDialect_pysqlite
+from ... import pool
+from ...util.concurrency import await_only
+
+
+class AsyncAdapt_aiosqlite_cursor(object):
+    """Adapt an aiosqlite cursor to the synchronous DBAPI cursor interface.
+
+    Rows are fully fetched from the driver when the statement is executed;
+    see :class:`.AsyncAdapt_aiosqlite_ss_cursor` for the streaming
+    version.
+
+    """
+
+    server_side = False
+
+    def __init__(self, adapt_connection):
+        self._adapt_connection = adapt_connection
+        self._connection = adapt_connection._connection
+        self.await_ = adapt_connection.await_
+        self.arraysize = 1
+        self.rowcount = -1
+        self.lastrowid = None
+        self.description = None
+        self._rows = collections.deque()
+        self._cursor = None
+
+    def close(self):
+        self._rows.clear()
+
+    def execute(self, operation, parameters=None):
+        _cursor = self.await_(self._connection.cursor())
+
+        try:
+            if parameters is None:
+                self.await_(_cursor.execute(operation))
+            else:
+                self.await_(_cursor.execute(operation, parameters))
+
+            if _cursor.description:
+                self.description = _cursor.description
+                self.lastrowid = self.rowcount = -1
+
+                if not self.server_side:
+                    self._rows = collections.deque(
+                        self.await_(_cursor.fetchall())
+                    )
+            else:
+                self.description = None
+                self.lastrowid = _cursor.lastrowid
+                self.rowcount = _cursor.rowcount
+        finally:
+            if self.server_side and self.description:
+                self._cursor = _cursor
+            else:
+                self.await_(_cursor.close())
+
+    def executemany(self, operation, seq_of_parameters):
+        _cursor = self.await_(self._connection.cursor())
+        try:
+            self.await_(_cursor.executemany(operation, seq_of_parameters))
+            self.description = None
+            self.lastrowid = _cursor.lastrowid
+            self.rowcount = _cursor.rowcount
+        finally:
+            self.await_(_cursor.close())
+
+    def setinputsizes(self, *inputsizes):
+        pass
+
+    def __iter__(self):
+        while self._rows:
+            yield self._rows.popleft()
+
+    def fetchone(self):
+        if self._rows:
+            return self._rows.popleft()
+        else:
+            return None
+
+    def fetchmany(self, size=None):
+        if size is None:
+            size = self.arraysize
+
+        rows = self._rows
+        return [rows.popleft() for _ in range(min(size, len(rows)))]
+
+    def fetchall(self):
+        retval = list(self._rows)
+        self._rows.clear()
+        return retval
+
+
+class AsyncAdapt_aiosqlite_ss_cursor(AsyncAdapt_aiosqlite_cursor):
+    """Adapt an aiosqlite cursor such that rows are fetched from the
+    driver as they are requested, used when the ``stream_results``
+    execution option is in effect.
+
+    """
+
+    server_side = True
+
+    def close(self):
+        if self._cursor is not None:
+            self.await_(self._cursor.close())
+            self._cursor = None
+
+    def __iter__(self):
+        while True:
+            row = self.fetchone()
+            if row is None:
+                break
+            yield row
+
+    def fetchone(self):
+        if self._cursor is None:
+            return None
+        return self.await_(self._cursor.fetchone())
+
+    def fetchmany(self, size=None):
+        if self._cursor is None:
+            return []
+        if size is None:
+            size = self.arraysize
+        return self.await_(self._cursor.fetchmany(size=size))
+
+    def fetchall(self):
+        if self._cursor is None:
+            return []
+        return self.await_(self._cursor.fetchall())
+
+
+class AsyncAdapt_aiosqlite_connection(object):
+    """Adapt an aiosqlite connection to the synchronous DBAPI connection
+    interface.
+
+    """
+
+    await_ = staticmethod(await_only)
+
+    def __init__(self, dbapi, connection):
+        self.dbapi = dbapi
+        self._connection = connection
+
+    @property
+    def isolation_level(self):
+        return self._connection.isolation_level
+
+    @isolation_level.setter
+    def isolation_level(self, value):
+        self._connection.isolation_level = value
+
+    def create_function(self, *args, **kw):
+        self.await_(self._connection.create_function(*args, **kw))
+
+    def cursor(self, server_side=False):
+        if server_side:
+            return AsyncAdapt_aiosqlite_ss_cursor(self)
+        else:
+            return AsyncAdapt_aiosqlite_cursor(self)
+
+    def execute(self, *args, **kw):
+        cursor = self.cursor()
+        cursor.execute(*args, **kw)
+        return cursor
+
+    def rollback(self):
+        self.await_(self._connection.rollback())
+
+    def commit(self):
+        self.await_(self._connection.commit())
+
+    def close(self):
+        self.await_(self._connection.close())
+
+
+class AsyncAdapt_aiosqlite_dbapi(object):
+    """Present the aiosqlite module as a synchronous DBAPI module.
+
+    Exception classes and module-level constants are those of pysqlite,
+    which aiosqlite passes through unchanged.
+
+    """
+
+    paramstyle = "qmark"
+
+    def __init__(self, aiosqlite, sqlite):
+        self.aiosqlite = aiosqlite
+        self.sqlite = sqlite
+        self._init_dbapi_attributes()
+
+    def _init_dbapi_attributes(self):
+        for name in (
+            "DatabaseError",
+            "DataError",
+            "Error",
+            "IntegrityError",
+            "InterfaceError",
+            "InternalError",
+            "NotSupportedError",
+            "OperationalError",
+            "ProgrammingError",
+            "Warning",
+            "Binary",
+            "PARSE_COLNAMES",
+            "PARSE_DECLTYPES",
+            "sqlite_version",
+            "sqlite_version_info",
+        ):
+            setattr(self, name, getattr(self.sqlite, name))
+
+    def connect(self, *arg, **kw):
+        connection = self.aiosqlite.connect(*arg, **kw)
+        return AsyncAdapt_aiosqlite_connection(self, await_only(connection))
+
+
+class AsyncAdapt_aiosqlite_static_pool(pool.StaticPool):
+    """A :class:`.StaticPool` which closes its connection when disposed,
+    ending the background thread of the aiosqlite connection."""
+
+    def dispose(self):
+        if (
+            "connection" in self.__dict__
+            and self.connection.connection is not None
+        ):
+            self.connection.close()
+            del self.__dict__["connection"]
+
+        super(AsyncAdapt_aiosqlite_static_pool, self).dispose()
+
+
+class SQLiteExecutionContext_aiosqlite(SQLiteExecutionContext):
+    def create_server_side_cursor(self):
+        return self._dbapi_connection.cursor(server_side=True)
+
+
+class SQLiteDialect_aiosqlite(SQLiteDialect_pysqlite):
+    driver = "aiosqlite"
+
+    is_async = True
+
+    supports_server_side_cursors = True
+    server_side_cursors = False
+
+    execution_ctx_cls = SQLiteExecutionContext_aiosqlite
+
+    @classmethod
+    def dbapi(cls):
+        import aiosqlite
+        import sqlite3
+
+        return AsyncAdapt_aiosqlite_dbapi(aiosqlite, sqlite3)
+
+    @classmethod
+    def get_pool_class(cls, url):
+        if url.database and url.database != ":memory:":
+            return pool.NullPool
+        else:
+            return AsyncAdapt_aiosqlite_static_pool
+
+
+dialect = SQLiteDialect_aiosqlite
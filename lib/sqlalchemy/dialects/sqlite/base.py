@@ -386,6 +386,68 @@ resolution algorithm is applied to the constraint itself::
         PRIMARY KEY (id) ON CONFLICT FAIL
     )
 
+.. _sqlite_on_conflict_insert:
+
+INSERT...ON CONFLICT (Upsert)
+------------------------------
+
+Starting with version 3.24.0, SQLite allows "upserts" (update or insert) of
+rows into a table via the ``ON CONFLICT`` clause of the ``INSERT`` statement.
+This is distinct from the ``ON CONFLICT`` clause applied to constraints
+in DDL described at :ref:`sqlite_on_conflict_ddl`.  A candidate row will
+only be inserted if that row does not violate any unique constraints.  In
+the case of a unique constraint violation, a secondary action can occur
+which can be either "DO UPDATE", indicating that the data in the target
+row should be updated, or "DO NOTHING", which indicates to silently skip
+this row.
+
+SQLAlchemy provides ``ON CONFLICT`` support via the SQLite-specific
+:func:`.sqlite.dml.insert()` function, which provides
+the generative methods :meth:`~.sqlite.dml.Insert.on_conflict_do_update`
+and :meth:`~.sqlite.dml.Insert.on_conflict_do_nothing`::
+
+    from sqlalchemy.dialects.sqlite import insert
+
+    insert_stmt = insert(my_table).values(
+        id='some_existing_id',
+        data='inserted value')
+
+    do_nothing_stmt = insert_stmt.on_conflict_do_nothing(
+        index_elements=['id']
+    )
+
+    conn.execute(do_nothing_stmt)
+
+    do_update_stmt = insert_stmt.on_conflict_do_update(
+        index_elements=['id'],
+        set_=dict(data=insert_stmt.excluded.data)
+    )
+
+    conn.execute(do_update_stmt)
+
+The conflict target is established by column inference only, using the
+:paramref:`~.sqlite.dml.Insert.on_conflict_do_update.index_elements`
+argument along with the optional
+:paramref:`~.sqlite.dml.Insert.on_conflict_do_update.index_where` argument
+to target a partial index; SQLite has no syntax to name a constraint
+directly.  The ``DO UPDATE`` form requires a target, while ``DO NOTHING``
+may omit it to skip rows conflicting with any unique constraint.
+
+The :attr:`~.sqlite.dml.Insert.excluded` namespace refers to the row
+proposed for insertion, and the
+:paramref:`~.sqlite.dml.Insert.on_conflict_do_update.where` argument
+limits which existing rows are updated, as with PostgreSQL.
+
+.. note::
+
+    SQLite's parser can't distinguish the ``ON`` keyword of an upsert
+    from a join condition when the ``INSERT`` is derived from a ``SELECT``
+    that has no ``WHERE`` clause; for :meth:`.Insert.from_select`
+    upserts, include a ``WHERE`` clause such as ``WHERE true`` in the
+    SELECT.
+
+.. versionadded:: 1.3.12
+
 .. _sqlite_type_reflection:
 
 Type Reflection
@@ -585,6 +647,7 @@ from ...engine import default
 from ...engine import reflection
 from ...sql import ColumnElement
 from ...sql import compiler
+from ...sql import elements
 from ...types import BLOB  # noqa
 from ...types import BOOLEAN  # noqa
 from ...types import CHAR  # noqa
@@ -1039,6 +1102,97 @@ class SQLiteCompiler(compiler.SQLCompiler):
             ", ".join("1" for type_ in element_types or [INTEGER()]),
         )
 
+    def _on_conflict_target(self, clause, **kw):
+        if clause.inferred_target_elements is not None:
+            target_text = "(%s)" % ", ".join(
+                (
+                    self.preparer.quote(c)
+                    if isinstance(c, util.string_types)
+                    else self.process(c, include_table=False, use_schema=False)
+                )
+                for c in clause.inferred_target_elements
+            )
+            if clause.inferred_target_whereclause is not None:
+                target_text += " WHERE %s" % self.process(
+                    clause.inferred_target_whereclause,
+                    include_table=False,
+                    use_schema=False,
+                    literal_binds=True,
+                )
+        else:
+            target_text = ""
+
+        return target_text
+
+    def visit_on_conflict_do_nothing(self, on_conflict, **kw):
+
+        target_text = self._on_conflict_target(on_conflict, **kw)
+
+        if target_text:
+            return "ON CONFLICT %s DO NOTHING" % target_text
+        else:
+            return "ON CONFLICT DO NOTHING"
+
+    def visit_on_conflict_do_update(self, on_conflict, **kw):
+        clause = on_conflict
+
+        target_text = self._on_conflict_target(on_conflict, **kw)
+
+        action_set_ops = []
+
+        set_parameters = dict(clause.update_values_to_set)
+        # create a list of column assignment clauses as tuples
+
+        insert_statement = self.stack[-1]["selectable"]
+        cols = insert_statement.table.c
+        for c in cols:
+            col_key = c.key
+            if col_key in set_parameters:
+                value = set_parameters.pop(col_key)
+                if elements._is_literal(value):
+                    value = elements.BindParameter(None, value, type_=c.type)
+
+                else:
+                    if (
+                        isinstance(value, elements.BindParameter)
+                        and value.type._isnull
+                    ):
+                        value = value._clone()
+                        value.type = c.type
+                value_text = self.process(value.self_group(), use_schema=False)
+
+                key_text = self.preparer.quote(c.name)
+                action_set_ops.append("%s = %s" % (key_text, value_text))
+
+        # check for names that don't match columns
+        if set_parameters:
+            util.warn(
+                "Additional column names not matching "
+                "any column keys in table '%s': %s"
+                % (
+                    self.statement.table.name,
+                    (", ".join("'%s'" % c for c in set_parameters)),
+                )
+            )
+            for k, v in set_parameters.items():
+                key_text = (
+                    self.preparer.quote(k)
+                    if isinstance(k, util.string_types)
+                    else self.process(k, use_schema=False)
+                )
+                value_text = self.process(
+                    elements._literal_as_binds(v), use_schema=False
+                )
+                action_set_ops.append("%s = %s" % (key_text, value_text))
+
+        action_text = ", ".join(action_set_ops)
+        if clause.update_whereclause is not None:
+            action_text += " WHERE %s" % self.process(
+                clause.update_whereclause, include_table=True, use_schema=False
+            )
+
+        return "ON CONFLICT %s DO UPDATE SET %s" % (target_text, action_text)
+
 
 class SQLiteDDLCompiler(compiler.DDLCompiler):
     def get_column_specification(self, column, **kwargs):
@@ -1407,6 +1561,8 @@ class SQLiteDialect(default.DefaultDialect):
     supports_empty_insert = False
     supports_cast = True
     supports_multivalues_insert = True
+    use_insertmanyvalues = True
+    insertmanyvalues_max_parameters = 999
     tuple_in_values = True
 
     default_paramstyle = "qmark"
@@ -1499,6 +1655,9 @@ class SQLiteDialect(default.DefaultDialect):
                 self.dbapi.sqlite_version_info
                 >= (3, 7, 11)
             )
+            if self.dbapi.sqlite_version_info >= (3, 32, 0):
+                # http://www.sqlite.org/limits.html#max_variable_number
+                self.insertmanyvalues_max_parameters = 32766
             # see http://www.sqlalchemy.org/trac/ticket/2568
             # as well as http://www.sqlite.org/src/info/600482d161
             self._broken_fk_pragma_quotes = self.dbapi.sqlite_version_info < (
@@ -1509,6 +1668,66 @@ class SQLiteDialect(default.DefaultDialect):
 
     _isolation_lookup = {"READ UNCOMMITTED": 1, "SERIALIZABLE": 0}
 
+    def _upsert_statement(self, table, index_elements, set_keys):
+        from .dml import insert
+
+        if self.dbapi is not None and self.dbapi.sqlite_version_info < (
+            3,
+            24,
+            0,
+        ):
+            raise NotImplementedError(
+                "INSERT..ON CONFLICT requires SQLite 3.24.0 or greater"
+            )
+
+        stmt = insert(table)
+        if set_keys:
+            return stmt.on_conflict_do_update(
+                index_elements=index_elements,
+                set_=dict((key, stmt.excluded[key]) for key in set_keys),
+            )
+        else:
+            return stmt.on_conflict_do_nothing(index_elements=index_elements)
+
+    def _json_partial_update(self, column, changes):
+        expr = column
+        for change in changes:
+            if change[0] == "append":
+                # the "$[#]" path is new in SQLite 3.31.0
+                if (
+                    self.dbapi is not None
+                    and self.dbapi.sqlite_version_info < (3, 31, 0)
+                ):
+                    return None
+                args = []
+                for value in change[1]:
+                    args.extend(
+                        [
+                            "$[#]",
+                            sql.func.json(sql.literal(value, column.type)),
+                        ]
+                    )
+                expr = sql.func.json_insert(expr, *args, type_=column.type)
+                continue
+
+            # SQLite's JSON paths have no escape for a quote in a label
+            if '"' in change[1]:
+                return None
+            path = '$."%s"' % change[1]
+            if change[0] == "set":
+                value = change[2]
+                if value is None:
+                    value = column.type.NULL
+                expr = sql.func.json_set(
+                    expr,
+                    path,
+                    sql.func.json(sql.literal(value, column.type)),
+                    type_=column.type,
+                )
+            else:
+                expr = sql.func.json_remove(expr, path, type_=column.type)
+        return expr
+
     def set_isolation_level(self, connection, level):
         try:
             isolation_level = self._isolation_lookup[level.replace("_", " ")]
@@ -1614,6 +1833,24 @@ class SQLiteDialect(default.DefaultDialect):
 
         return [row[0] for row in rs]
 
+    def get_table_versions(self, connection, schema=None, **kw):
+        # the CREATE statements of a table and its indexes change along
+        # with its definition
+        if schema is not None:
+            qschema = self.identifier_preparer.quote_identifier(schema)
+            master = "%s.sqlite_master" % qschema
+        else:
+            master = "sqlite_master"
+        s = (
+            "SELECT tbl_name, sql FROM %s "
+            "WHERE type IN ('table', 'view', 'index') "
+            "ORDER BY tbl_name, type DESC, name"
+        ) % (master,)
+        versions = util.defaultdict(tuple)
+        for tbl_name, sql_ in connection.execute(s):
+            versions[tbl_name] += (sql_,)
+        return dict(versions)
+
     @reflection.cache
     def get_view_definition(self, connection, view_name, schema=None, **kw):
         if schema is not None:
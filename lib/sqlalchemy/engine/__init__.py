@@ -269,6 +269,15 @@ def create_engine(*args, **kwargs):
         Microsoft SQL Server.   Set this to ``False`` to disable
         the automatic usage of RETURNING.
 
+    :param insertmanyvalues_page_size=1000: the maximum number of parameter
+        sets rendered into each INSERT statement when
+        :paramref:`.create_engine.use_insertmanyvalues` is in effect.  The
+        number of parameter sets per statement is further limited so that
+        the number of bound parameters does not exceed that which the
+        database accepts.
+
+        .. versionadded:: 1.3.12
+
     :param isolation_level: this string parameter is interpreted by various
         dialects in order to affect the transaction isolation level of the
         database connection.   The parameter essentially accepts some subset of
@@ -394,6 +403,27 @@ def create_engine(*args, **kwargs):
        "sqlalchemy.pool" logger. Defaults to a hexstring of the object's
        id.
 
+    :param pool_adjust_interval=60: number of seconds over which
+        :class:`.AdaptiveQueuePool` observes demand before shrinking its
+        target size.
+
+        .. versionadded:: 1.3.12
+
+    :param pool_idle_timeout=60: number of seconds that
+        :class:`.AdaptiveQueuePool` keeps connections beyond its target
+        size in the pool after they're returned.
+
+        .. versionadded:: 1.3.12
+
+        .. seealso::
+
+            :ref:`pool_adaptive`
+
+    :param pool_min_size=1: the smallest target size that
+        :class:`.AdaptiveQueuePool` will shrink to.
+
+        .. versionadded:: 1.3.12
+
     :param pool_pre_ping: boolean, if True will enable the connection pool
         "pre-ping" feature that tests connections for liveness upon
         each checkout.
@@ -458,6 +488,55 @@ def create_engine(*args, **kwargs):
 
         .. versionadded:: 1.2.3
 
+    :param query_cache_size=500: size of the cache used to store compiled
+        forms of SQL expression constructs, keyed on the structure of each
+        statement independent of its bound parameter values.  Statements
+        that can't produce a cache key, such as an :func:`.insert` given
+        literal values via :meth:`.ValuesBase.values`, are compiled on
+        each execution.  Set to zero or ``None`` to disable the cache.
+        The ``compiled_cache`` execution option, when present, takes
+        precedence; passing ``compiled_cache=None`` disables caching for
+        that connection or statement.
+
+        .. versionadded:: 1.3.12
+
+    :param statement_stats=False: if True, the :class:`.Engine` will
+        collect timing statistics for each distinct SQL statement it
+        executes, covering compilation, execution, fetching of rows and
+        ORM object loading, made available via
+        :attr:`.Engine.statement_stats`.
+
+        .. versionadded:: 1.3.12
+
+        .. seealso::
+
+            :ref:`engine_statement_stats`
+
+    :param statement_stats_size=500: the maximum number of distinct
+        statements for which :paramref:`.create_engine.statement_stats`
+        retains statistics; the least recently executed statements are
+        discarded beyond this size.
+
+        .. versionadded:: 1.3.12
+
+    :param use_insertmanyvalues: when ``True``, an INSERT statement
+        executed with a list of parameter sets, i.e. an "executemany", is
+        sent to the database as a series of INSERT statements which each
+        render a batch of the parameter sets inside of a multi-row VALUES
+        clause, rather than being passed to the DBAPI
+        ``cursor.executemany()`` method.  The statement is compiled once;
+        only its VALUES clause is repeated for each batch.  On backends
+        that support RETURNING, this allows the ORM to fetch server
+        generated defaults for many objects at once.  Defaults to
+        ``True`` for the SQLite, MySQL and PostgreSQL dialects; set to
+        ``False`` to use ``cursor.executemany()`` in all cases.
+
+        .. versionadded:: 1.3.12
+
+        .. seealso::
+
+            :paramref:`.create_engine.insertmanyvalues_page_size`
+
     :param strategy='plain': selects alternate engine implementations.
         Currently available are:
 
@@ -11,11 +11,13 @@ import sys
 
 from .interfaces import Connectable
 from .interfaces import ExceptionContext
+from .stats import StatementStats
 from .util import _distill_params
 from .. import exc
 from .. import interfaces
 from .. import log
 from .. import util
+from ..sql import dml
 from ..sql import schema
 from ..sql import util as sql_util
 
@@ -235,6 +237,16 @@ class Connection(Connectable):
           used by the ORM internally supersedes a cache dictionary
           specified here.
 
+          When this option is not present, the dialect-wide cache
+          configured by :paramref:`.create_engine.query_cache_size` is
+          used, which is keyed on the structure of each statement rather
+          than its identity.  Passing ``None`` disables compiled caching
+          altogether.
+
+          .. versionchanged:: 1.3.12 ``compiled_cache=None`` disables
+             caching; the dialect-level structural cache is used when
+             the option is not present.
+
         :param isolation_level: Available on: :class:`.Connection`.
 
           Set the transaction isolation level for the lifespan of this
@@ -1047,6 +1059,86 @@ class Connection(Connectable):
             self.dispatch.after_execute(self, ddl, multiparams, params, ret)
         return ret
 
+    def _compile_for_execution(self, dialect, elem, keys, inline):
+        """Return the compiled form of the given statement along with its
+        cache key, from the compiled cache if present."""
+
+        statement_stats = self.engine.statement_stats
+        compile_time = None
+
+        cache_key = None
+        if "compiled_cache" in self._execution_options:
+            compiled_cache = self._execution_options["compiled_cache"]
+            if compiled_cache is not None:
+                key = (
+                    dialect,
+                    elem,
+                    tuple(sorted(keys)),
+                    self.schema_for_object.hash_key,
+                    inline,
+                )
+                compiled_sql = compiled_cache.get(key)
+            else:
+                compiled_sql = None
+            if compiled_sql is None:
+                if statement_stats is not None:
+                    compile_time = util.perf_counter()
+                compiled_sql = elem.compile(
+                    dialect=dialect,
+                    column_keys=keys,
+                    inline=inline,
+                    schema_translate_map=self.schema_for_object
+                    if not self.schema_for_object.is_default
+                    else None,
+                )
+                if statement_stats is not None:
+                    compile_time = util.perf_counter() - compile_time
+                if compiled_cache is not None:
+                    compiled_cache[key] = compiled_sql
+        else:
+            compiled_cache = dialect._compiled_cache
+            if compiled_cache is not None:
+                cache_key = elem._generate_cache_key()
+
+            if cache_key is not None:
+                key = (
+                    cache_key.key,
+                    tuple(sorted(keys)),
+                    self.schema_for_object.hash_key,
+                    inline,
+                )
+                compiled_sql = compiled_cache.get(key)
+            else:
+                compiled_sql = None
+
+            if compiled_sql is None:
+                if statement_stats is not None:
+                    compile_time = util.perf_counter()
+                compiled_sql = elem.compile(
+                    dialect=dialect,
+                    column_keys=keys,
+                    inline=inline,
+                    schema_translate_map=self.schema_for_object
+                    if not self.schema_for_object.is_default
+                    else None,
+                )
+                if statement_stats is not None:
+                    compile_time = util.perf_counter() - compile_time
+                if (
+                    cache_key is not None
+                    and not compiled_sql._literal_binds_rendered
+                ):
+                    compiled_sql._cache_key = cache_key
+                    compiled_cache[key] = compiled_sql
+                else:
+                    cache_key = None
+
+        if statement_stats is not None:
+            statement_stats._entry(compiled_sql.string)._record_compile(
+                compile_time
+            )
+        return compiled_sql, cache_key
+
     def _execute_clauseelement(self, elem, multiparams, params):
         """Execute a sql.ClauseElement object."""
 
@@ -1063,33 +1155,29 @@ class Connection(Connectable):
             keys = []
 
         dialect = self.dialect
-        if "compiled_cache" in self._execution_options:
-            key = (
-                dialect,
-                elem,
-                tuple(sorted(keys)),
-                self.schema_for_object.hash_key,
-                len(distilled_params) > 1,
-            )
-            compiled_sql = self._execution_options["compiled_cache"].get(key)
-            if compiled_sql is None:
-                compiled_sql = elem.compile(
-                    dialect=dialect,
-                    column_keys=keys,
-                    inline=len(distilled_params) > 1,
-                    schema_translate_map=self.schema_for_object
-                    if not self.schema_for_object.is_default
-                    else None,
-                )
-                self._execution_options["compiled_cache"][key] = compiled_sql
-        else:
-            compiled_sql = elem.compile(
-                dialect=dialect,
-                column_keys=keys,
-                inline=len(distilled_params) > 1,
-                schema_translate_map=self.schema_for_object
-                if not self.schema_for_object.is_default
-                else None,
+
+        # an executemany() is compiled "inline", unless the dialect can
+        # deliver per-row RETURNING for return_defaults()
+        inline = len(distilled_params) > 1 and not (
+            dialect.insert_executemany_returning
+            and isinstance(elem, dml.Insert)
+            and elem._return_defaults
+        )
+
+        compiled_sql, cache_key = self._compile_for_execution(
+            dialect, elem, keys, inline
+        )
+
+        if (
+            len(distilled_params) > 1
+            and not inline
+            and not dialect._supports_insertmanyvalues(compiled_sql)
+        ):
+            # the statement can't be rendered as "insertmanyvalues", such
+            # as when it includes a CTE or an ON CONFLICT clause; it's
+            # instead passed to cursor.executemany() without RETURNING
+            compiled_sql, cache_key = self._compile_for_execution(
+                dialect, elem, keys, True
             )
 
         ret = self._execute_context(
@@ -1099,6 +1187,8 @@ class Connection(Connectable):
             distilled_params,
             compiled_sql,
             distilled_params,
+            elem,
+            cache_key,
         )
         if self._has_events or self.engine._has_events:
             self.dispatch.after_execute(self, elem, multiparams, params, ret)
@@ -1179,18 +1269,104 @@ class Connection(Connectable):
         if context.compiled:
             context.pre_exec()
 
-        cursor, statement, parameters = (
-            context.cursor,
-            context.statement,
-            context.parameters,
-        )
+        stats_entry = None
+        statement_stats = self.engine.statement_stats
+        if statement_stats is not None:
+            stats_entry = context._stats_entry = statement_stats._entry(
+                context.compiled.string
+                if context.compiled is not None
+                else context.statement
+            )
 
-        if not context.executemany:
-            parameters = parameters[0]
+        if context._insertmanyvalues:
+            if stats_entry is not None:
+                execute_time = util.perf_counter()
+            self._execute_insertmanyvalues(context)
+            if stats_entry is not None:
+                stats_entry._record_execute(
+                    util.perf_counter() - execute_time
+                )
+        else:
+            cursor, statement, parameters = (
+                context.cursor,
+                context.statement,
+                context.parameters,
+            )
 
-        if self._has_events or self.engine._has_events:
-            for fn in self.dispatch.before_cursor_execute:
-                statement, parameters = fn(
+            if not context.executemany:
+                parameters = parameters[0]
+
+            if self._has_events or self.engine._has_events:
+                for fn in self.dispatch.before_cursor_execute:
+                    statement, parameters = fn(
+                        self,
+                        cursor,
+                        statement,
+                        parameters,
+                        context,
+                        context.executemany,
+                    )
+
+            if self._echo:
+                self.engine.logger.info(statement)
+                if not self.engine.hide_parameters:
+                    self.engine.logger.info(
+                        "%r",
+                        sql_util._repr_params(
+                            parameters, batches=10, ismulti=context.executemany
+                        ),
+                    )
+                else:
+                    self.engine.logger.info(
+                        "[SQL parameters hidden due to hide_parameters=True]"
+                    )
+
+            if stats_entry is not None:
+                execute_time = util.perf_counter()
+            evt_handled = False
+            try:
+                if context.executemany:
+                    if self.dialect._has_events:
+                        for fn in self.dialect.dispatch.do_executemany:
+                            if fn(cursor, statement, parameters, context):
+                                evt_handled = True
+                                break
+                    if not evt_handled:
+                        self.dialect.do_executemany(
+                            cursor, statement, parameters, context
+                        )
+                elif not parameters and context.no_parameters:
+                    if self.dialect._has_events:
+                        for fn in self.dialect.dispatch.do_execute_no_params:
+                            if fn(cursor, statement, context):
+                                evt_handled = True
+                                break
+                    if not evt_handled:
+                        self.dialect.do_execute_no_params(
+                            cursor, statement, context
+                        )
+                else:
+                    if self.dialect._has_events:
+                        for fn in self.dialect.dispatch.do_execute:
+                            if fn(cursor, statement, parameters, context):
+                                evt_handled = True
+                                break
+                    if not evt_handled:
+                        self.dialect.do_execute(
+                            cursor, statement, parameters, context
+                        )
+            except BaseException as e:
+                self._handle_dbapi_exception(
+                    e, statement, parameters, cursor, context
+                )
+
+            if stats_entry is not None:
+                stats_entry._record_execute(
+                    util.perf_counter() - execute_time
+                )
+
+            if self._has_events or self.engine._has_events:
+                self.dispatch.after_cursor_execute(
                     self,
                     cursor,
                     statement,
@@ -1199,67 +1375,6 @@ class Connection(Connectable):
                     context.executemany,
                 )
 
-        if self._echo:
-            self.engine.logger.info(statement)
-            if not self.engine.hide_parameters:
-                self.engine.logger.info(
-                    "%r",
-                    sql_util._repr_params(
-                        parameters, batches=10, ismulti=context.executemany
-                    ),
-                )
-            else:
-                self.engine.logger.info(
-                    "[SQL parameters hidden due to hide_parameters=True]"
-                )
-
-        evt_handled = False
-        try:
-            if context.executemany:
-                if self.dialect._has_events:
-                    for fn in self.dialect.dispatch.do_executemany:
-                        if fn(cursor, statement, parameters, context):
-                            evt_handled = True
-                            break
-                if not evt_handled:
-                    self.dialect.do_executemany(
-                        cursor, statement, parameters, context
-                    )
-            elif not parameters and context.no_parameters:
-                if self.dialect._has_events:
-                    for fn in self.dialect.dispatch.do_execute_no_params:
-                        if fn(cursor, statement, context):
-                            evt_handled = True
-                            break
-                if not evt_handled:
-                    self.dialect.do_execute_no_params(
-                        cursor, statement, context
-                    )
-            else:
-                if self.dialect._has_events:
-                    for fn in self.dialect.dispatch.do_execute:
-                        if fn(cursor, statement, parameters, context):
-                            evt_handled = True
-                            break
-                if not evt_handled:
-                    self.dialect.do_execute(
-                        cursor, statement, parameters, context
-                    )
-        except BaseException as e:
-            self._handle_dbapi_exception(
-                e, statement, parameters, cursor, context
-            )
-
-        if self._has_events or self.engine._has_events:
-            self.dispatch.after_cursor_execute(
-                self,
-                cursor,
-                statement,
-                parameters,
-                context,
-                context.executemany,
-            )
-
         if context.compiled:
             context.post_exec()
 
@@ -1286,6 +1401,85 @@ class Connection(Connectable):
                 result._autoclose_connection = True
         return result
 
+    def _execute_insertmanyvalues(self, context):
+        """Execute an executemany() INSERT as a series of INSERT statements
+        which each render a batch of parameter sets inside of a multi-row
+        VALUES expression.
+
+        Each batch is executed individually using ``cursor.execute()``,
+        with the ``before_cursor_execute``, ``after_cursor_execute`` and
+        ``do_execute`` events invoked for each.  Rows returned by each batch
+        are collected in order and delivered by the execution context's
+        cursor.
+
+        """
+        cursor = context.cursor
+        batches = list(context._insertmanyvalues_batches())
+        num_batches = len(batches)
+
+        rows = []
+        description = None
+        rowcount = 0
+
+        for batchnum, (statement, parameters, num_rows) in enumerate(
+            batches, 1
+        ):
+            if self._has_events or self.engine._has_events:
+                for fn in self.dispatch.before_cursor_execute:
+                    statement, parameters = fn(
+                        self, cursor, statement, parameters, context, False
+                    )
+
+            if self._echo:
+                self.engine.logger.info(statement)
+                if not self.engine.hide_parameters:
+                    self.engine.logger.info(
+                        "[insertmanyvalues batch %d of %d] %r",
+                        batchnum,
+                        num_batches,
+                        sql_util._repr_params(parameters, batches=10),
+                    )
+                else:
+                    self.engine.logger.info(
+                        "[insertmanyvalues batch %d of %d] "
+                        "[SQL parameters hidden due to hide_parameters=True]",
+                        batchnum,
+                        num_batches,
+                    )
+
+            try:
+                for fn in (
+                    ()
+                    if not self.dialect._has_events
+                    else self.dialect.dispatch.do_execute
+                ):
+                    if fn(cursor, statement, parameters, context):
+                        break
+                else:
+                    self.dialect.do_execute(
+                        cursor, statement, parameters, context
+                    )
+
+                if cursor.description is not None:
+                    description = cursor.description
+                    rows.extend(cursor.fetchall())
+                elif cursor.rowcount is not None and cursor.rowcount >= 0:
+                    rowcount += cursor.rowcount
+            except BaseException as e:
+                self._handle_dbapi_exception(
+                    e, statement, parameters, cursor, context
+                )
+
+            if self._has_events or self.engine._has_events:
+                self.dispatch.after_cursor_execute(
+                    self, cursor, statement, parameters, context, False
+                )
+
+        if description is not None:
+            rowcount = len(rows)
+
+        context._set_insertmanyvalues_result(description, rows, rowcount)
+
     def _cursor_execute(self, cursor, statement, parameters, context=None):
         """Execute a statement + params on the given cursor.
 
@@ -1841,6 +2035,16 @@ class Engine(Connectable, log.Identified):
     _has_events = False
     _connection_cls = Connection
 
+    statement_stats = None
+    """The :class:`.StatementStats` collection of per-statement timing
+    statistics for this :class:`.Engine`, or ``None`` if not enabled.
+
+    Enabled using the :paramref:`.create_engine.statement_stats` parameter.
+
+    .. versionadded:: 1.3.12
+
+    """
+
     schema_for_object = schema._schema_getter(None)
     """Return the ".schema" attribute for an object.
 
@@ -1867,6 +2071,8 @@ class Engine(Connectable, log.Identified):
         proxy=None,
         execution_options=None,
         hide_parameters=False,
+        statement_stats=False,
+        statement_stats_size=500,
     ):
         self.pool = pool
         self.url = url
@@ -1875,6 +2081,8 @@ class Engine(Connectable, log.Identified):
             self.logging_name = logging_name
         self.echo = echo
         self.hide_parameters = hide_parameters
+        if statement_stats:
+            self.statement_stats = StatementStats(statement_stats_size)
         log.instance_logger(self, echoflag=echo)
         if proxy:
             interfaces.ConnectionProxy._adapt_listener(self, proxy)
@@ -2318,6 +2526,7 @@ class OptionEngine(Engine):
         self.logging_name = proxied.logging_name
         self.echo = proxied.echo
         self.hide_parameters = proxied.hide_parameters
+        self.statement_stats = proxied.statement_stats
         log.instance_logger(self, echoflag=self.echo)
 
         # note: this will propagate events that are assigned to the parent
@@ -14,6 +14,8 @@ as the base class for their own corresponding classes.
 """
 
 import codecs
+import collections
+import itertools
 import random
 import re
 import weakref
@@ -129,8 +131,55 @@ class DefaultDialect(interfaces.Dialect):
     supports_empty_insert = True
     supports_multivalues_insert = False
 
+    use_insertmanyvalues = False
+    """True if an executemany() of an INSERT statement should be rendered
+    as a series of INSERT statements that each include many rows inside
+    of a multi-row VALUES expression, rather than being passed to the
+    DBAPI ``cursor.executemany()`` method.
+
+    The statement is compiled once; the multi-row VALUES expression is
+    generated from the compiled single-row expression for each batch of
+    parameter sets.  When the dialect additionally supports RETURNING,
+    rows returned by each batch are collected, which the ORM makes use
+    of in order to fetch server-generated defaults for many objects at
+    once.
+
+    May be set using the :paramref:`.create_engine.use_insertmanyvalues`
+    parameter.
+
+    .. versionadded:: 1.3.12
+
+    """
+
+    insertmanyvalues_page_size = 1000
+    """The maximum number of parameter sets rendered into a single
+    multi-row INSERT statement when :attr:`.use_insertmanyvalues` is in
+    effect.
+
+    .. versionadded:: 1.3.12
+
+    """
+
+    insertmanyvalues_max_parameters = 32700
+    """The maximum number of bound parameters the database accepts in a
+    single statement; limits the number of parameter sets rendered into a
+    single multi-row INSERT statement when :attr:`.use_insertmanyvalues` is
+    in effect.
+
+    .. versionadded:: 1.3.12
+
+    """
+
     supports_server_side_cursors = False
 
+    is_async = False
+    """True if this dialect makes use of an asyncio DBAPI, which is adapted
+    to a synchronous interface by way of :mod:`sqlalchemy.ext.asyncio`.
+
+    .. versionadded:: 1.3.12
+
+    """
+
     server_version_info = None
 
     construct_arguments = None
@@ -210,6 +259,9 @@ class DefaultDialect(interfaces.Dialect):
         empty_in_strategy="static",
         max_identifier_length=None,
         label_length=None,
+        query_cache_size=500,
+        use_insertmanyvalues=None,
+        insertmanyvalues_page_size=None,
         **kwargs
     ):
 
@@ -260,6 +312,20 @@ class DefaultDialect(interfaces.Dialect):
             )
         self.label_length = label_length
 
+        if query_cache_size:
+            self._compiled_cache = util.LRUCache(query_cache_size)
+        else:
+            self._compiled_cache = None
+
+        if use_insertmanyvalues is not None:
+            self.use_insertmanyvalues = use_insertmanyvalues
+        if insertmanyvalues_page_size is not None:
+            if insertmanyvalues_page_size < 1:
+                raise exc.ArgumentError(
+                    "insertmanyvalues_page_size must be a positive integer"
+                )
+            self.insertmanyvalues_page_size = insertmanyvalues_page_size
+
         if self.description_encoding == "use_encoding":
             self._description_decoder = (
                 processors.to_unicode_processor_factory
@@ -283,9 +349,28 @@ class DefaultDialect(interfaces.Dialect):
     def supports_sane_rowcount_returning(self):
         return self.supports_sane_rowcount
 
+    @property
+    def insert_executemany_returning(self):
+        """True if an executemany() of an INSERT statement may make use of
+        RETURNING, delivering the returned rows of each parameter set in
+        order.
+
+        .. versionadded:: 1.3.12
+
+        """
+        return bool(
+            self.use_insertmanyvalues
+            and self.supports_multivalues_insert
+            and self.implicit_returning
+        )
+
     @classmethod
     def get_pool_class(cls, url):
-        return getattr(cls, "poolclass", pool.QueuePool)
+        if cls.is_async:
+            default = pool.AsyncAdaptedQueuePool
+        else:
+            default = pool.QueuePool
+        return getattr(cls, "poolclass", default)
 
     def initialize(self, connection):
         try:
@@ -453,13 +538,99 @@ class DefaultDialect(interfaces.Dialect):
         include_columns,
         exclude_columns,
         resolve_fks,
+        _inspector=None,
         **opts
     ):
-        insp = reflection.Inspector.from_engine(connection)
+        if _inspector is not None:
+            insp = _inspector
+        else:
+            insp = reflection.Inspector.from_engine(connection)
         return insp.reflecttable(
             table, include_columns, exclude_columns, resolve_fks, **opts
         )
 
+    def _get_multi(self, fn, connection, schema, filter_names, **kw):
+        """Produce the result of a ``get_multi_*()`` reflection method by
+        calling the given single-table method for each table."""
+
+        if filter_names is None:
+            filter_names = self.get_table_names(
+                connection, schema, info_cache=kw.get("info_cache")
+            )
+        result = {}
+        for table_name in filter_names:
+            try:
+                result[table_name] = fn(
+                    connection, table_name, schema=schema, **kw
+                )
+            except exc.NoSuchTableError:
+                pass
+        return result
+
+    def get_multi_columns(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        result = self._get_multi(
+            self.get_columns, connection, schema, filter_names, **kw
+        )
+        # some dialects return no columns for a nonexistent table
+        # rather than raising
+        return dict(
+            (table_name, columns)
+            for table_name, columns in result.items()
+            if columns
+        )
+
+    def get_multi_pk_constraint(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._get_multi(
+            self.get_pk_constraint, connection, schema, filter_names, **kw
+        )
+
+    def get_multi_foreign_keys(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._get_multi(
+            self.get_foreign_keys, connection, schema, filter_names, **kw
+        )
+
+    def get_multi_indexes(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._get_multi(
+            self.get_indexes, connection, schema, filter_names, **kw
+        )
+
+    def get_multi_unique_constraints(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._get_multi(
+            self.get_unique_constraints,
+            connection,
+            schema,
+            filter_names,
+            **kw
+        )
+
+    def get_multi_check_constraints(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._get_multi(
+            self.get_check_constraints,
+            connection,
+            schema,
+            filter_names,
+            **kw
+        )
+
+    def get_multi_table_comment(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._get_multi(
+            self.get_table_comment, connection, schema, filter_names, **kw
+        )
+
     def get_pk_constraint(self, conn, table_name, schema=None, **kw):
         """Compatibility method, adapts the result of get_primary_keys()
         for those dialects which don't implement get_pk_constraint().
@@ -536,6 +707,49 @@ class DefaultDialect(interfaces.Dialect):
     def do_close(self, dbapi_connection):
         dbapi_connection.close()
 
+    def _upsert_statement(self, table, index_elements, set_keys):
+        """Return an INSERT construct for ``table`` which updates the
+        columns named by ``set_keys`` when a row matching
+        ``index_elements`` already exists.
+
+        Used by :meth:`.Session.bulk_merge_mappings`.
+
+        """
+        raise NotImplementedError(
+            "The %s dialect does not support bulk upserts" % self.name
+        )
+
+    def _json_partial_update(self, column, changes):
+        """Return a SQL expression which applies ``changes`` to the
+        current value of the JSON ``column`` in place, or None if the
+        full value should be written instead.
+
+        ``changes`` is a list of ``("set", key, value)``,
+        ``("delete", key)`` and ``("append", values)`` tuples, as
+        recorded by the :mod:`sqlalchemy.ext.mutable` JSON containers.
+
+        """
+        return None
+
+    def _supports_insertmanyvalues(self, compiled):
+        """Return True if an executemany() of the given compiled INSERT
+        statement may be rendered as "insertmanyvalues"."""
+
+        imv = compiled._insertmanyvalues
+        return (
+            imv is not None
+            and self.use_insertmanyvalues
+            and self.supports_multivalues_insert
+            and self.supports_unicode_statements
+            and (not compiled.returning or self.insert_executemany_returning)
+            # a dialect-specific compiler may have rendered additional
+            # text around that of the INSERT itself
+            and compiled.string
+            == imv.statement_prefix
+            + imv.single_values_expr
+            + imv.statement_suffix
+        )
+
     @util.memoized_property
     def _dialect_specific_select_one(self):
         return str(expression.select([1]).compile(dialect=self))
@@ -661,6 +875,43 @@ class StrCompileDialect(DefaultDialect):
     supports_simple_order_by_label = True
 
 
+class _InsertManyValuesCursor(object):
+    """Present the rows returned by each batch of an "insertmanyvalues"
+    execution as those of a single DBAPI cursor.
+
+    """
+
+    def __init__(self, cursor, description, rows, rowcount):
+        self.cursor = cursor
+        self.description = description
+        self.rowcount = rowcount
+        self._rows = collections.deque(rows)
+
+    def fetchone(self):
+        if self._rows:
+            return self._rows.popleft()
+        else:
+            return None
+
+    def fetchmany(self, size=None):
+        if size is None:
+            size = self.cursor.arraysize
+        rows = self._rows
+        return [rows.popleft() for _ in range(min(size, len(rows)))]
+
+    def fetchall(self):
+        retval = list(self._rows)
+        self._rows.clear()
+        return retval
+
+    def close(self):
+        self._rows.clear()
+        self.cursor.close()
+
+    def __getattr__(self, key):
+        return getattr(self.cursor, key)
+
+
 class DefaultExecutionContext(interfaces.ExecutionContext):
     isinsert = False
     isupdate = False
@@ -671,10 +922,14 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
     executemany = False
     compiled = None
     statement = None
+    invoked_statement = None
     result_column_struct = None
     returned_defaults = None
+    _returned_defaults_rows = None
     _is_implicit_returning = False
     _is_explicit_returning = False
+    _insertmanyvalues = False
+    _stats_entry = None
 
     # a hook for SQLite's translation of
     # result column names
@@ -717,7 +972,14 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
     @classmethod
     def _init_compiled(
-        cls, dialect, connection, dbapi_connection, compiled, parameters
+        cls,
+        dialect,
+        connection,
+        dbapi_connection,
+        compiled,
+        parameters,
+        invoked_statement=None,
+        cache_key=None,
     ):
         """Initialize execution context for a Compiled construct."""
 
@@ -727,6 +989,18 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         self.dialect = connection.dialect
 
         self.compiled = compiled
+        if invoked_statement is not None:
+            self.invoked_statement = invoked_statement
+        else:
+            self.invoked_statement = compiled.statement
+
+        # a Compiled retrieved from the dialect-level cache was generated
+        # from a different statement than the one being executed; bound
+        # values and result columns are taken from the invoked statement
+        if cache_key is not None and cache_key is not compiled._cache_key:
+            extracted_parameters = cache_key.bindparams
+        else:
+            extracted_parameters = None
 
         # this should be caught in the engine before
         # we get here
@@ -736,8 +1010,13 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
             connection._execution_options
         )
 
+        if extracted_parameters is not None:
+            result_columns = compiled._result_columns_for_cache_key(cache_key)
+        else:
+            result_columns = compiled._result_columns
+
         self.result_column_struct = (
-            compiled._result_columns,
+            result_columns,
             compiled._ordered_columns,
             compiled._textual_ordered_columns,
         )
@@ -756,10 +1035,18 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         self.is_text = compiled.isplaintext
 
         if not parameters:
-            self.compiled_parameters = [compiled.construct_params()]
+            self.compiled_parameters = [
+                compiled.construct_params(
+                    extracted_parameters=extracted_parameters
+                )
+            ]
         else:
             self.compiled_parameters = [
-                compiled.construct_params(m, _group_number=grp)
+                compiled.construct_params(
+                    m,
+                    _group_number=grp,
+                    extracted_parameters=extracted_parameters,
+                )
                 for grp, m in enumerate(parameters)
             ]
 
@@ -829,8 +1116,75 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
         self.parameters = dialect.execute_sequence_format(parameters)
 
+        if self.executemany:
+            self._insertmanyvalues = dialect._supports_insertmanyvalues(
+                compiled
+            )
+
+        if (
+            self.executemany
+            and self._is_implicit_returning
+            and not self._insertmanyvalues
+        ):
+            raise exc.InvalidRequestError(
+                "Statement %r can't deliver rows from RETURNING for "
+                "executemany() as it can't be rendered using "
+                "\"insertmanyvalues\"" % self.unicode_statement
+            )
+
         return self
 
+    def _insertmanyvalues_batches(self):
+        """Yield tuples of ``(statement, parameters, num_rows)``, each
+        consisting of an INSERT statement which renders a batch of the
+        parameter sets of this executemany() inside of a multi-row VALUES
+        expression, along with the parameters for that statement.
+
+        """
+        imv = self.compiled._insertmanyvalues
+        dialect = self.dialect
+        positional = self.compiled.positional
+
+        batch_size = max(
+            1,
+            min(
+                dialect.insertmanyvalues_page_size,
+                dialect.insertmanyvalues_max_parameters
+                // max(1, len(imv.bind_names)),
+            ),
+        )
+
+        all_parameters = self.parameters
+        for start in range(0, len(all_parameters), batch_size):
+            batch = all_parameters[start : start + batch_size]
+
+            if positional:
+                values_expr = ", ".join([imv.single_values_expr] * len(batch))
+                parameters = dialect.execute_sequence_format(
+                    itertools.chain.from_iterable(batch)
+                )
+            else:
+                exprs = []
+                parameters = {}
+                for idx, row in enumerate(batch):
+                    suffix = "__%d" % idx
+                    exprs.append(suffix.join(imv.values_template_parts))
+                    parameters.update(
+                        (key + suffix, value) for key, value in row.items()
+                    )
+                values_expr = ", ".join(exprs)
+
+            yield (
+                imv.statement_prefix + values_expr + imv.statement_suffix,
+                parameters,
+                len(batch),
+            )
+
+    def _set_insertmanyvalues_result(self, description, rows, rowcount):
+        self.cursor = _InsertManyValuesCursor(
+            self.cursor, description, rows, rowcount
+        )
+
     def _expand_in_parameters(self, compiled, processors):
         """handle special 'expanding' parameters, IN tuples that are rendered
         on a per-parameter basis for an otherwise fixed SQL statement string.
@@ -1204,9 +1558,14 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
         if self.isinsert:
             if self._is_implicit_returning:
-                row = result.fetchone()
-                self.returned_defaults = row
-                self._setup_ins_pk_from_implicit_returning(row)
+                if not self.executemany:
+                    row = result.fetchone()
+                    self.returned_defaults = row
+                    self._setup_ins_pk_from_implicit_returning(row)
+                elif self._insertmanyvalues:
+                    # rows aren't necessarily in the order of the
+                    # parameter sets
+                    self._returned_defaults_rows = result.fetchall()
                 result._soft_close()
                 result._metadata = None
             elif not self._is_explicit_returning:
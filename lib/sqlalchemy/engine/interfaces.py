@@ -430,6 +430,127 @@ class Dialect(object):
 
         raise NotImplementedError()
 
+    def get_multi_columns(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about columns in all tables in the given
+        `schema`.
+
+        Given a :class:`.Connection`, an optional string `schema` and an
+        optional sequence of table names `filter_names`, return a
+        dictionary mapping each table name to a list of column
+        dictionaries, in the same format as :meth:`.Dialect.get_columns`.
+        If `filter_names` is given, only the named tables are included;
+        names which don't refer to a table are omitted from the result,
+        and may or may not be omitted by the other ``get_multi_*()``
+        methods.
+
+        Dialects may implement this and the other ``get_multi_*()`` methods
+        using a single catalog query for all tables; the default
+        implementation calls the corresponding single-table method once for
+        each table.
+
+        .. versionadded:: 1.3.12
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_pk_constraint(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about the primary key constraints of all tables
+        in the given `schema`, as a dictionary of table names to the
+        result of :meth:`.Dialect.get_pk_constraint`.
+
+        .. versionadded:: 1.3.12
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_foreign_keys(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about the foreign keys of all tables in the
+        given `schema`, as a dictionary of table names to the result of
+        :meth:`.Dialect.get_foreign_keys`.
+
+        .. versionadded:: 1.3.12
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_indexes(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about the indexes of all tables in the
+        given `schema`, as a dictionary of table names to the result of
+        :meth:`.Dialect.get_indexes`.
+
+        .. versionadded:: 1.3.12
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_unique_constraints(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about the unique constraints of all tables in
+        the given `schema`, as a dictionary of table names to the result of
+        :meth:`.Dialect.get_unique_constraints`.
+
+        .. versionadded:: 1.3.12
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_check_constraints(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about the check constraints of all tables in
+        the given `schema`, as a dictionary of table names to the result of
+        :meth:`.Dialect.get_check_constraints`.
+
+        .. versionadded:: 1.3.12
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_table_comment(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return the comments of all tables in the given `schema`, as a
+        dictionary of table names to the result of
+        :meth:`.Dialect.get_table_comment`.
+
+        .. versionadded:: 1.3.12
+
+        """
+
+        raise NotImplementedError()
+
+    def get_table_versions(self, connection, schema=None, **kw):
+        """Return a version token for each table in the given `schema`.
+
+        Given a :class:`.Connection` and an optional string `schema`, return
+        a dictionary mapping table names to a picklable value which changes
+        whenever the definition of the table, including its columns,
+        constraints, indexes and comment, is altered.   The tokens are used
+        to determine which tables need to be reflected again when using a
+        :class:`.ReflectionCache`; a dialect that can't determine them raises
+        ``NotImplementedError``.
+
+        .. versionadded:: 1.3.12
+
+        """
+
+        raise NotImplementedError()
+
     def normalize_name(self, name):
         """convert the given name to lowercase if it is detected as
         case insensitive.
@@ -25,6 +25,11 @@ methods such as get_table_names, get_columns, etc.
    'name' attribute..
 """
 
+import hashlib
+import os
+import sys
+import tempfile
+
 from .base import Connectable
 from .. import exc
 from .. import inspection
@@ -108,6 +113,7 @@ class Inspector(object):
 
         self.dialect = self.engine.dialect
         self.info_cache = {}
+        self._prefetched = {}
 
     @classmethod
     def from_engine(cls, bind):
@@ -365,15 +371,22 @@ class Inspector(object):
 
         """
 
+        col_defs = self._get_prefetched("columns", table_name, schema, kw)
+        if col_defs is not None:
+            return col_defs
+
         col_defs = self.dialect.get_columns(
             self.bind, table_name, schema, info_cache=self.info_cache, **kw
         )
+        self._instantiate_types(col_defs)
+        return col_defs
+
+    def _instantiate_types(self, col_defs):
         for col_def in col_defs:
             # make this easy and only return instances for coltype
             coltype = col_def["type"]
             if not isinstance(coltype, TypeEngine):
                 col_def["type"] = coltype()
-        return col_defs
 
     @deprecated(
         "0.7",
@@ -412,6 +425,12 @@ class Inspector(object):
          use :class:`.quoted_name`.
 
         """
+        prefetched = self._get_prefetched(
+            "pk_constraint", table_name, schema, kw
+        )
+        if prefetched is not None:
+            return prefetched
+
         return self.dialect.get_pk_constraint(
             self.bind, table_name, schema, info_cache=self.info_cache, **kw
         )
@@ -447,6 +466,12 @@ class Inspector(object):
 
         """
 
+        prefetched = self._get_prefetched(
+            "foreign_keys", table_name, schema, kw
+        )
+        if prefetched is not None:
+            return prefetched
+
         return self.dialect.get_foreign_keys(
             self.bind, table_name, schema, info_cache=self.info_cache, **kw
         )
@@ -487,6 +512,12 @@ class Inspector(object):
 
         """
 
+        prefetched = self._get_prefetched(
+            "indexes", table_name, schema, kw
+        )
+        if prefetched is not None:
+            return prefetched
+
         return self.dialect.get_indexes(
             self.bind, table_name, schema, info_cache=self.info_cache, **kw
         )
@@ -512,6 +543,12 @@ class Inspector(object):
 
         """
 
+        prefetched = self._get_prefetched(
+            "unique_constraints", table_name, schema, kw
+        )
+        if prefetched is not None:
+            return prefetched
+
         return self.dialect.get_unique_constraints(
             self.bind, table_name, schema, info_cache=self.info_cache, **kw
         )
@@ -532,6 +569,12 @@ class Inspector(object):
 
         """
 
+        prefetched = self._get_prefetched(
+            "table_comment", table_name, schema, kw
+        )
+        if prefetched is not None:
+            return prefetched
+
         return self.dialect.get_table_comment(
             self.bind, table_name, schema, info_cache=self.info_cache, **kw
         )
@@ -565,10 +608,363 @@ class Inspector(object):
 
         """
 
+        prefetched = self._get_prefetched(
+            "check_constraints", table_name, schema, kw
+        )
+        if prefetched is not None:
+            return prefetched
+
         return self.dialect.get_check_constraints(
             self.bind, table_name, schema, info_cache=self.info_cache, **kw
         )
 
+    def get_multi_columns(self, schema=None, filter_names=None, **kw):
+        """Return information about columns in all tables in `schema`.
+
+        Returns a dictionary mapping each table name to a list of column
+        dictionaries, in the same format as :meth:`.Inspector.get_columns`.
+        Dialects which support it, such as PostgreSQL, retrieve this
+        information for all tables using a single catalog query.
+
+        :param schema: string schema name; if omitted, uses the default schema
+         of the database connection.  For special quoting,
+         use :class:`.quoted_name`.
+
+        :param filter_names: optional sequence of table names; if given,
+         only the named tables are included.   Names which don't refer to
+         a table are omitted from the result, and may or may not be omitted
+         by the other ``get_multi_*()`` methods.
+
+        .. versionadded:: 1.3.12
+
+        """
+
+        result = self.dialect.get_multi_columns(
+            self.bind,
+            schema=schema,
+            filter_names=filter_names,
+            info_cache=self.info_cache,
+            **kw
+        )
+        for col_defs in result.values():
+            self._instantiate_types(col_defs)
+        return result
+
+    def get_multi_pk_constraint(self, schema=None, filter_names=None, **kw):
+        """Return information about the primary key constraints of all
+        tables in `schema`, as a dictionary mapping each table name to
+        the result of :meth:`.Inspector.get_pk_constraint`.
+
+        See :meth:`.Inspector.get_multi_columns` for a description of the
+        parameters.
+
+        .. versionadded:: 1.3.12
+
+        """
+
+        return self.dialect.get_multi_pk_constraint(
+            self.bind,
+            schema=schema,
+            filter_names=filter_names,
+            info_cache=self.info_cache,
+            **kw
+        )
+
+    def get_multi_foreign_keys(self, schema=None, filter_names=None, **kw):
+        """Return information about the foreign keys of all tables in
+        `schema`, as a dictionary mapping each table name to the result of
+        :meth:`.Inspector.get_foreign_keys`.
+
+        See :meth:`.Inspector.get_multi_columns` for a description of the
+        parameters.
+
+        .. versionadded:: 1.3.12
+
+        """
+
+        return self.dialect.get_multi_foreign_keys(
+            self.bind,
+            schema=schema,
+            filter_names=filter_names,
+            info_cache=self.info_cache,
+            **kw
+        )
+
+    def get_multi_indexes(self, schema=None, filter_names=None, **kw):
+        """Return information about the indexes of all tables in `schema`,
+        as a dictionary mapping each table name to the result of
+        :meth:`.Inspector.get_indexes`.
+
+        See :meth:`.Inspector.get_multi_columns` for a description of the
+        parameters.
+
+        .. versionadded:: 1.3.12
+
+        """
+
+        return self.dialect.get_multi_indexes(
+            self.bind,
+            schema=schema,
+            filter_names=filter_names,
+            info_cache=self.info_cache,
+            **kw
+        )
+
+    def get_multi_unique_constraints(
+        self, schema=None, filter_names=None, **kw
+    ):
+        """Return information about the unique constraints of all tables in
+        `schema`, as a dictionary mapping each table name to the result of
+        :meth:`.Inspector.get_unique_constraints`.
+
+        See :meth:`.Inspector.get_multi_columns` for a description of the
+        parameters.
+
+        .. versionadded:: 1.3.12
+
+        """
+
+        return self.dialect.get_multi_unique_constraints(
+            self.bind,
+            schema=schema,
+            filter_names=filter_names,
+            info_cache=self.info_cache,
+            **kw
+        )
+
+    def get_multi_check_constraints(
+        self, schema=None, filter_names=None, **kw
+    ):
+        """Return information about the check constraints of all tables in
+        `schema`, as a dictionary mapping each table name to the result of
+        :meth:`.Inspector.get_check_constraints`.
+
+        See :meth:`.Inspector.get_multi_columns` for a description of the
+        parameters.
+
+        .. versionadded:: 1.3.12
+
+        """
+
+        return self.dialect.get_multi_check_constraints(
+            self.bind,
+            schema=schema,
+            filter_names=filter_names,
+            info_cache=self.info_cache,
+            **kw
+        )
+
+    def get_multi_table_comment(self, schema=None, filter_names=None, **kw):
+        """Return the comments of all tables in `schema`, as a dictionary
+        mapping each table name to the result of
+        :meth:`.Inspector.get_table_comment`.
+
+        See :meth:`.Inspector.get_multi_columns` for a description of the
+        parameters.
+
+        .. versionadded:: 1.3.12
+
+        """
+
+        return self.dialect.get_multi_table_comment(
+            self.bind,
+            schema=schema,
+            filter_names=filter_names,
+            info_cache=self.info_cache,
+            **kw
+        )
+
+    def get_table_versions(self, schema=None, **kw):
+        """Return a dictionary mapping each table in `schema` to a token
+        which changes whenever the table's definition is altered.
+
+        The tokens are fetched from the database on each call.   Raises
+        ``NotImplementedError`` for dialects that don't support them;
+        currently PostgreSQL and SQLite do.
+
+        .. versionadded:: 1.3.12
+
+        .. seealso::
+
+            :class:`.ReflectionCache`
+
+        """
+
+        return self.dialect.get_table_versions(self.bind, schema, **kw)
+
+    # reflection information retrieved by prefetch(); the flag indicates
+    # if reflecttable() passes the Table's dialect keyword arguments
+    # when retrieving it
+    _prefetch_kinds = (
+        ("columns", True),
+        ("pk_constraint", True),
+        ("foreign_keys", True),
+        ("indexes", False),
+        ("unique_constraints", False),
+        ("check_constraints", False),
+        ("table_comment", False),
+    )
+
+    def prefetch(
+        self,
+        table_names=None,
+        schema=None,
+        cache=None,
+        max_workers=None,
+        **kw
+    ):
+        r"""Retrieve reflection information for many tables at once.
+
+        The columns, constraints, indexes and comments of the given tables
+        are retrieved using the ``get_multi_*()`` methods, and are
+        subsequently returned by :meth:`.Inspector.reflecttable` as well
+        as the single-table methods of this :class:`.Inspector`, when
+        called for the same schema and keyword arguments, without
+        further queries.   :meth:`.MetaData.reflect` makes use of this
+        method.
+
+        :param table_names: sequence of table names; defaults to all tables
+         in the schema.
+
+        :param schema: string schema name; if omitted, uses the default schema
+         of the database connection.
+
+        :param cache: optional :class:`.ReflectionCache`; tables which are
+         unchanged since they were stored in the cache, as determined by
+         :meth:`.Inspector.get_table_versions`, are loaded from the cache
+         instead of the database.
+
+        :param max_workers: if greater than one, the tables are divided
+         among this many threads, each of which retrieves information
+         using its own connection checked out from the
+         :class:`.Engine`'s connection pool.   The pool should allow for
+         this many connections at once.   As these connections are separate
+         from the one in use by this :class:`.Inspector`, this can't be
+         used to reflect tables created in an uncommitted transaction, nor
+         with databases local to a single connection such as an in-memory
+         SQLite database.
+
+        :param \**kw: dialect-specific keyword arguments, passed in the
+         same way as :meth:`.Inspector.reflecttable` passes the
+         :attr:`.Table.dialect_kwargs` of the :class:`.Table` being
+         reflected.
+
+        .. versionadded:: 1.3.12
+
+        """
+
+        if table_names is None:
+            table_names = self.get_table_names(schema)
+        table_names = list(table_names)
+
+        versions = None
+        cached = {}
+        if cache is not None:
+            try:
+                versions = self.get_table_versions(schema)
+            except NotImplementedError:
+                pass
+            else:
+                cached = dict(
+                    (name, entry)
+                    for name, entry in cache.load(self, schema, kw).items()
+                    if versions.get(name) == entry[0]
+                )
+
+        to_fetch = []
+        for name in table_names:
+            if name in cached:
+                self._prefetched[(schema, name)] = (kw, cached[name][1])
+            else:
+                to_fetch.append(name)
+
+        if not to_fetch:
+            return
+
+        if max_workers is not None and max_workers > 1:
+            fetched = self._fetch_multi_parallel(
+                to_fetch, schema, max_workers, kw
+            )
+        else:
+            fetched = self._fetch_multi(to_fetch, schema, kw)
+
+        for name, info in fetched.items():
+            self._prefetched[(schema, name)] = (kw, info)
+
+        if versions is not None:
+            cached.update(
+                (name, (versions[name], info))
+                for name, info in fetched.items()
+                if name in versions
+            )
+            cache.store(self, schema, kw, cached)
+
+    def _fetch_multi(self, table_names, schema, kw):
+        fetched = {}
+        for kind, pass_kw in self._prefetch_kinds:
+            try:
+                result = getattr(self, "get_multi_%s" % kind)(
+                    schema=schema,
+                    filter_names=table_names,
+                    **(kw if pass_kw else {})
+                )
+            except NotImplementedError:
+                # optional dialect feature
+                continue
+            for name, value in result.items():
+                fetched.setdefault(name, {})[kind] = value
+
+        return dict(
+            (name, info) for name, info in fetched.items() if "columns" in info
+        )
+
+    def _fetch_multi_parallel(self, table_names, schema, max_workers, kw):
+        chunks = [
+            chunk
+            for chunk in (
+                table_names[idx::max_workers] for idx in range(max_workers)
+            )
+            if chunk
+        ]
+        results = []
+        errors = []
+
+        def fetch(chunk):
+            try:
+                with self.engine.connect() as conn:
+                    insp = Inspector.from_engine(conn)
+                    results.append(insp._fetch_multi(chunk, schema, kw))
+            except Exception:
+                errors.append(sys.exc_info())
+
+        threads = [
+            util.threading.Thread(target=fetch, args=(chunk,))
+            for chunk in chunks
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            util.reraise(*errors[0])
+
+        fetched = {}
+        for result in results:
+            fetched.update(result)
+        return fetched
+
+    def _get_prefetched(self, kind, table_name, schema, kw):
+        entry = self._prefetched.get((schema, table_name))
+        if entry is None:
+            return None
+        prefetch_kw, info = entry
+        if kind not in info:
+            return None
+        if kw != (prefetch_kw if dict(self._prefetch_kinds)[kind] else {}):
+            return None
+        return info[kind]
+
     def reflecttable(
         self,
         table,
@@ -830,6 +1226,7 @@ class Inspector(object):
                         schema=referred_schema,
                         autoload_with=self.bind,
                         _extend_on=_extend_on,
+                        _inspector=self,
                         **reflection_options
                     )
                 for column in referred_columns:
@@ -845,6 +1242,7 @@ class Inspector(object):
                         autoload_with=self.bind,
                         schema=sa_schema.BLANK_SCHEMA,
                         _extend_on=_extend_on,
+                        _inspector=self,
                         **reflection_options
                     )
                 for column in referred_columns:
@@ -1007,3 +1405,81 @@ class Inspector(object):
             return
         else:
             table.comment = comment_dict.get("text", None)
+
+
+class ReflectionCache(object):
+    """Stores reflected table information in a directory on disk, so that
+    tables which haven't changed since they were last reflected needn't
+    be reflected again.
+
+    E.g.::
+
+        from sqlalchemy.engine.reflection import ReflectionCache
+
+        metadata = MetaData()
+        metadata.reflect(
+            engine, reflection_cache=ReflectionCache("/var/cache/myapp")
+        )
+
+    The information retrieved by :meth:`.Inspector.prefetch` for each
+    table is stored along with the table's version token, as returned by
+    :meth:`.Inspector.get_table_versions`; when the token is unchanged on a
+    subsequent run, the stored information is used in place of querying the
+    database.   The cache has no effect for dialects which don't provide
+    version tokens.
+
+    Information is stored in a separate file for each database URL, schema
+    and set of dialect-specific reflection arguments.   Files which can't
+    be read are ignored, and the directory may be removed at any time to
+    discard the cache.
+
+    .. versionadded:: 1.3.12
+
+    .. seealso::
+
+        :meth:`.Inspector.prefetch`
+
+        :paramref:`.MetaData.reflect.reflection_cache`
+
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, inspector, schema, kw):
+        key = "%r|%s|%r" % (inspector.engine.url, schema, sorted(kw.items()))
+        return os.path.join(
+            self.directory,
+            "%s.pickle" % hashlib.sha1(key.encode("utf-8")).hexdigest(),
+        )
+
+    def load(self, inspector, schema, kw):
+        """Return the stored information for the given schema, as a
+        dictionary mapping each table name to a tuple of version token and
+        reflection information."""
+
+        try:
+            with open(self._path(inspector, schema, kw), "rb") as file_:
+                return util.pickle.load(file_)
+        except Exception:
+            # missing, truncated or otherwise unreadable; the tables
+            # will be reflected from the database and the file replaced
+            return {}
+
+    def store(self, inspector, schema, kw, entries):
+        """Replace the stored information for the given schema."""
+
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        path = self._path(inspector, schema, kw)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as file_:
+                util.pickle.dump(entries, file_, util.pickle.HIGHEST_PROTOCOL)
+            if util.win32 and os.path.exists(path):
+                os.remove(path)
+            os.rename(tmp_path, path)
+        except:
+            with util.safe_reraise():
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
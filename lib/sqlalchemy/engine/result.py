@@ -9,6 +9,7 @@
 and :class:`.RowProxy."""
 
 
+import array
 import collections
 import operator
 
@@ -50,7 +51,13 @@ except ImportError:
     _baserowproxy_usecext = False
 
     class BaseRowProxy(object):
-        __slots__ = ("_parent", "_row", "_processors", "_keymap")
+        __slots__ = (
+            "_parent",
+            "_row",
+            "_processors",
+            "_keymap",
+            "_processed",
+        )
 
         def __init__(self, parent, row, processors, keymap):
             """RowProxy objects are constructed by ResultProxy objects."""
@@ -59,6 +66,11 @@ except ImportError:
             self._row = row
             self._processors = processors
             self._keymap = keymap
+            self._processed = None
+
+        @classmethod
+        def _make_rows(cls, parent, rows, processors, keymap):
+            return [cls(parent, row, processors, keymap) for row in rows]
 
         def __reduce__(self):
             return (
@@ -103,11 +115,19 @@ except ImportError:
                     "Ambiguous column name '%s' in "
                     "result set column descriptions" % obj
                 )
-            if processor is not None:
-                return processor(self._row[index])
-            else:
+            if processor is None:
                 return self._row[index]
 
+            # as with the C extension, a column's processor runs only the
+            # first time it's accessed by key or index
+            processed = self._processed
+            if processed is None:
+                processed = self._processed = {}
+            elif index in processed:
+                return processed[index]
+            value = processed[index] = processor(self._row[index])
+            return value
+
         def __getattr__(self, name):
             try:
                 return self[name]
@@ -115,6 +135,24 @@ except ImportError:
                 raise AttributeError(e.args[0])
 
 
+try:
+    from sqlalchemy.cresultproxy import columns_from_rows as _columns_from_rows
+except ImportError:
+
+    def _columns_from_rows(rows, processors):
+        """Transpose a list of DBAPI rows into a list of columns, applying
+        the given result processors to each column."""
+
+        if rows:
+            columns = zip(*rows)
+        else:
+            columns = [()] * len(processors)
+        return [
+            list(column) if processor is None else list(map(processor, column))
+            for processor, column in zip(processors, columns)
+        ]
+
+
 class RowProxy(BaseRowProxy):
     """Proxy values from a single cursor row.
 
@@ -134,10 +172,10 @@ class RowProxy(BaseRowProxy):
         return {"_parent": self._parent, "_row": tuple(self)}
 
     def __setstate__(self, state):
-        self._parent = parent = state["_parent"]
-        self._row = state["_row"]
-        self._processors = parent._processors
-        self._keymap = parent._keymap
+        parent = state["_parent"]
+        BaseRowProxy.__init__(
+            self, parent, state["_row"], parent._processors, parent._keymap
+        )
 
     __hash__ = None
 
@@ -708,6 +746,9 @@ class ResultProxy(object):
     _metadata = None
     _soft_closed = False
     closed = False
+    _stats_entry = None
+    _stats_elapsed = 0.0
+    _stats_rows = 0
 
     def __init__(self, context):
         self.context = context
@@ -718,6 +759,8 @@ class ResultProxy(object):
             self.connection._echo and context.engine._should_log_debug()
         )
         self._init_metadata()
+        if context._stats_entry is not None and self._metadata is not None:
+            self._stats_entry = context._stats_entry
 
     def _getter(self, key, raiseerr=True):
         try:
@@ -890,6 +933,10 @@ class ResultProxy(object):
         if self._soft_closed:
             return
         self._soft_closed = True
+        if self._stats_entry is not None:
+            self._stats_entry._record_fetch(
+                self._stats_elapsed, self._stats_rows
+            )
         cursor = self.cursor
         self.connection._safe_close_cursor(cursor)
         if self._autoclose_connection:
@@ -1173,6 +1220,10 @@ class ResultProxy(object):
         else:
             return default
 
+    def _stats_fetched(self, start, rows):
+        self._stats_elapsed += util.perf_counter() - start
+        self._stats_rows += rows
+
     def process_rows(self, rows):
         process_row = self._process_row
         metadata = self._metadata
@@ -1186,9 +1237,7 @@ class ResultProxy(object):
                 l.append(process_row(metadata, row, processors, keymap))
             return l
         else:
-            return [
-                process_row(metadata, row, processors, keymap) for row in rows
-            ]
+            return process_row._make_rows(metadata, rows, processors, keymap)
 
     def fetchall(self):
         """Fetch all rows, just like DB-API ``cursor.fetchall()``.
@@ -1208,7 +1257,11 @@ class ResultProxy(object):
         """
 
         try:
+            if self._stats_entry is not None:
+                start = util.perf_counter()
             l = self.process_rows(self._fetchall_impl())
+            if self._stats_entry is not None:
+                self._stats_fetched(start, len(l))
             self._soft_close()
             return l
         except BaseException as e:
@@ -1236,7 +1289,11 @@ class ResultProxy(object):
         """
 
         try:
+            if self._stats_entry is not None:
+                start = util.perf_counter()
             l = self.process_rows(self._fetchmany_impl(size))
+            if self._stats_entry is not None:
+                self._stats_fetched(start, len(l))
             if len(l) == 0:
                 self._soft_close()
             return l
@@ -1245,6 +1302,94 @@ class ResultProxy(object):
                 e, None, None, self.cursor, self.context
             )
 
+    def fetch_columnar(self, size=None):
+        """Fetch rows, returning the values of each column as a list.
+
+        Returns a list containing one list of values for each column in
+        the result, in the same order as :meth:`.ResultProxy.keys`.  Result
+        processing for each column's type is applied to each column as a
+        whole, and no :class:`.RowProxy` objects are created, making this
+        method well suited to fetching large numbers of rows whose values
+        will be consumed per column::
+
+            result = conn.execute(select([table.c.x, table.c.y]))
+            x, y = result.fetch_columnar()
+
+        :param size: the maximum number of rows to fetch, as with
+         :meth:`.ResultProxy.fetchmany`; if omitted, all remaining rows are
+         fetched as with :meth:`.ResultProxy.fetchall`.   When no rows
+         remain, a list of empty lists is returned.
+
+        .. versionadded:: 1.3.12
+
+        .. seealso::
+
+            :meth:`.ResultProxy.columns_as_arrays`
+
+        """
+        try:
+            if self._stats_entry is not None:
+                start = util.perf_counter()
+            if size is None:
+                rows = self._fetchall_impl()
+            else:
+                rows = self._fetchmany_impl(size)
+
+            metadata = self._metadata
+            processors = metadata._orig_processors or metadata._processors
+            if self._echo:
+                log = self.context.engine.logger.debug
+                for row in rows:
+                    log("Row %r", sql_util._repr_row(row))
+            columns = _columns_from_rows(rows, processors)
+            if self._stats_entry is not None:
+                self._stats_fetched(start, len(rows))
+            if size is None or not rows:
+                self._soft_close()
+            return columns
+        except BaseException as e:
+            self.connection._handle_dbapi_exception(
+                e, None, None, self.cursor, self.context
+            )
+
+    def columns_as_arrays(self, typecodes, size=None):
+        """Fetch rows, returning the values of each column as an
+        ``array.array``.
+
+        This method works like :meth:`.ResultProxy.fetch_columnar`, where
+        each column is additionally converted to an ``array.array`` of the
+        given typecode; the typecodes are given as a sequence in the same
+        order as the columns of the result, where a typecode of ``None``
+        indicates that a column should remain a list::
+
+            result = conn.execute(select([table.c.id, table.c.value]))
+            ids, values = result.columns_as_arrays(["q", "d"])
+
+        Columns converted to arrays must not contain NULL values.   Arrays
+        support the buffer protocol, so that they may be passed to NumPy
+        without copying, e.g. ``numpy.frombuffer(values, dtype="d")``.
+
+        :param typecodes: a sequence of ``array`` module typecodes, one
+         for each column in the result.
+
+        :param size: the maximum number of rows to fetch; if omitted, all
+         remaining rows are fetched.
+
+        .. versionadded:: 1.3.12
+
+        """
+        num_columns = len(self.keys())
+        if len(typecodes) != num_columns:
+            raise exc.ArgumentError(
+                "Got %d typecodes for a result with %d columns"
+                % (len(typecodes), num_columns)
+            )
+        columns = self.fetch_columnar(size)
+        return [
+            column if typecode is None else array.array(typecode, column)
+            for typecode, column in zip(typecodes, columns)
+        ]
+
     def fetchone(self):
         """Fetch one row, just like DB-API ``cursor.fetchone()``.
 
@@ -1263,10 +1408,17 @@ class ResultProxy(object):
 
         """
         try:
+            if self._stats_entry is not None:
+                start = util.perf_counter()
             row = self._fetchone_impl()
             if row is not None:
-                return self.process_rows([row])[0]
+                row = self.process_rows([row])[0]
+                if self._stats_entry is not None:
+                    self._stats_fetched(start, 1)
+                return row
             else:
+                if self._stats_entry is not None:
+                    self._stats_fetched(start, 0)
                 self._soft_close()
                 return None
         except BaseException as e:
@@ -1286,6 +1438,9 @@ class ResultProxy(object):
         if self._metadata is None:
             return self._non_result(None)
 
+        if self._stats_entry is not None:
+            start = util.perf_counter()
+
         try:
             row = self._fetchone_impl()
         except BaseException as e:
@@ -1295,9 +1450,10 @@ class ResultProxy(object):
 
         try:
             if row is not None:
-                return self.process_rows([row])[0]
-            else:
-                return None
+                row = self.process_rows([row])[0]
+            if self._stats_entry is not None:
+                self._stats_fetched(start, 0 if row is None else 1)
+            return row
         finally:
             self.close()
 
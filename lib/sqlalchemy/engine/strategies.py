@@ -132,6 +132,9 @@ class DefaultEngineStrategy(EngineStrategy):
                 "reset_on_return": "pool_reset_on_return",
                 "pre_ping": "pool_pre_ping",
                 "use_lifo": "pool_use_lifo",
+                "min_size": "pool_min_size",
+                "idle_timeout": "pool_idle_timeout",
+                "adjust_interval": "pool_adjust_interval",
             }
             for k in util.get_cls_kwargs(poolclass):
                 tk = translate.get(k, k)
@@ -195,7 +198,11 @@ class DefaultEngineStrategy(EngineStrategy):
                 c = base.Connection(
                     engine, connection=dbapi_connection, _has_events=False
                 )
-                c._execution_options = util.immutabledict()
+                # statements emitted while the dialect is initializing are
+                # compiled before it's fully configured; don't cache them
+                c._execution_options = util.immutabledict(
+                    {"compiled_cache": None}
+                )
                 dialect.initialize(c)
                 dialect.do_rollback(c.connection)
 
@@ -18,6 +18,14 @@ Above, ``some_object.dispatch`` would be an instance of ``_Dispatch`` and
 ``first_connect`` is typically an instance of ``_ListenerCollection``
 if event listeners are present, or ``_EmptyListener`` if none are present.
 
+Each instance-level collection maintains a tuple of every listener function
+it will invoke, combining its own listeners with those established at the
+class level and, for ``_JoinedListener``, those of the parent dispatcher,
+along with a plain boolean ``has_listeners``.  These are regenerated when
+the listeners of the collection, or of any collection it draws upon, are
+modified, so that firing an event, or checking if an event has any
+listeners, doesn't need to consult more than one collection.
+
 The attribute mechanics here spend effort trying to ensure listener functions
 are available with a minimum of function call overhead, that unnecessary
 objects aren't created (i.e. many empty per-instance listener collections),
@@ -76,6 +84,7 @@ class _ClsLevelDispatch(RefCollection):
         "has_kw",
         "legacy_signatures",
         "_clslevel",
+        "_dependents",
         "__weakref__",
     )
 
@@ -94,6 +103,7 @@ class _ClsLevelDispatch(RefCollection):
         fn.__doc__ = legacy._augment_fn_docs(self, parent_dispatch_cls, fn)
 
         self._clslevel = weakref.WeakKeyDictionary()
+        self._dependents = weakref.WeakSet()
 
     def _adjust_fn_spec(self, fn, named):
         if named:
@@ -135,6 +145,7 @@ class _ClsLevelDispatch(RefCollection):
                     self._assign_cls_collection(cls)
                 self._clslevel[cls].appendleft(event_key._listen_fn)
         registry._stored_in_collection(event_key, self)
+        self._compile_dependents()
 
     def append(self, event_key, propagate):
         target = event_key.dispatch_target
@@ -156,6 +167,7 @@ class _ClsLevelDispatch(RefCollection):
                     self._assign_cls_collection(cls)
                 self._clslevel[cls].append(event_key._listen_fn)
         registry._stored_in_collection(event_key, self)
+        self._compile_dependents()
 
     def _assign_cls_collection(self, target):
         if getattr(target, "_sa_propagate_class_events", True):
@@ -182,6 +194,7 @@ class _ClsLevelDispatch(RefCollection):
             if cls in self._clslevel:
                 self._clslevel[cls].remove(event_key._listen_fn)
         registry._removed_from_collection(event_key, self)
+        self._compile_dependents()
 
     def clear(self):
         """Clear all class level listeners"""
@@ -191,6 +204,14 @@ class _ClsLevelDispatch(RefCollection):
             to_clear.update(dispatcher)
             dispatcher.clear()
         registry._clear(self, to_clear)
+        self._compile_dependents()
+
+    def _compile_dependents(self):
+        """Regenerate the listener tuples of instance-level collections
+        which refer to class-level listeners of this event."""
+
+        for collection in list(self._dependents):
+            collection._compile()
 
     def for_modify(self, obj):
         """Return an event collection which can be modified.
@@ -203,11 +224,43 @@ class _ClsLevelDispatch(RefCollection):
 
 
 class _InstanceLevelDispatch(RefCollection):
-    __slots__ = ()
+    __slots__ = ("_fns", "has_listeners", "_dependents", "__weakref__")
 
     def _adjust_fn_spec(self, fn, named):
         return self.parent._adjust_fn_spec(fn, named)
 
+    def _compile(self):
+        """Regenerate the tuple of listener functions for this collection,
+        as well as for those collections which include it."""
+
+        self._fns = fns = self._compile_fns()
+        self.has_listeners = bool(fns)
+        if self._dependents:
+            for collection in list(self._dependents):
+                collection._compile()
+
+    def _add_dependent(self, collection):
+        if self._dependents is None:
+            self._dependents = weakref.WeakSet()
+        self._dependents.add(collection)
+
+    def __call__(self, *args, **kw):
+        """Execute this event."""
+
+        for fn in self._fns:
+            fn(*args, **kw)
+
+    def __len__(self):
+        return len(self._fns)
+
+    def __iter__(self):
+        return iter(self._fns)
+
+    def __bool__(self):
+        return self.has_listeners
+
+    __nonzero__ = __bool__
+
 
 class _EmptyListener(_InstanceLevelDispatch):
     """Serves as a proxy interface to the events
@@ -230,6 +283,12 @@ class _EmptyListener(_InstanceLevelDispatch):
         self.parent = parent  # _ClsLevelDispatch
         self.parent_listeners = parent._clslevel[target_cls]
         self.name = parent.name
+        self._dependents = None
+        self._compile()
+        parent._dependents.add(self)
+
+    def _compile_fns(self):
+        return tuple(self.parent_listeners)
 
     def for_modify(self, obj):
         """Return an event collection which can be modified.
@@ -243,6 +302,9 @@ class _EmptyListener(_InstanceLevelDispatch):
         result = _ListenerCollection(self.parent, obj._instance_cls)
         if getattr(obj, self.name) is self:
             setattr(obj, self.name, result)
+            # _JoinedListener objects which refer to this collection
+            # by way of "obj" will now locate the new one
+            self._compile()
         else:
             assert isinstance(getattr(obj, self.name), _JoinedListener)
         return result
@@ -254,23 +316,6 @@ class _EmptyListener(_InstanceLevelDispatch):
         exec_once_unless_exception
     ) = insert = append = remove = clear = _needs_modify
 
-    def __call__(self, *args, **kw):
-        """Execute this event."""
-
-        for fn in self.parent_listeners:
-            fn(*args, **kw)
-
-    def __len__(self):
-        return len(self.parent_listeners)
-
-    def __iter__(self):
-        return iter(self.parent_listeners)
-
-    def __bool__(self):
-        return bool(self.parent_listeners)
-
-    __nonzero__ = __bool__
-
 
 class _CompoundListener(_InstanceLevelDispatch):
     __slots__ = "_exec_once_mutex", "_exec_once"
@@ -313,25 +358,6 @@ class _CompoundListener(_InstanceLevelDispatch):
         if not self._exec_once:
             self._exec_once_impl(True, *args, **kw)
 
-    def __call__(self, *args, **kw):
-        """Execute this event."""
-
-        for fn in self.parent_listeners:
-            fn(*args, **kw)
-        for fn in self.listeners:
-            fn(*args, **kw)
-
-    def __len__(self):
-        return len(self.parent_listeners) + len(self.listeners)
-
-    def __iter__(self):
-        return chain(self.parent_listeners, self.listeners)
-
-    def __bool__(self):
-        return bool(self.listeners or self.parent_listeners)
-
-    __nonzero__ = __bool__
-
 
 class _ListenerCollection(_CompoundListener):
     """Instance-level attributes on instances of :class:`._Dispatch`.
@@ -349,7 +375,6 @@ class _ListenerCollection(_CompoundListener):
         "name",
         "listeners",
         "propagate",
-        "__weakref__",
     )
 
     def __init__(self, parent, target_cls):
@@ -361,6 +386,12 @@ class _ListenerCollection(_CompoundListener):
         self.name = parent.name
         self.listeners = collections.deque()
         self.propagate = set()
+        self._dependents = None
+        self._compile()
+        parent._dependents.add(self)
+
+    def _compile_fns(self):
+        return tuple(chain(self.parent_listeners, self.listeners))
 
     def for_modify(self, obj):
         """Return an event collection which can be modified.
@@ -387,17 +418,20 @@ class _ListenerCollection(_CompoundListener):
         ]
 
         existing_listeners.extend(other_listeners)
+        self._compile()
 
         to_associate = other.propagate.union(other_listeners)
         registry._stored_in_collection_multi(self, other, to_associate)
 
     def insert(self, event_key, propagate):
         if event_key.prepend_to_list(self, self.listeners):
+            self._compile()
             if propagate:
                 self.propagate.add(event_key._listen_fn)
 
     def append(self, event_key, propagate):
         if event_key.append_to_list(self, self.listeners):
+            self._compile()
             if propagate:
                 self.propagate.add(event_key._listen_fn)
 
@@ -405,15 +439,17 @@ class _ListenerCollection(_CompoundListener):
         self.listeners.remove(event_key._listen_fn)
         self.propagate.discard(event_key._listen_fn)
         registry._removed_from_collection(event_key, self)
+        self._compile()
 
     def clear(self):
         registry._clear(self, self.listeners)
         self.propagate.clear()
         self.listeners.clear()
+        self._compile()
 
 
 class _JoinedListener(_CompoundListener):
-    __slots__ = "parent", "name", "local", "parent_listeners"
+    __slots__ = "parent", "name", "local", "parent_listeners", "_listeners"
 
     def __init__(self, parent, name, local):
         self._exec_once = False
@@ -421,17 +457,37 @@ class _JoinedListener(_CompoundListener):
         self.name = name
         self.local = local
         self.parent_listeners = self.local
+        self._listeners = None
+        self._dependents = None
+        self._compile()
+        local._add_dependent(self)
 
     @property
     def listeners(self):
         return getattr(self.parent, self.name)
 
+    def _compile_fns(self):
+        # the parent dispatcher may have replaced its collection
+        # since we last looked, e.g. _EmptyListener.for_modify()
+        listeners = self.listeners
+        if listeners is not self._listeners:
+            self._listeners = listeners
+            listeners._add_dependent(self)
+        return self.local._fns + listeners._fns
+
     def _adjust_fn_spec(self, fn, named):
         return self.local._adjust_fn_spec(fn, named)
 
     def for_modify(self, obj):
-        self.local = self.parent_listeners = self.local.for_modify(obj)
-        return self
+        local = self.local.for_modify(obj)
+        if local is self.local:
+            return self
+
+        # this _JoinedListener may be shared among many
+        # _JoinedDispatchers; establish a new one local to "obj"
+        joined = _JoinedListener(self.parent, self.name, local)
+        setattr(obj, self.name, joined)
+        return joined
 
     def insert(self, event_key, propagate):
         self.local.insert(event_key, propagate)
@@ -70,7 +70,13 @@ class _Dispatch(object):
 
     # In one ORM edge case, an attribute is added to _Dispatch,
     # so __dict__ is used in just that case and potentially others.
-    __slots__ = "_parent", "_instance_cls", "__dict__", "_empty_listeners"
+    __slots__ = (
+        "_parent",
+        "_instance_cls",
+        "__dict__",
+        "_empty_listeners",
+        "_joined_listeners",
+    )
 
     _empty_listener_reg = weakref.WeakKeyDictionary()
 
@@ -90,6 +96,7 @@ class _Dispatch(object):
                 }
         else:
             self._empty_listeners = {}
+        self._joined_listeners = {}
 
     def __getattr__(self, name):
         # Assign EmptyListeners as attributes on demand
@@ -256,18 +263,32 @@ class Events(util.with_metaclass(_EventMeta, object)):
 class _JoinedDispatcher(object):
     """Represent a connection between two _Dispatch objects."""
 
-    __slots__ = "local", "parent", "_instance_cls"
+    __slots__ = "local", "parent", "_instance_cls", "_joined_listeners"
 
     def __init__(self, local, parent):
         self.local = local
         self.parent = parent
         self._instance_cls = self.local._instance_cls
+        self._joined_listeners = {}
 
     def __getattr__(self, name):
         # Assign _JoinedListeners as attributes on demand
         # to reduce startup time for new dispatch objects.
         ls = getattr(self.local, name)
-        jl = _JoinedListener(self.parent, ls.name, ls)
+        if isinstance(ls, _EmptyListener):
+            # the local dispatcher has no listeners of its own, as is
+            # typical for a Connection joined to its Engine; the
+            # _JoinedListener is shared among all dispatchers joined to
+            # the same parent.  _JoinedListener.for_modify() establishes
+            # a new one if listeners are later added locally.
+            try:
+                jl = self.parent._joined_listeners[ls]
+            except KeyError:
+                jl = self.parent._joined_listeners[ls] = _JoinedListener(
+                    self.parent, ls.name, ls
+                )
+        else:
+            jl = _JoinedListener(self.parent, ls.name, ls)
         setattr(self, ls.name, jl)
         return jl
 
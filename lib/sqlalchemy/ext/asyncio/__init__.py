@@ -0,0 +1,35 @@
+# ext/asyncio/__init__.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""asyncio front-end for the Core and ORM.
+
+Provides :class:`.AsyncEngine`, :class:`.AsyncConnection` and
+:class:`.AsyncSession`, which run the synchronous :class:`.Engine`,
+:class:`.Connection` and :class:`.Session` against an asyncio DBAPI,
+using the greenlet library to pass control to the event loop whenever
+the driver needs to be awaited.
+
+Requires Python 3.6 or greater as well as the ``greenlet`` library.
+
+"""
+
+from .engine import AsyncConnection
+from .engine import AsyncEngine
+from .engine import AsyncTransaction
+from .engine import create_async_engine
+from .result import AsyncResult
+from .session import AsyncSession
+
+
+__all__ = [
+    "create_async_engine",
+    "AsyncEngine",
+    "AsyncConnection",
+    "AsyncTransaction",
+    "AsyncResult",
+    "AsyncSession",
+]
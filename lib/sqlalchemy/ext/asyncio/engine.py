@@ -0,0 +1,350 @@
+# ext/asyncio/engine.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+from .result import AsyncResult
+from ... import exc
+from ... import util
+from ...engine import create_engine as _create_engine
+from ...util.concurrency import greenlet_spawn
+
+
+def create_async_engine(*arg, **kw):
+    """Create a new :class:`.AsyncEngine` instance.
+
+    Arguments passed to :func:`.create_async_engine` are mostly identical
+    to those passed to the :func:`.create_engine` function.  The specified
+    dialect must be an asyncio-compatible dialect such as
+    :mod:`~sqlalchemy.dialects.sqlite.aiosqlite`.
+
+    """
+
+    sync_engine = _create_engine(*arg, **kw)
+    if not sync_engine.dialect.is_async:
+        raise exc.ArgumentError(
+            "The asyncio extension requires an async driver to be used. "
+            "The loaded %r is not async." % sync_engine.dialect.driver
+        )
+    return AsyncEngine(sync_engine)
+
+
+class StartableContext(object):
+    """An object that may be awaited or used as an ``async with`` context
+    manager, establishing its state by way of ``start()``."""
+
+    __slots__ = ()
+
+    async def start(self):
+        raise NotImplementedError()
+
+    def __await__(self):
+        return self.start().__await__()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, type_, value, traceback):
+        pass
+
+    def _raise_for_not_started(self):
+        raise exc.InvalidRequestError(
+            "%s context has not been started and object has not been "
+            "awaited." % (self.__class__.__name__)
+        )
+
+
+class AsyncConnection(StartableContext):
+    """An asyncio proxy for a :class:`.Connection`.
+
+    :class:`.AsyncConnection` is acquired using the
+    :meth:`.AsyncEngine.connect` method, and must be either awaited or used
+    as an ``async with`` context manager::
+
+        async with engine.connect() as conn:
+            result = await conn.execute(select([table]))
+
+    Each method runs the corresponding method of the underlying
+    :class:`.Connection` within a greenlet, so that IO performed by the
+    adapted DBAPI can yield to the event loop.
+
+    .. versionadded:: 1.3.12
+
+    """
+
+    __slots__ = ("async_engine", "sync_engine", "sync_connection")
+
+    def __init__(self, async_engine, sync_connection=None):
+        self.async_engine = async_engine
+        self.sync_engine = async_engine.sync_engine
+        self.sync_connection = sync_connection
+
+    async def start(self):
+        """Start this :class:`.AsyncConnection` object's context
+        outside of using a Python ``with:`` block.
+
+        """
+        if self.sync_connection is not None:
+            raise exc.InvalidRequestError("connection is already started")
+        self.sync_connection = await greenlet_spawn(self.sync_engine.connect)
+        return self
+
+    def _sync_connection(self):
+        if self.sync_connection is None:
+            self._raise_for_not_started()
+        return self.sync_connection
+
+    @property
+    def closed(self):
+        """Return True if this connection is closed."""
+
+        return self.sync_connection is None or self.sync_connection.closed
+
+    def in_transaction(self):
+        """Return True if a transaction is in progress."""
+
+        return self._sync_connection().in_transaction()
+
+    def begin(self):
+        """Begin a transaction, returning an :class:`.AsyncTransaction`.
+
+        The transaction must be either awaited or used as an ``async with``
+        context manager, which commits the transaction on success and
+        rolls it back if an exception is raised::
+
+            async with conn.begin():
+                await conn.execute(table.insert(), {"data": "d1"})
+
+        """
+        self._sync_connection()
+        return AsyncTransaction(self)
+
+    async def execute(self, statement, *multiparams, **params):
+        r"""Execute a SQL statement construct and return a
+        :class:`.ResultProxy`.
+
+        Arguments are the same as those of :meth:`.Connection.execute`.
+
+        The rows of the result are buffered by the adapted DBAPI cursor
+        before this method returns, so that the fetch methods of the
+        returned :class:`.ResultProxy` may be called without awaiting.
+        To fetch rows from a server side cursor as they are needed, use
+        :meth:`.AsyncConnection.stream`.
+
+        """
+        conn = self._sync_connection()
+
+        return await greenlet_spawn(
+            conn.execute, statement, *multiparams, **params
+        )
+
+    async def scalar(self, statement, *multiparams, **params):
+        r"""Execute a SQL statement construct and return a scalar object.
+
+        Arguments are the same as those of :meth:`.Connection.scalar`.
+
+        """
+        conn = self._sync_connection()
+
+        return await greenlet_spawn(
+            conn.scalar, statement, *multiparams, **params
+        )
+
+    async def stream(self, statement, *multiparams, **params):
+        r"""Execute a statement and return an :class:`.AsyncResult`,
+        which fetches rows using a server side cursor as they are awaited.
+
+        The statement is executed with the ``stream_results`` execution
+        option in effect.
+
+        """
+        conn = self._sync_connection().execution_options(stream_results=True)
+
+        result = await greenlet_spawn(
+            conn.execute, statement, *multiparams, **params
+        )
+        return AsyncResult(result)
+
+    async def run_sync(self, fn, *arg, **kw):
+        """Invoke the given synchronous callable, passing the
+        :class:`.Connection` as the first argument.
+
+        This allows routines written against the synchronous API, such as
+        :meth:`.MetaData.create_all`, to be run against an
+        :class:`.AsyncConnection`::
+
+            async with engine.begin() as conn:
+                await conn.run_sync(metadata.create_all)
+
+        """
+        conn = self._sync_connection()
+
+        return await greenlet_spawn(fn, conn, *arg, **kw)
+
+    async def close(self):
+        """Close this :class:`.AsyncConnection`, returning the underlying
+        DBAPI connection to the connection pool.
+
+        Any transaction in progress is rolled back.
+
+        """
+        if self.sync_connection is not None:
+            await greenlet_spawn(self.sync_connection.close)
+
+    async def __aexit__(self, type_, value, traceback):
+        await self.close()
+
+
+class AsyncTransaction(StartableContext):
+    """An asyncio proxy for a :class:`.Transaction`.
+
+    .. versionadded:: 1.3.12
+
+    """
+
+    __slots__ = ("connection", "sync_transaction")
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.sync_transaction = None
+
+    async def start(self):
+        """Start this :class:`.AsyncTransaction` object's context
+        outside of using a Python ``with:`` block.
+
+        """
+        self.sync_transaction = await greenlet_spawn(
+            self.connection._sync_connection().begin
+        )
+        return self
+
+    def _sync_transaction(self):
+        if self.sync_transaction is None:
+            self._raise_for_not_started()
+        return self.sync_transaction
+
+    @property
+    def is_active(self):
+        return (
+            self.sync_transaction is not None
+            and self.sync_transaction.is_active
+        )
+
+    async def commit(self):
+        """Commit this :class:`.AsyncTransaction`."""
+
+        await greenlet_spawn(self._sync_transaction().commit)
+
+    async def rollback(self):
+        """Roll back this :class:`.AsyncTransaction`."""
+
+        await greenlet_spawn(self._sync_transaction().rollback)
+
+    async def close(self):
+        """Close this :class:`.AsyncTransaction`, rolling it back if it
+        is still active.
+
+        """
+        await greenlet_spawn(self._sync_transaction().close)
+
+    async def __aexit__(self, type_, value, traceback):
+        if self.is_active:
+            if type_ is None:
+                await self.commit()
+            else:
+                await self.rollback()
+
+
+class _EngineBegin(object):
+    """The ``async with`` context returned by :meth:`.AsyncEngine.begin`."""
+
+    __slots__ = ("async_engine", "conn", "transaction")
+
+    def __init__(self, async_engine):
+        self.async_engine = async_engine
+        self.conn = self.transaction = None
+
+    async def __aenter__(self):
+        self.conn = await self.async_engine.connect()
+        try:
+            self.transaction = await self.conn.begin()
+        except BaseException:
+            with util.safe_reraise():
+                await self.conn.close()
+        return self.conn
+
+    async def __aexit__(self, type_, value, traceback):
+        try:
+            await self.transaction.__aexit__(type_, value, traceback)
+        finally:
+            await self.conn.close()
+
+
+class AsyncEngine(object):
+    """An asyncio proxy for an :class:`.Engine`.
+
+    :class:`.AsyncEngine` is acquired using the :func:`.create_async_engine`
+    function::
+
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        engine = create_async_engine("sqlite+aiosqlite:///file.db")
+
+    .. versionadded:: 1.3.12
+
+    """
+
+    __slots__ = ("sync_engine",)
+
+    def __init__(self, sync_engine):
+        self.sync_engine = sync_engine
+
+    @property
+    def dialect(self):
+        return self.sync_engine.dialect
+
+    @property
+    def url(self):
+        return self.sync_engine.url
+
+    @property
+    def pool(self):
+        return self.sync_engine.pool
+
+    def connect(self):
+        """Return an :class:`.AsyncConnection` object.
+
+        The connection is established when the object is awaited or
+        entered as an ``async with`` context manager::
+
+            async with engine.connect() as conn:
+                result = await conn.execute(select([table]))
+
+        """
+        return AsyncConnection(self)
+
+    def begin(self):
+        """Return an ``async with`` context manager which delivers an
+        :class:`.AsyncConnection` with a transaction begun.
+
+        The transaction is committed when the block completes, or rolled
+        back if an exception is raised::
+
+            async with engine.begin() as conn:
+                await conn.execute(table.insert(), {"data": "d1"})
+
+        """
+        return _EngineBegin(self)
+
+    async def dispose(self):
+        """Dispose of the connection pool used by this
+        :class:`.AsyncEngine`.
+
+        .. seealso::
+
+            :meth:`.Engine.dispose`
+
+        """
+        await greenlet_spawn(self.sync_engine.dispose)
@@ -0,0 +1,104 @@
+# ext/asyncio/result.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+from ...util.concurrency import greenlet_spawn
+
+
+class AsyncResult(object):
+    """An asyncio wrapper around a :class:`.ResultProxy` which fetches
+    rows from a server side cursor.
+
+    :class:`.AsyncResult` is returned by the :meth:`.AsyncConnection.stream`
+    and :meth:`.AsyncSession.stream` methods.  Rows may be fetched using
+    the awaitable fetch methods, or by iterating using ``async for``::
+
+        result = await conn.stream(select([table]))
+
+        async for row in result:
+            print(row)
+
+    .. versionadded:: 1.3.12
+
+    """
+
+    __slots__ = ("_real_result",)
+
+    def __init__(self, real_result):
+        self._real_result = real_result
+
+    @property
+    def returns_rows(self):
+        return self._real_result.returns_rows
+
+    @property
+    def closed(self):
+        return self._real_result.closed
+
+    def keys(self):
+        """Return the current set of string keys for rows."""
+
+        return self._real_result.keys()
+
+    async def close(self):
+        """Close this :class:`.AsyncResult`, releasing its cursor."""
+
+        await greenlet_spawn(self._real_result.close)
+
+    async def fetchone(self):
+        """Fetch one row, or None if no rows remain."""
+
+        return await greenlet_spawn(self._real_result.fetchone)
+
+    async def fetchmany(self, size=None):
+        """Fetch many rows, or an empty list if no rows remain."""
+
+        return await greenlet_spawn(self._real_result.fetchmany, size)
+
+    async def fetchall(self):
+        """Fetch all remaining rows."""
+
+        return await greenlet_spawn(self._real_result.fetchall)
+
+    async def first(self):
+        """Fetch the first row and then close the result.
+
+        Returns None if no row is present.
+
+        """
+        return await greenlet_spawn(self._real_result.first)
+
+    async def scalar(self):
+        """Fetch the first column of the first row, and close the result.
+
+        Returns None if no row is present.
+
+        """
+        return await greenlet_spawn(self._real_result.scalar)
+
+    async def partitions(self, size=None):
+        """Iterate through sub-lists of rows of the size given.
+
+        Each list will be of the size given, excluding the last list to
+        be yielded, which may have a smaller number of rows.  No empty
+        lists will be yielded.
+
+        """
+        while True:
+            partition = await self.fetchmany(size)
+            if partition:
+                yield partition
+            else:
+                break
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        row = await self.fetchone()
+        if row is None:
+            raise StopAsyncIteration()
+        return row
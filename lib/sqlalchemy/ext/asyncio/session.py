@@ -0,0 +1,310 @@
+# ext/asyncio/session.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+from .engine import AsyncConnection
+from .engine import AsyncEngine
+from .result import AsyncResult
+from ...orm import Session
+from ...util.concurrency import greenlet_spawn
+
+
+def _sync_bind(bind):
+    if isinstance(bind, AsyncEngine):
+        return bind.sync_engine
+    elif isinstance(bind, AsyncConnection):
+        return bind._sync_connection()
+    else:
+        return bind
+
+
+class AsyncSession(object):
+    """Asyncio version of :class:`.Session`.
+
+    The :class:`.AsyncSession` proxies a :class:`.Session`, running each
+    operation which may emit SQL within a greenlet, so that IO performed by
+    the adapted DBAPI can yield to the event loop::
+
+        async with AsyncSession(engine) as session:
+            session.add(SomeObject(data="d1"))
+            await session.commit()
+
+    Operations which emit SQL implicitly, such as the lazy loading of a
+    relationship or the loading of an expired attribute, can't be awaited
+    and will raise an error when invoked outside of a greenlet.  Relationships
+    should instead be loaded eagerly, attributes may be loaded explicitly
+    using :meth:`.AsyncSession.refresh`, and the ``expire_on_commit=False``
+    option may be used to keep attributes loaded after a commit.  Routines
+    written against the synchronous :class:`.Session` may also be invoked
+    within a greenlet using :meth:`.AsyncSession.run_sync`.
+
+    .. versionadded:: 1.3.12
+
+    """
+
+    def __init__(self, bind=None, binds=None, **kw):
+        self.bind = bind
+        self.binds = binds
+
+        if binds is not None:
+            binds = dict(
+                (key, _sync_bind(value)) for key, value in binds.items()
+            )
+
+        self.sync_session = Session(bind=_sync_bind(bind), binds=binds, **kw)
+
+    def __contains__(self, instance):
+        return instance in self.sync_session
+
+    def __iter__(self):
+        return iter(self.sync_session)
+
+    @property
+    def dirty(self):
+        return self.sync_session.dirty
+
+    @property
+    def deleted(self):
+        return self.sync_session.deleted
+
+    @property
+    def new(self):
+        return self.sync_session.new
+
+    @property
+    def identity_map(self):
+        return self.sync_session.identity_map
+
+    @property
+    def is_active(self):
+        return self.sync_session.is_active
+
+    def add(self, instance, _warn=True):
+        """Place an object in this :class:`.AsyncSession`.
+
+        .. seealso::
+
+            :meth:`.Session.add`
+
+        """
+        self.sync_session.add(instance, _warn=_warn)
+
+    def add_all(self, instances):
+        """Add the given collection of instances to this
+        :class:`.AsyncSession`.
+
+        .. seealso::
+
+            :meth:`.Session.add_all`
+
+        """
+        self.sync_session.add_all(instances)
+
+    def expunge(self, instance):
+        """Remove the given instance from this :class:`.AsyncSession`.
+
+        .. seealso::
+
+            :meth:`.Session.expunge`
+
+        """
+        self.sync_session.expunge(instance)
+
+    def expunge_all(self):
+        """Remove all object instances from this :class:`.AsyncSession`.
+
+        .. seealso::
+
+            :meth:`.Session.expunge_all`
+
+        """
+        self.sync_session.expunge_all()
+
+    def expire(self, instance, attribute_names=None):
+        """Expire the attributes on an instance.
+
+        .. seealso::
+
+            :meth:`.Session.expire`
+
+        """
+        self.sync_session.expire(instance, attribute_names=attribute_names)
+
+    def expire_all(self):
+        """Expires all persistent instances within this
+        :class:`.AsyncSession`.
+
+        .. seealso::
+
+            :meth:`.Session.expire_all`
+
+        """
+        self.sync_session.expire_all()
+
+    async def refresh(self, instance, attribute_names=None, **kw):
+        """Expire and refresh the attributes on the given instance.
+
+        .. seealso::
+
+            :meth:`.Session.refresh`
+
+        """
+        return await greenlet_spawn(
+            self.sync_session.refresh,
+            instance,
+            attribute_names=attribute_names,
+            **kw
+        )
+
+    async def run_sync(self, fn, *arg, **kw):
+        """Invoke the given synchronous callable, passing the
+        :class:`.Session` as the first argument.
+
+        This allows ORM routines written against the synchronous API, such
+        as those which make use of :class:`.Query`, to be run against an
+        :class:`.AsyncSession`::
+
+            def fetch_users(session):
+                return session.query(User).filter_by(name="ed").all()
+
+            users = await async_session.run_sync(fetch_users)
+
+        Lazy loads and other implicit IO may take place within the
+        callable.
+
+        """
+        return await greenlet_spawn(fn, self.sync_session, *arg, **kw)
+
+    async def execute(self, clause, params=None, mapper=None, bind=None, **kw):
+        """Execute a SQL expression construct or string statement within
+        the current transaction.
+
+        .. seealso::
+
+            :meth:`.Session.execute`
+
+        """
+        return await greenlet_spawn(
+            self.sync_session.execute,
+            clause,
+            params=params,
+            mapper=mapper,
+            bind=_sync_bind(bind),
+            **kw
+        )
+
+    async def scalar(self, clause, params=None, mapper=None, bind=None, **kw):
+        """Like :meth:`~.AsyncSession.execute` but return a scalar result.
+
+        .. seealso::
+
+            :meth:`.Session.scalar`
+
+        """
+        return await greenlet_spawn(
+            self.sync_session.scalar,
+            clause,
+            params=params,
+            mapper=mapper,
+            bind=_sync_bind(bind),
+            **kw
+        )
+
+    async def stream(self, clause, params=None, mapper=None, bind=None, **kw):
+        """Execute a statement and return an :class:`.AsyncResult` which
+        fetches rows using a server side cursor as they are awaited.
+
+        The statement must be an :class:`.Executable` construct; it is
+        executed with the ``stream_results`` execution option in effect.
+
+        """
+        clause = clause.execution_options(stream_results=True)
+
+        result = await greenlet_spawn(
+            self.sync_session.execute,
+            clause,
+            params=params,
+            mapper=mapper,
+            bind=_sync_bind(bind),
+            **kw
+        )
+        return AsyncResult(result)
+
+    async def get(self, entity, ident):
+        """Return an instance based on the given primary key identifier,
+        or ``None`` if not found.
+
+        .. seealso::
+
+            :meth:`.Query.get`
+
+        """
+        return await greenlet_spawn(
+            lambda: self.sync_session.query(entity).get(ident)
+        )
+
+    async def delete(self, instance):
+        """Mark an instance as deleted.
+
+        This is an awaitable as cascades along relationships may need to
+        be loaded.
+
+        .. seealso::
+
+            :meth:`.Session.delete`
+
+        """
+        return await greenlet_spawn(self.sync_session.delete, instance)
+
+    async def merge(self, instance, load=True):
+        """Copy the state of a given instance into a corresponding instance
+        within this :class:`.AsyncSession`.
+
+        .. seealso::
+
+            :meth:`.Session.merge`
+
+        """
+        return await greenlet_spawn(
+            self.sync_session.merge, instance, load=load
+        )
+
+    async def flush(self, objects=None):
+        """Flush all the object changes to the database.
+
+        .. seealso::
+
+            :meth:`.Session.flush`
+
+        """
+        await greenlet_spawn(self.sync_session.flush, objects=objects)
+
+    async def commit(self):
+        """Flush pending changes and commit the current transaction."""
+
+        await greenlet_spawn(self.sync_session.commit)
+
+    async def rollback(self):
+        """Rollback the current transaction in progress."""
+
+        await greenlet_spawn(self.sync_session.rollback)
+
+    async def close(self):
+        """Close this :class:`.AsyncSession`, releasing connection
+        resources and expunging all objects.
+
+        .. seealso::
+
+            :meth:`.Session.close`
+
+        """
+        await greenlet_spawn(self.sync_session.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, type_, value, traceback):
+        await self.close()
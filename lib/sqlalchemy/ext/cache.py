@@ -0,0 +1,880 @@
+# ext/cache.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""A second-level cache for ORM-loaded rows and query results.
+
+The :class:`.SecondLevelCache` stores the column values of objects
+loaded by the ORM, keyed on mapper and primary key, within a
+:class:`.CacheRegion`.   Sessions which use the :class:`.CachingQuery`
+class will then serve :meth:`.Query.get` as well as simple many-to-one
+lazy loads from the cache when the object isn't already present in the
+:class:`.Session`, without emitting SQL.   Lists of primary keys
+returned by queries may also be cached, using
+:meth:`.CachingQuery.from_cache`.
+
+Rows which are inserted, updated or deleted by the unit of work are
+removed from the cache when the flush completes and again when the
+transaction ends, and cached query results for the affected classes are
+invalidated at the same points.   INSERT, UPDATE and DELETE statements
+emitted by :meth:`.Query.update`, :meth:`.Query.delete` or
+:meth:`.Session.execute` against the table of a cached class invalidate
+all cached rows and query results for that class at the same points.
+A session doesn't store rows or query results for a class which has been
+invalidated since its transaction began, as these may reflect the state
+of the database prior to the change.
+
+Usage::
+
+    from sqlalchemy.ext.cache import CacheRegion
+    from sqlalchemy.ext.cache import CachingQuery
+    from sqlalchemy.ext.cache import MemoryBackend
+    from sqlalchemy.ext.cache import SecondLevelCache
+
+    Session = sessionmaker(bind=engine, query_cls=CachingQuery)
+
+    cache = SecondLevelCache(
+        CacheRegion(MemoryBackend(size=10000), expiration_time=300),
+        session_factory=Session,
+    )
+    cache.cache_class(Country)
+    cache.cache_class(Currency)
+
+    session = Session()
+
+    # emits SQL the first time, then is served from the cache in
+    # subsequent sessions
+    country = session.query(Country).get(5)
+
+    # the list of primary keys is cached; the objects themselves are
+    # assembled from the cached rows
+    countries = (
+        session.query(Country).filter(Country.continent == "EU").from_cache()
+    )
+
+Only column-based attributes are cached; relationships and other
+attributes are loaded as usual when first accessed on an object that was
+retrieved from the cache.   Values are pickled by both backends, so that
+objects retrieved from the cache don't share mutable column values with
+the object that was stored or with each other.   The
+:meth:`.InstanceEvents.load` event is emitted for an object retrieved
+from the cache, with ``None`` as the query context; extensions such as
+:mod:`sqlalchemy.ext.mutable` which establish their state upon load
+therefore apply to it as well.
+
+The rows loaded by a :class:`.CachingQuery` are stored when the query
+returns them, using one :meth:`.CacheBackend.set_multi` call per class.
+
+Cached query results are invalidated only by changes to the class that
+was queried; a query which filters on the columns of other classes may
+return stale results until the region's expiration time elapses.
+Similarly, changes made to the database other than by the sessions
+tracked by the cache, as well as those made by textual SQL statements,
+aren't detected; :meth:`.SecondLevelCache.invalidate`,
+:meth:`.SecondLevelCache.invalidate_class` and
+:meth:`.SecondLevelCache.invalidate_queries` may be used to discard
+cached data in these cases.
+
+The event listeners established by a :class:`.SecondLevelCache` remain
+in place until :meth:`.SecondLevelCache.dispose` is called.
+
+.. versionadded:: 1.3.12
+
+"""
+
+import hashlib
+import threading
+import time
+import uuid
+import weakref
+
+from .. import event
+from .. import inspect
+from .. import util
+from ..orm import attributes
+from ..orm import loading
+from ..orm.query import _MapperEntity
+from ..orm.query import Query
+from ..orm.session import make_transient_to_detached
+from ..orm.session import object_session
+from ..orm.session import Session
+from ..sql.dml import UpdateBase
+from ..util import pickle
+
+
+__all__ = [
+    "CacheBackend",
+    "MemoryBackend",
+    "MemcachedBackend",
+    "CacheRegion",
+    "SecondLevelCache",
+    "CachingQuery",
+]
+
+NO_VALUE = util.symbol("NO_VALUE")
+"""Returned by a :class:`.CacheBackend` for a key that isn't present."""
+
+_CACHE_KEY = "_sa_second_level_cache"
+
+_ALL_ROWS = util.symbol("ALL_ROWS")
+
+_PENDING_STORES = "_sa_second_level_cache_pending"
+
+
+class CacheBackend(object):
+    """Base class for storage backends used by a :class:`.CacheRegion`.
+
+    Subclasses implement :meth:`.get`, :meth:`.set` and :meth:`.delete`;
+    :meth:`.get_multi`, :meth:`.set_multi` and :meth:`.delete_multi` may
+    be overridden for backends which can perform them in a single round
+    trip.
+
+    """
+
+    def get(self, key):
+        """Return the value for the given key, or :data:`.NO_VALUE`."""
+        raise NotImplementedError()
+
+    def get_multi(self, keys):
+        """Return a list of values for the given keys, with
+        :data:`.NO_VALUE` for those which aren't present."""
+        return [self.get(key) for key in keys]
+
+    def set(self, key, value, expiration_time):
+        """Store a value, expiring it after the given number of seconds
+        unless ``expiration_time`` is None."""
+        raise NotImplementedError()
+
+    def set_multi(self, mapping, expiration_time):
+        """Store each of the values in the given dictionary of keys and
+        values."""
+        for key, value in mapping.items():
+            self.set(key, value, expiration_time)
+
+    def delete(self, key):
+        """Remove the given key, if present."""
+        raise NotImplementedError()
+
+    def delete_multi(self, keys):
+        """Remove each of the given keys, if present."""
+        for key in keys:
+            self.delete(key)
+
+
+class MemoryBackend(CacheBackend):
+    """An in-process backend which retains the most recently used
+    values, up to the given number of keys.
+
+    The backend is local to the process and is safe for use by multiple
+    threads.   Values are pickled when stored, so that each value
+    returned is a new copy which isn't shared with the value that was
+    stored or with other callers.
+
+    """
+
+    def __init__(self, size=1000):
+        self._cache = util.LRUCache(size)
+
+    def get(self, key):
+        entry = self._cache.get(key)
+        if entry is None:
+            return NO_VALUE
+        value, expires = entry
+        if expires is not None and expires <= time.time():
+            self._cache.pop(key, None)
+            return NO_VALUE
+        return pickle.loads(value)
+
+    def set(self, key, value, expiration_time):
+        if expiration_time is not None:
+            expires = time.time() + expiration_time
+        else:
+            expires = None
+        self._cache[key] = (
+            pickle.dumps(value, pickle.HIGHEST_PROTOCOL),
+            expires,
+        )
+
+    def delete(self, key):
+        self._cache.pop(key, None)
+
+
+class MemcachedBackend(CacheBackend):
+    """A backend which stores values in memcached.
+
+    The given client is used as is; any memcached client which provides
+    ``get()``, ``get_multi()``, ``set()``, ``set_multi()``, ``delete()``
+    and ``delete_multi()`` methods in the style of the ``pymemcache`` and
+    ``python-memcached`` libraries may be used.   Values are pickled, and
+    keys are hashed so that they meet memcached's restrictions on key
+    length and content.
+
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    def _key(self, key):
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def _loads(self, value):
+        if value is None:
+            return NO_VALUE
+        return pickle.loads(value)
+
+    def get(self, key):
+        return self._loads(self.client.get(self._key(key)))
+
+    def get_multi(self, keys):
+        hashed = [self._key(key) for key in keys]
+        values = self.client.get_multi(hashed)
+        return [self._loads(values.get(key)) for key in hashed]
+
+    def set(self, key, value, expiration_time):
+        self.client.set(
+            self._key(key),
+            pickle.dumps(value, pickle.HIGHEST_PROTOCOL),
+            int(expiration_time or 0),
+        )
+
+    def set_multi(self, mapping, expiration_time):
+        self.client.set_multi(
+            dict(
+                (self._key(key), pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+                for key, value in mapping.items()
+            ),
+            int(expiration_time or 0),
+        )
+
+    def delete(self, key):
+        self.client.delete(self._key(key))
+
+    def delete_multi(self, keys):
+        self.client.delete_multi([self._key(key) for key in keys])
+
+
+class CacheRegion(object):
+    """A namespace within a :class:`.CacheBackend` along with the
+    expiration time used for values stored in it.
+
+    :param backend: the :class:`.CacheBackend` in use; defaults to a new
+     :class:`.MemoryBackend`.
+
+    :param expiration_time: number of seconds after which values stored
+     in this region expire, defaulting to one hour; None indicates that
+     values don't expire other than through invalidation or eviction by
+     the backend.
+
+    :param key_prefix: string prepended to every key stored by this region,
+     allowing multiple regions, or multiple applications, to share a
+     backend.
+
+    """
+
+    def __init__(self, backend=None, expiration_time=3600, key_prefix="sa:"):
+        if backend is None:
+            backend = MemoryBackend()
+        self.backend = backend
+        self.expiration_time = expiration_time
+        self.key_prefix = key_prefix
+
+    def get(self, key):
+        return self.backend.get(self.key_prefix + key)
+
+    def get_multi(self, keys):
+        if not keys:
+            return []
+        prefix = self.key_prefix
+        return self.backend.get_multi([prefix + key for key in keys])
+
+    def set(self, key, value, expiration_time=NO_VALUE):
+        if expiration_time is NO_VALUE:
+            expiration_time = self.expiration_time
+        self.backend.set(self.key_prefix + key, value, expiration_time)
+
+    def set_multi(self, mapping, expiration_time=NO_VALUE):
+        if not mapping:
+            return
+        if expiration_time is NO_VALUE:
+            expiration_time = self.expiration_time
+        prefix = self.key_prefix
+        self.backend.set_multi(
+            dict((prefix + key, value) for key, value in mapping.items()),
+            expiration_time,
+        )
+
+    def delete(self, key):
+        self.backend.delete(self.key_prefix + key)
+
+    def delete_multi(self, keys):
+        if keys:
+            prefix = self.key_prefix
+            self.backend.delete_multi([prefix + key for key in keys])
+
+
+class SecondLevelCache(object):
+    """Cache the rows of selected mapped classes across sessions.
+
+    :param region: the default :class:`.CacheRegion` for classes passed
+     to :meth:`.cache_class`; defaults to a region using a
+     :class:`.MemoryBackend` and the default expiration time.
+
+    :param session_factory: a :class:`.sessionmaker`, or a :class:`.Session`
+     class or subclass, whose sessions are tracked by the cache; defaults
+     to :class:`.Session`, which applies to all sessions.   Rows and query
+     results are stored only by sessions which are tracked, and only
+     changes made by tracked sessions are invalidated; all sessions which
+     write to the cached classes should therefore be produced by this
+     factory.
+
+    The cache serves objects to sessions whose ``query_cls`` is
+    :class:`.CachingQuery`.   The event listeners established by the cache
+    are removed by :meth:`.SecondLevelCache.dispose`.
+
+    """
+
+    def __init__(self, region=None, session_factory=Session):
+        if region is None:
+            region = CacheRegion()
+        self.region = region
+        self.session_factory = session_factory
+        self._regions = {}
+        self._touched = weakref.WeakKeyDictionary()
+        self._snapshots = weakref.WeakKeyDictionary()
+        self._connections = weakref.WeakKeyDictionary()
+        self._mutex = threading.Lock()
+        self._listeners = []
+
+        for name, fn in [
+            ("after_begin", self._after_begin),
+            ("after_flush", self._after_flush),
+            ("after_commit", self._after_commit),
+            ("after_soft_rollback", self._after_rollback),
+            ("after_transaction_end", self._after_transaction_end),
+            ("after_bulk_update", self._after_bulk),
+            ("after_bulk_delete", self._after_bulk),
+        ]:
+            self._listen(session_factory, name, fn)
+
+    def _listen(self, target, name, fn, **kw):
+        event.listen(target, name, fn, **kw)
+        self._listeners.append((target, name, fn))
+
+    def cache_class(self, class_, region=None):
+        """Cache rows of the given mapped class, and of the classes which
+        share its inheritance hierarchy.
+
+        :param class_: a mapped class or :class:`.Mapper`.
+
+        :param region: the :class:`.CacheRegion` to use for this class;
+         defaults to the region passed to :class:`.SecondLevelCache`.
+
+        """
+        base_mapper = inspect(class_).base_mapper
+        manager = base_mapper.class_manager
+        existing = manager.info.get(_CACHE_KEY)
+        if existing is self:
+            return
+        elif existing is not None:
+            raise ValueError(
+                "Class %s is already cached by another SecondLevelCache"
+                % base_mapper.class_.__name__
+            )
+        manager.info[_CACHE_KEY] = self
+        self._regions[base_mapper] = region or self.region
+
+        target = base_mapper.class_
+        self._listen(target, "load", self._on_load, raw=True, propagate=True)
+        self._listen(
+            target, "refresh", self._on_refresh, raw=True, propagate=True
+        )
+        for name in ("after_insert", "after_update", "after_delete"):
+            self._listen(target, name, self._on_persist, propagate=True)
+
+    def dispose(self):
+        """Remove all event listeners established by this cache, and stop
+        caching the classes passed to :meth:`.cache_class`.
+
+        Values already stored in the cache regions are not removed.
+
+        """
+        for target, name, fn in self._listeners:
+            event.remove(target, name, fn)
+        self._listeners = []
+
+        for connection in list(self._connections):
+            if event.contains(connection, "after_execute", self._on_execute):
+                event.remove(connection, "after_execute", self._on_execute)
+        self._connections.clear()
+
+        for base_mapper in self._regions:
+            base_mapper.class_manager.info.pop(_CACHE_KEY, None)
+        self._regions.clear()
+        self._touched.clear()
+        self._snapshots.clear()
+
+    def invalidate(self, *instances):
+        """Remove the cached rows for the given instances, as well as the
+        cached query results for their classes."""
+
+        by_mapper = util.defaultdict(set)
+        for instance in instances:
+            state = attributes.instance_state(instance)
+            mapper = state.mapper
+            key = state.key or mapper._identity_key_from_state(state)
+            by_mapper[mapper.base_mapper].add(key[1])
+        self._invalidate(by_mapper)
+
+    def invalidate_class(self, class_):
+        """Invalidate all cached rows and query results for the given
+        class.
+
+        This may be used after the rows of the class are changed other than
+        through a :class:`.Session` tracked by the cache, or by a textual
+        SQL statement.
+
+        """
+        base_mapper = inspect(class_).base_mapper
+        self._invalidate({base_mapper: (_ALL_ROWS,)})
+
+    def invalidate_queries(self, class_):
+        """Invalidate all cached query results for the given class."""
+
+        base_mapper = inspect(class_).base_mapper
+        self._invalidate({base_mapper: ()})
+
+    def _region_for(self, base_mapper):
+        return self._regions[base_mapper]
+
+    def _token(self, mapper):
+        class_ = mapper.class_
+        return "%s.%s" % (class_.__module__, class_.__name__)
+
+    def _row_key(self, base_mapper, ident):
+        return "row:%s:%r" % (self._token(base_mapper), tuple(ident))
+
+    def _version_key(self, base_mapper):
+        return "version:%s" % self._token(base_mapper)
+
+    def _generation_key(self, base_mapper):
+        return "generation:%s" % self._token(base_mapper)
+
+    def _query_key(self, base_mapper, version, statement_key):
+        return "query:%s:%s:%s" % (
+            self._token(base_mapper),
+            version,
+            hashlib.sha1(statement_key.encode("utf-8")).hexdigest(),
+        )
+
+    def _get_or_create(self, region, keys):
+        """Return the values of the given version or generation keys,
+        establishing a new value for those which aren't present."""
+
+        values = region.get_multi(keys)
+        for idx, (key, value) in enumerate(zip(keys, values)):
+            if value is NO_VALUE:
+                values[idx] = uuid.uuid4().hex
+                region.set(key, values[idx], None)
+        return values
+
+    def _query_version(self, base_mapper):
+        region = self._region_for(base_mapper)
+        (version,) = self._get_or_create(
+            region, [self._version_key(base_mapper)]
+        )
+        return version
+
+    def _snapshot(self, session, base_mapper):
+        """Return the query version and row generation of the given class
+        as of the start of the session's transaction, or None."""
+
+        snapshot = self._snapshots.get(session)
+        if snapshot is None:
+            return None
+        return snapshot.get(base_mapper)
+
+    def _touch(self, session, base_mapper, ident):
+        with self._mutex:
+            touched = self._touched.get(session)
+            if touched is None:
+                touched = self._touched[session] = util.defaultdict(set)
+        touched[base_mapper].add(ident)
+
+    def _is_touched(self, session, base_mapper, ident=None):
+        touched = self._touched.get(session)
+        if not touched or base_mapper not in touched:
+            return False
+        idents = touched[base_mapper]
+        return ident is None or _ALL_ROWS in idents or tuple(ident) in idents
+
+    def _on_load(self, state, context):
+        if context is None:
+            # restored from the cache by _restore()
+            return
+        self._store_loaded(context, state)
+
+    def _on_refresh(self, state, context, attrs):
+        if attrs is None:
+            self._store_loaded(context, state)
+
+    def _store_loaded(self, context, state):
+        # a CachingQuery stores the objects it loads once it returns them;
+        # see CachingQuery._execute_and_instances()
+        pending = context.attributes.get(_PENDING_STORES)
+        if pending is not None:
+            pending[self].append(state)
+        else:
+            self._store_states(context.session, [state])
+
+    def _store_states(self, session, states):
+        """Store the column values of the given loaded states, using one
+        ``set_multi()`` and one version check for each class."""
+
+        entries = util.defaultdict(dict)
+        for state in states:
+            key = state.key
+            if key is None or key[2] is not None or state.modified:
+                continue
+            mapper = state.mapper
+            base_mapper = mapper.base_mapper
+            snapshot = self._snapshot(session, base_mapper)
+            if snapshot is None or self._is_touched(
+                session, base_mapper, key[1]
+            ):
+                continue
+
+            dict_ = state.dict
+            values = dict(
+                (prop.key, dict_[prop.key])
+                for prop in mapper.column_attrs
+                if prop.key in dict_
+            )
+            entries[base_mapper][self._row_key(base_mapper, key[1])] = (
+                self._token(mapper),
+                values,
+                snapshot[1],
+            )
+
+        for base_mapper, rows in entries.items():
+            region = self._region_for(base_mapper)
+            region.set_multi(rows)
+
+            # the rows were loaded within a transaction that began before
+            # the class was invalidated, or the class was invalidated while
+            # they were being stored; as invalidation changes the version
+            # before removing rows, the rows either are removed by the
+            # invalidation or are removed here
+            version = self._snapshot(session, base_mapper)[0]
+            if region.get(self._version_key(base_mapper)) != version:
+                region.delete_multi(list(rows))
+
+    def _on_persist(self, mapper, connection, target):
+        session = object_session(target)
+        if session is None:
+            return
+        state = attributes.instance_state(target)
+        key = state.key or mapper._identity_key_from_state(state)
+        self._touch(session, mapper.base_mapper, key[1])
+
+    def _on_execute(self, conn, clauseelement, multiparams, params, result):
+        """Mark the classes of a table modified by a DML statement, other
+        than one emitted by the unit of work, as touched in their
+        entirety."""
+
+        session = self._connections.get(conn)
+        session = session() if session is not None else None
+        if (
+            session is None
+            or session._flushing
+            or not isinstance(clauseelement, UpdateBase)
+        ):
+            return
+        table = clauseelement.table
+        for base_mapper in list(self._regions):
+            for mapper in base_mapper.self_and_descendants:
+                if table in mapper.tables:
+                    self._touch(session, base_mapper, _ALL_ROWS)
+                    break
+
+    def _after_begin(self, session, transaction, connection):
+        if session not in self._snapshots:
+            by_region = util.defaultdict(list)
+            for base_mapper, region in self._regions.items():
+                by_region[region].append(base_mapper)
+
+            snapshot = {}
+            for region, base_mappers in by_region.items():
+                keys = []
+                for base_mapper in base_mappers:
+                    keys.append(self._version_key(base_mapper))
+                    keys.append(self._generation_key(base_mapper))
+                values = self._get_or_create(region, keys)
+                snapshot.update(
+                    zip(base_mappers, zip(values[0::2], values[1::2]))
+                )
+            self._snapshots[session] = snapshot
+
+        if connection not in self._connections:
+            event.listen(connection, "after_execute", self._on_execute)
+        self._connections[connection] = weakref.ref(session)
+
+    def _after_bulk(self, context):
+        mapper = context.mapper
+        if mapper is not None and mapper.base_mapper in self._regions:
+            self._touch(context.session, mapper.base_mapper, _ALL_ROWS)
+
+    def _after_flush(self, session, flush_context):
+        touched = self._touched.get(session)
+        if touched:
+            self._invalidate(touched)
+
+    def _after_commit(self, session):
+        if session.transaction.nested:
+            return
+        touched = self._touched.pop(session, None)
+        if touched:
+            self._invalidate(touched)
+
+    def _after_rollback(self, session, previous_transaction):
+        if previous_transaction.parent is not None:
+            return
+        touched = self._touched.pop(session, None)
+        if touched:
+            self._invalidate(touched)
+
+    def _after_transaction_end(self, session, transaction):
+        if transaction.parent is None:
+            self._snapshots.pop(session, None)
+
+    def _invalidate(self, by_mapper):
+        for base_mapper, idents in by_mapper.items():
+            region = self._region_for(base_mapper)
+
+            # the version is changed first; see _store_state()
+            region.set(
+                self._version_key(base_mapper), uuid.uuid4().hex, None
+            )
+            if _ALL_ROWS in idents:
+                region.set(
+                    self._generation_key(base_mapper), uuid.uuid4().hex, None
+                )
+            region.delete_multi(
+                [
+                    self._row_key(base_mapper, ident)
+                    for ident in idents
+                    if ident is not _ALL_ROWS
+                ]
+            )
+
+    def _restore(self, session, mapper, entry, generation):
+        if entry is NO_VALUE or entry[2] != generation:
+            return None
+        token, values = entry[0:2]
+        for sub_mapper in mapper.self_and_descendants:
+            if self._token(sub_mapper) == token:
+                break
+        else:
+            return None
+        instance = sub_mapper.class_manager.new_instance()
+        attributes.instance_dict(instance).update(values)
+        make_transient_to_detached(instance)
+        session.add(instance)
+
+        state = attributes.instance_state(instance)
+        state.manager.dispatch.load(state, None)
+        return instance
+
+    def _instance_for_ident(self, session, mapper, ident):
+        base_mapper = mapper.base_mapper
+        if self._is_touched(session, base_mapper, ident):
+            return None
+        entry, generation = self._region_for(base_mapper).get_multi(
+            [
+                self._row_key(base_mapper, ident),
+                self._generation_key(base_mapper),
+            ]
+        )
+        return self._restore(session, mapper, entry, generation)
+
+    def _instances_for_idents(self, session, mapper, idents):
+        """Return instances for the given list of primary key identities
+        from the session's identity map or from the cache, or None if any
+        of them can't be located."""
+
+        base_mapper = mapper.base_mapper
+        results = []
+        missing = []
+        for ident in idents:
+            key = mapper.identity_key_from_primary_key(ident)
+            instance = loading.get_from_identity(
+                session, key, attributes.PASSIVE_OFF
+            )
+            if instance is None:
+                missing.append((len(results), ident))
+            results.append(instance)
+
+        if missing:
+            entries = self._region_for(base_mapper).get_multi(
+                [self._row_key(base_mapper, ident) for idx, ident in missing]
+                + [self._generation_key(base_mapper)]
+            )
+            generation = entries.pop()
+            for (idx, ident), entry in zip(missing, entries):
+                instance = self._restore(session, mapper, entry, generation)
+                if instance is None:
+                    return None
+                results[idx] = instance
+        return results
+
+
+def _cache_for_mapper(mapper):
+    return mapper.base_mapper.class_manager.info.get(_CACHE_KEY)
+
+
+def _store_pending(session, pending):
+    for cache, states in list(pending.items()):
+        cache._store_states(session, states)
+    pending.clear()
+
+
+class CachingQuery(Query):
+    """A :class:`.Query` subclass which makes use of the
+    :class:`.SecondLevelCache` configured for the classes it loads.
+
+    The cache is consulted when an object is located by primary key and
+    isn't present in the :class:`.Session`, which includes
+    :meth:`.Query.get` and many-to-one lazy loads that locate the related
+    object by primary key.   :meth:`.CachingQuery.from_cache` additionally
+    caches the results of individual queries.
+
+    """
+
+    _cache_results = False
+
+    def from_cache(self):
+        """Return a new :class:`.CachingQuery` whose results are cached.
+
+        The primary keys of the objects returned are stored in the cache,
+        keyed on the SQL and parameters of the query; subsequent executions
+        of the same query assemble the objects from the session and from
+        cached rows, falling back to the database if any of the rows are
+        no longer cached.   Only queries against a single cached class
+        make use of the cache.
+
+        """
+        q = self._clone()
+        q._cache_results = True
+        return q
+
+    def _identity_lookup(
+        self,
+        mapper,
+        primary_key_identity,
+        identity_token=None,
+        passive=attributes.PASSIVE_OFF,
+        **kw
+    ):
+        instance = super(CachingQuery, self)._identity_lookup(
+            mapper,
+            primary_key_identity,
+            identity_token=identity_token,
+            passive=passive,
+            **kw
+        )
+        if (
+            instance is None
+            and identity_token is None
+            and passive & attributes.SQL_OK
+            and passive & attributes.RELATED_OBJECT_OK
+        ):
+            cache = _cache_for_mapper(mapper)
+            if cache is not None:
+                instance = cache._instance_for_ident(
+                    self.session, mapper, primary_key_identity
+                )
+        return instance
+
+    def _execute_and_instances(self, querycontext):
+        pending = querycontext.attributes[
+            _PENDING_STORES
+        ] = util.defaultdict(list)
+        return self._store_pending(
+            querycontext.session,
+            pending,
+            super(CachingQuery, self)._execute_and_instances(querycontext),
+        )
+
+    def _store_pending(self, session, pending, iterator):
+        """Yield the results of the given iterator, storing the objects
+        loaded so far in the cache before each result is returned."""
+
+        for row in iterator:
+            if pending:
+                _store_pending(session, pending)
+            yield row
+        if pending:
+            _store_pending(session, pending)
+
+    def _cached_entity(self):
+        if (
+            not self._cache_results
+            or self._populate_existing
+            or self._for_update_arg is not None
+            or len(self._entities) != 1
+            or not isinstance(self._entities[0], _MapperEntity)
+        ):
+            return None, None
+        mapper = self._entities[0].mapper
+        return mapper, _cache_for_mapper(mapper)
+
+    def _statement_key(self):
+        compiled = self.with_labels().statement.compile()
+        params = dict(compiled.params)
+        params.update(self._params)
+        return " ".join(
+            [str(compiled)]
+            + ["%s=%r" % (key, params[key]) for key in sorted(params)]
+        )
+
+    def __iter__(self):
+        mapper, cache = self._cached_entity()
+        if cache is None:
+            return super(CachingQuery, self).__iter__()
+
+        session = self.session
+        if self._autoflush:
+            session._autoflush()
+
+        base_mapper = mapper.base_mapper
+        if cache._is_touched(session, base_mapper):
+            return super(CachingQuery, self).__iter__()
+
+        region = cache._region_for(base_mapper)
+        version = cache._query_version(base_mapper)
+        cache_key = cache._query_key(
+            base_mapper, version, self._statement_key()
+        )
+        idents = region.get(cache_key)
+        if idents is not NO_VALUE:
+            instances = cache._instances_for_idents(session, mapper, idents)
+            if instances is not None:
+                return iter(instances)
+
+        instances = list(super(CachingQuery, self).__iter__())
+
+        # results are stored only if the class wasn't invalidated since
+        # the session's transaction began; once it's invalidated after
+        # this point, the version within the key is no longer current
+        snapshot = cache._snapshot(session, base_mapper)
+        if snapshot is None or snapshot[0] != version:
+            return iter(instances)
+
+        identity_keys = [
+            attributes.instance_state(obj).key for obj in instances
+        ]
+        if all(key[2] is None for key in identity_keys):
+            region.set(cache_key, [key[1] for key in identity_keys])
+        return iter(instances)
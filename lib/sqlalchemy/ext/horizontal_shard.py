@@ -13,12 +13,31 @@ distribute queries and persistence operations across multiple databases.
 For a usage example, see the :ref:`examples_sharding` example included in
 the source distribution.
 
+A query which is run against more than one shard emits its statement
+against every shard before any rows are returned; the
+``max_workers`` parameter of :class:`.ShardedSession` allows these
+statements to be emitted concurrently.  ORM results are then produced from
+each shard's result lazily.  When the query's ORDER BY refers to mapped
+column attributes or to column expressions which are themselves part of the
+query, the rows of each shard are combined using an ordered merge, so that
+the overall result is ordered as well; LIMIT and OFFSET are then applied to
+the combined result, with each shard being asked only for the first
+LIMIT + OFFSET rows.  Otherwise, the results of each shard are returned one
+after the other.
+
 """
 
+import heapq
+import itertools
+import sys
+
 from .. import inspect
 from .. import util
+from ..orm.query import _result_getter
 from ..orm.query import Query
+from ..orm.query import QueryContext
 from ..orm.session import Session
+from ..sql import keyset
 
 
 __all__ = ["ShardedSession", "ShardedQuery"]
@@ -29,6 +48,7 @@ class ShardedQuery(Query):
         super(ShardedQuery, self).__init__(*args, **kwargs)
         self.id_chooser = self.session.id_chooser
         self.query_chooser = self.session.query_chooser
+        self.max_workers = self.session.max_workers
         self._shard_id = None
 
     def set_shard(self, shard_id):
@@ -55,35 +75,126 @@ class ShardedQuery(Query):
         elif self._shard_id is not None:
             return iter_for_shard(self._shard_id)
         else:
-            partial = []
-            for shard_id in self.query_chooser(self):
-                partial.extend(iter_for_shard(shard_id))
+            return self._iter_for_shards(
+                context, list(self.query_chooser(self))
+            )
+
+    def _iter_for_shards(self, context, shard_ids):
+        """Execute the given context against multiple shards, returning
+        a single iterator of ORM results.
+
+        The statement is emitted against each shard up front, concurrently
+        if ``max_workers`` was given to the :class:`.ShardedSession`.
+        The results of each shard are then run through
+        :func:`.loading.instances` lazily; if the ORDER BY of the query
+        can be evaluated against the loaded rows, the per-shard results
+        are combined using an ordered merge, else they are chained together
+        in the order of ``shard_ids``.
+
+        """
+        query = self
+        sort_key = _sort_key_for(context.query)
+
+        limit, offset = self._limit, self._offset
+        if len(shard_ids) > 1 and (limit is not None or offset):
+            if sort_key is None and self._order_by:
+                # rows can't be ordered in Python, so a trimmed result
+                # wouldn't be the same rows the database would choose;
+                # leave LIMIT / OFFSET to each individual shard
+                limit = offset = None
+            else:
+                # each shard returns the first limit + offset rows; the
+                # overall OFFSET and LIMIT are then applied to the merged
+                # result
+                query = self._clone()
+                if limit is not None:
+                    query._limit = limit + (offset or 0)
+                query._offset = None
+                context = query._compile_context()
+                context.statement.use_labels = True
+        else:
+            limit = offset = None
+
+        results = self._execute_for_shards(
+            shard_ids,
+            lambda shard_id: self._connection_from_session(
+                mapper=self._bind_mapper(), shard_id=shard_id
+            ),
+            context.statement,
+        )
+
+        iterators = [
+            _ShardIterator(
+                query, result, _context_for_shard(context, shard_id)
+            )
+            for shard_id, result in zip(shard_ids, results)
+        ]
+
+        if sort_key is not None and len(iterators) > 1:
+            rows = _ordered_merge(iterators, sort_key)
+        else:
+            rows = itertools.chain.from_iterable(iterators)
+
+        if limit is not None or offset:
+            offset = offset or 0
+            rows = itertools.islice(
+                rows, offset, offset + limit if limit is not None else None
+            )
+        return rows
+
+    def _execute_for_shards(self, shard_ids, connection_for_shard, statement):
+        """Execute a statement against a series of shards, returning
+        the list of :class:`.ResultProxy` objects in the order of
+        ``shard_ids``.
+
+        Connections are procured serially, as the :class:`.Session` itself
+        is not thread safe; the statements are then emitted on a pool of
+        at most ``max_workers`` threads.  Shards that resolve to the same
+        DBAPI connection are run one after the other within a single thread.
 
-            # if some kind of in memory 'sorting'
-            # were done, this is where it would happen
-            return iter(partial)
+        """
+        connections = [
+            connection_for_shard(shard_id) for shard_id in shard_ids
+        ]
+        results = [None] * len(connections)
+
+        groups = util.OrderedDict()
+        for idx, conn in enumerate(connections):
+            groups.setdefault(id(conn.connection), []).append(idx)
+
+        def execute(indexes):
+            for idx in indexes:
+                results[idx] = connections[idx].execute(
+                    statement, self._params
+                )
+
+        try:
+            _run_concurrently(execute, list(groups.values()), self.max_workers)
+        except:
+            with util.safe_reraise():
+                for result in results:
+                    if result is not None:
+                        result.close()
+        return results
 
     def _execute_crud(self, stmt, mapper):
-        def exec_for_shard(shard_id):
-            conn = self._connection_from_session(
+        def connection_for_shard(shard_id):
+            return self._connection_from_session(
                 mapper=mapper,
                 shard_id=shard_id,
                 clause=stmt,
                 close_with_result=True,
             )
-            result = conn.execute(stmt, self._params)
-            return result
 
         if self._shard_id is not None:
-            return exec_for_shard(self._shard_id)
+            return connection_for_shard(self._shard_id).execute(
+                stmt, self._params
+            )
         else:
-            rowcount = 0
-            results = []
-            for shard_id in self.query_chooser(self):
-                result = exec_for_shard(shard_id)
-                rowcount += result.rowcount
-                results.append(result)
-
+            results = self._execute_for_shards(
+                list(self.query_chooser(self)), connection_for_shard, stmt
+            )
+            rowcount = sum(result.rowcount for result in results)
             return ShardedResult(results, rowcount)
 
     def _identity_lookup(
@@ -185,6 +296,7 @@ class ShardedSession(Session):
         query_chooser,
         shards=None,
         query_cls=ShardedQuery,
+        max_workers=None,
         **kwargs
     ):
         """Construct a ShardedSession.
@@ -207,11 +319,26 @@ class ShardedSession(Session):
         :param shards: A dictionary of string shard names
           to :class:`~sqlalchemy.engine.Engine` objects.
 
+        :param max_workers: when greater than one, statements which are
+          emitted against more than one shard, including queries as well as
+          :meth:`.Query.update` and :meth:`.Query.delete`, are executed
+          concurrently using up to this many threads.  Connections are
+          still procured from the :class:`.Session` in the calling thread,
+          and ORM results are still produced in the calling thread; only the
+          execution of the statement on each shard's connection takes place
+          in a worker thread.  The DBAPI in use must allow a connection to
+          be used from a thread other than the one which created it; for
+          pysqlite, this means passing ``check_same_thread=False``.
+          Defaults to ``None``, executing shards one at a time.
+
+          .. versionadded:: 1.3.12
+
         """
         super(ShardedSession, self).__init__(query_cls=query_cls, **kwargs)
         self.shard_chooser = shard_chooser
         self.id_chooser = id_chooser
         self.query_chooser = query_chooser
+        self.max_workers = max_workers
         self.__binds = {}
         self.connection_callable = self.connection
         if shards is not None:
@@ -255,3 +382,174 @@ class ShardedSession(Session):
 
     def bind_shard(self, shard_id, bind):
         self.__binds[shard_id] = bind
+
+
+class _ShardIterator(object):
+    """Iterate the ORM results for a single shard's :class:`.ResultProxy`.
+
+    :func:`.loading.instances` isn't invoked until the first row is
+    requested, so that results from many shards may be consumed
+    incrementally.
+
+    """
+
+    __slots__ = ("query", "result", "context", "_iterator")
+
+    def __init__(self, query, result, context):
+        self.query = query
+        self.result = result
+        self.context = context
+        self._iterator = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._iterator is None:
+            self._iterator = self.query.instances(self.result, self.context)
+        return next(self._iterator)
+
+    next = __next__
+
+
+def _context_for_shard(context, shard_id):
+    """Return a copy of a :class:`.QueryContext` local to one shard.
+
+    Each call to :func:`.loading.instances` establishes per-load state such
+    as ``runid`` and ``partials`` on the context, so the results of
+    several shards can only be interleaved if each has its own context.
+
+    """
+    shard_context = QueryContext.__new__(QueryContext)
+    for attr in QueryContext.__slots__:
+        if hasattr(context, attr):
+            setattr(shard_context, attr, getattr(context, attr))
+    shard_context.attributes = dict(context.attributes)
+    shard_context.attributes["shard_id"] = shard_id
+    shard_context.identity_token = shard_id
+    return shard_context
+
+
+class _Descending(object):
+    """Reverse the ordering of a value within a sort key."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __ne__(self, other):
+        return self.value != other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+def _sort_key_for(query):
+    """Return a function which produces a sort key for an ORM result row
+    corresponding to the ORDER BY of the given query, or None if the
+    query has no ORDER BY or it can't be evaluated against the rows.
+
+    Each element of the ORDER BY must refer to a column attribute of
+    an entity within the query, or to a column expression which is itself
+    one of the query's columns.  NULL is considered to sort lower than
+    all other values, unless :meth:`.ColumnElement.nullsfirst` or
+    :meth:`.ColumnElement.nullslast` is used.
+
+    """
+    if not query._order_by:
+        return None
+
+    single_entity = query.is_single_entity
+    getters = []
+    for element in query._order_by:
+        element, descending, nullsfirst = keyset._unwrap_ordering(element)
+
+        getter = _result_getter(query, element, single_entity)
+        if getter is None:
+            return None
+
+        if nullsfirst is None:
+            nullsfirst = not descending
+        getters.append((getter, descending, nullsfirst != descending))
+
+    def sort_key(row):
+        key = []
+        for getter, descending, nulls_low in getters:
+            value = getter(row)
+            if nulls_low:
+                value = (value is not None, value)
+            else:
+                value = (value is None, value)
+            key.append(_Descending(value) if descending else value)
+        return key
+
+    return sort_key
+
+
+def _ordered_merge(iterators, sort_key):
+    """Merge already-sorted iterators into a single sorted iterator.
+
+    Ties are broken by the position of the iterator, so that rows which
+    sort the same are returned in shard order.
+
+    """
+    heap = []
+    for idx, iterator in enumerate(iterators):
+        for row in iterator:
+            heap.append((sort_key(row), idx, row, iterator))
+            break
+    heapq.heapify(heap)
+
+    while heap:
+        key, idx, row, iterator = heap[0]
+        yield row
+        for row in iterator:
+            heapq.heapreplace(heap, (sort_key(row), idx, row, iterator))
+            break
+        else:
+            heapq.heappop(heap)
+
+
+def _run_concurrently(fn, items, max_workers):
+    """Call ``fn`` for each of ``items`` on up to ``max_workers``
+    threads, re-raising the first exception encountered."""
+
+    if not max_workers or max_workers < 2 or len(items) < 2:
+        for item in items:
+            fn(item)
+        return
+
+    mutex = util.threading.Lock()
+    pending = iter(items)
+    errors = []
+
+    def worker():
+        while True:
+            with mutex:
+                if errors:
+                    return
+                item = next(pending, None)
+            if item is None:
+                return
+            try:
+                fn(item)
+            except:
+                with mutex:
+                    errors.append(sys.exc_info())
+                return
+
+    threads = [
+        util.threading.Thread(target=worker)
+        for i in range(min(max_workers, len(items)))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        util.reraise(*errors[0])
@@ -222,6 +222,62 @@ from within the mutable extension::
     def modified_json(instance):
         print("json value modified:", instance.data)
 
+.. _mutable_json_partial_updates:
+
+In-Place Updates of JSON Columns
+--------------------------------
+
+A subclass of :class:`.MutableDict` or :class:`.MutableList` which sets
+the ``json_partial_updates`` flag, used with a :class:`.types.JSON`
+column, keeps a log of the keys it has set or deleted, or of the items
+appended to it, since it was loaded or last flushed for each parent
+object.  On backends which support it, the unit of work renders this log
+as an UPDATE which modifies the stored document in place, rather than
+writing out the whole document again::
+
+    class JSONDict(MutableDict):
+        json_partial_updates = True
+
+    class MyDataClass(Base):
+        __tablename__ = 'my_data'
+        id = Column(Integer, primary_key=True)
+        data = Column(JSONDict.as_mutable(postgresql.JSONB))
+
+    obj = session.query(MyDataClass).first()
+    obj.data['status'] = 'complete'
+    del obj.data['pending']
+    session.flush()
+
+Above, PostgreSQL receives an UPDATE of the form
+``SET data=(jsonb_set(my_data.data, CAST(%(param_1)s AS TEXT[]),
+%(param_2)s) - CAST(%(param_3)s AS TEXT))``.  The supported backends are:
+
+* PostgreSQL, for the :class:`.postgresql.JSONB` type only, using
+  ``jsonb_set()`` and the ``-`` and ``||`` operators
+
+* MySQL, using ``JSON_SET()``, ``JSON_REMOVE()`` and
+  ``JSON_ARRAY_APPEND()``
+
+* SQLite, using ``json_set()``, ``json_remove()`` and, on SQLite 3.31.0
+  and above, ``json_insert()``
+
+The full value is written instead for other backends, for a value which
+was newly assigned to the attribute or unpickled, when a dictionary key
+is not a string, when a list is changed other than by appending to it,
+and when :func:`.attributes.flag_modified` is called by the application.
+As changes made within nested dictionaries and lists are not logged, the
+full value is also written whenever the value contains a dictionary or
+list.  Once the UPDATE is emitted, the attribute is expired as is the
+case for any other SQL expression, so that the document as modified by
+the database is loaded when next accessed.
+
+Partial updates are not enabled by default, as they apply the logged
+changes to the document as it's stored in the database at the time of
+the UPDATE, rather than replacing it with the value held in Python;
+changes made to other keys by concurrent transactions are retained.
+
+.. versionadded:: 1.3.12
+
 .. _mutable_composites:
 
 Establishing Mutability on Composites
@@ -358,6 +414,7 @@ import weakref
 
 from .. import event
 from .. import types
+from .. import util
 from ..orm import Mapper
 from ..orm import mapper
 from ..orm import object_mapper
@@ -448,6 +505,9 @@ class MutableBase(object):
         parent_cls = attribute.class_
 
         listen_keys = cls._get_listen_keys(attribute)
+        log_changes = (
+            issubclass(cls, _JSONChangeLog) and cls.json_partial_updates
+        )
 
         def load(state, *args):
             """Listen for objects loaded or refreshed.
@@ -462,6 +522,8 @@ class MutableBase(object):
                     val = cls.coerce(key, val)
                     state.dict[key] = val
                 val._parents[state.obj()] = key
+                if log_changes and isinstance(val, _JSONChangeLog):
+                    val._start_change_log(state.obj())
 
         def load_attrs(state, ctx, attrs):
             if not attrs or listen_keys.intersection(attrs):
@@ -483,10 +545,27 @@ class MutableBase(object):
                 value = cls.coerce(key, value)
             if value is not None:
                 value._parents[target.obj()] = key
+                if isinstance(value, _JSONChangeLog):
+                    value._change_logs.pop(target.obj(), None)
             if isinstance(oldvalue, cls):
                 oldvalue._parents.pop(target.obj(), None)
+                if isinstance(oldvalue, _JSONChangeLog):
+                    oldvalue._change_logs.pop(target.obj(), None)
             return value
 
+        def modified(state, initiator):
+            """Discard the change log of the value when the attribute
+            is flagged as modified other than by the value itself."""
+
+            val = state.dict.get(key, None)
+            if isinstance(val, _JSONChangeLog) and not val._logging:
+                val._change_logs.pop(state.obj(), None)
+
+        def flushed(mapper, connection, state):
+            val = state.dict.get(key, None)
+            if isinstance(val, _JSONChangeLog):
+                val._start_change_log(state.obj())
+
         def pickle(state, state_dict):
             val = state.dict.get(key, None)
             if val is not None:
@@ -513,6 +592,16 @@ class MutableBase(object):
         event.listen(
             parent_cls, "unpickle", unpickle, raw=True, propagate=True
         )
+        if log_changes:
+            event.listen(
+                attribute, "modified", modified, raw=True, propagate=True
+            )
+            event.listen(
+                parent_cls, "after_insert", flushed, raw=True, propagate=True
+            )
+            event.listen(
+                parent_cls, "after_update", flushed, raw=True, propagate=True
+            )
 
 
 class Mutable(MutableBase):
@@ -673,7 +762,60 @@ def _setup_composite_listener():
 _setup_composite_listener()
 
 
-class MutableDict(Mutable, dict):
+def _has_containers(values):
+    """Return True if any of the given values is a dictionary or list,
+    within which changes aren't logged."""
+
+    for value in values:
+        if isinstance(value, (dict, list)):
+            return True
+    return False
+
+
+class _JSONChangeLog(object):
+    """Mixin for :class:`.Mutable` containers which log the changes made
+    to them for each parent, so that a JSON column may be updated in place.
+
+    A parent has a change log from the point at which it loads or flushes
+    the value; a change log is discarded whenever the parent's attribute is
+    flagged as modified by any means other than a logged change.
+
+    """
+
+    json_partial_updates = False
+    """When True, changes are logged so that a JSON column may be updated
+    in place; see :ref:`mutable_json_partial_updates`.
+
+    .. versionadded:: 1.3.12
+
+    """
+
+    _logging = False
+
+    @memoized_property
+    def _change_logs(self):
+        """Dictionary of parent object->change log."""
+
+        return weakref.WeakKeyDictionary()
+
+    def _start_change_log(self, parent):
+        raise NotImplementedError()
+
+    def _logged_changed(self):
+        self._logging = True
+        try:
+            self.changed()
+        finally:
+            self._logging = False
+
+    def _sa_json_changes(self, parent):
+        """Return the list of changes logged for the given parent, or None
+        if its full value must be written."""
+
+        raise NotImplementedError()
+
+
+class MutableDict(_JSONChangeLog, Mutable, dict):
     """A dictionary type that implements :class:`.Mutable`.
 
     The :class:`.MutableDict` object implements a dictionary that will
@@ -688,6 +830,10 @@ class MutableDict(Mutable, dict):
     coercion to the values placed in the dictionary so that they too are
     "mutable", and emit events up to their parent structure.
 
+    A subclass which sets ``json_partial_updates = True`` also logs the
+    keys set or deleted, so that a :class:`.types.JSON` column may be
+    updated in place; see :ref:`mutable_json_partial_updates`.
+
     .. seealso::
 
         :class:`.MutableList`
@@ -699,30 +845,31 @@ class MutableDict(Mutable, dict):
     def __setitem__(self, key, value):
         """Detect dictionary set events and emit change events."""
         dict.__setitem__(self, key, value)
-        self.changed()
+        self._keys_changed((key,))
 
     def setdefault(self, key, value):
         result = dict.setdefault(self, key, value)
-        self.changed()
+        self._keys_changed((key,))
         return result
 
     def __delitem__(self, key):
         """Detect dictionary del events and emit change events."""
         dict.__delitem__(self, key)
-        self.changed()
+        self._keys_changed((key,))
 
     def update(self, *a, **kw):
-        dict.update(self, *a, **kw)
-        self.changed()
+        values = dict(*a, **kw)
+        dict.update(self, values)
+        self._keys_changed(values)
 
     def pop(self, *arg):
         result = dict.pop(self, *arg)
-        self.changed()
+        self._keys_changed(arg[0:1])
         return result
 
     def popitem(self):
         result = dict.popitem(self)
-        self.changed()
+        self._keys_changed(result[0:1])
         return result
 
     def clear(self):
@@ -745,8 +892,30 @@ class MutableDict(Mutable, dict):
     def __setstate__(self, state):
         self.update(state)
 
+    def _start_change_log(self, parent):
+        self._change_logs[parent] = util.OrderedSet()
+
+    def _keys_changed(self, keys):
+        for log in self._change_logs.values():
+            log.update(keys)
+        self._logged_changed()
+
+    def _sa_json_changes(self, parent):
+        log = self._change_logs.get(parent)
+        if log is None or _has_containers(self.values()):
+            return None
+        changes = []
+        for key in log:
+            if not isinstance(key, util.string_types):
+                return None
+            elif key in self:
+                changes.append(("set", key, self[key]))
+            else:
+                changes.append(("delete", key))
+        return changes
+
 
-class MutableList(Mutable, list):
+class MutableList(_JSONChangeLog, Mutable, list):
     """A list type that implements :class:`.Mutable`.
 
     The :class:`.MutableList` object implements a list that will
@@ -761,6 +930,10 @@ class MutableList(Mutable, list):
     coercion to the values placed in the dictionary so that they too are
     "mutable", and emit events up to their parent structure.
 
+    A subclass which sets ``json_partial_updates = True`` also logs the
+    items appended to the list, so that a :class:`.types.JSON` column may
+    be updated in place; see :ref:`mutable_json_partial_updates`.
+
     .. versionadded:: 1.1
 
     .. seealso::
@@ -806,11 +979,12 @@ class MutableList(Mutable, list):
 
     def append(self, x):
         list.append(self, x)
-        self.changed()
+        self._items_appended(1)
 
     def extend(self, x):
+        length = len(self)
         list.extend(self, x)
-        self.changed()
+        self._items_appended(len(self) - length)
 
     def __iadd__(self, x):
         self.extend(x)
@@ -846,6 +1020,23 @@ class MutableList(Mutable, list):
         else:
             return value
 
+    def _start_change_log(self, parent):
+        self._change_logs[parent] = 0
+
+    def _items_appended(self, count):
+        logs = self._change_logs
+        for parent, appended in list(logs.items()):
+            logs[parent] = appended + count
+        self._logged_changed()
+
+    def _sa_json_changes(self, parent):
+        appended = self._change_logs.get(parent)
+        if appended is None or _has_containers(self):
+            return None
+        elif not appended:
+            return []
+        return [("append", list(self[-appended:]))]
+
 
 class MutableSet(Mutable, set):
     """A set type that implements :class:`.Mutable`.
@@ -805,7 +805,7 @@ class ScalarAttributeImpl(AttributeImpl):
         else:
             old = dict_.get(self.key, NO_VALUE)
 
-        if self.dispatch.remove:
+        if self.dispatch.remove.has_listeners:
             self.fire_remove_event(state, dict_, old, self._remove_token)
         state._modified_event(dict_, self, old)
 
@@ -845,7 +845,7 @@ class ScalarAttributeImpl(AttributeImpl):
         else:
             old = dict_.get(self.key, NO_VALUE)
 
-        if self.dispatch.set:
+        if self.dispatch.set.has_listeners:
             value = self.fire_replace_event(
                 state, dict_, value, old, initiator
             )
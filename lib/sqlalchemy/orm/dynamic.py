@@ -149,7 +149,9 @@ class DynamicAttributeImpl(attributes.AttributeImpl):
     def _modified_event(self, state, dict_):
 
         if self.key not in state.committed_state:
-            state.committed_state[self.key] = CollectionHistory(self, state)
+            state._writable_committed_state()[self.key] = CollectionHistory(
+                self, state
+            )
 
         state._modified_event(dict_, self, attributes.NEVER_SET)
 
@@ -51,6 +51,8 @@ class ClassManager(dict):
 
     deferred_scalar_loader = None
 
+    _state_class = state.InstanceState
+
     original_init = object.__init__
 
     factory = None
@@ -200,7 +202,7 @@ class ClassManager(dict):
     @util.memoized_property
     def _state_constructor(self):
         self.dispatch.first_init(self, self.class_)
-        return state.InstanceState
+        return self._state_class
 
     def manage(self):
         """Mark this instance as the manager for its class."""
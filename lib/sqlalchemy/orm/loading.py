@@ -38,6 +38,9 @@ def instances(query, cursor, context):
     context.runid = _new_runid()
     context.post_load_paths = {}
 
+    stats_entry = cursor.context._stats_entry
+    hydrate_time = 0
+
     filtered = query._has_mapper_entities
 
     single_entity = query.is_single_entity
@@ -76,6 +79,9 @@ def instances(query, cursor, context):
             else:
                 fetch = cursor.fetchall()
 
+            if stats_entry is not None:
+                start = util.perf_counter()
+
             if single_entity:
                 proc = process[0]
                 rows = [proc(row) for row in fetch]
@@ -91,11 +97,17 @@ def instances(query, cursor, context):
             if filtered:
                 rows = util.unique_list(rows, filter_fn)
 
+            if stats_entry is not None:
+                hydrate_time += util.perf_counter() - start
+
             for row in rows:
                 yield row
 
             if not query._yield_per:
                 break
+
+        if stats_entry is not None:
+            stats_entry._record_hydrate(hydrate_time)
     except Exception as err:
         cursor.close()
         util.raise_from_cause(err)
@@ -429,9 +441,11 @@ def _instance_processor(
     session_identity_map = context.session.identity_map
 
     populate_existing = context.populate_existing or mapper.always_refresh
-    load_evt = bool(mapper.class_manager.dispatch.load)
-    refresh_evt = bool(mapper.class_manager.dispatch.refresh)
-    persistent_evt = bool(context.session.dispatch.loaded_as_persistent)
+    load_evt = mapper.class_manager.dispatch.load.has_listeners
+    refresh_evt = mapper.class_manager.dispatch.refresh.has_listeners
+    persistent_evt = (
+        context.session.dispatch.loaded_as_persistent.has_listeners
+    )
     if persistent_evt:
         loaded_as_persistent = context.session.dispatch.loaded_as_persistent
     instance_state = attributes.instance_state
@@ -697,11 +711,11 @@ def _populate_full(
             for key, set_callable in populators["expire"]:
                 dict_.pop(key, None)
                 if set_callable:
-                    state.expired_attributes.add(key)
+                    state._writable_expired_attributes().add(key)
         else:
             for key, set_callable in populators["expire"]:
                 if set_callable:
-                    state.expired_attributes.add(key)
+                    state._writable_expired_attributes().add(key)
         for key, populator in populators["new"]:
             populator(state, dict_, row)
         for key, populator in populators["delayed"]:
@@ -753,7 +767,7 @@ def _populate_partial(
             if key in to_load:
                 dict_.pop(key, None)
                 if set_callable:
-                    state.expired_attributes.add(key)
+                    state._writable_expired_attributes().add(key)
         for key, populator in populators["new"]:
             if key in to_load:
                 populator(state, dict_, row)
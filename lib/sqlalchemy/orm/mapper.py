@@ -27,6 +27,7 @@ from . import exc as orm_exc
 from . import instrumentation
 from . import loading
 from . import properties
+from . import state as statelib
 from . import util as orm_util
 from .base import _class_to_mapper
 from .base import _INSTRUMENTOR
@@ -159,6 +160,7 @@ class Mapper(InspectionAttr):
         confirm_deleted_rows=True,
         eager_defaults=False,
         legacy_is_orphan=False,
+        compact_state=False,
         _compiled_cache_size=100,
     ):
         r"""Return a new :class:`~.Mapper` object.
@@ -250,6 +252,21 @@ class Mapper(InspectionAttr):
 
            See the section :ref:`column_prefix` for an example.
 
+        :param compact_state: if True, instances of the mapped class are
+           tracked using a :class:`.CompactInstanceState`, which stores its
+           per-object attributes in ``__slots__`` and doesn't allocate the
+           collections used for change tracking until the object is first
+           modified or expired.  This reduces the memory used by large
+           numbers of loaded, unmodified objects.   Code which manipulates
+           :attr:`.InstanceState.committed_state` directly, rather than
+           through the attribute system, is not compatible with this mode.
+
+           .. versionadded:: 1.3.12
+
+           .. seealso::
+
+                :ref:`faq_memory_many_objects`
+
         :param concrete: If True, indicates this mapper should use concrete
            table inheritance with its parent mapper.
 
@@ -652,6 +669,7 @@ class Mapper(InspectionAttr):
         self.passive_updates = passive_updates
         self.passive_deletes = passive_deletes
         self.legacy_is_orphan = legacy_is_orphan
+        self.compact_state = compact_state
         self._clause_adapter = None
         self._requires_row_aliasing = False
         self._inherits_equated_pairs = None
@@ -1297,6 +1315,8 @@ class Mapper(InspectionAttr):
         manager.deferred_scalar_loader = util.partial(
             loading.load_scalar_attributes, self
         )
+        if self.compact_state:
+            manager._state_class = statelib.CompactInstanceState
 
         # The remaining members can be added by any mapper,
         # e_name None or not.
@@ -2260,6 +2280,22 @@ class Mapper(InspectionAttr):
             for table, columns in self._cols_by_table.items()
         )
 
+    @_memoized_configured_property
+    def _json_cols(self):
+        return dict(
+            (
+                table,
+                frozenset(
+                    [
+                        col
+                        for col in columns
+                        if isinstance(col.type, sql.sqltypes.JSON)
+                    ]
+                ),
+            )
+            for table, columns in self._cols_by_table.items()
+        )
+
     @property
     def selectable(self):
         """The :func:`.select` construct this :class:`.Mapper` selects from
@@ -3085,6 +3121,10 @@ class Mapper(InspectionAttr):
     def _compiled_cache(self):
         return util.LRUCache(self._compiled_cache_size)
 
+    @_memoized_configured_property
+    def _query_context_cache(self):
+        return util.LRUCache(self._compiled_cache_size)
+
     @_memoized_configured_property
     def _sorted_tables(self):
         table_to_mapper = {}
@@ -181,6 +181,118 @@ def _bulk_update(
         )
 
 
+def _bulk_merge(mapper, mappings, session_transaction, refresh):
+    base_mapper = mapper.base_mapper
+
+    cached_connections = _cached_connection_dict(base_mapper)
+
+    if session_transaction.session.connection_callable:
+        raise NotImplementedError(
+            "connection_callable / per-instance sharding "
+            "not supported in bulk_merge_mappings()"
+        )
+
+    if mapper.version_id_col is not None:
+        raise NotImplementedError(
+            "version_id_col not supported in bulk_merge_mappings()"
+        )
+
+    mappings = list(mappings)
+
+    connection = session_transaction.connection(base_mapper)
+    dialect = connection.dialect
+
+    for table, super_mapper in base_mapper._sorted_tables.items():
+        if not mapper.isa(super_mapper):
+            continue
+
+        pk_keys = mapper._pk_keys_by_table[table]
+
+        # group rows by the set of columns present, as each set
+        # renders a distinct statement
+        records = util.OrderedDict()
+        for (
+            state,
+            state_dict,
+            params,
+            mp,
+            conn,
+            value_params,
+            has_all_pks,
+            has_all_defaults,
+        ) in _collect_insert_commands(
+            table,
+            ((None, mapping, mapper, connection) for mapping in mappings),
+            bulk=True,
+            render_nulls=True,
+        ):
+            if value_params:
+                raise sa_exc.InvalidRequestError(
+                    "SQL expressions are not supported as values "
+                    "in bulk_merge_mappings()"
+                )
+            if not pk_keys.issubset(params):
+                raise sa_exc.InvalidRequestError(
+                    "Primary key values for table '%s' are required "
+                    "in all mappings passed to bulk_merge_mappings()"
+                    % table.description
+                )
+            records.setdefault(tuple(sorted(params)), []).append(params)
+
+        for keys, multiparams in records.items():
+            statement = base_mapper._memo(
+                ("merge", table, dialect.name, keys),
+                lambda: dialect._upsert_statement(
+                    table,
+                    [c for c in table.primary_key],
+                    [key for key in keys if key not in pk_keys],
+                ),
+            )
+            cached_connections[connection].execute(statement, multiparams)
+
+    if refresh:
+        _refresh_merged_states(
+            mapper, mappings, session_transaction.session.identity_map
+        )
+
+
+def _refresh_merged_states(mapper, mappings, identity_map):
+    """Apply merged values to the unmodified attributes of instances
+    already present in the identity map."""
+
+    identity_props = [p.key for p in mapper._identity_key_props]
+    column_keys = set(
+        prop.key for prop in mapper.column_attrs if not prop.deferred
+    )
+    expire_keys = set(
+        mapper._columntoproperty[col].key
+        for col in mapper.columns
+        if col.server_onupdate is not None
+        and col in mapper._columntoproperty
+    )
+
+    for mapping in mappings:
+        obj = identity_map.get(
+            mapper.identity_key_from_primary_key(
+                [mapping[key] for key in identity_props]
+            )
+        )
+        if obj is None:
+            continue
+        state = attributes.instance_state(obj)
+        dict_ = state.dict
+        keys = [
+            key
+            for key in column_keys.intersection(mapping)
+            if key not in state.committed_state
+        ]
+        for key in keys:
+            dict_[key] = mapping[key]
+        state._commit(dict_, keys)
+        if expire_keys:
+            state._expire_attributes(dict_, expire_keys)
+
+
 def save_obj(base_mapper, states, uowtransaction, single=False):
     """Issue ``INSERT`` and/or ``UPDATE`` statements for a list
     of objects.
@@ -607,6 +719,7 @@ def _collect_update_commands(
             has_all_defaults = True
         else:
             params = {}
+            json_cols = mapper._json_cols[table]
             for propkey in set(propkey_to_col).intersection(
                 state.committed_state
             ):
@@ -629,6 +742,13 @@ def _collect_update_commands(
                     )
                     is not True
                 ):
+                    if col in json_cols:
+                        expr = _json_partial_update(
+                            state, col, value, connection.dialect
+                        )
+                        if expr is not None:
+                            value_params[col] = expr
+                            continue
                     params[col.key] = value
 
             if mapper.base_mapper.eager_defaults:
@@ -749,6 +869,24 @@ def _collect_update_commands(
                 )
 
 
+def _json_partial_update(state, col, value, dialect):
+    """Return an expression which updates a JSON column in place, or
+    None if its full value should be written.
+
+    This applies to values which keep a log of the changes made to them
+    since they were loaded or last flushed, such as the containers of
+    :mod:`sqlalchemy.ext.mutable`.
+
+    """
+    json_changes = getattr(value, "_sa_json_changes", None)
+    if json_changes is None:
+        return None
+    changes = json_changes(state.obj())
+    if not changes:
+        return None
+    return dialect._json_partial_update(col, changes)
+
+
 def _collect_post_update_commands(
     base_mapper, uowtransaction, table, states_to_update, post_update_cols
 ):
@@ -1117,27 +1255,40 @@ def _emit_insert_statements(
             elif mapper.version_id_col is not None:
                 statement = statement.return_defaults(mapper.version_id_col)
 
-            for (
-                state,
-                state_dict,
-                params,
-                mapper_rec,
-                connection,
-                value_params,
-                has_all_pks,
-                has_all_defaults,
-            ) in records:
+            records = list(records)
 
-                if value_params:
-                    result = connection.execute(
-                        statement.values(value_params), params
-                    )
-                else:
-                    result = cached_connections[connection].execute(
-                        statement, params
-                    )
+            if (
+                has_all_pks
+                and not hasvalue
+                and len(records) > 1
+                and connection.dialect.insert_executemany_returning
+                and table.implicit_returning
+            ):
+                inserted = _emit_batch_insert_statement(
+                    cached_connections, mapper, table, statement, records
+                )
+            else:
+                inserted = _emit_single_insert_statements(
+                    cached_connections, statement, records
+                )
+
+            for (
+                (
+                    state,
+                    state_dict,
+                    params,
+                    mapper_rec,
+                    connection,
+                    value_params,
+                    has_all_pks,
+                    has_all_defaults,
+                ),
+                result,
+                last_inserted_params,
+                primary_key,
+                returned_defaults_row,
+            ) in inserted:
 
-                primary_key = result.context.inserted_primary_key
                 if primary_key is not None:
                     # set primary key attributes
                     for pk, col in zip(
@@ -1158,14 +1309,97 @@ def _emit_insert_statements(
                             state,
                             state_dict,
                             result,
-                            result.context.compiled_parameters[0],
+                            last_inserted_params,
                             value_params,
                             False,
+                            returned_defaults_row=returned_defaults_row,
                         )
                     else:
                         _postfetch_bulk_save(mapper_rec, state_dict, table)
 
 
+def _emit_single_insert_statements(cached_connections, statement, records):
+    """Emit an INSERT statement for each of the given records, yielding
+    each record along with its result, its compiled parameters, its
+    primary key and its returned row."""
+
+    for record in records:
+        connection, value_params = record[4], record[5]
+        if value_params:
+            result = connection.execute(
+                statement.values(value_params), record[2]
+            )
+        else:
+            result = cached_connections[connection].execute(
+                statement, record[2]
+            )
+
+        yield (
+            record,
+            result,
+            result.context.compiled_parameters[0],
+            result.context.inserted_primary_key,
+            None,
+        )
+
+
+def _emit_batch_insert_statement(
+    cached_connections, mapper, table, statement, records
+):
+    """Emit a single executemany() INSERT statement for records which
+    each include their primary key, yielding each record along with the
+    result, its compiled parameters, its primary key and its returned
+    row.
+
+    The database isn't guaranteed to deliver rows from RETURNING in the
+    order of the parameter sets, so the primary key columns are rendered
+    as bound expressions in order that they're part of RETURNING; each
+    returned row is then matched to its record by primary key.
+
+    """
+
+    pk_cols = mapper._pks_by_table[table]
+    statement = statement.values(
+        dict(
+            (col.key, sql.bindparam(col.key, type_=col.type))
+            for col in pk_cols
+        )
+    )
+
+    connection = records[0][4]
+    result = cached_connections[connection].execute(
+        statement, [record[2] for record in records]
+    )
+
+    returned_rows = dict(
+        (tuple(row[col] for col in pk_cols), row)
+        for row in result.context._returned_defaults_rows or ()
+    )
+
+    for record, compiled_params in zip(
+        records, result.context.compiled_parameters
+    ):
+        primary_key = tuple(record[2][col.key] for col in pk_cols)
+        row = returned_rows.get(primary_key)
+        if row is None:
+            # the returned row couldn't be located, such as for a
+            # primary key type which doesn't round trip; the
+            # attributes are loaded from the database on next access
+            # instead
+            state = record[0]
+            if state is not None:
+                state._expire_attributes(
+                    state.dict,
+                    [
+                        mapper._columntoproperty[col].key
+                        for col in result.context.compiled.returning
+                        if not col.primary_key
+                        and col in mapper._columntoproperty
+                    ],
+                )
+        yield record, result, compiled_params, None, row
+
+
 def _emit_post_update_statements(
     base_mapper, uowtransaction, cached_connections, mapper, table, update
 ):
@@ -1460,7 +1694,7 @@ def _postfetch_post_update(
     ):
         prefetch_cols = list(prefetch_cols) + [mapper.version_id_col]
 
-    refresh_flush = bool(mapper.class_manager.dispatch.refresh_flush)
+    refresh_flush = mapper.class_manager.dispatch.refresh_flush.has_listeners
     if refresh_flush:
         load_evt_attrs = []
 
@@ -1496,6 +1730,7 @@ def _postfetch(
     params,
     value_params,
     isupdate,
+    returned_defaults_row=None,
 ):
     """Expire attributes in need of newly persisted database state,
     after an INSERT or UPDATE statement has proceeded for that
@@ -1511,12 +1746,15 @@ def _postfetch(
     ):
         prefetch_cols = list(prefetch_cols) + [mapper.version_id_col]
 
-    refresh_flush = bool(mapper.class_manager.dispatch.refresh_flush)
+    refresh_flush = mapper.class_manager.dispatch.refresh_flush.has_listeners
     if refresh_flush:
         load_evt_attrs = []
 
     if returning_cols:
-        row = result.context.returned_defaults
+        if returned_defaults_row is not None:
+            row = returned_defaults_row
+        else:
+            row = result.context.returned_defaults
         if row is not None:
             for col in returning_cols:
                 # pk cols returned from insert are handled
@@ -1821,7 +2059,7 @@ class BulkUpdate(BulkUD):
         )
 
     def _do_before_compile(self):
-        if self.query.dispatch.before_compile_update:
+        if self.query.dispatch.before_compile_update.has_listeners:
             for fn in self.query.dispatch.before_compile_update:
                 new_query = fn(self.query, self)
                 if new_query is not None:
@@ -1909,7 +2147,7 @@ class BulkDelete(BulkUD):
         )
 
     def _do_before_compile(self):
-        if self.query.dispatch.before_compile_delete:
+        if self.query.dispatch.before_compile_delete.has_listeners:
             for fn in self.query.dispatch.before_compile_delete:
                 new_query = fn(self.query, self)
                 if new_query is not None:
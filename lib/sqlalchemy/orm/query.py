@@ -19,7 +19,9 @@ database to return iterable result sets.
 
 """
 
+import copy
 from itertools import chain
+from itertools import islice
 
 from . import attributes
 from . import exc as orm_exc
@@ -47,7 +49,9 @@ from .. import inspection
 from .. import log
 from .. import sql
 from .. import util
+from ..sql import elements as sql_elements
 from ..sql import expression
+from ..sql import keyset
 from ..sql import util as sql_util
 from ..sql import visitors
 from ..sql.base import ColumnCollection
@@ -363,7 +367,9 @@ class Query(object):
                     if e is not None:
                         return e
 
-        return visitors.replacement_traverse(clause, {}, replace)
+        return visitors.replacement_traverse(
+            clause, {"share_unmodified": True}, replace
+        )
 
     def _query_entity_zero(self):
         """Return the first QueryEntity."""
@@ -888,6 +894,8 @@ class Query(object):
 
         .. seealso::
 
+            :meth:`.Query.partitions`
+
             :meth:`.Query.enable_eagerloads`
 
         """
@@ -896,6 +904,62 @@ class Query(object):
             {"stream_results": True, "max_row_buffer": count}
         )
 
+    def partitions(self, size=None):
+        """Execute this :class:`.Query` and iterate through its results in
+        lists of ``size`` rows each.
+
+        The query is run with :meth:`.Query.yield_per` in effect, so that
+        rows are fetched from the cursor and converted into ORM objects one
+        partition at a time; a server side cursor is used where supported
+        by the dialect.  Each partition is fully loaded, including any
+        :func:`.selectinload` eager loaders, which emit their IN queries for
+        the objects of each partition as it's produced::
+
+            for partition in session.query(User).options(
+                selectinload(User.addresses)
+            ).partitions(1000):
+                for user in partition:
+                    process(user)
+
+        Objects which are no longer referenced once a partition has been
+        processed are released from the :class:`.Session`, so that memory
+        use remains bounded for arbitrarily large results.  The same
+        restrictions regarding collection eager loading as those of
+        :meth:`.Query.yield_per` apply.
+
+        :param size: number of rows in each partition; defaults to the
+         value passed to :meth:`.Query.yield_per` if one is established.
+
+        .. versionadded:: 1.3.12
+
+        .. seealso::
+
+            :meth:`.Query.yield_per`
+
+        """
+        if size is None:
+            size = self._yield_per
+            if not size:
+                raise sa_exc.ArgumentError(
+                    "A partition size must be passed to Query.partitions() "
+                    "when Query.yield_per() is not in effect"
+                )
+
+        if size != self._yield_per:
+            q = self.yield_per(size)
+        else:
+            q = self
+
+        return q._iter_partitions(size)
+
+    def _iter_partitions(self, size):
+        iterator = iter(self)
+        while True:
+            partition = list(islice(iterator, size))
+            if not partition:
+                break
+            yield partition
+
     def get(self, ident):
         """Return an instance based on the given primary key identifier,
         or ``None`` if not found.
@@ -1854,6 +1918,103 @@ class Query(object):
         else:
             self._order_by = self._order_by + criterion
 
+    def _keyset_ordering(self):
+        entities = util.unique_list(
+            ent.entity_zero
+            for ent in self._entities
+            if isinstance(ent, (_MapperEntity, _ColumnEntity))
+            and ent.mapper is not None
+        )
+        return keyset.KeysetOrdering(
+            self._order_by or (),
+            [
+                [
+                    getattr(entity.entity, prop.key).__clause_element__()
+                    for prop in entity.mapper._identity_key_props
+                ]
+                for entity in entities
+            ],
+        )
+
+    def seek(self, token=None):
+        """Return a new :class:`.Query` which returns the rows following
+        those of a previous page, using keyset ("seek") pagination.
+
+        Keyset pagination locates the start of a page using criteria against
+        the ORDER BY of the query, rather than skipping rows with OFFSET,
+        so that each page can be located directly using an index::
+
+            q = session.query(User).order_by(User.name, User.id)
+
+            users = q.seek().limit(20).all()
+            token = q.seek_token(users[-1])
+
+            # the next page
+            users = q.seek(token).limit(20).all()
+
+        The ORDER BY may include any combination of ascending and descending
+        expressions.  Expressions which may be NULL must state the position
+        of NULL values using :meth:`.ColumnElement.nullsfirst` or
+        :meth:`.ColumnElement.nullslast`.  If the ORDER BY doesn't include
+        the primary key attributes of an entity, and the query refers to a
+        single entity, that entity's primary key attributes are added to the
+        ORDER BY, so that each row has a distinct position.
+
+        As the page is located using the WHERE clause, :meth:`.Query.seek`
+        may be combined with eager loaders such as :func:`.joinedload`
+        which wrap a LIMIT query within a subquery.  It must be called
+        before :meth:`.Query.limit` is applied.
+
+        :param token: a token returned by :meth:`.Query.seek_token` for the
+         last row of the previous page.  If omitted, the first page is
+         returned.
+
+        .. versionadded:: 1.3.12
+
+        .. seealso::
+
+            :meth:`.Query.seek_token`
+
+            :meth:`.Select.seek`
+
+        """
+        self._no_statement_condition("seek")
+        self._no_limit_offset("seek")
+
+        ordering = self._keyset_ordering()
+        q = self.order_by(*ordering.added) if ordering.added else self
+        if token is not None:
+            q = q.filter(ordering.criterion(ordering.values(token)))
+        elif q is self:
+            q = self._clone()
+        return q
+
+    def seek_token(self, row):
+        """Return an opaque token representing the position of the given
+        row, which is passed to :meth:`.Query.seek` in order to return the
+        rows which follow it.
+
+        The row is an object or tuple as returned by this :class:`.Query`.
+        Each expression in the ORDER BY, including the primary key
+        attributes added by :meth:`.Query.seek`, must either be an
+        attribute of an entity in the row or be one of its columns.
+
+        .. versionadded:: 1.3.12
+
+        """
+        ordering = self._keyset_ordering()
+        single_entity = self.is_single_entity
+        values = []
+        for expr, descending, nullsfirst, nullable in ordering.elements:
+            getter = _result_getter(self, expr, single_entity)
+            if getter is None:
+                raise sa_exc.InvalidRequestError(
+                    "ORDER BY expression %s is not present in the rows "
+                    "of this Query" % expr
+                )
+            values.append(getter(row))
+        return ordering.token(values)
+
     @_generative(_no_statement_condition, _no_limit_offset)
     def group_by(self, *criterion):
         """apply one or more GROUP BY criterion to the query and return
@@ -3222,6 +3383,21 @@ class Query(object):
         of columns
         appropriate to the entity class represented by this :class:`.Query`.
 
+        A :func:`~.expression.lambda_stmt` construct which produces a
+        SELECT may also be passed, so that the construction of the statement
+        is cached::
+
+            user = session.query(User).from_statement(
+                lambda_stmt(
+                    lambda: select([User.__table__]).where(
+                        User.__table__.c.name == name
+                    )
+                )
+            ).one()
+
+        .. versionchanged:: 1.3.12 :meth:`.Query.from_statement` accepts a
+           :func:`~.expression.lambda_stmt` construct.
+
         .. seealso::
 
             :ref:`orm_tutorial_literal_sql` - usage examples in the
@@ -3231,7 +3407,12 @@ class Query(object):
         statement = expression._expression_literal_as_text(statement)
 
         if not isinstance(
-            statement, (expression.TextClause, expression.SelectBase)
+            statement,
+            (
+                expression.TextClause,
+                expression.SelectBase,
+                expression.StatementLambdaElement,
+            ),
         ):
             raise sa_exc.ArgumentError(
                 "from_statement accepts text(), select(), "
@@ -3360,11 +3541,11 @@ class Query(object):
             return None
 
     def __iter__(self):
-        context = self._compile_context()
+        query, context = self._cached_compile_context()
         context.statement.use_labels = True
         if self._autoflush and not self._populate_existing:
             self.session._autoflush()
-        return self._execute_and_instances(context)
+        return query._execute_and_instances(context)
 
     def __str__(self):
         context = self._compile_context()
@@ -3888,7 +4069,7 @@ class Query(object):
         return update_op.rowcount
 
     def _compile_context(self, labels=True):
-        if self.dispatch.before_compile:
+        if self.dispatch.before_compile.has_listeners:
             for fn in self.dispatch.before_compile:
                 new_query = fn(self)
                 if new_query is not None and new_query is not self:
@@ -3941,6 +4122,253 @@ class Query(object):
 
         return context
 
+    def _cached_compile_context(self):
+        """Return the :class:`.Query` and :class:`.QueryContext` with which
+        to execute this query.
+
+        The :class:`.QueryContext` compiled for a query is cached by the
+        base mapper of the query's leading entity, keyed on the structure
+        of the query, so that a later query of the same structure may skip
+        :meth:`._compile_context` and execute the cached statement using
+        the bound parameter values of its own SQL expressions.
+
+        """
+        if (
+            self.session is None
+            or not self.session.enable_baked_queries
+            or self.dispatch.before_compile.has_listeners
+        ):
+            return self, self._compile_context()
+
+        cache_key = self._context_cache_key()
+        if cache_key is None:
+            return self, self._compile_context()
+
+        mapper, key, bindparams = cache_key
+        base_mapper = mapper.base_mapper
+        cached = base_mapper._query_context_cache.get(key)
+        if cached is not None:
+            return self._from_cached_context(base_mapper, cached, bindparams)
+
+        context = self._compile_context()
+        cached = self._cacheable_context(context, bindparams)
+        if cached is not None:
+            base_mapper._query_context_cache[key] = cached
+        return self, context
+
+    @_generative()
+    def _no_context_cache(self):
+        self._bake_ok = False
+
+    @util.dependencies("sqlalchemy.orm.strategy_options")
+    def _context_cache_key(self, strategy_options):
+        """Return a tuple of the mapper, the structural key and the list
+        of bound parameters for this query, or None if the query can't
+        be cached.
+
+        """
+        for_update = self._for_update_arg
+        if (
+            not self._bake_ok
+            or not self._entities
+            or self._statement is not None
+            or self._refresh_state is not None
+            or self._from_obj_alias is not None
+            or self._filter_aliases
+            or self._prefixes
+            or self._suffixes
+            or (for_update is not None and for_update.of is not None)
+            or not isinstance(self._limit, _context_cache_ints)
+            or not isinstance(self._offset, _context_cache_ints)
+        ):
+            return None
+
+        mapper = self._bind_mapper()
+        if mapper is None:
+            return None
+
+        bindparams = []
+        key = [self.__class__]
+
+        for ent in self._entities:
+            ent_key = ent._context_cache_key(bindparams)
+            if ent_key is None:
+                return None
+            key.append(ent_key)
+
+        elements = []
+        for value in (
+            self._criterion,
+            self._order_by,
+            self._group_by,
+            self._having,
+            self._distinct,
+            self._from_obj,
+        ):
+            if isinstance(value, (list, tuple)):
+                key.append(len(value))
+                elements.extend(value)
+            elif isinstance(value, sql.ClauseElement):
+                key.append(True)
+                elements.append(value)
+            else:
+                key.append(value)
+
+        for element in elements:
+            element_key = element._generate_cache_key()
+            if element_key is None:
+                return None
+            key.append(element_key.key)
+            bindparams.extend(element_key.bindparams)
+
+        for attr_key, value in self._attributes.items():
+            if attr_key == "_unbound_load_dedupes":
+                continue
+            if isinstance(value, strategy_options.Load):
+                value = (
+                    value.__class__,
+                    value.strategy,
+                    value._of_type,
+                    value.is_class_strategy,
+                    value.is_opts_only,
+                    value.propagate_to_loaders,
+                    tuple(
+                        (opt_key, value.local_opts[opt_key])
+                        for opt_key in sorted(value.local_opts)
+                    ),
+                )
+            elif not isinstance(value, _context_cache_literals):
+                return None
+            key.append((attr_key, value))
+
+        for opt in self._with_options:
+            if not isinstance(opt, strategy_options.Load):
+                opt_key = opt._generate_cache_key(self._current_path)
+                if opt_key is False:
+                    return None
+                key.append(opt_key)
+
+        if for_update is not None:
+            for_update = (
+                for_update.__class__,
+                for_update.read,
+                for_update.nowait,
+                for_update.skip_locked,
+                for_update.key_share,
+            )
+
+        key.extend(
+            [
+                self._limit,
+                self._offset,
+                for_update,
+                self._yield_per,
+                self._with_labels,
+                self._only_return_tuples,
+                self._enable_eagerloads,
+                self._enable_single_crit,
+                self._orm_only_adapt,
+                self._orm_only_from_obj_alias,
+                self._populate_existing,
+                self._invoke_all_eagers,
+                self._version_check,
+                self._select_from_entity,
+                self._join_entities,
+                self._correlate,
+                self._with_hints,
+                self._current_path.path,
+                frozenset(self._only_load_props)
+                if self._only_load_props
+                else None,
+                frozenset(
+                    (search, adapter.selectable)
+                    for search, adapter in self._polymorphic_adapters.items()
+                ),
+            ]
+        )
+
+        key = tuple(key)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return mapper, key, bindparams
+
+    def _cacheable_context(self, context, bindparams):
+        """Return the cache entry for a newly compiled
+        :class:`.QueryContext`, or None if it can't be reused."""
+
+        for value in context.attributes.values():
+            # subquery eager loaders compile a Query against
+            # this one and its session
+            if isinstance(value, Query):
+                return None
+
+        # the bound parameters of later queries are located in the cached
+        # statement by key; if any were copied into the statement with
+        # a new key, such as by adaptation, their values can't be replaced
+        statement_keys = set()
+        visitors.traverse(
+            context.statement,
+            {},
+            {"bindparam": lambda bind: statement_keys.add(bind.key)},
+        )
+        bind_keys = [bind.key for bind in bindparams]
+        if not statement_keys.issuperset(bind_keys):
+            return None
+
+        template = copy.copy(context)
+        template.query = template.session = template.propagate_options = None
+        template.attributes = context.attributes.copy()
+        return (
+            template,
+            self._entities,
+            self._primary_entity,
+            self._polymorphic_adapters,
+            bind_keys,
+        )
+
+    def _from_cached_context(self, base_mapper, cached, bindparams):
+        (
+            template,
+            entities,
+            primary_entity,
+            polymorphic_adapters,
+            bind_keys,
+        ) = cached
+
+        params = dict(
+            (key, bind.effective_value)
+            for key, bind in zip(bind_keys, bindparams)
+            if not bind.required
+        )
+        params.update(self._params)
+
+        # the context refers to the query entities which were set up
+        # against it, so these are used in place of our own
+        query = self._clone()
+        query._entities = entities
+        query._primary_entity = primary_entity
+        query._polymorphic_adapters = polymorphic_adapters
+        query._params = params
+
+        # the statement is the same object on each use, so its compiled
+        # form may be cached by identity as BakedQuery does
+        if "compiled_cache" not in query._execution_options:
+            query._execution_options = query._execution_options.union(
+                {"compiled_cache": base_mapper._compiled_cache}
+            )
+
+        context = copy.copy(template)
+        context.query = query
+        context.session = query.session
+        context.autoflush = query._autoflush
+        context.propagate_options = set(
+            o for o in query._with_options if o.propagate_to_loaders
+        )
+        context.attributes = template.attributes.copy()
+        return query, context
+
     def _compound_eager_statement(self, context):
         # for eager joins present and LIMIT/OFFSET/DISTINCT,
         # wrap the query inside a select,
@@ -4103,6 +4531,15 @@ class LockmodeArg(ForUpdateArg):
         return LockmodeArg(read=read, nowait=nowait)
 
 
+_context_cache_ints = util.int_types + (type(None),)
+
+_context_cache_literals = util.string_types + _context_cache_ints + (
+    bool,
+    float,
+    tuple,
+)
+
+
 class _QueryEntity(object):
     """represent an entity column returned within a Query result."""
 
@@ -4124,6 +4561,13 @@ class _QueryEntity(object):
         q.__dict__ = self.__dict__.copy()
         return q
 
+    def _context_cache_key(self, bindparams):
+        """Return the structural key for this entity within the key
+        of :meth:`.Query._context_cache_key`, adding the bound parameters
+        it contains to ``bindparams``, or None if it can't be cached."""
+
+        return None
+
 
 class _MapperEntity(_QueryEntity):
     """mapper/class/AliasedClass entity"""
@@ -4154,6 +4598,15 @@ class _MapperEntity(_QueryEntity):
             self._label_name = self.mapper.class_.__name__
         self.path = self.entity_zero._path_registry
 
+    def _context_cache_key(self, bindparams):
+        return (
+            _MapperEntity,
+            self.entity_zero,
+            tuple(self._with_polymorphic or ()),
+            self._polymorphic_discriminator,
+            self.selectable,
+        )
+
     def set_with_polymorphic(
         self, query, cls_or_mappers, selectable, polymorphic_on
     ):
@@ -4633,6 +5086,18 @@ class _ColumnEntity(_QueryEntity):
         c.entity_zero = self.entity_zero
         c.entities = self.entities
 
+    def _context_cache_key(self, bindparams):
+        column_key = self.column._generate_cache_key()
+        if column_key is None:
+            return None
+        bindparams.extend(column_key.bindparams)
+        return (
+            _ColumnEntity,
+            column_key.key,
+            self._label_name,
+            self.entity_zero,
+        )
+
     def setup_entity(self, ext_info, aliased_adapter):
         if "selectable" not in self.__dict__:
             self.selectable = ext_info.selectable
@@ -4685,6 +5150,66 @@ class _ColumnEntity(_QueryEntity):
         return str(self.column)
 
 
+def _result_getter(query, element, single_entity):
+    """Return a function which extracts the value of the given column
+    expression from a result row of the given query, or None if it
+    isn't present in the query's rows.
+
+    The expression may be one of the query's column entities, or a column
+    attribute of one of its mapped entities.
+
+    """
+    if isinstance(element, sql_elements._label_reference):
+        element = element.element
+    if isinstance(element, expression.Label):
+        element = element.element
+
+    for idx, ent in enumerate(query._entities):
+        if isinstance(ent, _ColumnEntity):
+            column = ent.column
+            if isinstance(element, sql_elements._textual_label_reference):
+                match = ent._label_name == element.element
+            else:
+                if isinstance(column, expression.Label):
+                    column = column.element
+                match = column._deannotate() is element._deannotate()
+            if match:
+                return _item_getter(idx, single_entity, None)
+        elif isinstance(ent, _MapperEntity) and isinstance(
+            element, expression.ColumnClause
+        ):
+            parententity = element._annotations.get("parententity")
+            if parententity is None:
+                if ent.is_aliased_class:
+                    continue
+            elif parententity is not ent.entity_zero and (
+                ent.is_aliased_class
+                or parententity.is_aliased_class
+                or not ent.mapper.isa(parententity)
+            ):
+                continue
+            for column in element.base_columns:
+                try:
+                    prop = ent.mapper.get_property_by_column(column)
+                except orm_exc.UnmappedColumnError:
+                    continue
+                else:
+                    return _item_getter(idx, single_entity, prop.key)
+    return None
+
+
+def _item_getter(idx, single_entity, key):
+    if single_entity:
+        if key is None:
+            return lambda row: row
+        else:
+            return lambda row: getattr(row, key)
+    elif key is None:
+        return lambda row: row[idx]
+    else:
+        return lambda row: getattr(row[idx], key)
+
+
 class QueryContext(object):
     __slots__ = (
         "multi_row_eager_loaders",
@@ -551,6 +551,13 @@ class RelationshipProperty(StrategizedProperty):
 
             .. versionadded:: 1.2
 
+          * ``batch`` - items should be loaded lazily when the property is
+            first accessed, at the same time for all of the parent objects
+            loaded by the same query, using a SELECT statement which
+            specifies primary key identifiers using an IN clause.
+
+            .. versionadded:: 1.3.12
+
           * ``noload`` - no loading should occur at any time.  This is to
             support "write-only" attributes, or attributes which are
             populated in some manner specific to the application.
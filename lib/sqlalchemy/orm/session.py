@@ -636,6 +636,7 @@ class Session(_SessionClassMethods):
         "bulk_save_objects",
         "bulk_insert_mappings",
         "bulk_update_mappings",
+        "bulk_merge_mappings",
         "merge",
         "query",
         "refresh",
@@ -776,6 +777,11 @@ class Session(_SessionClassMethods):
            logic in the calling application or potentially within the ORM
            that may be malfunctioning due to cache key collisions or similar
            can be flagged by observing if this flag resolves the issue.
+           The flag additionally disables the caching of compiled
+           :class:`.Query` objects by their structure and loader options.
+
+           .. versionchanged:: 1.3.12 the flag also applies to the
+              compiled structure cache of :class:`.Query`.
 
            .. versionadded:: 1.2
 
@@ -2495,7 +2501,7 @@ class Session(_SessionClassMethods):
 
         flush_context = UOWTransaction(self)
 
-        if self.dispatch.before_flush:
+        if self.dispatch.before_flush.has_listeners:
             self.dispatch.before_flush(self, flush_context, objects)
             # re-establish "dirty states" in case the listeners
             # added
@@ -2860,6 +2866,72 @@ class Session(_SessionClassMethods):
             mapper, mappings, True, False, False, False, False
         )
 
+    def bulk_merge_mappings(self, mapper, mappings, refresh=False):
+        """Perform a bulk "upsert" of the given list of mapping dictionaries.
+
+        Each mapping is INSERTed as a new row, or, if a row with the same
+        primary key already exists, used to UPDATE that row, using the
+        database's native upsert syntax; this is ``INSERT..ON CONFLICT``
+        on PostgreSQL and SQLite, and ``INSERT..ON DUPLICATE KEY UPDATE``
+        on MySQL.   Unlike :meth:`.Session.merge`, no SELECT is emitted
+        to locate existing rows; mappings which contain the same set of
+        keys are batched together into a single "executemany" statement.
+
+        .. versionadded:: 1.3.12
+
+        .. warning::
+
+            The bulk merge feature shares the caveats of the other bulk
+            methods; object management, relationship handling and SQL
+            clause support are **silently omitted**, and Python-side
+            :paramref:`.Column.onupdate` values are not applied to rows
+            that are updated.
+
+            **Please read the list of caveats at** :ref:`bulk_operations`
+            **before using this method, and fully test and confirm the
+            functionality of all code developed using these systems.**
+
+        :param mapper: a mapped class, or the actual :class:`.Mapper` object,
+         representing the single kind of object represented within the mapping
+         list.
+
+        :param mappings: a list of dictionaries, each one containing the state
+         of the mapped row to be merged, in terms of the attribute names
+         on the mapped class.   Each dictionary must contain the primary
+         key values of the row; a value of ``None`` is written as NULL.
+         Keys that are present and are not part of the primary key are
+         applied to the SET clause of the upsert; keys that are omitted
+         keep their existing value for rows that are updated.
+
+        :param refresh: when True, instances already present in the
+         :class:`.Session` identity map whose primary keys match a merged
+         row have the merged values applied to those attributes which have
+         no pending changes, and have attributes mapped to columns with a
+         server-side ON UPDATE default expired.
+
+        .. seealso::
+
+            :ref:`bulk_operations`
+
+            :meth:`.Session.bulk_insert_mappings`
+
+            :meth:`.Session.bulk_update_mappings`
+
+        """
+        mapper = _class_to_mapper(mapper)
+        self._flushing = True
+
+        transaction = self.begin(subtransactions=True)
+        try:
+            persistence._bulk_merge(mapper, mappings, transaction, refresh)
+            transaction.commit()
+
+        except:
+            with util.safe_reraise():
+                transaction.rollback(_capture_exception=True)
+        finally:
+            self._flushing = False
+
     def _bulk_save_mappings(
         self,
         mapper,
@@ -3313,14 +3385,15 @@ def make_transient(instance):
         s._expunge_states([state])
 
     # remove expired state
-    state.expired_attributes.clear()
+    if state.expired_attributes:
+        state.expired_attributes.clear()
 
     # remove deferred callables
     if state.callables:
         del state.callables
 
     if state.key:
-        del state.key
+        state.key = None
     if state._deleted:
         del state._deleted
 
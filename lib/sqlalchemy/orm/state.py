@@ -344,7 +344,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
             state.session_id = None
 
             if to_transient and state.key:
-                del state.key
+                state.key = None
             if persistent:
                 if to_transient:
                     if persistent_to_transient is not None:
@@ -514,13 +514,9 @@ class InstanceState(interfaces.InspectionAttrInfo):
             else:
                 self.expired_attributes = set()
 
-        self.__dict__.update(
-            [
-                (k, state_dict[k])
-                for k in ("key", "load_options")
-                if k in state_dict
-            ]
-        )
+        for k in ("key", "load_options"):
+            if k in state_dict:
+                setattr(self, k, state_dict[k])
         if self.key:
             try:
                 self.identity_token = self.key[2]
@@ -542,10 +538,23 @@ class InstanceState(interfaces.InspectionAttrInfo):
         old = dict_.pop(key, None)
         if old is not None and self.manager[key].impl.collection:
             self.manager[key].impl._invalidate_collection(old)
-        self.expired_attributes.discard(key)
+        if self.expired_attributes:
+            self.expired_attributes.discard(key)
         if self.callables:
             self.callables.pop(key, None)
 
+    def _writable_committed_state(self):
+        """Return the ``committed_state`` dictionary, for in-place
+        modification."""
+
+        return self.committed_state
+
+    def _writable_expired_attributes(self):
+        """Return the ``expired_attributes`` set, for in-place
+        modification."""
+
+        return self.expired_attributes
+
     def _copy_callables(self, from_):
         if "callables" in from_.__dict__:
             self.callables = dict(from_.callables)
@@ -577,7 +586,8 @@ class InstanceState(interfaces.InspectionAttrInfo):
 
         if self.modified:
             modified_set.discard(self)
-            self.committed_state.clear()
+            if self.committed_state:
+                self.committed_state.clear()
             self.modified = False
 
         self._strong_obj = None
@@ -588,13 +598,13 @@ class InstanceState(interfaces.InspectionAttrInfo):
         if "parents" in self.__dict__:
             del self.__dict__["parents"]
 
-        self.expired_attributes.update(
-            [
-                impl.key
-                for impl in self.manager._scalar_loader_impls
-                if impl.expire_missing or impl.key in dict_
-            ]
-        )
+        expired_keys = [
+            impl.key
+            for impl in self.manager._scalar_loader_impls
+            if impl.expire_missing or impl.key in dict_
+        ]
+        if expired_keys:
+            self._writable_expired_attributes().update(expired_keys)
 
         if self.callables:
             for k in self.expired_attributes.intersection(self.callables):
@@ -625,7 +635,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
                 if no_loader and (impl.callable_ or key in callables):
                     continue
 
-                self.expired_attributes.add(key)
+                self._writable_expired_attributes().add(key)
                 if callables and key in callables:
                     del callables[key]
             old = dict_.pop(key, NO_VALUE)
@@ -639,7 +649,8 @@ class InstanceState(interfaces.InspectionAttrInfo):
             ):
                 self._last_known_values[key] = old
 
-            self.committed_state.pop(key, None)
+            if self.committed_state:
+                self.committed_state.pop(key, None)
             if pending:
                 pending.pop(key, None)
 
@@ -663,7 +674,8 @@ class InstanceState(interfaces.InspectionAttrInfo):
         # instance state didn't have an identity,
         # the attributes still might be in the callables
         # dict.  ensure they are removed.
-        self.expired_attributes.clear()
+        if self.expired_attributes:
+            self.expired_attributes.clear()
 
         return ATTR_WAS_SET
 
@@ -740,7 +752,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
 
                     if previous not in (None, NO_VALUE, NEVER_SET):
                         previous = attr.copy(previous)
-                self.committed_state[attr.key] = previous
+                self._writable_committed_state()[attr.key] = previous
 
             if attr.key in self._last_known_values:
                 self._last_known_values[attr.key] = NO_VALUE
@@ -778,14 +790,16 @@ class InstanceState(interfaces.InspectionAttrInfo):
         this step if a value was not populated in state.dict.
 
         """
-        for key in keys:
-            self.committed_state.pop(key, None)
+        if self.committed_state:
+            for key in keys:
+                self.committed_state.pop(key, None)
 
         self.expired = False
 
-        self.expired_attributes.difference_update(
-            set(keys).intersection(dict_)
-        )
+        if self.expired_attributes:
+            self.expired_attributes.difference_update(
+                set(keys).intersection(dict_)
+            )
 
         # the per-keys commit removes object-level callables,
         # while that of commit_all does not.  it's not clear
@@ -822,12 +836,14 @@ class InstanceState(interfaces.InspectionAttrInfo):
         for state, dict_ in iter_:
             state_dict = state.__dict__
 
-            state.committed_state.clear()
+            if state.committed_state:
+                state.committed_state.clear()
 
             if "_pending_mutations" in state_dict:
                 del state_dict["_pending_mutations"]
 
-            state.expired_attributes.difference_update(dict_)
+            if state.expired_attributes:
+                state.expired_attributes.difference_update(dict_)
 
             if instance_dict and state.modified:
                 instance_dict._modified.discard(state)
@@ -836,6 +852,90 @@ class InstanceState(interfaces.InspectionAttrInfo):
             state._strong_obj = None
 
 
+_EMPTY_COMMITTED_STATE = util.immutabledict()
+
+
+@inspection._self_inspects
+class CompactInstanceState(InstanceState):
+    """An :class:`.InstanceState` with a smaller per-object footprint.
+
+    The attributes that are populated for every loaded object are stored
+    in ``__slots__`` rather than in the instance dictionary, and the
+    ``committed_state`` dictionary and ``expired_attributes`` set start
+    out as shared, immutable empty collections which are replaced with
+    private ones only once the object is actually modified or expired.
+
+    This state class is used for instances of classes that are mapped
+    with the :paramref:`.mapper.compact_state` flag.
+
+    .. versionadded:: 1.3.12
+
+    """
+
+    __slots__ = (
+        "class_",
+        "manager",
+        "committed_state",
+        "expired_attributes",
+        "session_id",
+        "key",
+        "runid",
+        "load_options",
+        "load_path",
+        "insert_order",
+        "modified",
+        "expired",
+        "identity_token",
+        "_strong_obj",
+    )
+
+    def __init__(self, obj, manager):
+        self.class_ = obj.__class__
+        self.manager = manager
+        self.obj = weakref.ref(obj, self._cleanup)
+        self._init_slots()
+
+    def _init_slots(self):
+        self.committed_state = _EMPTY_COMMITTED_STATE
+        self.expired_attributes = util.EMPTY_SET
+        self.session_id = self.key = self.runid = None
+        self.load_options = util.EMPTY_SET
+        self.load_path = ()
+        self.insert_order = self.identity_token = self._strong_obj = None
+        self.modified = self.expired = False
+
+    def _writable_committed_state(self):
+        if self.committed_state is _EMPTY_COMMITTED_STATE:
+            self.committed_state = {}
+        return self.committed_state
+
+    def _writable_expired_attributes(self):
+        if self.expired_attributes is util.EMPTY_SET:
+            self.expired_attributes = set()
+        return self.expired_attributes
+
+    def __getstate__(self):
+        state_dict = InstanceState.__getstate__(self)
+        state_dict["class_"] = self.class_
+        for k in ("committed_state", "expired_attributes", "key"):
+            value = getattr(self, k)
+            if value:
+                state_dict[k] = value
+        for k in ("modified", "expired"):
+            state_dict[k] = getattr(self, k)
+        if self.load_options:
+            state_dict["load_options"] = self.load_options
+        return state_dict
+
+    def __setstate__(self, state_dict):
+        self._init_slots()
+        InstanceState.__setstate__(self, state_dict)
+        if not self.committed_state:
+            self.committed_state = _EMPTY_COMMITTED_STATE
+        if not self.expired_attributes:
+            self.expired_attributes = util.EMPTY_SET
+
+
 class AttributeState(object):
     """Provide an inspection interface corresponding
     to a particular attribute on a particular mapped object.
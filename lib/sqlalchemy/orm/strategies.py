@@ -785,6 +785,7 @@ class LazyLoader(AbstractRelationshipLoader, util.MemoizedSlots):
 
         if not self.parent_property.bake_queries:
             q.spoil(full=True)
+            q.add_criteria(lambda q: q._no_context_cache())
 
         if self.parent_property.secondary is not None:
             q.add_criteria(
@@ -939,6 +940,124 @@ class LoadLazyAttribute(object):
         return strategy._load_for_state(state, passive)
 
 
+@log.class_logger
+@properties.RelationshipProperty.strategy_for(lazy="batch")
+class BatchLazyLoader(LazyLoader):
+    """Provide loading behavior for a :class:`.RelationshipProperty`
+    with "lazy='batch'", that is loads when first accessed, for all of the
+    instances loaded by the same query at once.
+
+    """
+
+    __slots__ = ("_selectin_loader",)
+
+    def _memoized_attr__selectin_loader(self):
+        return self.parent_property._get_strategy((("lazy", "selectin"),))
+
+    def create_row_processor(
+        self, context, path, loadopt, mapper, result, adapter, populators
+    ):
+        key = self.key
+
+        # instances loaded by the same query share a single loader
+        # callable, which tracks them weakly
+        group_key = ("batch_lazy_group", self)
+        group = context.attributes.get(group_key)
+        if group is None:
+            group = context.attributes[group_key] = LoadBatchLazyAttribute(
+                key, self
+            )
+        refs = group.refs
+
+        def set_batch_lazy_callable(state, dict_, row):
+            state._reset(dict_, key)
+            if "callables" not in state.__dict__:
+                state.callables = {}
+            state.callables[key] = group
+            refs.append(state.obj)
+
+        populators["new"].append((key, set_batch_lazy_callable))
+
+    def _load_for_batch(self, state, passive, group):
+        if (
+            not state.key
+            or not passive & attributes.SQL_OK
+            or not passive & attributes.RELATED_OBJECT_OK
+            or passive & attributes.NO_AUTOFLUSH
+            or passive & attributes.LOAD_AGAINST_COMMITTED
+        ):
+            return self._load_for_state(state, passive)
+
+        session = _state_session(state)
+        if not session:
+            return self._load_for_state(state, passive)
+
+        if self.use_get:
+            # a many-to-one which may already be in the identity map
+            value = self._load_for_state(state, passive ^ attributes.SQL_OK)
+            if value is not attributes.PASSIVE_NO_RESULT:
+                return value
+
+        key = self.key
+        states = [state]
+        seen = set(states)
+        for ref in group.refs:
+            obj = ref()
+            if obj is None:
+                continue
+            sibling = attributes.instance_state(obj)
+            if (
+                sibling not in seen
+                and sibling.session_id == state.session_id
+                and sibling.key is not None
+                and key not in sibling.dict
+                and sibling.callables.get(key) is group
+            ):
+                states.append(sibling)
+                seen.add(sibling)
+
+        # every instance that remains eligible is loaded below
+        del group.refs[:]
+
+        self._selectin_loader._load_for_states(
+            session,
+            state.load_path,
+            [(sibling, False) for sibling in states],
+            self.entity,
+            state.load_options,
+            False,
+        )
+        return attributes.ATTR_WAS_SET
+
+
+class LoadBatchLazyAttribute(object):
+    """serializable loader object used by BatchLazyLoader.
+
+    Refers weakly to each instance loaded along with those that it is
+    established upon; the instances are not retained when serialized.
+
+    """
+
+    def __init__(self, key, initiating_strategy):
+        self.key = key
+        self.strategy_key = initiating_strategy.strategy_key
+        self.refs = []
+
+    def __getstate__(self):
+        return {"key": self.key, "strategy_key": self.strategy_key}
+
+    def __setstate__(self, state):
+        self.key = state["key"]
+        self.strategy_key = state["strategy_key"]
+        self.refs = []
+
+    def __call__(self, state, passive=attributes.PASSIVE_OFF):
+        prop = state.manager.mapper._props[self.key]
+        strategy = prop._get_strategy(self.strategy_key)
+
+        return strategy._load_for_batch(state, passive, self)
+
+
 @properties.RelationshipProperty.strategy_for(lazy="immediate")
 class ImmediateLoader(AbstractRelationshipLoader):
     __slots__ = ()
@@ -2232,14 +2351,33 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
             effective_entity,
         )
 
-    @util.dependencies("sqlalchemy.ext.baked")
     def _load_for_path(
-        self, baked, context, path, states, load_only, effective_entity
+        self, context, path, states, load_only, effective_entity
     ):
-
         if load_only and self.key not in load_only:
             return
 
+        orig_query = context.query
+        self._load_for_states(
+            context.session,
+            path,
+            states,
+            effective_entity,
+            orig_query._with_options,
+            orig_query._populate_existing,
+        )
+
+    @util.dependencies("sqlalchemy.ext.baked")
+    def _load_for_states(
+        self,
+        baked,
+        session,
+        path,
+        states,
+        effective_entity,
+        options,
+        populate_existing,
+    ):
         query_info = self._query_info
 
         if query_info.load_only_child:
@@ -2340,13 +2478,9 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
                 ).order_by(*pk_cols)
             )
 
-        orig_query = context.query
+        q._add_lazyload_options(options, path[self.parent_property])
 
-        q._add_lazyload_options(
-            orig_query._with_options, path[self.parent_property]
-        )
-
-        if orig_query._populate_existing:
+        if populate_existing:
             q.add_criteria(lambda q: q.populate_existing())
 
         if self.parent_property.order_by:
@@ -2374,12 +2508,12 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
 
         if query_info.load_only_child:
             self._load_via_child(
-                our_states, none_states, query_info, q, context
+                our_states, none_states, query_info, q, session
             )
         else:
-            self._load_via_parent(our_states, query_info, q, context)
+            self._load_via_parent(our_states, query_info, q, session)
 
-    def _load_via_child(self, our_states, none_states, query_info, q, context):
+    def _load_via_child(self, our_states, none_states, query_info, q, session):
         uselist = self.uselist
 
         # this sort is really for the benefit of the unit tests
@@ -2389,7 +2523,7 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
             our_keys = our_keys[self._chunksize :]
             data = {
                 k: v
-                for k, v in q(context.session).params(
+                for k, v in q(session).params(
                     primary_keys=[
                         key[0] if query_info.zero_idx else key for key in chunk
                     ]
@@ -2421,7 +2555,7 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
             # collection will be populated
             state.get_impl(self.key).set_committed_value(state, dict_, None)
 
-    def _load_via_parent(self, our_states, query_info, q, context):
+    def _load_via_parent(self, our_states, query_info, q, session):
         uselist = self.uselist
         _empty_result = () if uselist else None
 
@@ -2437,7 +2571,7 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
             data = {
                 k: [vv[1] for vv in v]
                 for k, v in itertools.groupby(
-                    q(context.session).params(primary_keys=primary_keys),
+                    q(session).params(primary_keys=primary_keys),
                     lambda x: x[0],
                 )
             }
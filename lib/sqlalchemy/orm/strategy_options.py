@@ -1295,6 +1295,37 @@ def lazyload_all(*keys):
     return _UnboundLoad._from_keys(_UnboundLoad.lazyload, keys, True, {})
 
 
+@loader_option()
+def batchload(loadopt, attr):
+    """Indicate that the given attribute should be loaded using "batch lazy"
+    loading.
+
+    The attribute is loaded when first accessed, as with :func:`.lazyload`;
+    however, it is loaded at the same time for all of the instances which
+    were loaded by the same query and remain present in the
+    :class:`.Session`, using a single SELECT in the same way as
+    :func:`.selectinload`.
+
+    This function is part of the :class:`.Load` interface and supports
+    both method-chained and standalone operation.
+
+    .. versionadded:: 1.3.12
+
+    .. seealso::
+
+        :ref:`loading_toplevel`
+
+        :ref:`batch_lazy_loading`
+
+    """
+    return loadopt.set_relationship_strategy(attr, {"lazy": "batch"})
+
+
+@batchload._add_unbound_fn
+def batchload(*keys):
+    return _UnboundLoad._from_keys(_UnboundLoad.batchload, keys, False, {})
+
+
 @loader_option()
 def immediateload(loadopt, attr):
     """Indicate that the given attribute should be loaded using
@@ -363,6 +363,14 @@ class UOWTransaction(object):
             if not ret:
                 break
 
+        # if no relationships contributed any actions, every mapper
+        # is flushed independently of the others and there is nothing
+        # to sort.
+        self.independent_mappers = self._has_independent_mappers()
+        if self.independent_mappers:
+            self.cycles = set()
+            return set(self.postsort_actions.values())
+
         # see if the graph of mapper dependencies has cycles.
         self.cycles = cycles = topological.find_cycles(
             self.dependencies, list(self.postsort_actions.values())
@@ -399,9 +407,59 @@ class UOWTransaction(object):
             [a for a in self.postsort_actions.values() if not a.disabled]
         ).difference(cycles)
 
+    def _has_independent_mappers(self):
+        """Return True if the only dependencies present are those
+        between the SaveUpdateAll and DeleteAll of each base mapper, as
+        established by _per_mapper_flush_actions().
+
+        """
+        if len(self.dependencies) * 2 != len(self.postsort_actions):
+            return False
+        for saves, deletes in self.dependencies:
+            if (
+                saves.__class__ is not SaveUpdateAll
+                or deletes.__class__ is not DeleteAll
+                or saves.mapper is not deletes.mapper
+            ):
+                return False
+        return True
+
+    def _execute_independent(self):
+        """Flush all states when no mapper depends on any other.
+
+        States are grouped by base mapper in a single pass, rather than
+        through a topological sort of per-mapper actions; all saves are
+        emitted before all deletes, which satisfies the one dependency
+        each mapper has.
+
+        """
+        for base_mapper, states in self._states_by_base_mapper(False):
+            persistence.save_obj(base_mapper, states, self)
+
+        # collected after the saves, which may have removed deletes
+        # that were converted into a "row switch" UPDATE
+        for base_mapper, states in self._states_by_base_mapper(True):
+            persistence.delete_obj(base_mapper, states, self)
+
+    def _states_by_base_mapper(self, isdelete):
+        checktup = (isdelete, False)
+        by_mapper = util.OrderedDict()
+        for state, tup in self.states.items():
+            if tup == checktup:
+                base_mapper = state.manager.mapper.base_mapper
+                if base_mapper in by_mapper:
+                    by_mapper[base_mapper].append(state)
+                else:
+                    by_mapper[base_mapper] = [state]
+        return by_mapper.items()
+
     def execute(self):
         postsort_actions = self._generate_actions()
 
+        if self.independent_mappers:
+            self._execute_independent()
+            return
+
         # sort = topological.sort(self.dependencies, postsort_actions)
         # print "--------------"
         # print "\ndependencies:", self.dependencies
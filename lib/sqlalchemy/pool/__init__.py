@@ -27,7 +27,10 @@ from .base import reset_none
 from .base import reset_rollback
 from .dbapi_proxy import clear_managers
 from .dbapi_proxy import manage
+from .impl import AdaptiveQueuePool
+from .impl import AffinityQueuePool
 from .impl import AssertionPool
+from .impl import AsyncAdaptedQueuePool
 from .impl import NullPool
 from .impl import QueuePool
 from .impl import SingletonThreadPool
@@ -41,7 +44,10 @@ __all__ = [
     "reset_rollback",
     "clear_managers",
     "manage",
+    "AdaptiveQueuePool",
+    "AffinityQueuePool",
     "AssertionPool",
+    "AsyncAdaptedQueuePool",
     "NullPool",
     "QueuePool",
     "SingletonThreadPool",
@@ -523,7 +523,7 @@ class _ConnectionRecord(object):
         while self.finalize_callback:
             finalizer = self.finalize_callback.pop()
             finalizer(connection)
-        if pool.dispatch.checkin:
+        if pool.dispatch.checkin.has_listeners:
             pool.dispatch.checkin(connection, self)
         pool._return_conn(self)
 
@@ -623,7 +623,7 @@ class _ConnectionRecord(object):
 
     def __close(self):
         self.finalize_callback.clear()
-        if self.__pool.dispatch.close:
+        if self.__pool.dispatch.close.has_listeners:
             self.__pool.dispatch.close(self.connection, self)
         self.__pool._close_connection(self.connection)
         self.connection = None
@@ -647,7 +647,7 @@ class _ConnectionRecord(object):
                 pool.dispatch.first_connect.for_modify(
                     pool.dispatch
                 ).exec_once_unless_exception(self.connection, self)
-            if pool.dispatch.connect:
+            if pool.dispatch.connect.has_listeners:
                 pool.dispatch.connect(self.connection, self)
 
 
@@ -681,7 +681,7 @@ def _finalize_fairy(
 
             # Immediately close detached instances
             if not connection_record:
-                if pool.dispatch.close_detached:
+                if pool.dispatch.close_detached.has_listeners:
                     pool.dispatch.close_detached(connection)
                 pool._close_connection(connection)
         except BaseException as e:
@@ -770,7 +770,7 @@ class _ConnectionFairy(object):
         fairy._counter += 1
 
         if (
-            not pool.dispatch.checkout and not pool._pre_ping
+            not pool.dispatch.checkout.has_listeners and not pool._pre_ping
         ) or fairy._counter != 1:
             return fairy
 
@@ -852,7 +852,7 @@ class _ConnectionFairy(object):
     _close = _checkin
 
     def _reset(self, pool):
-        if pool.dispatch.reset:
+        if pool.dispatch.reset.has_listeners:
             pool.dispatch.reset(self, self._connection_record)
         if pool._reset_on_return is reset_rollback:
             if self._echo:
@@ -990,7 +990,7 @@ class _ConnectionFairy(object):
             self.info = self.info.copy()
             self._connection_record = None
 
-            if self._pool.dispatch.detach:
+            if self._pool.dispatch.detach.has_listeners:
                 self._pool.dispatch.detach(self.connection, rec)
 
     def close(self):
@@ -10,6 +10,7 @@
 
 """
 
+import time
 import traceback
 import weakref
 
@@ -32,6 +33,8 @@ class QueuePool(Pool):
 
     """
 
+    _queue_class = sqla_queue.Queue
+
     def __init__(
         self,
         creator,
@@ -94,7 +97,7 @@ class QueuePool(Pool):
 
         """
         Pool.__init__(self, creator, **kw)
-        self._pool = sqla_queue.Queue(pool_size, use_lifo=use_lifo)
+        self._pool = self._queue_class(pool_size, use_lifo=use_lifo)
         self._overflow = 0 - pool_size
         self._max_overflow = max_overflow
         self._timeout = timeout
@@ -112,33 +115,32 @@ class QueuePool(Pool):
     def _do_get(self):
         use_overflow = self._max_overflow > -1
 
-        try:
-            wait = use_overflow and self._overflow >= self._max_overflow
-            return self._pool.get(wait, self._timeout)
-        except sqla_queue.Empty:
-            # don't do things inside of "except Empty", because when we say
-            # we timed out or can't connect and raise, Python 3 tells
-            # people the real error is queue.Empty which it isn't.
-            pass
-        if use_overflow and self._overflow >= self._max_overflow:
-            if not wait:
-                return self._do_get()
-            else:
-                raise exc.TimeoutError(
-                    "QueuePool limit of size %d overflow %d reached, "
-                    "connection timed out, timeout %d"
-                    % (self.size(), self.overflow(), self._timeout),
-                    code="3o7r",
-                )
-
-        if self._inc_overflow():
+        while True:
             try:
-                return self._create_connection()
-            except:
-                with util.safe_reraise():
-                    self._dec_overflow()
-        else:
-            return self._do_get()
+                wait = use_overflow and self._overflow >= self._max_overflow
+                return self._pool.get(wait, self._timeout)
+            except sqla_queue.Empty:
+                # don't do things inside of "except Empty", because when we
+                # say we timed out or can't connect and raise, Python 3 tells
+                # people the real error is queue.Empty which it isn't.
+                pass
+            if use_overflow and self._overflow >= self._max_overflow:
+                if not wait:
+                    continue
+                else:
+                    raise exc.TimeoutError(
+                        "QueuePool limit of size %d overflow %d reached, "
+                        "connection timed out, timeout %d"
+                        % (self.size(), self.overflow(), self._timeout),
+                        code="3o7r",
+                    )
+
+            if self._inc_overflow():
+                try:
+                    return self._create_connection()
+                except:
+                    with util.safe_reraise():
+                        self._dec_overflow()
 
     def _inc_overflow(self):
         if self._max_overflow == -1:
@@ -183,7 +185,7 @@ class QueuePool(Pool):
             except sqla_queue.Empty:
                 break
 
-        self._overflow = 0 - self.size()
+        self._overflow = 0 - self._pool.maxsize
         self.logger.info("Pool disposed. %s", self.status())
 
     def status(self):
@@ -215,6 +217,329 @@ class QueuePool(Pool):
         return self._pool.maxsize - self._pool.qsize() + self._overflow
 
 
+class AsyncAdaptedQueuePool(QueuePool):
+
+    """A :class:`.QueuePool` for use with an asyncio database driver.
+
+    Connections are checked out from within a greenlet spawned by the
+    :mod:`sqlalchemy.ext.asyncio` extension; when the pool is exhausted,
+    waiting for a connection to be returned yields to the event loop rather
+    than blocking the thread.   This pool is selected automatically by
+    dialects which make use of an asyncio driver.
+
+    .. versionadded:: 1.3.12
+
+    """
+
+    _queue_class = sqla_queue.AsyncAdaptedQueue
+
+
+class AffinityQueuePool(QueuePool):
+
+    """A :class:`.QueuePool` which minimizes lock contention between
+    threads.
+
+    Connections are checked out and checked in without acquiring a mutex
+    whenever the pool has a connection available; only a checkout which
+    finds the pool empty and must wait for a connection to be returned
+    makes use of a lock and condition.  A checkout first attempts to
+    return the connection that the same thread most recently checked in,
+    if it's idle in the pool, and otherwise returns the most recently
+    checked in connection, as when :paramref:`.QueuePool.use_lifo` is set.
+
+    The ``pool_size``, ``max_overflow`` and ``timeout`` parameters, as
+    well as :class:`.PoolEvents`, behave the same as for
+    :class:`.QueuePool`.
+
+    .. versionadded:: 1.3.12
+
+    .. seealso::
+
+        :ref:`pool_affinity`
+
+    """
+
+    _queue_class = sqla_queue.AffinityQueue
+
+    def __init__(self, creator, use_lifo=True, **kw):
+        QueuePool.__init__(self, creator, use_lifo=use_lifo, **kw)
+
+
+class AdaptiveQueuePool(QueuePool):
+
+    """A :class:`.QueuePool` which adjusts the number of connections it
+    retains according to observed demand, and which collects statistics
+    about its use.
+
+    The pool allows at most ``pool_size + max_overflow`` connections to be
+    open at once, the same as :class:`.QueuePool`.  Rather than retaining
+    ``pool_size`` connections and closing overflow connections as soon as
+    they're returned, the pool maintains a "target" size which grows as soon
+    as more connections are checked out at once, and which shrinks to the
+    peak number of connections checked out over the most recent
+    ``adjust_interval``.   Connections beyond the target size are kept in
+    the pool for ``idle_timeout`` seconds after they're returned, so that a
+    burst of demand can re-use them rather than opening new connections.
+
+    Connections are retrieved in LIFO order, so that the connections which
+    aren't needed remain idle and can be closed.  Expiration is
+    performed as connections are checked out and returned.
+
+    Statistics are available from the :meth:`.AdaptiveQueuePool.stats`
+    method.
+
+    .. versionadded:: 1.3.12
+
+    .. seealso::
+
+        :ref:`pool_adaptive`
+
+    """
+
+    def __init__(
+        self,
+        creator,
+        pool_size=5,
+        max_overflow=10,
+        min_size=1,
+        idle_timeout=60,
+        adjust_interval=60,
+        **kw
+    ):
+        r"""
+        Construct an AdaptiveQueuePool.
+
+        :param creator: a callable function that returns a DB-API
+          connection object, same as that of :paramref:`.Pool.creator`.
+
+        :param pool_size: the initial target size of the pool; defaults
+          to 5.
+
+        :param max_overflow: together with ``pool_size``, determines the
+          total number of connections that may be open at once, which is
+          also the largest the target size may grow.  May be set to -1 to
+          indicate no limit.  Defaults to 10.
+
+        :param min_size: the smallest the target size may shrink.
+          Defaults to 1.
+
+        :param idle_timeout: number of seconds that a connection beyond
+          the target size is kept in the pool after being returned, before
+          it's closed.  Defaults to 60.
+
+        :param adjust_interval: number of seconds over which the peak
+          number of checked out connections is observed, after which the
+          target size is reduced to that peak.  Defaults to 60.
+
+        :param \**kw: Other keyword arguments including
+          :paramref:`.QueuePool.timeout` and those of :class:`.Pool`
+          are passed to the :class:`.QueuePool` constructor.
+
+        """
+        if max_overflow > -1:
+            self._max_size = pool_size + max_overflow
+            QueuePool.__init__(
+                self,
+                creator,
+                pool_size=self._max_size,
+                max_overflow=0,
+                use_lifo=True,
+                **kw
+            )
+        else:
+            self._max_size = None
+            QueuePool.__init__(
+                self,
+                creator,
+                pool_size=0,
+                max_overflow=-1,
+                use_lifo=True,
+                **kw
+            )
+
+        self._initial_size = pool_size
+        self._min_size = min_size
+        self._idle_timeout = idle_timeout
+        self._adjust_interval = adjust_interval
+        self._stats_mutex = threading.Lock()
+        self._idle_since = {}
+        self._records = weakref.WeakSet()
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self._target_size = self._initial_size
+        self._window_start = time.time()
+        self._window_peak = 0
+        self._checkouts = 0
+        self._connects = 0
+        self._idle_closed = 0
+        self._wait_time = 0
+        self._max_wait_time = 0
+
+    def _create_connection(self):
+        rec = QueuePool._create_connection(self)
+        self._records.add(rec)
+        with self._stats_mutex:
+            self._connects += 1
+        return rec
+
+    def _do_get(self):
+        start = time.time()
+        rec = QueuePool._do_get(self)
+        now = time.time()
+        wait = now - start
+
+        with self._stats_mutex:
+            self._checkouts += 1
+            self._wait_time += wait
+            if wait > self._max_wait_time:
+                self._max_wait_time = wait
+
+            checkedout = self.checkedout()
+            if checkedout > self._window_peak:
+                self._window_peak = checkedout
+            if checkedout > self._target_size:
+                self._target_size = checkedout
+            self._adjust(now)
+
+        self._close_idle(now)
+        return rec
+
+    def _do_return_conn(self, conn):
+        now = time.time()
+        self._idle_since[conn] = now
+        QueuePool._do_return_conn(self, conn)
+
+        with self._stats_mutex:
+            self._adjust(now)
+        self._close_idle(now)
+
+    def _adjust(self, now):
+        if now - self._window_start >= self._adjust_interval:
+            self._target_size = max(self._window_peak, self._min_size)
+            self._window_peak = self.checkedout()
+            self._window_start = now
+
+    def _close_idle(self, now):
+        # connections are retrieved LIFO, so the connections that have
+        # been idle longest are at the bottom of the queue
+        expired = []
+        queue = self._pool
+        with queue.mutex:
+            excess = self._connections() - self._target_size
+            while excess > 0 and queue.queue:
+                rec = queue.queue[0]
+                if now - self._idle_since.get(rec, now) < self._idle_timeout:
+                    break
+                queue.queue.popleft()
+                expired.append(rec)
+                excess -= 1
+
+        for rec in expired:
+            self._idle_since.pop(rec, None)
+            try:
+                rec.close()
+            finally:
+                self._dec_overflow()
+        if expired:
+            with self._stats_mutex:
+                self._idle_closed += len(expired)
+
+    def _connections(self):
+        return self._pool.maxsize + self._overflow
+
+    def stats(self):
+        """Return a dictionary of statistics regarding the use of
+        this pool.
+
+        The dictionary includes the following keys:
+
+        * ``size`` - the current target size of the pool
+
+        * ``connections`` - the number of connections currently open
+
+        * ``checkedout`` - the number of connections currently checked out
+
+        * ``peak_checkedout`` - the largest number of connections checked
+          out at once within the current adjustment interval
+
+        * ``checkouts`` - the total number of checkouts
+
+        * ``connects`` - the total number of connections opened
+
+        * ``idle_closed`` - the total number of connections closed due to
+          ``idle_timeout``
+
+        * ``wait_time`` - total seconds spent by checkouts waiting for a
+          connection, including the time taken to open new connections
+
+        * ``max_wait_time`` - the longest time in seconds a single checkout
+          has waited
+
+        * ``max_connection_age`` - age in seconds of the oldest open
+          connection, or ``None`` if no connections are open
+
+        * ``avg_connection_age`` - average age in seconds of the open
+          connections, or ``None`` if no connections are open
+
+        """
+        now = time.time()
+        ages = [
+            now - rec.starttime
+            for rec in list(self._records)
+            if rec.connection is not None and rec.starttime is not None
+        ]
+        with self._stats_mutex:
+            return {
+                "size": self._target_size,
+                "connections": self._connections(),
+                "checkedout": self.checkedout(),
+                "peak_checkedout": self._window_peak,
+                "checkouts": self._checkouts,
+                "connects": self._connects,
+                "idle_closed": self._idle_closed,
+                "wait_time": self._wait_time,
+                "max_wait_time": self._max_wait_time,
+                "max_connection_age": max(ages) if ages else None,
+                "avg_connection_age": sum(ages) / len(ages) if ages else None,
+            }
+
+    def recreate(self):
+        self.logger.info("Pool recreating")
+        if self._max_size is not None:
+            max_overflow = self._max_size - self._initial_size
+        else:
+            max_overflow = -1
+        return self.__class__(
+            self._creator,
+            pool_size=self._initial_size,
+            max_overflow=max_overflow,
+            min_size=self._min_size,
+            idle_timeout=self._idle_timeout,
+            adjust_interval=self._adjust_interval,
+            timeout=self._timeout,
+            recycle=self._recycle,
+            echo=self.echo,
+            logging_name=self._orig_logging_name,
+            use_threadlocal=self._use_threadlocal,
+            reset_on_return=self._reset_on_return,
+            _dispatch=self.dispatch,
+            dialect=self._dialect,
+        )
+
+    def dispose(self):
+        QueuePool.dispose(self)
+        self._idle_since.clear()
+        with self._stats_mutex:
+            self._target_size = self._initial_size
+
+    def size(self):
+        return self._target_size
+
+    def overflow(self):
+        return self._connections() - self._target_size
+
+
 class NullPool(Pool):
 
     """A Pool which does not pool connections.
@@ -42,6 +42,7 @@ from .expression import intersect_all  # noqa
 from .expression import Join  # noqa
 from .expression import join  # noqa
 from .expression import label  # noqa
+from .expression import lambda_stmt  # noqa
 from .expression import lateral  # noqa
 from .expression import literal  # noqa
 from .expression import literal_column  # noqa
@@ -192,8 +192,12 @@ def _new_annotation_type(cls, base_cls):
             base_cls = annotated_classes[super_]
             break
 
+    # the annotated class uses the cache key traversal of the class
+    # it annotates; annotations don't take part in compilation
     annotated_classes[cls] = anno_cls = type(
-        "Annotated%s" % cls.__name__, (base_cls, cls), {}
+        "Annotated%s" % cls.__name__,
+        (base_cls, cls),
+        {"_cache_key_traversal": cls._cache_key_traversal},
     )
     globals()["Annotated%s" % cls.__name__] = anno_cls
     return anno_cls
@@ -23,6 +23,7 @@ To generate user-defined SQL strings, see
 
 """
 
+import collections
 import contextlib
 import itertools
 import re
@@ -152,6 +153,17 @@ FK_INITIALLY = re.compile(r"^(?:DEFERRED|IMMEDIATE)$", re.I)
 BIND_PARAMS = re.compile(r"(?<![:\w\$\x5c]):([\w\$]+)(?![:\w\$])", re.UNICODE)
 BIND_PARAMS_ESC = re.compile(r"\x5c(:[\w\$]*)(?![:\w\$])", re.UNICODE)
 
+_InsertManyValues = collections.namedtuple(
+    "_InsertManyValues",
+    [
+        "statement_prefix",
+        "single_values_expr",
+        "statement_suffix",
+        "bind_names",
+        "values_template_parts",
+    ],
+)
+
 BIND_TEMPLATES = {
     "pyformat": "%%(%(name)s)s",
     "qmark": "?",
@@ -506,6 +518,34 @@ class SQLCompiler(Compiled):
 
     insert_prefetch = update_prefetch = ()
 
+    _insertmanyvalues = None
+    """When an INSERT is compiled with a single set of parameters inside
+    a VALUES expression, which may be rendered as a multi-row VALUES
+    expression for an executemany, describes how to do so.
+
+    This is an :class:`._InsertManyValues` tuple, consisting of the text of
+    the statement that precedes and follows the VALUES expression, the
+    names of the bound parameters rendered within it, and for named
+    paramstyles, the VALUES expression split on the point at which each
+    bound parameter name is to receive a per-row suffix.
+
+    .. versionadded:: 1.3.12
+
+    """
+
+    _cache_key = None
+    """The :class:`.CacheKey` of the statement this compiled object was
+    generated from, when stored in the dialect-level compiled cache.
+
+    .. versionadded:: 1.3.12
+
+    """
+
+    _literal_binds_rendered = False
+    """True if the value of a bound parameter was rendered inline within
+    the statement; the compiled form is then specific to those values and
+    can't be reused for other statements having the same cache key."""
+
     def __init__(
         self, dialect, statement, column_keys=None, inline=False, **kwargs
     ):
@@ -647,8 +687,90 @@ class SQLCompiler(Compiled):
     def sql_compiler(self):
         return self
 
-    def construct_params(self, params=None, _group_number=None, _check=True):
-        """return a dictionary of bind parameter keys and values"""
+    @util.memoized_property
+    def _cache_key_bind_positions(self):
+        """Map the bound parameters of this compiled object to their
+        position within the bound parameters of its cache key."""
+
+        positions = dict(
+            (id(bindparam), idx)
+            for idx, bindparam in enumerate(self._cache_key.bindparams)
+        )
+        result = {}
+        for bindparam in self.bind_names:
+            # the compiler may have rendered a clone of the bound
+            # parameter which was present in the statement
+            bp = bindparam
+            while bp is not None:
+                if id(bp) in positions:
+                    result[bindparam] = positions[id(bp)]
+                    break
+                bp = bp._is_clone_of
+        return result
+
+    @util.memoized_property
+    def _cache_key_result_positions(self):
+        """Locate the objects within _result_columns by their position
+        within the elements of the cache key."""
+
+        positions = dict(
+            (id(elem), idx)
+            for idx, elem in enumerate(self._cache_key.elements)
+        )
+        return [
+            tuple(positions.get(id(obj)) for obj in objs)
+            for key, name, objs, type_ in self._result_columns
+        ]
+
+    def _result_columns_for_cache_key(self, cache_key):
+        """Return _result_columns in terms of the elements of another
+        statement which has the same cache key as this one."""
+
+        if cache_key is None or cache_key is self._cache_key:
+            return self._result_columns
+
+        elements = cache_key.elements
+        return [
+            (
+                key,
+                name,
+                tuple(
+                    obj if idx is None else elements[idx]
+                    for obj, idx in zip(objs, positions)
+                ),
+                type_,
+            )
+            for (key, name, objs, type_), positions in zip(
+                self._result_columns, self._cache_key_result_positions
+            )
+        ]
+
+    def construct_params(
+        self,
+        params=None,
+        _group_number=None,
+        _check=True,
+        extracted_parameters=None,
+    ):
+        """return a dictionary of bind parameter keys and values.
+
+        :param extracted_parameters: the list of :class:`.BindParameter`
+         objects from the :class:`.CacheKey` of a statement other than the
+         one this object was compiled from, whose values are used in place
+         of those embedded in the compiled object.
+
+         .. versionadded:: 1.3.12
+
+        """
+
+        if extracted_parameters is not None:
+            positions = self._cache_key_bind_positions
+            resolved = dict(
+                (bindparam, extracted_parameters[positions[bindparam]])
+                for bindparam in positions
+            )
+        else:
+            resolved = None
 
         if params:
             pd = {}
@@ -674,10 +796,15 @@ class SQLCompiler(Compiled):
                             code="cd3x",
                         )
 
-                elif bindparam.callable:
-                    pd[name] = bindparam.effective_value
                 else:
-                    pd[name] = bindparam.value
+                    if resolved:
+                        value_param = resolved.get(bindparam, bindparam)
+                    else:
+                        value_param = bindparam
+                    if value_param.callable:
+                        pd[name] = value_param.effective_value
+                    else:
+                        pd[name] = value_param.value
             return pd
         else:
             pd = {}
@@ -697,10 +824,15 @@ class SQLCompiler(Compiled):
                             code="cd3x",
                         )
 
-                if bindparam.callable:
-                    pd[self.bind_names[bindparam]] = bindparam.effective_value
+                name = self.bind_names[bindparam]
+                if resolved:
+                    value_param = resolved.get(bindparam, bindparam)
+                else:
+                    value_param = bindparam
+                if value_param.callable:
+                    pd[name] = value_param.effective_value
                 else:
-                    pd[self.bind_names[bindparam]] = bindparam.value
+                    pd[name] = value_param.value
             return pd
 
     @property
@@ -726,6 +858,9 @@ class SQLCompiler(Compiled):
     def visit_grouping(self, grouping, asfrom=False, **kwargs):
         return "(" + grouping.element._compiler_dispatch(self, **kwargs) + ")"
 
+    def visit_lambda_element(self, element, **kw):
+        return element._resolved._compiler_dispatch(self, **kw)
+
     def visit_label_reference(
         self, element, within_columns_clause=False, **kwargs
     ):
@@ -1519,6 +1654,7 @@ class SQLCompiler(Compiled):
         )
 
     def render_literal_bindparam(self, bindparam, **kw):
+        self._literal_binds_rendered = True
         value = bindparam.effective_value
         return self.render_literal_value(value, bindparam.type)
 
@@ -2390,6 +2526,69 @@ class SQLCompiler(Compiled):
             )
         return dialect_hints, table_text
 
+    def _insertmanyvalues_for_text(self, text, values_start, values_end):
+        """Return an :class:`._InsertManyValues` for the given INSERT
+        statement text, or None if the bound parameters in the statement
+        can't be rendered once per row."""
+
+        single_values_expr = text[values_start:values_end]
+
+        if self.positional:
+            # all positional parameters are within the VALUES expression,
+            # in order; each row repeats them
+            bind_names = tuple(self.positiontup)
+            values_template_parts = None
+        else:
+            bind_names = []
+            markers = {}
+            for name in self.binds:
+                marker = self.bindtemplate % {"name": name}
+                if marker not in single_values_expr:
+                    # a parameter outside of the VALUES expression can't
+                    # be given distinct values per row
+                    return None
+                bind_names.append(name)
+                markers[marker] = name
+
+            token = "\x00"
+            if token in single_values_expr:
+                return None
+            elif not markers:
+                return _InsertManyValues(
+                    text[0:values_start],
+                    single_values_expr,
+                    text[values_end:],
+                    (),
+                    (single_values_expr,),
+                )
+
+            # split the VALUES expression at the end of each parameter
+            # name, so that each row may render it with a suffix
+            marker_re = re.compile(
+                "(%s)(?!\\w)"
+                % "|".join(
+                    re.escape(marker)
+                    for marker in sorted(markers, key=len, reverse=True)
+                )
+            )
+
+            def repl(m):
+                name = markers[m.group(1)]
+                return self.bindtemplate % {"name": name + token}
+
+            values_template_parts = tuple(
+                marker_re.sub(repl, single_values_expr).split(token)
+            )
+            bind_names = tuple(bind_names)
+
+        return _InsertManyValues(
+            text[0:values_start],
+            single_values_expr,
+            text[values_end:],
+            bind_names,
+            values_template_parts,
+        )
+
     def visit_insert(self, insert_stmt, asfrom=False, **kw):
         toplevel = not self.stack
 
@@ -2401,10 +2600,16 @@ class SQLCompiler(Compiled):
             }
         )
 
+        if self.positional:
+            crud_positions_start = len(self.positiontup)
+
         crud_params = crud._setup_crud_params(
             self, insert_stmt, crud.ISINSERT, **kw
         )
 
+        if self.positional:
+            crud_positions_end = len(self.positiontup)
+
         if (
             not crud_params
             and not self.dialect.supports_default_values
@@ -2478,7 +2683,10 @@ class SQLCompiler(Compiled):
             )
         else:
             insert_single_values_expr = ", ".join([c[1] for c in crud_params])
-            text += " VALUES (%s)" % insert_single_values_expr
+            text += " VALUES "
+            values_start = len(text)
+            text += "(%s)" % insert_single_values_expr
+            values_end = len(text)
             if toplevel:
                 self.insert_single_values_expr = insert_single_values_expr
 
@@ -2494,6 +2702,23 @@ class SQLCompiler(Compiled):
 
         if self.ctes and toplevel and not self.dialect.cte_follows_insert:
             text = self._render_cte_clause() + text
+        elif (
+            toplevel
+            and self.insert_single_values_expr is not None
+            and not self.ctes
+            and insert_stmt._post_values_clause is None
+            and not self._numeric_binds
+            and (
+                not self.positional
+                or (
+                    crud_positions_start == 0
+                    and crud_positions_end == len(self.positiontup)
+                )
+            )
+        ):
+            self._insertmanyvalues = self._insertmanyvalues_for_text(
+                text, values_start, values_end
+            )
 
         self.stack.pop(-1)
 
@@ -479,6 +479,21 @@ class Insert(ValuesBase):
     """
 
     __visit_name__ = "insert"
+    _cache_key_traversal = [
+        ("table", "clauseelement"),
+        ("parameters", "dml_parameters"),
+        ("select", "clauseelement"),
+        ("select_names", "string_or_clauseelement_list"),
+        ("include_insert_from_select_defaults", "plain"),
+        ("inline", "plain"),
+        ("_returning", "clauseelement_list"),
+        ("_return_defaults", "clauseelement_list_or_bool"),
+        ("_prefixes", "prefixes"),
+        ("_hints", "hints"),
+        ("_post_values_clause", "clauseelement"),
+        ("dialect_options", "dialect_options"),
+        ("_execution_options", "plain_dict"),
+    ]
 
     _supports_multi_parameters = True
 
@@ -628,6 +643,20 @@ class Update(ValuesBase):
     """
 
     __visit_name__ = "update"
+    _cache_key_traversal = [
+        ("table", "clauseelement"),
+        ("parameters", "dml_parameters"),
+        ("_whereclause", "clauseelement"),
+        ("inline", "plain"),
+        ("_preserve_parameter_order", "plain"),
+        ("_returning", "clauseelement_list"),
+        ("_return_defaults", "clauseelement_list_or_bool"),
+        ("_prefixes", "prefixes"),
+        ("_hints", "hints"),
+        ("_post_values_clause", "clauseelement"),
+        ("dialect_options", "dialect_options"),
+        ("_execution_options", "plain_dict"),
+    ]
 
     def __init__(
         self,
@@ -813,6 +842,15 @@ class Delete(UpdateBase):
     """
 
     __visit_name__ = "delete"
+    _cache_key_traversal = [
+        ("table", "clauseelement"),
+        ("_whereclause", "clauseelement"),
+        ("_returning", "clauseelement_list"),
+        ("_prefixes", "prefixes"),
+        ("_hints", "hints"),
+        ("dialect_options", "dialect_options"),
+        ("_execution_options", "plain_dict"),
+    ]
 
     def __init__(
         self,
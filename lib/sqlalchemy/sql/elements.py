@@ -18,6 +18,7 @@ import operator
 import re
 
 from . import operators
+from . import traversals
 from . import type_api
 from .annotation import Annotated
 from .base import _generative
@@ -195,6 +196,25 @@ class ClauseElement(Visitable):
     _order_by_label_element = None
     _is_from_container = False
 
+    _cache_key_traversal = None
+    """Sequence of ``(attribute name, kind)`` tuples which produce the
+    structural cache key for this element; see :mod:`.sql.traversals`.
+
+    A value of None indicates the element can't be cached.  The
+    :class:`.VisitableType` metaclass sets this to None for each subclass
+    which doesn't declare it, unless the subclass sets ``inherit_cache``.
+
+    """
+
+    inherit_cache = False
+    """Indicate that this class adds no state to its superclass which would
+    affect compilation, so that the superclass' cache key generation may
+    be used as is.
+
+    .. versionadded:: 1.3.12
+
+    """
+
     def _clone(self):
         """Create a shallow copy of this ClauseElement.
 
@@ -356,6 +376,35 @@ class ClauseElement(Visitable):
         """
         pass
 
+    def _gen_cache_key(self, traversal):
+        """Return the structural cache key tuple for this element.
+
+        The default implementation consumes ``_cache_key_traversal``;
+        elements visited more than once within the same statement are
+        keyed as back-references.
+
+        """
+        spec = self._cache_key_traversal
+        if spec is None:
+            traversal.uncacheable()
+
+        ref = traversal.memoized(self)
+        if ref is not None:
+            return ref
+
+        visit = traversals._visit_dispatch
+        return (self.__class__,) + tuple(
+            visit[kind](traversal, getattr(self, attrname, None))
+            for attrname, kind in spec
+        )
+
+    def _generate_cache_key(self):
+        """Return a :class:`.CacheKey` for this element, or None if
+        it can't be cached.
+
+        """
+        return traversals._generate_cache_key(self)
+
     def get_children(self, **kwargs):
         r"""Return immediate child elements of this :class:`.ClauseElement`.
 
@@ -919,6 +968,14 @@ class BindParameter(ColumnElement):
     """
 
     __visit_name__ = "bindparam"
+    _cache_key_traversal = [
+        ("key", "string"),
+        ("type", "type"),
+        ("expanding", "plain"),
+        ("required", "plain"),
+        ("isoutparam", "plain"),
+        ("_is_crud", "plain"),
+    ]
 
     _is_crud = False
     _expanding_in_types = ()
@@ -1250,6 +1307,19 @@ class BindParameter(ColumnElement):
                 "%%(%d %s)s" % (id(self), self._orig_key or "param")
             )
 
+    def _gen_cache_key(self, traversal):
+        # the value itself is not part of the key; the bind is instead
+        # collected so that its value may be extracted at execution time
+        key = super(BindParameter, self)._gen_cache_key(traversal)
+        if key[0] != "_ref":
+            traversal.bindparams.append(self)
+            if self._expanding_in_types:
+                key += tuple(
+                    type_._static_cache_key
+                    for type_ in self._expanding_in_types
+                )
+        return key
+
     def compare(self, other, **kw):
         """Compare this :class:`BindParameter` to the given
         clause."""
@@ -1288,6 +1358,9 @@ class TypeClause(ClauseElement):
     """
 
     __visit_name__ = "typeclause"
+    _cache_key_traversal = [
+        ("type", "type"),
+    ]
 
     def __init__(self, type_):
         self.type = type_
@@ -1314,6 +1387,11 @@ class TextClause(Executable, ClauseElement):
     """
 
     __visit_name__ = "textclause"
+    _cache_key_traversal = [
+        ("text", "string"),
+        ("_bindparams", "clauseelement_dict"),
+        ("_execution_options", "plain_dict"),
+    ]
 
     _bind_params_regex = re.compile(r"(?<![:\w\x5c]):(\w+)(?!:)", re.UNICODE)
     _execution_options = Executable._execution_options.union(
@@ -1765,6 +1843,7 @@ class Null(ColumnElement):
     """
 
     __visit_name__ = "null"
+    _cache_key_traversal = []
 
     @util.memoized_property
     def type(self):
@@ -1789,6 +1868,7 @@ class False_(ColumnElement):
     """
 
     __visit_name__ = "false"
+    _cache_key_traversal = []
 
     @util.memoized_property
     def type(self):
@@ -1848,6 +1928,7 @@ class True_(ColumnElement):
     """
 
     __visit_name__ = "true"
+    _cache_key_traversal = []
 
     @util.memoized_property
     def type(self):
@@ -1913,6 +1994,13 @@ class ClauseList(ClauseElement):
     """
 
     __visit_name__ = "clauselist"
+    _cache_key_traversal = [
+        ("clauses", "clauseelement_list"),
+        ("operator", "plain"),
+        ("group", "plain"),
+        ("group_contents", "plain"),
+        ("_tuple_values", "plain"),
+    ]
 
     def __init__(self, *clauses, **kwargs):
         self.operator = kwargs.pop("operator", operators.comma_op)
@@ -2000,6 +2088,12 @@ class ClauseList(ClauseElement):
 
 class BooleanClauseList(ClauseList, ColumnElement):
     __visit_name__ = "clauselist"
+    _cache_key_traversal = [
+        ("clauses", "clauseelement_list"),
+        ("operator", "plain"),
+        ("group", "plain"),
+        ("group_contents", "plain"),
+    ]
 
     _tuple_values = False
 
@@ -2137,6 +2231,12 @@ or_ = BooleanClauseList.or_
 class Tuple(ClauseList, ColumnElement):
     """Represent a SQL tuple."""
 
+    _cache_key_traversal = [
+        ("clauses", "clauseelement_list"),
+        ("operator", "plain"),
+        ("type", "type"),
+    ]
+
     def __init__(self, *clauses, **kw):
         """Return a :class:`.Tuple`.
 
@@ -2218,6 +2318,12 @@ class Case(ColumnElement):
     """
 
     __visit_name__ = "case"
+    _cache_key_traversal = [
+        ("value", "clauseelement"),
+        ("whens", "clauseelement_tuples"),
+        ("else_", "clauseelement"),
+        ("type", "type"),
+    ]
 
     def __init__(self, whens, value=None, else_=None):
         r"""Produce a ``CASE`` expression.
@@ -2456,6 +2562,10 @@ class Cast(ColumnElement):
     """
 
     __visit_name__ = "cast"
+    _cache_key_traversal = [
+        ("clause", "clauseelement"),
+        ("typeclause", "clauseelement"),
+    ]
 
     def __init__(self, expression, type_):
         r"""Produce a ``CAST`` expression.
@@ -2545,6 +2655,10 @@ class TypeCoerce(ColumnElement):
     """
 
     __visit_name__ = "type_coerce"
+    _cache_key_traversal = [
+        ("clause", "clauseelement"),
+        ("type", "type"),
+    ]
 
     def __init__(self, expression, type_):
         r"""Associate a SQL expression with a particular type, without rendering
@@ -2637,6 +2751,10 @@ class Extract(ColumnElement):
     """Represent a SQL EXTRACT clause, ``extract(field FROM expr)``."""
 
     __visit_name__ = "extract"
+    _cache_key_traversal = [
+        ("field", "string"),
+        ("expr", "clauseelement"),
+    ]
 
     def __init__(self, field, expr, **kwargs):
         """Return a :class:`.Extract` construct.
@@ -2675,6 +2793,9 @@ class _label_reference(ColumnElement):
     """
 
     __visit_name__ = "label_reference"
+    _cache_key_traversal = [
+        ("element", "clauseelement"),
+    ]
 
     def __init__(self, element):
         self.element = element
@@ -2689,6 +2810,9 @@ class _label_reference(ColumnElement):
 
 class _textual_label_reference(ColumnElement):
     __visit_name__ = "textual_label_reference"
+    _cache_key_traversal = [
+        ("element", "string"),
+    ]
 
     def __init__(self, element):
         self.element = element
@@ -2713,6 +2837,13 @@ class UnaryExpression(ColumnElement):
     """
 
     __visit_name__ = "unary"
+    _cache_key_traversal = [
+        ("element", "clauseelement"),
+        ("operator", "plain"),
+        ("modifier", "plain"),
+        ("type", "type"),
+        ("wraps_column_expression", "plain"),
+    ]
 
     def __init__(
         self,
@@ -3010,6 +3141,8 @@ class CollectionAggregate(UnaryExpression):
 
     """
 
+    inherit_cache = True
+
     @classmethod
     def _create_any(cls, expr):
         """Produce an ANY expression.
@@ -3095,6 +3228,8 @@ class CollectionAggregate(UnaryExpression):
 
 
 class AsBoolean(UnaryExpression):
+    inherit_cache = True
+
     def __init__(self, element, operator, negate):
         self.element = element
         self.type = type_api.BOOLEANTYPE
@@ -3129,6 +3264,13 @@ class BinaryExpression(ColumnElement):
     """
 
     __visit_name__ = "binary"
+    _cache_key_traversal = [
+        ("left", "clauseelement"),
+        ("right", "clauseelement"),
+        ("operator", "plain"),
+        ("type", "type"),
+        ("modifiers", "plain_dict"),
+    ]
 
     _is_implicitly_boolean = True
     """Indicates that any database will know this is a boolean expression
@@ -3226,6 +3368,11 @@ class Slice(ColumnElement):
     """
 
     __visit_name__ = "slice"
+    _cache_key_traversal = [
+        ("start", "plain"),
+        ("stop", "plain"),
+        ("step", "plain"),
+    ]
 
     def __init__(self, start, stop, step):
         self.start = start
@@ -3242,13 +3389,17 @@ class IndexExpression(BinaryExpression):
     """Represent the class of expressions that are like an "index" operation.
     """
 
-    pass
+    inherit_cache = True
 
 
 class Grouping(ColumnElement):
     """Represent a grouping within a column expression"""
 
     __visit_name__ = "grouping"
+    _cache_key_traversal = [
+        ("element", "clauseelement"),
+        ("type", "type"),
+    ]
 
     def __init__(self, element):
         self.element = element
@@ -3311,6 +3462,13 @@ class Over(ColumnElement):
     """
 
     __visit_name__ = "over"
+    _cache_key_traversal = [
+        ("element", "clauseelement"),
+        ("order_by", "clauseelement"),
+        ("partition_by", "clauseelement"),
+        ("range_", "plain"),
+        ("rows", "plain"),
+    ]
 
     order_by = None
     partition_by = None
@@ -3524,6 +3682,10 @@ class WithinGroup(ColumnElement):
     """
 
     __visit_name__ = "withingroup"
+    _cache_key_traversal = [
+        ("element", "clauseelement"),
+        ("order_by", "clauseelement"),
+    ]
 
     order_by = None
 
@@ -3636,6 +3798,10 @@ class FunctionFilter(ColumnElement):
     """
 
     __visit_name__ = "funcfilter"
+    _cache_key_traversal = [
+        ("func", "clauseelement"),
+        ("criterion", "clauseelement"),
+    ]
 
     criterion = None
 
@@ -3754,6 +3920,11 @@ class Label(ColumnElement):
     """
 
     __visit_name__ = "label"
+    _cache_key_traversal = [
+        ("name", "string"),
+        ("_element", "clauseelement"),
+        ("_type", "type"),
+    ]
 
     def __init__(self, name, element, type_=None):
         """Return a :class:`Label` object for the
@@ -3902,6 +4073,13 @@ class ColumnClause(Immutable, ColumnElement):
     """
 
     __visit_name__ = "column"
+    _cache_key_traversal = [
+        ("name", "string"),
+        ("key", "string"),
+        ("type", "type"),
+        ("is_literal", "plain"),
+        ("table", "clauseelement"),
+    ]
 
     onupdate = default = server_default = server_onupdate = None
 
@@ -4027,6 +4205,19 @@ class ColumnClause(Immutable, ColumnElement):
 
     table = property(_get_table, _set_table)
 
+    def _gen_cache_key(self, traversal):
+        table = self.table
+        if (
+            table is not None
+            and table._is_table
+            and hash(table._columns._data.get(self.key)) == hash(self)
+        ):
+            # a column that's part of a table is keyed on that table, which
+            # is itself keyed on identity
+            return (table._gen_cache_key(traversal), self.key)
+        else:
+            return super(ColumnClause, self)._gen_cache_key(traversal)
+
     @_memoized_property
     def _from_objects(self):
         t = self.table
@@ -4163,6 +4354,9 @@ class ColumnClause(Immutable, ColumnElement):
 
 class CollationClause(ColumnElement):
     __visit_name__ = "collation"
+    _cache_key_traversal = [
+        ("collation", "string"),
+    ]
 
     def __init__(self, collation):
         self.collation = collation
@@ -4171,6 +4365,10 @@ class CollationClause(ColumnElement):
 class _IdentifiedClause(Executable, ClauseElement):
 
     __visit_name__ = "identified"
+    _cache_key_traversal = [
+        ("ident", "string"),
+    ]
+
     _execution_options = Executable._execution_options.union(
         {"autocommit": False}
     )
@@ -4181,14 +4379,17 @@ class _IdentifiedClause(Executable, ClauseElement):
 
 class SavepointClause(_IdentifiedClause):
     __visit_name__ = "savepoint"
+    inherit_cache = True
 
 
 class RollbackToSavepointClause(_IdentifiedClause):
     __visit_name__ = "rollback_to_savepoint"
+    inherit_cache = True
 
 
 class ReleaseSavepointClause(_IdentifiedClause):
     __visit_name__ = "release_savepoint"
+    inherit_cache = True
 
 
 class quoted_name(util.MemoizedSlots, util.text_type):
@@ -55,6 +55,7 @@ __all__ = [
     "intersect_all",
     "join",
     "label",
+    "lambda_stmt",
     "lateral",
     "literal",
     "literal_column",
@@ -147,6 +148,7 @@ from .functions import func  # noqa
 from .functions import Function  # noqa
 from .functions import FunctionElement  # noqa
 from .functions import modifier  # noqa
+from .lambdas import StatementLambdaElement  # noqa
 from .selectable import _interpret_as_from  # noqa
 from .selectable import Alias  # noqa
 from .selectable import CompoundSelect  # noqa
@@ -183,6 +185,9 @@ and_ = public_factory(BooleanClauseList.and_, ".expression.and_")
 alias = public_factory(Alias._factory, ".expression.alias")
 tablesample = public_factory(TableSample._factory, ".expression.tablesample")
 lateral = public_factory(Lateral._factory, ".expression.lateral")
+lambda_stmt = public_factory(
+    StatementLambdaElement, ".expression.lambda_stmt"
+)
 or_ = public_factory(BooleanClauseList.or_, ".expression.or_")
 bindparam = public_factory(BindParameter, ".expression.bindparam")
 select = public_factory(Select, ".expression.select")
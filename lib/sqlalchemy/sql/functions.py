@@ -443,6 +443,15 @@ class FunctionElement(Executable, ColumnElement, FromClause):
 
 
 class FunctionAsBinary(BinaryExpression):
+    _cache_key_traversal = [
+        ("sql_function", "clauseelement"),
+        ("left_index", "plain"),
+        ("right_index", "plain"),
+        ("operator", "plain"),
+        ("type", "type"),
+        ("modifiers", "plain_dict"),
+    ]
+
     def __init__(self, fn, left_index, right_index):
         left = fn.clauses.clauses[left_index - 1]
         right = fn.clauses.clauses[right_index - 1]
@@ -642,6 +651,14 @@ class Function(FunctionElement):
     """
 
     __visit_name__ = "function"
+    _cache_key_traversal = [
+        ("name", "string"),
+        ("packagenames", "string_list"),
+        ("clause_expr", "clauseelement"),
+        ("type", "type"),
+        ("_has_args", "plain"),
+        ("_execution_options", "plain_dict"),
+    ]
 
     def __init__(self, name, *clauses, **kw):
         """Construct a :class:`.Function`.
@@ -688,6 +705,13 @@ class _GenericMeta(VisitableType):
                 # Set _register to True to register child classes by default
                 cls._register = True
 
+            # the state of a generic function is stored within the
+            # attributes established by Function, so subclasses share its
+            # cache key unless they state otherwise
+            if "_cache_key_traversal" not in clsdict:
+                clsdict = dict(clsdict)
+                cls.inherit_cache = clsdict.setdefault("inherit_cache", True)
+
         super(_GenericMeta, cls).__init__(clsname, bases, clsdict)
 
 
@@ -786,6 +810,11 @@ class next_value(GenericFunction):
 
     """
 
+    _cache_key_traversal = [
+        ("sequence", "plain"),
+        ("type", "type"),
+    ]
+
     type = sqltypes.Integer()
     name = "next_value"
 
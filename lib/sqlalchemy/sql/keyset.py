@@ -0,0 +1,277 @@
+# sql/keyset.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Keyset ("seek") pagination support.
+
+Given the ORDER BY of a statement along with the ORDER BY values of the last
+row of a page, produces the WHERE criteria which select the rows that follow
+it, as well as the opaque tokens in which those values are passed from one
+page to the next.  Used by :meth:`.Select.seek` and :meth:`.Query.seek`.
+
+"""
+
+import base64
+import datetime
+import decimal
+import json
+import uuid
+import zlib
+
+from . import operators
+from .elements import _label_reference
+from .elements import _textual_label_reference
+from .elements import and_
+from .elements import False_
+from .elements import Label
+from .elements import or_
+from .elements import UnaryExpression
+from .. import exc
+from .. import util
+
+
+_ordering_modifiers = {
+    operators.asc_op: ("descending", False),
+    operators.desc_op: ("descending", True),
+    operators.nullsfirst_op: ("nullsfirst", True),
+    operators.nullslast_op: ("nullsfirst", False),
+}
+
+
+def _unwrap_ordering(element):
+    """Break an ORDER BY element into its expression, whether it is
+    descending, and whether NULLs are ordered first, where the latter is
+    None if not specified."""
+
+    opts = {"descending": None, "nullsfirst": None}
+    while (
+        isinstance(element, UnaryExpression)
+        and element.modifier in _ordering_modifiers
+    ):
+        name, value = _ordering_modifiers[element.modifier]
+        if opts[name] is None:
+            opts[name] = value
+        element = element.element
+
+    if isinstance(element, _label_reference):
+        element = element.element
+    return element, bool(opts["descending"]), opts["nullsfirst"]
+
+
+def _is_nullable(element):
+    if isinstance(element, Label):
+        element = element.element
+    return getattr(element, "nullable", True)
+
+
+class KeysetOrdering(object):
+    """The ORDER BY of a statement as used for keyset pagination.
+
+    Consists of the ORDER BY expressions of the statement, followed by
+    any columns of a unique key not already present, so that each row
+    has a distinct position.
+
+    """
+
+    __slots__ = ("elements", "added")
+
+    def __init__(self, order_by, unique_keys):
+        self.elements = elements = []
+        present = util.column_set()
+        for element in order_by:
+            expr, descending, nullsfirst = _unwrap_ordering(element)
+            if isinstance(expr, _textual_label_reference):
+                raise exc.InvalidRequestError(
+                    "Can't use ORDER BY label name %r for keyset pagination; "
+                    "order by the labeled expression itself" % expr.element
+                )
+            nullable = _is_nullable(expr)
+            if nullable and nullsfirst is None:
+                raise exc.InvalidRequestError(
+                    "ORDER BY expression %s may be NULL; keyset pagination "
+                    "requires that the position of NULL values be stated "
+                    "using nullsfirst() or nullslast()" % expr
+                )
+            elements.append((expr, descending, bool(nullsfirst), nullable))
+            present.add(expr._deannotate())
+
+        self.added = ()
+        if not any(
+            all(col._deannotate() in present for col in key)
+            for key in unique_keys
+        ):
+            if len(unique_keys) != 1:
+                raise exc.InvalidRequestError(
+                    "Can't determine a unique key with which to order rows "
+                    "for keyset pagination; the ORDER BY must include the "
+                    "columns of a unique key"
+                )
+            self.added = tuple(
+                col
+                for col in unique_keys[0]
+                if col._deannotate() not in present
+            )
+            elements.extend((col, False, False, False) for col in self.added)
+
+    def _fingerprint(self):
+        return zlib.crc32(
+            "|".join(
+                "%s %d %d" % (expr, descending, nullsfirst)
+                for expr, descending, nullsfirst, nullable in self.elements
+            ).encode("utf-8")
+        ) & 0xFFFFFFFF
+
+    def criterion(self, values):
+        """Return WHERE criteria selecting the rows which follow the row
+        having the given ORDER BY values."""
+
+        clauses = []
+        equal = []
+        for (expr, descending, nullsfirst, nullable), value in zip(
+            self.elements, values
+        ):
+            if value is None:
+                after = expr.isnot(None) if nullsfirst else None
+            else:
+                after = expr < value if descending else expr > value
+                if nullable and not nullsfirst:
+                    after = or_(after, expr.is_(None))
+            if after is not None:
+                clauses.append(and_(*(equal + [after])))
+            equal.append(expr.is_(None) if value is None else expr == value)
+
+        if not clauses:
+            return False_()
+        criterion = or_(*clauses)
+
+        # a redundant range against the first ORDER BY expression, so that
+        # an index on it can be used to locate the first row
+        expr, descending, nullsfirst, nullable = self.elements[0]
+        value = values[0]
+        if value is not None and (nullsfirst or not nullable):
+            criterion = and_(
+                expr <= value if descending else expr >= value, criterion
+            )
+        return criterion
+
+    def token(self, values):
+        """Return an opaque token for the given ORDER BY values."""
+
+        payload = json.dumps(
+            [self._fingerprint(), [_encode_value(value) for value in values]],
+            separators=(",", ":"),
+        )
+        return util.text_type(
+            base64.urlsafe_b64encode(payload.encode("utf-8"))
+            .rstrip(b"=")
+            .decode("ascii")
+        )
+
+    def values(self, token):
+        """Return the ORDER BY values encoded by the given token."""
+
+        try:
+            token = token.encode("ascii")
+            payload = json.loads(
+                base64.urlsafe_b64decode(token + b"=" * (-len(token) % 4))
+                .decode("utf-8")
+            )
+            fingerprint, values = payload
+            values = [_decode_value(value) for value in values]
+        except Exception:
+            raise exc.ArgumentError("Invalid keyset pagination token")
+
+        if fingerprint != self._fingerprint() or len(values) != len(
+            self.elements
+        ):
+            raise exc.ArgumentError(
+                "Keyset pagination token does not correspond to the "
+                "ORDER BY of this statement"
+            )
+        return values
+
+
+class _FixedOffset(datetime.tzinfo):
+    def __init__(self, minutes):
+        self._offset = datetime.timedelta(minutes=minutes)
+
+    def utcoffset(self, dt):
+        return self._offset
+
+    def dst(self, dt):
+        return None
+
+    def tzname(self, dt):
+        return None
+
+
+def _encode_value(value):
+    if value is None or isinstance(
+        value, (bool, float) + util.int_types + util.string_types
+    ):
+        return value
+    elif isinstance(value, datetime.datetime):
+        offset = value.utcoffset()
+        return {
+            "datetime": [
+                value.year,
+                value.month,
+                value.day,
+                value.hour,
+                value.minute,
+                value.second,
+                value.microsecond,
+                offset.days * 1440 + offset.seconds // 60
+                if offset is not None
+                else None,
+            ]
+        }
+    elif isinstance(value, datetime.date):
+        return {"date": [value.year, value.month, value.day]}
+    elif isinstance(value, datetime.time):
+        return {
+            "time": [value.hour, value.minute, value.second, value.microsecond]
+        }
+    elif isinstance(value, datetime.timedelta):
+        return {"timedelta": [value.days, value.seconds, value.microseconds]}
+    elif isinstance(value, decimal.Decimal):
+        return {"decimal": str(value)}
+    elif isinstance(value, uuid.UUID):
+        return {"uuid": value.hex}
+    elif isinstance(value, util.binary_type):
+        return {"binary": base64.b64encode(value).decode("ascii")}
+    else:
+        raise exc.ArgumentError(
+            "Can't encode value of type %s in a keyset pagination token"
+            % type(value).__name__
+        )
+
+
+def _decode_value(value):
+    if not isinstance(value, dict):
+        return value
+
+    ((type_, value),) = value.items()
+    if type_ == "datetime":
+        offset = value.pop()
+        return datetime.datetime(
+            *value,
+            tzinfo=_FixedOffset(offset) if offset is not None else None
+        )
+    elif type_ == "date":
+        return datetime.date(*value)
+    elif type_ == "time":
+        return datetime.time(*value)
+    elif type_ == "timedelta":
+        return datetime.timedelta(*value)
+    elif type_ == "decimal":
+        return decimal.Decimal(value)
+    elif type_ == "uuid":
+        return uuid.UUID(value)
+    elif type_ == "binary":
+        return base64.b64decode(value.encode("ascii"))
+    else:
+        raise ValueError(type_)
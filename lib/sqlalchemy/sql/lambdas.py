@@ -0,0 +1,588 @@
+# sql/lambdas.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Statement construction cached on the code location of a Python lambda.
+
+A :class:`.StatementLambdaElement` produces its SQL statement by invoking
+one or more Python lambdas.  The first time a particular set of lambdas is
+invoked, the literal values they refer to as closure variables, default
+arguments or module-level globals are replaced with bound parameters, and
+the resulting statement is stored in a cache keyed on the code objects of
+the lambdas.  Subsequent invocations locate the stored statement and supply
+the current values of those variables as bound parameter values, without
+invoking the lambdas again.
+
+"""
+
+import datetime
+import decimal
+import dis
+import types
+import uuid
+
+from . import elements
+from . import traversals
+from . import type_api
+from . import visitors
+from .base import Executable
+from .elements import ClauseElement
+from .. import exc
+from .. import inspection
+from .. import util
+
+
+_closure_per_cache_key = util.LRUCache(1000)
+"""Cache of :class:`._LambdaCacheEntry` objects, keyed on the code objects
+of a series of lambdas along with the non-literal values they refer to."""
+
+_analyzed_code = util.LRUCache(1000)
+
+_bound_value_types = set(
+    util.int_types
+    + util.string_types
+    + (
+        util.text_type,
+        util.binary_type,
+        float,
+        decimal.Decimal,
+        datetime.date,
+        datetime.datetime,
+        datetime.time,
+        datetime.timedelta,
+        uuid.UUID,
+    )
+)
+"""Types of variable values which are delivered as bound parameters.
+
+``bool`` and ``None`` are not included, as these are typically used to
+make decisions within the lambda itself; they are instead part of the
+cache key by value, see ``_keyed_value_types``.
+
+"""
+
+_keyed_value_types = (type(None), bool)
+"""Types of variable values which are made part of the cache key by value,
+along with tuples and frozensets of acceptable values."""
+
+_BOUND = util.symbol("BOUND")
+_VALUE = util.symbol("VALUE")
+_MISSING = util.symbol("MISSING")
+_UNCACHEABLE = util.symbol("UNCACHEABLE")
+
+
+def _make_cell(value):
+    return (lambda: value).__closure__[0]
+
+
+if hasattr(dis, "get_instructions"):
+
+    def _global_names(code):
+        names = set()
+        for instruction in dis.get_instructions(code):
+            if instruction.opname == "LOAD_GLOBAL":
+                names.add(instruction.argval)
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                names.update(_global_names(const))
+        return names
+
+
+else:
+
+    def _global_names(code):
+        names = set(code.co_names)
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                names.update(_global_names(const))
+        return names
+
+
+def _is_keyed_on_identity(value):
+    """Return True if the given value can be made part of the cache key by
+    identity.
+
+    These are SQL constructs, which are immutable, as well as classes,
+    functions and modules, which refer to code rather than to state; other
+    objects may carry state that a lambda would read from within the
+    statement, such as ``lambda: select([t]).where(t.c.id == obj.id)``,
+    which would not be reflected in the cache key.
+
+    """
+    if (
+        isinstance(value, (ClauseElement, types.ModuleType))
+        or hasattr(value, "__clause_element__")
+        or callable(value)
+    ):
+        return True
+
+    # SQL constructs from other packages, such as the ORM's aliased
+    # classes and mappers, are those that have an inspection target
+    # other than the generic one for object instances
+    for cls in type(value).__mro__:
+        if cls is not object and cls in inspection._registrars:
+            return True
+    return False
+
+
+class _UnkeyableValue(Exception):
+    pass
+
+
+def _cache_key_for_value(value):
+    """Return True if the given value, which is not a bound literal, can
+    be part of the cache key, False if it can't be hashed, or raise."""
+
+    if value.__class__ in _keyed_value_types or value is _MISSING:
+        return True
+    elif value.__class__ in (tuple, frozenset):
+        return all(
+            value.__class__ in _bound_value_types
+            or _cache_key_for_value(elem)
+            for elem in value
+        )
+
+    try:
+        hash(value)
+    except TypeError:
+        return False
+
+    if _is_keyed_on_identity(value):
+        return True
+    else:
+        raise _UnkeyableValue()
+
+
+class _LambdaAnalysis(object):
+    """The names of the variables a lambda refers to, derived from its
+    code object."""
+
+    __slots__ = ("closure_names", "global_names")
+
+    def __init__(self, fn):
+        code = fn.__code__
+        self.closure_names = code.co_freevars
+        self.global_names = tuple(
+            name for name in sorted(_global_names(code))
+        )
+
+    @classmethod
+    def for_fn(cls, fn):
+        code = fn.__code__
+        analysis = _analyzed_code.get(code)
+        if analysis is None:
+            _analyzed_code[code] = analysis = cls(fn)
+        return analysis
+
+
+class _LambdaCacheEntry(object):
+    """A statement produced from a series of lambdas, along with the
+    correspondence of its bound parameters to the variables of those
+    lambdas."""
+
+    __slots__ = ("statement", "cache_key", "bind_map", "values")
+
+    def __init__(self, statement, cache_key, bind_map, values):
+        self.statement = statement
+        self.cache_key = cache_key
+        self.bind_map = bind_map
+        self.values = values
+
+
+class StatementLambdaElement(Executable, ClauseElement):
+    """Represent a composable SQL statement as a series of lambdas.
+
+    The :class:`.StatementLambdaElement` is constructed using the
+    :func:`.lambda_stmt` function::
+
+        from sqlalchemy import lambda_stmt
+
+        def get_user(connection, user_id):
+            stmt = lambda_stmt(
+                lambda: select([users]).where(users.c.id == user_id)
+            )
+            return connection.execute(stmt).first()
+
+    Additional criteria may be added using the ``+`` operator or the
+    :meth:`.StatementLambdaElement.add_criteria` method, each of which
+    accepts a lambda that receives the current statement and returns a
+    new one::
+
+        stmt = lambda_stmt(lambda: select([users]))
+        if name is not None:
+            stmt += lambda s: s.where(users.c.name == name)
+
+    The statement is produced by invoking the lambdas only the first time
+    a particular combination of lambdas is encountered; the result is
+    cached based on the code location of each lambda.  Variables referred
+    to by the lambdas which contain literal values such as integers,
+    strings and dates are rendered as bound parameters, so that subsequent
+    invocations only need to supply the current values of these variables
+    to the cached statement.  SQL constructs, mapped classes, functions,
+    ``None`` and booleans are instead made part of the cache key, so that a
+    change in their value, or identity in the case of objects, results in
+    the lambdas being invoked again.
+
+    Variables referring to any other kind of object, such as ``self`` or
+    an ORM-mapped instance, raise :class:`.InvalidRequestError`, as
+    attributes read from such an object within the lambda would be cached
+    along with the statement.  Values needed from such objects should be
+    assigned to local variables outside of the lambda::
+
+        # raises InvalidRequestError
+        stmt = lambda_stmt(
+            lambda: select([users]).where(users.c.id == self.user_id)
+        )
+
+        # OK; "user_id" is rendered as a bound parameter
+        user_id = self.user_id
+        stmt = lambda_stmt(
+            lambda: select([users]).where(users.c.id == user_id)
+        )
+
+    As the lambdas are invoked with bound parameter objects in place of
+    literal values, they should only use such values within SQL
+    expressions.  A lambda which uses these values to make decisions in
+    Python, or which refers to a variable containing a value that can't be
+    hashed such as a list, is invoked each time the statement is executed.
+
+    .. versionadded:: 1.3.12
+
+    .. seealso::
+
+        :func:`.lambda_stmt`
+
+    """
+
+    __visit_name__ = "lambda_element"
+
+    _cache_key_traversal = None
+
+    def __init__(self, fn, _parent=None):
+        """Produce a SQL statement that is cached based on the code
+        location of the given lambda.
+
+        E.g.::
+
+            from sqlalchemy import lambda_stmt
+
+            stmt = lambda_stmt(
+                lambda: select([users]).where(users.c.id == user_id)
+            )
+
+            result = connection.execute(stmt)
+
+        The lambda is invoked with no arguments and must return an
+        executable SQL statement such as a :func:`.select`, :func:`.insert`,
+        :func:`.update` or :func:`.delete` construct.  See
+        :class:`.StatementLambdaElement` for a description of how the lambda
+        and the variables it refers to are cached.
+
+        :param fn: a Python callable, typically a lambda, which returns
+         a SQL statement.
+
+        .. versionadded:: 1.3.12
+
+        """
+        if not callable(fn):
+            raise exc.ArgumentError(
+                "lambda_stmt() and add_criteria() accept a callable; "
+                "got %r" % (fn,)
+            )
+        if _parent is not None:
+            self._fns = _parent._fns + (fn,)
+        else:
+            self._fns = (fn,)
+
+    @util.memoized_property
+    def _entry(self):
+        """The :class:`._LambdaCacheEntry` for the lambdas of this element
+        and the values of their variables, or ``_UNCACHEABLE``."""
+
+        key = []
+        values = []
+        self._values = ()
+
+        for fn in self._fns:
+            try:
+                variables = self._variables_for_fn(fn)
+            except ValueError:
+                # an empty closure cell
+                return _UNCACHEABLE
+
+            key.append(fn.__code__)
+            for kind, name, value in variables:
+                if value.__class__ in _bound_value_types:
+                    key.append(_BOUND)
+                    key.append(value.__class__)
+                    values.append(value)
+                    continue
+
+                try:
+                    cacheable = _cache_key_for_value(value)
+                except _UnkeyableValue:
+                    raise exc.InvalidRequestError(
+                        "%s named '%s' inside of lambda callable %s does "
+                        "not refer to a SQL element, class, function or "
+                        "literal value, and can't be made part of the "
+                        "lambda's cache key; any attributes it provides "
+                        "would be cached along with the statement.  Assign "
+                        "the values needed from it to local variables "
+                        "outside of the lambda, and refer to those within "
+                        "the lambda instead." % (kind, name, fn.__code__)
+                    )
+                if not cacheable:
+                    return _UNCACHEABLE
+                key.append(_VALUE)
+                key.append(value)
+
+        key = tuple(key)
+        self._values = tuple(values)
+
+        entry = _closure_per_cache_key.get(key)
+        if entry is None:
+            entry = self._build_entry()
+            _closure_per_cache_key[key] = entry
+        return entry
+
+    def _variables_for_fn(self, fn):
+        analysis = _LambdaAnalysis.for_fn(fn)
+
+        variables = []
+        if fn.__closure__:
+            variables.extend(
+                ("Closure variable", name, cell.cell_contents)
+                for name, cell in zip(analysis.closure_names, fn.__closure__)
+            )
+        if fn.__defaults__:
+            code = fn.__code__
+            varnames = code.co_varnames[: code.co_argcount]
+            variables.extend(
+                ("Default argument", name, value)
+                for name, value in zip(
+                    varnames[-len(fn.__defaults__) :], fn.__defaults__
+                )
+            )
+        if analysis.global_names:
+            globals_ = fn.__globals__
+            variables.extend(
+                ("Global variable", name, globals_.get(name, _MISSING))
+                for name in analysis.global_names
+            )
+        return variables
+
+    def _tracked_fn(self, fn, trackers):
+        """Return a copy of the given function, where variables containing
+        literal values are replaced with bound parameters."""
+
+        def track(name, value):
+            if value.__class__ in _bound_value_types:
+                bindparam = elements.BindParameter(
+                    name, value, type_=type_api.NULLTYPE, unique=True
+                )
+                trackers.append(bindparam)
+                return bindparam
+            else:
+                return value
+
+        analysis = _LambdaAnalysis.for_fn(fn)
+
+        closure = fn.__closure__
+        if closure:
+            closure = tuple(
+                _make_cell(track(name, cell.cell_contents))
+                for name, cell in zip(analysis.closure_names, closure)
+            )
+
+        defaults = fn.__defaults__
+        if defaults:
+            varnames = fn.__code__.co_varnames[: fn.__code__.co_argcount]
+            defaults = tuple(
+                track(name, value)
+                for name, value in zip(varnames[-len(defaults) :], defaults)
+            )
+
+        globals_ = fn.__globals__
+        if analysis.global_names:
+            tracked_globals = {}
+            for name in analysis.global_names:
+                value = globals_.get(name, _MISSING)
+                if value is not _MISSING:
+                    tracked = track(name, value)
+                    if tracked is not value:
+                        tracked_globals[name] = tracked
+            if tracked_globals:
+                globals_ = dict(globals_)
+                globals_.update(tracked_globals)
+
+        return types.FunctionType(
+            fn.__code__, globals_, fn.__name__, defaults, closure
+        )
+
+    def _invoke(self, fns):
+        statement = None
+        for idx, fn in enumerate(fns):
+            if idx == 0:
+                statement = fn()
+            else:
+                statement = fn(statement)
+
+            if not isinstance(statement, Executable) or not isinstance(
+                statement, ClauseElement
+            ):
+                raise exc.ArgumentError(
+                    "Lambda passed to lambda_stmt() or add_criteria() must "
+                    "return an executable SQL statement; got %r"
+                    % (statement,)
+                )
+        return statement
+
+    def _build_entry(self):
+        trackers = []
+        try:
+            statement = self._invoke(
+                [self._tracked_fn(fn, trackers) for fn in self._fns]
+            )
+        except Exception:
+            # the lambda made use of a tracked value in Python; it will be
+            # invoked with the actual values each time
+            return _UNCACHEABLE
+
+        cache_key = statement._generate_cache_key()
+        if cache_key is None:
+            return _UNCACHEABLE
+
+        tracker_positions = dict(
+            (id(tracker), idx) for idx, tracker in enumerate(trackers)
+        )
+        bind_map = []
+        for position, bindparam in enumerate(cache_key.bindparams):
+            while bindparam is not None:
+                idx = tracker_positions.get(id(bindparam))
+                if idx is not None:
+                    bind_map.append((position, idx))
+                    break
+                bindparam = bindparam._is_clone_of
+
+        if set(idx for position, idx in bind_map) != set(
+            range(len(trackers))
+        ):
+            # a tracked value was consumed in Python rather than becoming
+            # part of the statement
+            return _UNCACHEABLE
+
+        return _LambdaCacheEntry(
+            statement,
+            cache_key,
+            tuple(bind_map),
+            tuple(tracker.value for tracker in trackers),
+        )
+
+    def add_criteria(self, other):
+        """Return a new :class:`.StatementLambdaElement` which adds the given
+        lambda to the series of lambdas which produce the statement.
+
+        The lambda receives the statement produced by the previous lambdas
+        and returns a new statement::
+
+            stmt = stmt.add_criteria(lambda s: s.where(table.c.id == 5))
+
+        This is equivalent to ``stmt + (lambda s: s.where(...))``.
+
+        """
+        return self.__class__(other, _parent=self)
+
+    def __add__(self, other):
+        return self.add_criteria(other)
+
+    def _values_match(self):
+        entry_values = self._entry.values
+        return all(
+            value is entry_value or value == entry_value
+            for value, entry_value in zip(self._values, entry_values)
+        )
+
+    @util.memoized_property
+    def _bindparam_replacements(self):
+        entry = self._entry
+        values = self._values
+        bindparams = entry.cache_key.bindparams
+        return dict(
+            (position, bindparams[position]._with_value(values[idx]))
+            for position, idx in entry.bind_map
+        )
+
+    @util.memoized_property
+    def _cache_key(self):
+        entry = self._entry
+        if entry is _UNCACHEABLE:
+            return self._resolved._generate_cache_key()
+        elif self._values_match():
+            return entry.cache_key
+
+        bindparams = list(entry.cache_key.bindparams)
+        for position, bindparam in self._bindparam_replacements.items():
+            bindparams[position] = bindparam
+        return traversals.CacheKey(
+            entry.cache_key.key, bindparams, entry.cache_key.elements
+        )
+
+    @util.memoized_property
+    def _resolved(self):
+        """The SQL statement represented by this element."""
+
+        entry = self._entry
+        if entry is _UNCACHEABLE:
+            return self._invoke(self._fns)
+        elif self._values_match():
+            return entry.statement
+
+        bindparams = entry.cache_key.bindparams
+        replacements = dict(
+            (id(bindparams[position]), bindparam)
+            for position, bindparam in self._bindparam_replacements.items()
+        )
+        return visitors.replacement_traverse(
+            entry.statement, {}, lambda elem: replacements.get(id(elem))
+        )
+
+    def _generate_cache_key(self):
+        return self._cache_key
+
+    def _gen_cache_key(self, traversal):
+        return self._resolved._gen_cache_key(traversal)
+
+    def __getattr__(self, key):
+        if key in ("_resolved", "_entry", "_values", "_fns"):
+            raise AttributeError(key)
+        return getattr(self._resolved, key)
+
+    @property
+    def bind(self):
+        return self._bind or self._resolved.bind
+
+    @property
+    def _from_objects(self):
+        return self._resolved._from_objects
+
+    def _get_execution_options(self):
+        options = self.__dict__.get("_lambda_execution_options")
+        if options is not None:
+            return options
+        elif self._entry is _UNCACHEABLE:
+            return self._resolved._execution_options
+        else:
+            return self._entry.statement._execution_options
+
+    def _set_execution_options(self, options):
+        self.__dict__["_lambda_execution_options"] = options
+
+    _execution_options = property(
+        _get_execution_options, _set_execution_options
+    )
+
+    def get_children(self, **kwargs):
+        return (self._resolved,)
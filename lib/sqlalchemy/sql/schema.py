@@ -564,6 +564,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
         # this argument is only used with _init_existing()
         kwargs.pop("autoload_replace", True)
         _extend_on = kwargs.pop("_extend_on", None)
+        _inspector = kwargs.pop("_inspector", None)
 
         resolve_fks = kwargs.pop("resolve_fks", True)
         include_columns = kwargs.pop("include_columns", None)
@@ -593,6 +594,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
                 include_columns,
                 _extend_on=_extend_on,
                 resolve_fks=resolve_fks,
+                _inspector=_inspector,
             )
 
         # initialize all the column, etc. objects.  done after reflection to
@@ -607,6 +609,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
         exclude_columns=(),
         resolve_fks=True,
         _extend_on=None,
+        _inspector=None,
     ):
 
         if autoload_with:
@@ -617,6 +620,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
                 exclude_columns,
                 resolve_fks,
                 _extend_on=_extend_on,
+                _inspector=_inspector,
             )
         else:
             bind = _bind_or_error(
@@ -663,6 +667,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
         autoload_replace = kwargs.pop("autoload_replace", True)
         schema = kwargs.pop("schema", None)
         _extend_on = kwargs.pop("_extend_on", None)
+        _inspector = kwargs.pop("_inspector", None)
 
         if schema and schema != self.schema:
             raise exc.ArgumentError(
@@ -678,6 +683,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
             for c in self.c:
                 if c.name not in include_columns:
                     self._columns.remove(c)
+                    self._cache_version += 1
 
         for key in ("quote", "quote_schema"):
             if key in kwargs:
@@ -706,6 +712,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
                 exclude_columns,
                 resolve_fks,
                 _extend_on=_extend_on,
+                _inspector=_inspector,
             )
 
         self._extra_kwargs(**kwargs)
@@ -1025,6 +1032,8 @@ class Column(DialectKWArgs, SchemaItem, ColumnClause):
 
     __visit_name__ = "column"
 
+    inherit_cache = True
+
     def __init__(self, *args, **kwargs):
         r"""
         Construct a new ``Column`` object.
@@ -1482,6 +1491,7 @@ class Column(DialectKWArgs, SchemaItem, ColumnClause):
                         table.constraints.remove(fk.constraint)
 
         table._columns.replace(self)
+        table._cache_version += 1
 
         if self.primary_key:
             table.primary_key._replace(self)
@@ -3401,6 +3411,7 @@ class PrimaryKeyConstraint(ColumnCollectionConstraint):
 
     def _set_parent(self, table):
         super(PrimaryKeyConstraint, self)._set_parent(table)
+        table._cache_version += 1
 
         if table.primary_key is not self:
             table.constraints.discard(table.primary_key)
@@ -4124,6 +4135,8 @@ class MetaData(SchemaItem):
         extend_existing=False,
         autoload_replace=True,
         resolve_fks=True,
+        reflection_cache=None,
+        max_workers=None,
         **dialect_kwargs
     ):
         r"""Load all available table definitions from the database.
@@ -4190,6 +4203,22 @@ class MetaData(SchemaItem):
 
             :paramref:`.Table.resolve_fks`
 
+        :param reflection_cache: optional :class:`.ReflectionCache`, which
+         stores the reflected information for each table on disk; on
+         subsequent calls, tables which haven't changed since they were
+         stored are loaded from the cache rather than from the database.
+         Changes are detected using :meth:`.Inspector.get_table_versions`,
+         which is currently supported by the PostgreSQL and SQLite dialects.
+
+         .. versionadded:: 1.3.12
+
+        :param max_workers: if greater than one, information about the
+         tables is retrieved using this many threads, each with its own
+         connection checked out from the :class:`.Engine`'s connection pool;
+         see :meth:`.Inspector.prefetch` for details.
+
+         .. versionadded:: 1.3.12
+
         :param \**dialect_kwargs: Additional keyword arguments not mentioned
          above are dialect specific, and passed in the form
          ``<dialectname>_<argname>``.  See the documentation regarding an
@@ -4207,6 +4236,8 @@ class MetaData(SchemaItem):
 
         with bind.connect() as conn:
 
+            insp = inspection.inspect(conn)
+
             reflect_opts = {
                 "autoload": True,
                 "autoload_with": conn,
@@ -4214,6 +4245,7 @@ class MetaData(SchemaItem):
                 "autoload_replace": autoload_replace,
                 "resolve_fks": resolve_fks,
                 "_extend_on": set(),
+                "_inspector": insp,
             }
 
             reflect_opts.update(dialect_kwargs)
@@ -4266,6 +4298,16 @@ class MetaData(SchemaItem):
                     if extend_existing or name not in current
                 ]
 
+            # retrieve information about all the tables up front, using
+            # the bulk reflection methods of the dialect
+            insp.prefetch(
+                load,
+                schema,
+                cache=reflection_cache,
+                max_workers=max_workers,
+                **dialect_kwargs
+            )
+
             for name in load:
                 try:
                     Table(name, self, **reflect_opts)
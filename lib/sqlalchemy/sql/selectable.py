@@ -16,6 +16,7 @@ import operator
 from operator import attrgetter
 
 from sqlalchemy.sql.visitors import Visitable
+from . import keyset
 from . import operators
 from . import type_api
 from .annotation import Annotated
@@ -73,6 +74,8 @@ def _interpret_as_select(element):
 
 
 class _OffsetLimitParam(BindParameter):
+    inherit_cache = True
+
     @property
     def _limit_offset_value(self):
         return self.effective_value
@@ -268,6 +271,7 @@ class FromClause(Selectable):
     _is_join = False
     _is_select = False
     _is_from_container = False
+    _is_table = False
 
     _is_lateral = False
 
@@ -721,6 +725,13 @@ class Join(FromClause):
     """
 
     __visit_name__ = "join"
+    _cache_key_traversal = [
+        ("left", "clauseelement"),
+        ("right", "clauseelement"),
+        ("onclause", "clauseelement"),
+        ("isouter", "plain"),
+        ("full", "plain"),
+    ]
 
     _is_join = True
 
@@ -1226,6 +1237,11 @@ class Alias(FromClause):
     """
 
     __visit_name__ = "alias"
+    _cache_key_traversal = [
+        ("name", "string"),
+        ("element", "clauseelement"),
+    ]
+
     named_with_column = True
 
     _is_from_container = True
@@ -1401,6 +1417,8 @@ class Lateral(Alias):
     """
 
     __visit_name__ = "lateral"
+    inherit_cache = True
+
     _is_lateral = True
 
     @classmethod
@@ -1442,6 +1460,12 @@ class TableSample(Alias):
     """
 
     __visit_name__ = "tablesample"
+    _cache_key_traversal = [
+        ("name", "string"),
+        ("element", "clauseelement"),
+        ("sampling", "clauseelement"),
+        ("seed", "clauseelement"),
+    ]
 
     @classmethod
     def _factory(cls, selectable, sampling, name=None, seed=None):
@@ -1512,6 +1536,14 @@ class CTE(Generative, HasSuffixes, Alias):
     """
 
     __visit_name__ = "cte"
+    _cache_key_traversal = [
+        ("name", "string"),
+        ("element", "clauseelement"),
+        ("recursive", "plain"),
+        ("_cte_alias", "clauseelement"),
+        ("_restates", "fromclause_set"),
+        ("_suffixes", "prefixes"),
+    ]
 
     @classmethod
     def _factory(cls, selectable, name=None, recursive=False):
@@ -1769,6 +1801,9 @@ class FromGrouping(FromClause):
     """Represent a grouping of a FROM clause"""
 
     __visit_name__ = "grouping"
+    _cache_key_traversal = [
+        ("element", "clauseelement"),
+    ]
 
     def __init__(self, element):
         self.element = element
@@ -1858,6 +1893,10 @@ class TableClause(Immutable, FromClause):
     _autoincrement_column = None
     """No PK or default support so no autoincrement column."""
 
+    _is_table = True
+
+    _cache_version = 0
+
     def __init__(self, name, *columns):
         """Produce a new :class:`.TableClause`.
 
@@ -1897,6 +1936,13 @@ class TableClause(Immutable, FromClause):
     def append_column(self, c):
         self._columns[c.key] = c
         c.table = self
+        self._cache_version += 1
+
+    def _gen_cache_key(self, traversal):
+        # tables are keyed on identity; the version counter is incremented
+        # when the set of columns changes, which invalidates statements
+        # compiled against the previous form of the table
+        return (self, self._cache_version)
 
     def get_children(self, column_collections=True, **kwargs):
         if column_collections:
@@ -1963,6 +2009,14 @@ class TableClause(Immutable, FromClause):
 
 
 class ForUpdateArg(ClauseElement):
+    _cache_key_traversal = [
+        ("nowait", "plain"),
+        ("read", "plain"),
+        ("skip_locked", "plain"),
+        ("key_share", "plain"),
+        ("of", "clauseelement_list"),
+    ]
+
     @classmethod
     def parse_legacy_select(self, arg):
         """Parse the for_update argument of :func:`.select`.
@@ -2310,6 +2364,15 @@ class GenerativeSelect(SelectBase):
         """
         return _offset_or_limit_clause_asint(self._offset_clause, "offset")
 
+    @property
+    def _limit_offset_cache_key(self):
+        # some dialects render simple integer LIMIT / OFFSET values
+        # inline, so these are part of the statement's structure
+        return (
+            self._limit if self._simple_int_limit else None,
+            self._offset if self._simple_int_offset else None,
+        )
+
     @_generative
     def limit(self, limit):
         """return a new selectable with the given LIMIT criterion
@@ -2473,6 +2536,19 @@ class CompoundSelect(GenerativeSelect):
     """
 
     __visit_name__ = "compound_select"
+    _cache_key_traversal = [
+        ("keyword", "plain"),
+        ("selects", "clauseelement_list"),
+        ("use_labels", "plain"),
+        ("_limit_clause", "clauseelement"),
+        ("_offset_clause", "clauseelement"),
+        ("_limit_offset_cache_key", "plain"),
+        ("_order_by_clause", "clauseelement"),
+        ("_group_by_clause", "clauseelement"),
+        ("_for_update_arg", "clauseelement"),
+        ("_auto_correlate", "plain"),
+        ("_execution_options", "plain_dict"),
+    ]
 
     UNION = util.symbol("UNION")
     UNION_ALL = util.symbol("UNION ALL")
@@ -2723,6 +2799,28 @@ class Select(HasPrefixes, HasSuffixes, GenerativeSelect):
     """
 
     __visit_name__ = "select"
+    _cache_key_traversal = [
+        ("_raw_columns", "clauseelement_list"),
+        ("_from_obj", "clauseelement_list"),
+        ("_whereclause", "clauseelement"),
+        ("_having", "clauseelement"),
+        ("_distinct", "clauseelement_list_or_bool"),
+        ("use_labels", "plain"),
+        ("_limit_clause", "clauseelement"),
+        ("_offset_clause", "clauseelement"),
+        ("_limit_offset_cache_key", "plain"),
+        ("_order_by_clause", "clauseelement"),
+        ("_group_by_clause", "clauseelement"),
+        ("_for_update_arg", "clauseelement"),
+        ("_correlate", "fromclause_set"),
+        ("_correlate_except", "fromclause_set"),
+        ("_auto_correlate", "plain"),
+        ("_prefixes", "prefixes"),
+        ("_suffixes", "prefixes"),
+        ("_hints", "hints"),
+        ("_statement_hints", "plain"),
+        ("_execution_options", "plain_dict"),
+    ]
 
     _prefixes = ()
     _suffixes = ()
@@ -3462,6 +3560,82 @@ class Select(HasPrefixes, HasSuffixes, GenerativeSelect):
 
         self.append_whereclause(whereclause)
 
+    def _keyset_ordering(self):
+        return keyset.KeysetOrdering(
+            self._order_by_clause.clauses,
+            [
+                list(fromclause.primary_key)
+                for fromclause in self.froms
+                if fromclause.primary_key
+            ],
+        )
+
+    @_generative
+    def seek(self, token=None):
+        """return a new select() construct which returns the rows following
+        those of a previous page, using keyset ("seek") pagination.
+
+        Keyset pagination locates the start of a page using criteria against
+        the ORDER BY of the statement, rather than skipping rows with OFFSET,
+        so that each page can be located directly using an index::
+
+            stmt = select([users]).order_by(users.c.name, users.c.id)
+
+            rows = conn.execute(stmt.seek().limit(20)).fetchall()
+            token = stmt.seek_token(rows[-1])
+
+            # the next page
+            rows = conn.execute(stmt.seek(token).limit(20)).fetchall()
+
+        The ORDER BY may include any combination of ascending and descending
+        expressions.  Expressions which may be NULL must state the position
+        of NULL values using :meth:`.ColumnElement.nullsfirst` or
+        :meth:`.ColumnElement.nullslast`.  If the ORDER BY doesn't include
+        the columns of a primary key, and the statement selects from a
+        single table, that table's primary key columns are added to the ORDER
+        BY, so that each row has a distinct position.
+
+        :param token: a token returned by :meth:`.Select.seek_token` for the
+         last row of the previous page.  If omitted, the first page is
+         returned.
+
+        .. versionadded:: 1.3.12
+
+        .. seealso::
+
+            :meth:`.Select.seek_token`
+
+            :meth:`.Query.seek`
+
+        """
+        ordering = self._keyset_ordering()
+        if ordering.added:
+            self.append_order_by(*ordering.added)
+        if token is not None:
+            self.append_whereclause(ordering.criterion(ordering.values(token)))
+
+    def seek_token(self, row):
+        """Return an opaque token representing the position of the given
+        row, which is passed to :meth:`.Select.seek` in order to return the
+        rows which follow it.
+
+        Each expression in the ORDER BY, including the primary key columns
+        added by :meth:`.Select.seek`, must be present in the row.
+
+        .. versionadded:: 1.3.12
+
+        """
+        ordering = self._keyset_ordering()
+        values = []
+        for expr, descending, nullsfirst, nullable in ordering.elements:
+            try:
+                values.append(row[expr])
+            except KeyError:
+                raise exc.InvalidRequestError(
+                    "ORDER BY expression %s is not present in the row" % expr
+                )
+        return ordering.token(values)
+
     @_generative
     def having(self, having):
         """return a new select() construct with the given expression added to
@@ -3845,6 +4019,11 @@ class Select(HasPrefixes, HasSuffixes, GenerativeSelect):
 
 
 class ScalarSelect(Generative, Grouping):
+    _cache_key_traversal = [
+        ("element", "clauseelement"),
+        ("type", "type"),
+    ]
+
     _from_objects = []
     _is_from_container = True
     _is_implicitly_boolean = False
@@ -3881,6 +4060,8 @@ class Exists(UnaryExpression):
     """
 
     __visit_name__ = UnaryExpression.__visit_name__
+    inherit_cache = True
+
     _from_objects = []
 
     def __init__(self, *args, **kwargs):
@@ -3971,6 +4152,12 @@ class TextAsFrom(SelectBase):
     """
 
     __visit_name__ = "text_as_from"
+    _cache_key_traversal = [
+        ("element", "clauseelement"),
+        ("column_args", "clauseelement_list"),
+        ("positional", "plain"),
+        ("_execution_options", "plain_dict"),
+    ]
 
     _textual = True
 
@@ -0,0 +1,258 @@
+# sql/traversals.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Structural cache key generation for SQL expression constructs.
+
+A "cache key" is a hashable tuple which represents the *structure* of
+a statement, independent of the literal values present in its bound
+parameters and of the in-memory identity of its anonymous names.
+Two statements which produce the same cache key will compile to the same
+SQL string for a given dialect, so that a :class:`.Compiled` object
+generated for one may be reused for the other, given the bound parameter
+values extracted from the second.
+
+Each :class:`.ClauseElement` subclass participates by declaring a
+``_cache_key_traversal`` sequence of ``(attribute name, kind)`` tuples;
+classes that don't declare one, and that don't set ``inherit_cache = True``,
+are considered uncacheable and the statement will be compiled every time.
+
+"""
+
+import collections
+import operator
+import re
+
+from .. import util
+
+
+_anon_id = re.compile(r"%\((\d+) ")
+
+
+class CacheKey(
+    collections.namedtuple("CacheKey", ["key", "bindparams", "elements"])
+):
+    """The key for a particular SQL statement structure.
+
+    ``key`` is the hashable structural key; ``bindparams`` is the list of
+    :class:`.BindParameter` objects located in the statement, in the
+    order in which the traversal encountered them; ``elements`` is the
+    list of structural elements in traversal order, and is used to
+    correlate a compiled form generated from one statement with the
+    objects present in another statement with the same key.
+
+    """
+
+
+class _UncacheableElement(Exception):
+    """Raised internally when an element can't produce a cache key."""
+
+
+class _CacheKeyTraversal(object):
+    """State for a single cache key generation run.
+
+    Element-level ``_gen_cache_key()`` methods receive this object and
+    use the ``visit_<kind>()`` methods to produce the key for each
+    attribute named in their ``_cache_key_traversal``.
+
+    """
+
+    __slots__ = ("bindparams", "elements", "memo", "anon_ids")
+
+    def __init__(self):
+        self.bindparams = []
+        self.elements = []
+        self.memo = {}
+        self.anon_ids = {}
+
+    def uncacheable(self):
+        raise _UncacheableElement()
+
+    def memoized(self, element):
+        """Return a back-reference key if the element was already visited,
+        else register the element and return None."""
+
+        id_ = id(element)
+        idx = self.memo.get(id_)
+        if idx is not None:
+            return ("_ref", idx)
+        self.memo[id_] = len(self.elements)
+        self.elements.append(element)
+        return None
+
+    def _anon_ordinal(self, match):
+        anon_ids = self.anon_ids
+        id_ = match.group(1)
+        if id_ not in anon_ids:
+            anon_ids[id_] = len(anon_ids)
+        return "%%(%d " % anon_ids[id_]
+
+    def _normalized_name(self, name):
+        # anonymous names embed the id() of the object that generated
+        # them; replace those with ordinals local to this traversal
+        if "%(" in name:
+            return _anon_id.sub(self._anon_ordinal, name)
+        else:
+            return util.text_type(name)
+
+    def visit_clauseelement(self, element):
+        if element is None:
+            return None
+        return element._gen_cache_key(self)
+
+    def visit_clauseelement_list(self, elements):
+        if not elements:
+            return ()
+        return tuple(elem._gen_cache_key(self) for elem in elements)
+
+    def visit_clauseelement_tuples(self, tuples):
+        return tuple(
+            tuple(
+                elem._gen_cache_key(self) if elem is not None else None
+                for elem in tup
+            )
+            for tup in tuples
+        )
+
+    def visit_clauseelement_list_or_bool(self, value):
+        # e.g. Select._distinct, ValuesBase._return_defaults
+        if value is True or value is False or value is None:
+            return value
+        return self.visit_clauseelement_list(value)
+
+    def visit_clauseelement_dict(self, elements):
+        return tuple(
+            (key, elements[key]._gen_cache_key(self))
+            for key in sorted(elements)
+        )
+
+    def visit_string_or_clauseelement_list(self, elements):
+        if elements is None:
+            return None
+        return tuple(
+            self.visit_string(elem)
+            if isinstance(elem, util.string_types)
+            else elem._gen_cache_key(self)
+            for elem in elements
+        )
+
+    def visit_prefixes(self, prefixes):
+        # HasPrefixes / HasSuffixes store (clause, dialect name) tuples
+        return tuple(
+            (clause._gen_cache_key(self), dialect_name)
+            for clause, dialect_name in prefixes
+        )
+
+    def visit_hints(self, hints):
+        # hints are keyed on selectable identity; not cached
+        if hints:
+            self.uncacheable()
+        return ()
+
+    def visit_dml_parameters(self, parameters):
+        # literal values given to insert().values() / update().values()
+        # are converted to bound parameters by the compiler itself, so
+        # they can't be extracted from the statement; not cached
+        if parameters is not None:
+            self.uncacheable()
+        return None
+
+    def visit_fromclause_set(self, fromclauses):
+        """Key an unordered collection of FROM clauses, such as those
+        used for correlation.
+
+        Members that were already visited are keyed by position,
+        others by name; ambiguous orderings are not cached.
+
+        """
+        if fromclauses is None:
+            return None
+        elif not fromclauses:
+            return ()
+
+        memo = self.memo
+        keyed = []
+        for from_ in fromclauses:
+            idx = memo.get(id(from_))
+            if idx is not None:
+                keyed.append(((0, idx), from_))
+            else:
+                name = getattr(from_, "name", None)
+                if name is None:
+                    self.uncacheable()
+                keyed.append(((1, self._normalized_name(name)), from_))
+
+        keyed.sort(key=operator.itemgetter(0))
+        for (left, _), (right, _) in zip(keyed, keyed[1:]):
+            if left == right:
+                self.uncacheable()
+        return tuple(from_._gen_cache_key(self) for sort_key, from_ in keyed)
+
+    def visit_string(self, value):
+        if value is None:
+            return None
+        try:
+            quote = value.quote
+        except AttributeError:
+            # plain string
+            return value
+        else:
+            return (value.__class__, self._normalized_name(value), quote)
+
+    def visit_plain(self, value):
+        try:
+            hash(value)
+        except TypeError:
+            self.uncacheable()
+        else:
+            return value
+
+    def visit_string_list(self, value):
+        if not value:
+            return ()
+        return tuple(self.visit_string(elem) for elem in value)
+
+    def visit_plain_dict(self, value):
+        if not value:
+            return ()
+        return tuple(
+            (k, self.visit_plain(value[k])) for k in sorted(value)
+        )
+
+    def visit_type(self, type_):
+        if type_ is None:
+            return None
+        return type_._static_cache_key
+
+    def visit_dialect_options(self, dialect_options):
+        # "dialect_options" is a memoized collection; if it was never
+        # populated, no dialect-specific arguments are present
+        if dialect_options is None:
+            return ()
+        return tuple(
+            (name, self.visit_plain_dict(dict(args._non_defaults)))
+            for name, args in sorted(dialect_options.items())
+            if args._non_defaults
+        )
+
+
+def _generate_cache_key(element):
+    """Return a :class:`.CacheKey` for the given element, or None if the
+    element or one of its components does not support caching."""
+
+    traversal = _CacheKeyTraversal()
+    try:
+        key = element._gen_cache_key(traversal)
+    except _UncacheableElement:
+        return None
+    return CacheKey(key, traversal.bindparams, traversal.elements)
+
+
+_visit_dispatch = dict(
+    (name[6:], fn)
+    for name, fn in vars(_CacheKeyTraversal).items()
+    if name.startswith("visit_")
+)
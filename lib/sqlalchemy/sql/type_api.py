@@ -447,6 +447,31 @@ class TypeEngine(Visitable):
         else:
             return self.__class__
 
+    @util.memoized_property
+    def _static_cache_key(self):
+        """Return a hashable value which represents this type for the
+        purposes of the structural cache key of a statement.
+
+        The key is derived from the type's class and the contents of its
+        ``__dict__``; types which store unhashable state are keyed on
+        identity.
+
+        """
+        cls = self.__class__
+        key = [cls]
+        for name, value in sorted(self.__dict__.items()):
+            if isinstance(getattr(cls, name, None), util.memoized_property):
+                continue
+            elif isinstance(value, TypeEngine):
+                value = value._static_cache_key
+            else:
+                try:
+                    hash(value)
+                except TypeError:
+                    return (cls, self)
+            key.append((name, value))
+        return tuple(key)
+
     def dialect_impl(self, dialect):
         """Return a dialect-specific implementation for this
         :class:`.TypeEngine`.
@@ -777,12 +777,14 @@ class ClauseAdapter(visitors.ReplacingCloningVisitor):
         self.__traverse_options__ = {
             "stop_on": [selectable],
             "anonymize_labels": anonymize_labels,
+            "share_unmodified": True,
         }
         self.selectable = selectable
         self.include_fn = include_fn
         self.exclude_fn = exclude_fn
         self.equivalents = util.column_dict(equivalents or {})
         self.adapt_on_names = adapt_on_names
+        self._replacements = util.LRUCache(500)
 
     def _corresponding_column(
         self, col, require_embedded, _seen=util.EMPTY_SET
@@ -814,8 +816,27 @@ class ClauseAdapter(visitors.ReplacingCloningVisitor):
             return None
         elif self.exclude_fn and self.exclude_fn(col):
             return None
-        else:
-            return self._corresponding_column(col, True)
+
+        # the lookup is memoized per element for the lifespan of this
+        # adapter; keyed on id() as annotated elements hash the same as
+        # their parent.  the element itself is held in the entry so that
+        # its id is not reused while present.
+        entry = self._replacements.get(id(col))
+        if entry is None:
+            entry = self._replacements[id(col)] = (
+                col,
+                self._corresponding_column(col, True),
+            )
+        return entry[1]
+
+    def __getstate__(self):
+        d = self.__dict__.copy()
+        del d["_replacements"]
+        return d
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._replacements = util.LRUCache(500)
 
 
 class ColumnAdapter(ClauseAdapter):
@@ -925,10 +946,10 @@ class ColumnAdapter(ClauseAdapter):
         return c
 
     def __getstate__(self):
-        d = self.__dict__.copy()
+        d = ClauseAdapter.__getstate__(self)
         del d["columns"]
         return d
 
     def __setstate__(self, state):
-        self.__dict__.update(state)
+        ClauseAdapter.__setstate__(self, state)
         self.columns = util.PopulateDict(self._locate_col)
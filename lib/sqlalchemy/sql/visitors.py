@@ -61,12 +61,25 @@ class VisitableType(type):
 
     Classes having no ``__visit_name__`` attribute will remain unaffected.
 
+    Additionally, subclasses of elements which support the structural
+    cache key, that don't declare their own ``_cache_key_traversal`` and
+    don't set ``inherit_cache = True``, are marked as not supporting it,
+    so that subclasses adding new state don't silently share the cache
+    key of their parent.
+
     """
 
     def __init__(cls, clsname, bases, clsdict):
         if clsname != "Visitable" and hasattr(cls, "__visit_name__"):
             _generate_dispatch(cls)
 
+        if (
+            hasattr(cls, "_cache_key_traversal")
+            and "_cache_key_traversal" not in clsdict
+            and not clsdict.get("inherit_cache", False)
+        ):
+            cls._cache_key_traversal = None
+
         super(VisitableType, cls).__init__(clsname, bases, clsdict)
 
 
@@ -444,10 +457,27 @@ def replacement_traverse(obj, opts, replace):
     replacing a FROM clause inside of a SQL structure with a different one,
     as is a common use case within the ORM.
 
+    If the ``share_unmodified`` option is present in ``opts``, the
+    traversal is "copy on write": the given element itself is still
+    copied, however any column-level sub-element within it that contains
+    no replaced element is shared with the original structure rather than
+    being copied.  FROM clauses, SELECT statements and unique bound
+    parameters, along with the elements that contain them, are always
+    copied.
+
+    .. versionadded:: 1.3.12 added the ``share_unmodified`` option.
+
     """
 
     cloned = {}
     stop_on = {id(x) for x in opts.get("stop_on", [])}
+    share_unmodified = opts.get("share_unmodified", False)
+    anonymize_labels = opts.get("anonymize_labels", False)
+
+    # count of elements returned by clone() which differ from the element
+    # passed in; an element whose copy_internals step leaves this count
+    # unchanged contains no replacements
+    modified = [0]
 
     def clone(elem, **kw):
         if (
@@ -459,13 +489,41 @@ def replacement_traverse(obj, opts, replace):
             newelem = replace(elem)
             if newelem is not None:
                 stop_on.add(id(newelem))
+                modified[0] += 1
                 return newelem
+            elif (
+                share_unmodified
+                and elem.__visit_name__ == "bindparam"
+                and not elem.unique
+                and elem is not root
+            ):
+                # non-unique bound parameters have no internals to
+                # replace; unique ones are still copied so that each copy
+                # receives its own anonymous key
+                return elem
             else:
                 if elem not in cloned:
+                    mark = modified[0]
                     cloned[elem] = newelem = elem._clone()
                     newelem._copy_internals(clone=clone, **kw)
-                return cloned[elem]
+                    if (
+                        share_unmodified
+                        and modified[0] == mark
+                        and elem is not root
+                        and not elem.is_selectable
+                        and elem.__visit_name__ != "bindparam"
+                        and not (
+                            anonymize_labels
+                            and elem.__visit_name__ == "label"
+                        )
+                    ):
+                        cloned[elem] = elem
+                newelem = cloned[elem]
+                if newelem is not elem:
+                    modified[0] += 1
+                return newelem
 
+    root = obj
     if obj is not None:
         obj = clone(obj, **opts)
     return obj
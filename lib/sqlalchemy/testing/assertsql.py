@@ -100,7 +100,9 @@ class CompiledSQL(SQLMatchRule):
                 ),
             )
         else:
-            compiled = context.compiled.statement.compile(
+            # the compiled object may have been generated from a different
+            # statement with the same cache key
+            compiled = context.invoked_statement.compile(
                 dialect=compare_dialect,
                 column_keys=context.compiled.column_keys,
                 inline=context.compiled.inline,
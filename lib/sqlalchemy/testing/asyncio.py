@@ -0,0 +1,27 @@
+# testing/asyncio.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Support for running coroutine test functions.
+
+Requires Python 3.6 or greater.
+
+"""
+
+import asyncio
+
+from ..util import decorator
+
+
+@decorator
+def async_test(fn, *args, **kwargs):
+    """Run a coroutine function test within a new event loop."""
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(fn(*args, **kwargs))
+    finally:
+        loop.close()
@@ -333,6 +333,27 @@ class SuiteRequirements(Requirements):
             "Backend does not support multirow inserts.",
         )
 
+    @property
+    def insertmanyvalues(self):
+        """target dialect renders an executemany() of an INSERT as batches
+        of multi-row VALUES inserts."""
+
+        return exclusions.only_if(
+            lambda config: config.db.dialect.use_insertmanyvalues
+            and config.db.dialect.supports_multivalues_insert,
+            "%(database)s %(does_support)s 'insertmanyvalues'",
+        )
+
+    @property
+    def insert_executemany_returning(self):
+        """target dialect delivers RETURNING rows for an executemany()
+        of an INSERT."""
+
+        return exclusions.only_if(
+            lambda config: config.db.dialect.insert_executemany_returning,
+            "%(database)s %(does_support)s 'insert_executemany_returning'",
+        )
+
     @property
     def implements_get_lastrowid(self):
         """"target dialect implements the executioncontext.get_lastrowid()
@@ -1009,6 +1030,32 @@ class SuiteRequirements(Requirements):
             lambda: not self._has_cextensions(), "C extensions not installed"
         )
 
+    @property
+    def greenlet(self):
+        return exclusions.only_if(
+            lambda: self._has_greenlet(), "greenlet library is required"
+        )
+
+    @property
+    def aiosqlite(self):
+        return exclusions.only_if(
+            lambda: self._has_greenlet() and self._has_aiosqlite(),
+            "greenlet and aiosqlite libraries are required",
+        )
+
+    def _has_greenlet(self):
+        from sqlalchemy.util import concurrency
+
+        return concurrency.have_greenlet
+
+    def _has_aiosqlite(self):
+        try:
+            import aiosqlite  # noqa
+
+            return True
+        except ImportError:
+            return False
+
     def _has_sqlite(self):
         from sqlalchemy import create_engine
 
@@ -63,6 +63,7 @@ from .compat import namedtuple  # noqa
 from .compat import nested  # noqa
 from .compat import next  # noqa
 from .compat import parse_qsl  # noqa
+from .compat import perf_counter  # noqa
 from .compat import pickle  # noqa
 from .compat import print_  # noqa
 from .compat import py2k  # noqa
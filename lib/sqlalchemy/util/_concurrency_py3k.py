@@ -0,0 +1,99 @@
+# util/_concurrency_py3k.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Greenlet-based bridge between asyncio and the synchronous engine.
+
+The :class:`.Engine`, :class:`.Connection` and :class:`.Session` are
+written in terms of blocking calls.  In order to drive an asyncio
+database driver from them, the synchronous code is run inside of a
+greenlet spawned by :func:`.greenlet_spawn`; whenever an adapted DBAPI
+needs to wait on a coroutine, it calls :func:`.await_only`, which
+switches back to the parent greenlet running in the event loop so that
+the awaitable can be awaited there, and then resumes the synchronous
+code with its result.
+
+"""
+
+import asyncio
+import sys
+
+import greenlet
+
+from .. import exc
+
+
+class _AsyncIoGreenlet(greenlet.greenlet):
+    def __init__(self, fn, driver):
+        greenlet.greenlet.__init__(self, fn, driver)
+        self.driver = driver
+
+
+def await_only(awaitable):
+    """Await an awaitable from within a greenlet spawned by
+    :func:`.greenlet_spawn`.
+
+    The awaitable is handed to the parent greenlet, which awaits it within
+    the event loop; this function then returns its result, or raises its
+    exception.
+
+    """
+    current = greenlet.getcurrent()
+    if not isinstance(current, _AsyncIoGreenlet):
+        raise exc.InvalidRequestError(
+            "greenlet_spawn has not been called; can't call await_only() "
+            "here. Was IO attempted in an unexpected place?"
+        )
+
+    # switch back to the parent greenlet; it will await the awaitable
+    # and switch back here with its result
+    return current.driver.switch(awaitable)
+
+
+def await_fallback(awaitable):
+    """Await an awaitable either from within a greenlet spawned by
+    :func:`.greenlet_spawn`, or, when no such greenlet is present and no
+    event loop is running, by running it to completion in the current
+    event loop.
+
+    """
+    current = greenlet.getcurrent()
+    if not isinstance(current, _AsyncIoGreenlet):
+        loop = asyncio.get_event_loop()
+        if loop.is_running():
+            raise exc.InvalidRequestError(
+                "greenlet_spawn has not been called and asyncio event "
+                "loop is already running; can't call await_fallback() here."
+            )
+        return loop.run_until_complete(awaitable)
+
+    return current.driver.switch(awaitable)
+
+
+async def greenlet_spawn(fn, *args, **kwargs):
+    """Run a synchronous function within a greenlet, awaiting each
+    awaitable passed to :func:`.await_only` along the way.
+
+    Returns the return value of the function.
+
+    """
+    context = _AsyncIoGreenlet(fn, greenlet.getcurrent())
+
+    # runs the function until it either finishes or requests
+    # an awaitable by way of await_only()
+    result = context.switch(*args, **kwargs)
+
+    while not context.dead:
+        try:
+            value = await result
+        except BaseException:
+            # propagate the exception into the greenlet, at the point
+            # where await_only() was called
+            result = context.throw(*sys.exc_info())
+        else:
+            result = context.switch(value)
+
+    return result
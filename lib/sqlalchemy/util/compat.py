@@ -12,6 +12,7 @@ import contextlib
 import inspect
 import operator
 import sys
+import time
 
 
 py36 = sys.version_info >= (3, 6)
@@ -31,6 +32,11 @@ dottedgetter = operator.attrgetter
 namedtuple = collections.namedtuple
 next = next  # noqa
 
+try:
+    perf_counter = time.perf_counter
+except AttributeError:
+    perf_counter = time.time
+
 FullArgSpec = collections.namedtuple(
     "FullArgSpec",
     [
@@ -0,0 +1,41 @@
+# util/concurrency.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+from . import compat
+
+
+have_greenlet = False
+
+if compat.py36:
+    try:
+        import greenlet  # noqa
+    except ImportError:
+        pass
+    else:
+        have_greenlet = True
+        from ._concurrency_py3k import await_only  # noqa
+        from ._concurrency_py3k import await_fallback  # noqa
+        from ._concurrency_py3k import greenlet_spawn  # noqa
+
+if not have_greenlet:
+
+    def _not_implemented():
+        if not compat.py36:
+            raise ValueError("Cannot use this function in py2.")
+        else:
+            raise ValueError(
+                "the greenlet library is required to use this function."
+            )
+
+    def await_only(thing):  # noqa
+        _not_implemented()
+
+    def await_fallback(thing):  # noqa
+        _not_implemented()
+
+    def greenlet_spawn(fn, *args, **kw):  # noqa
+        _not_implemented()
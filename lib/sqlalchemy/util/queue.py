@@ -8,7 +8,8 @@
 """An adaptation of Py2.3/2.4's Queue module which supports reentrant
 behavior, using RLock instead of Lock for its mutex object.  The
 Queue object is used exclusively by the sqlalchemy.pool.QueuePool
-class.
+class; the AffinityQueue is used by the AffinityQueuePool and the
+AsyncAdaptedQueue is used by the AsyncAdaptedQueuePool.
 
 This is to support the connection pool's usage of weakref callbacks to return
 connections to the underlying Queue, which can in extremely
@@ -20,11 +21,19 @@ condition.
 
 from collections import deque
 from time import time as _time
+import weakref
 
+from .compat import py3k
+from .compat import raise_from_cause
 from .compat import threading
+from .concurrency import await_only
+from .langhelpers import memoized_property
 
+if py3k:
+    import asyncio
 
-__all__ = ["Empty", "Full", "Queue"]
+
+__all__ = ["Empty", "Full", "Queue", "AffinityQueue", "AsyncAdaptedQueue"]
 
 
 class Empty(Exception):
@@ -207,3 +216,182 @@ class Queue:
         else:
             # FIFO
             return self.queue.popleft()
+
+
+class AffinityQueue(Queue):
+    """A :class:`.Queue` which doesn't acquire its mutex unless it has to
+    wait.
+
+    Items are put and taken using the atomic ``append()`` and ``pop()``
+    operations of ``deque``; the mutex and its condition are only used
+    by a ``get()`` which finds the queue empty and must wait, and by a
+    ``put()`` which needs to wake up such a waiter.   Additionally,
+    ``get()`` first tries to return the item most recently put by the
+    calling thread, if it's still present in the queue.
+
+    ``put()`` never blocks; when the queue is full, the ``Full``
+    exception is raised regardless of the ``block`` argument.  Items
+    must be weak-referenceable.
+
+    """
+
+    def __init__(self, maxsize=0, use_lifo=True):
+        Queue.__init__(self, maxsize, use_lifo=use_lifo)
+        self._local = threading.local()
+        self._waiters = 0
+
+    def qsize(self):
+        return len(self.queue)
+
+    def empty(self):
+        return not self.queue
+
+    def full(self):
+        return 0 < self.maxsize <= len(self.queue)
+
+    def put(self, item, block=True, timeout=None):
+        queue = self.queue
+        queue.append(item)
+
+        if 0 < self.maxsize < len(queue):
+            # the queue appears to have overflowed, possibly because
+            # another thread appended at the same time; resolve this
+            # under the mutex, so that of two such puts only one takes
+            # back its item and fails
+            with self.mutex:
+                if self.maxsize < len(queue):
+                    try:
+                        queue.remove(item)
+                    except ValueError:
+                        # taken by a get() already, so the put
+                        # succeeded after all
+                        pass
+                    else:
+                        raise Full()
+
+        self._local.item = weakref.ref(item)
+
+        # a waiter increments _waiters before it last checks the queue,
+        # so if it isn't seen here, the waiter will see the item
+        if self._waiters:
+            with self.not_empty:
+                self.not_empty.notify()
+
+    def get(self, block=True, timeout=None):
+        ref = getattr(self._local, "item", None)
+        if ref is not None:
+            self._local.item = None
+            item = ref()
+            try:
+                self.queue.remove(item)
+            except ValueError:
+                pass
+            else:
+                return item
+
+        try:
+            return self._get()
+        except IndexError:
+            pass
+
+        with self.not_empty:
+            self._waiters += 1
+            try:
+                if block and timeout is not None:
+                    if timeout < 0:
+                        raise ValueError(
+                            "'timeout' must be a positive number"
+                        )
+                    endtime = _time() + timeout
+                while True:
+                    try:
+                        return self._get()
+                    except IndexError:
+                        pass
+                    if not block:
+                        raise Empty()
+                    elif timeout is None:
+                        self.not_empty.wait()
+                    else:
+                        remaining = endtime - _time()
+                        if remaining <= 0.0:
+                            raise Empty()
+                        self.not_empty.wait(remaining)
+            finally:
+                self._waiters -= 1
+
+
+class AsyncAdaptedQueue:
+    """A :class:`.Queue` lookalike which is backed by an ``asyncio``
+    queue, for use by a pool whose connections are checked out from within
+    a greenlet spawned by :func:`.greenlet_spawn`.
+
+    Waiting for an item yields to the event loop using
+    :func:`.await_only` rather than blocking the thread.
+
+    """
+
+    await_ = staticmethod(await_only)
+
+    def __init__(self, maxsize=0, use_lifo=False):
+        self.use_lifo = use_lifo
+        self.maxsize = maxsize
+
+    def empty(self):
+        return self._queue.empty()
+
+    def full(self):
+        return self._queue.full()
+
+    def qsize(self):
+        return self._queue.qsize()
+
+    @memoized_property
+    def _queue(self):
+        # the asyncio queue is created on first use, so that it is
+        # associated with the event loop that's actually running
+        if self.use_lifo:
+            queue = asyncio.LifoQueue(maxsize=self.maxsize)
+        else:
+            queue = asyncio.Queue(maxsize=self.maxsize)
+        return queue
+
+    def put_nowait(self, item):
+        try:
+            return self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            raise_from_cause(Full())
+
+    def put(self, item, block=True, timeout=None):
+        if not block:
+            return self.put_nowait(item)
+
+        try:
+            if timeout is not None:
+                return self.await_(
+                    asyncio.wait_for(self._queue.put(item), timeout)
+                )
+            else:
+                return self.await_(self._queue.put(item))
+        except (asyncio.QueueFull, asyncio.TimeoutError):
+            raise_from_cause(Full())
+
+    def get_nowait(self):
+        try:
+            return self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            raise_from_cause(Empty())
+
+    def get(self, block=True, timeout=None):
+        if not block:
+            return self.get_nowait()
+
+        try:
+            if timeout is not None:
+                return self.await_(
+                    asyncio.wait_for(self._queue.get(), timeout)
+                )
+            else:
+                return self.await_(self._queue.get())
+        except (asyncio.QueueEmpty, asyncio.TimeoutError):
+            raise_from_cause(Empty())
@@ -32,6 +32,10 @@ ext_modules = [
     Extension(
         "sqlalchemy.cutils", sources=["lib/sqlalchemy/cextension/utils.c"]
     ),
+    Extension(
+        "sqlalchemy.cpgtypes",
+        sources=["lib/sqlalchemy/cextension/pgtypes.c"],
+    ),
 ]
 
 ext_errors = (CCompilerError, DistutilsExecError, DistutilsPlatformError)
@@ -193,6 +197,8 @@ def run_setup(with_cext):
             "mssql_pyodbc": ["pyodbc"],
             "mssql_pymssql": ["pymssql"],
             "mssql": ["pyodbc"],
+            "asyncio": ["greenlet"],
+            "aiosqlite": ["greenlet", "aiosqlite"],
         },
         **kwargs
     )
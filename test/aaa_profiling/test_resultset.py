@@ -182,6 +182,11 @@ class RowProxyTest(fixtures.TestBase):
             seq_factory([value1, value2]),
         )
 
+        initial_v1_refcount = sys.getrefcount(value1)
+
+        # processed values are retained by the row once accessed
+        row[col1]
+
         v1_refcount = sys.getrefcount(value1)
         v2_refcount = sys.getrefcount(value2)
         for i in range(10):
@@ -195,6 +200,9 @@ class RowProxyTest(fixtures.TestBase):
         eq_(sys.getrefcount(value1), v1_refcount)
         eq_(sys.getrefcount(value2), v2_refcount)
 
+        del row
+        eq_(sys.getrefcount(value1), initial_v1_refcount - 1)
+
     def test_value_refcounts_pure_tuple(self):
         self._test_getitem_value_refcounts(tuple)
 
@@ -65,6 +65,33 @@ class EventsTest(fixtures.TestBase):
         t = self.Target()
         assert t.dispatch.event_one
 
+    def test_has_listeners(self):
+        def listen_one(x, y):
+            pass
+
+        def listen_two(x, y):
+            pass
+
+        t1 = self.Target()
+        t2 = self.Target()
+        eq_(t1.dispatch.event_one.has_listeners, False)
+
+        event.listen(t1, "event_one", listen_one)
+        eq_(t1.dispatch.event_one.has_listeners, True)
+        eq_(t2.dispatch.event_one.has_listeners, False)
+
+        event.listen(self.Target, "event_one", listen_two)
+        eq_(t2.dispatch.event_one.has_listeners, True)
+        eq_(list(t1.dispatch.event_one), [listen_two, listen_one])
+
+        event.remove(self.Target, "event_one", listen_two)
+        eq_(t2.dispatch.event_one.has_listeners, False)
+        eq_(list(t1.dispatch.event_one), [listen_one])
+
+        event.remove(t1, "event_one", listen_one)
+        eq_(t1.dispatch.event_one.has_listeners, False)
+        eq_(list(t1.dispatch.event_one), [])
+
     def test_register_class_instance(self):
         def listen_one(x, y):
             pass
@@ -1036,6 +1063,32 @@ class JoinTest(fixtures.TestBase):
             [call(element, 1), call(element, 2), call(element, 3)],
         )
 
+    def test_joined_listener_shared(self):
+        l1 = Mock()
+        l2 = Mock()
+        factory = self.TargetFactory()
+        e1 = factory.create()
+        e2 = factory.create()
+
+        is_(e1.dispatch.event_one, e2.dispatch.event_one)
+        eq_(e1.dispatch.event_one.has_listeners, False)
+
+        event.listen(factory, "event_one", l1)
+        eq_(e1.dispatch.event_one.has_listeners, True)
+
+        # listening on one element doesn't affect the other
+        event.listen(e1, "event_one", l2)
+        is_not_(e1.dispatch.event_one, e2.dispatch.event_one)
+
+        e1.run_event(1)
+        e2.run_event(2)
+        eq_(l1.mock_calls, [call(e1, 1), call(e2, 2)])
+        eq_(l2.mock_calls, [call(e1, 1)])
+
+        event.remove(factory, "event_one", l1)
+        eq_(e1.dispatch.event_one.has_listeners, True)
+        eq_(e2.dispatch.event_one.has_listeners, False)
+
 
 class DisableClsPropagateTest(fixtures.TestBase):
     def setUp(self):
@@ -1387,21 +1440,28 @@ class RemovalTest(fixtures.TestBase):
 
         event.remove(t1, "event_three", m1)
 
-    def test_no_remove_in_event(self):
+    def test_remove_in_event(self):
         Target = self._fixture()
 
         t1 = Target()
 
+        m1 = Mock()
+
         def evt():
             event.remove(t1, "event_one", evt)
 
         event.listen(t1, "event_one", evt)
+        event.listen(t1, "event_one", m1)
 
-        assert_raises_message(
-            Exception, "deque mutated during iteration", t1.dispatch.event_one
-        )
+        # the listeners in progress are not affected
+        t1.dispatch.event_one()
+        eq_(m1.mock_calls, [call()])
 
-    def test_no_add_in_event(self):
+        t1.dispatch.event_one()
+        eq_(m1.mock_calls, [call(), call()])
+        eq_(list(t1.dispatch.event_one), [m1])
+
+    def test_add_in_event(self):
         Target = self._fixture()
 
         t1 = Target()
@@ -1409,13 +1469,17 @@ class RemovalTest(fixtures.TestBase):
         m1 = Mock()
 
         def evt():
-            event.listen(t1, "event_one", m1)
+            if not event.contains(t1, "event_one", m1):
+                event.listen(t1, "event_one", m1)
 
         event.listen(t1, "event_one", evt)
 
-        assert_raises_message(
-            Exception, "deque mutated during iteration", t1.dispatch.event_one
-        )
+        # the new listener takes effect for the next event
+        t1.dispatch.event_one()
+        eq_(m1.mock_calls, [])
+
+        t1.dispatch.event_one()
+        eq_(m1.mock_calls, [call()])
 
     def test_remove_plain_named(self):
         Target = self._fixture()
@@ -21,6 +21,11 @@ if not sys.flags.no_user_site:
         os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "lib"),
     )
 
+# modules which make use of "async def" syntax can't be imported
+# on older Pythons
+if sys.version_info < (3, 6):
+    collect_ignore_glob = ["*_py3k.py"]
+
 # use bootstrapping so that test plugins are loaded
 # without touching the main library before coverage starts
 bootstrap_file = os.path.join(
@@ -24,6 +24,7 @@ from sqlalchemy import Index
 from sqlalchemy import INT
 from sqlalchemy import Integer
 from sqlalchemy import Interval
+from sqlalchemy import JSON
 from sqlalchemy import LargeBinary
 from sqlalchemy import literal
 from sqlalchemy import MetaData
@@ -881,6 +882,34 @@ class SQLTest(fixtures.TestBase, AssertsCompiledSQL):
             "t1 FULL OUTER JOIN t2 ON t1.x = t2.y",
         )
 
+    def test_json_partial_update(self):
+        m = MetaData()
+        t = Table(
+            "t",
+            m,
+            Column("id", Integer, primary_key=True),
+            Column("data", JSON),
+        )
+        expr = mysql.dialect()._json_partial_update(
+            t.c.data,
+            [("set", 'a"b', {"b": 1}), ("delete", "c"), ("append", [1])],
+        )
+        self.assert_compile(
+            t.update().values(data=expr),
+            "UPDATE t SET data=json_array_append(json_remove(json_set("
+            "t.data, %s, json_extract(%s, %s)), %s), %s, "
+            "json_extract(%s, %s))",
+            checkpositional=(
+                '$."a\\"b"',
+                {"b": 1},
+                "$",
+                '$."c"',
+                "$",
+                1,
+                "$",
+            ),
+        )
+
 
 class InsertOnDuplicateTest(fixtures.TestBase, AssertsCompiledSQL):
     __dialect__ = mysql.dialect()
@@ -29,6 +29,7 @@ from sqlalchemy.dialects.postgresql import array
 from sqlalchemy.dialects.postgresql import array_agg as pg_array_agg
 from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import TSRANGE
 from sqlalchemy.orm import aliased
 from sqlalchemy.orm import mapper
@@ -1578,6 +1579,59 @@ class CompileTest(fixtures.TestBase, AssertsCompiledSQL):
             dialect=postgresql.dialect(),
         )
 
+    def test_json_partial_update(self):
+        m = MetaData()
+        t = Table(
+            "t",
+            m,
+            Column("id", Integer, primary_key=True),
+            Column("data", JSONB),
+            Column("plain", postgresql.JSON),
+        )
+        dialect = postgresql.dialect()
+        expr = dialect._json_partial_update(
+            t.c.data,
+            [("set", "a", {"b": 1}), ("delete", "c"), ("append", [1, 2])],
+        )
+        self.assert_compile(
+            t.update().values(data=expr),
+            "UPDATE t SET data=((jsonb_set(t.data, "
+            "CAST(%(param_1)s AS TEXT[]), %(param_2)s) - "
+            "CAST(%(param_3)s AS TEXT)) || %(param_4)s)",
+            checkparams={
+                "param_1": ["a"],
+                "param_2": {"b": 1},
+                "param_3": "c",
+                "param_4": [1, 2],
+            },
+            dialect=dialect,
+        )
+        is_(
+            dialect._json_partial_update(t.c.plain, [("delete", "c")]),
+            None,
+        )
+
+    def test_json_partial_update_none_as_null(self):
+        m = MetaData()
+        t = Table(
+            "t",
+            m,
+            Column("id", Integer, primary_key=True),
+            Column("data", JSONB(none_as_null=True)),
+        )
+        dialect = postgresql.dialect()
+        expr = dialect._json_partial_update(t.c.data, [("set", "a", None)])
+
+        # jsonb_set() is STRICT; the value is bound as JSON 'null' rather
+        # than as SQL NULL
+        self.assert_compile(
+            t.update().values(data=expr),
+            "UPDATE t SET data=jsonb_set(t.data, "
+            "CAST(%(param_1)s AS TEXT[]), %(param_2)s)",
+            checkparams={"param_1": ["a"], "param_2": JSONB.NULL},
+            dialect=dialect,
+        )
+
 
 class InsertOnConflictTest(fixtures.TestBase, AssertsCompiledSQL):
     __dialect__ = postgresql.dialect()
@@ -1673,6 +1727,25 @@ class InsertOnConflictTest(fixtures.TestBase, AssertsCompiledSQL):
             {"myid": 1, "name": "foo", "param_1": "I'm a name"},
         )
 
+    def test_do_update_set_clause_column_key(self):
+        t = Table(
+            "mytable",
+            MetaData(),
+            Column("myid", Integer, primary_key=True),
+            Column("name", String(128), key="name_key"),
+        )
+        i = insert(t).values(myid=1, name_key="foo")
+        i = i.on_conflict_do_update(
+            index_elements=[t.c.myid],
+            set_={"name_key": i.excluded.name_key},
+        )
+        self.assert_compile(
+            i,
+            "INSERT INTO mytable (myid, name) VALUES "
+            "(%(myid)s, %(name_key)s) ON CONFLICT (myid) "
+            "DO UPDATE SET name = excluded.name",
+        )
+
     def test_do_update_str_index_elements_target_one(self):
         i = insert(self.table_with_metadata).values(myid=1, name="foo")
         i = i.on_conflict_do_update(
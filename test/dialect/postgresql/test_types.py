@@ -2213,6 +2213,110 @@ class HStoreTest(AssertsCompiledSQL, fixtures.TestBase):
         )
 
 
+class _HStoreParsingTest(fixtures.TestBase):
+    def test_parse(self):
+        eq_(
+            self.parse_hstore('"key2"=>"value2", "key1"=>"value1"'),
+            {"key1": "value1", "key2": "value2"},
+        )
+
+    def test_parse_empty(self):
+        eq_(self.parse_hstore(""), {})
+
+    def test_parse_null(self):
+        eq_(
+            self.parse_hstore('"a"=>NULL,"b" => "NULL"'),
+            {"a": None, "b": "NULL"},
+        )
+
+    def test_parse_slashes_and_quotes(self):
+        eq_(
+            self.parse_hstore('"\\\\\\"a"=>"\\\\\\"1", "\\x"=>""'),
+            {'\\"a': '\\"1', "\\x": ""},
+        )
+
+    def test_parse_unicode(self):
+        eq_(
+            self.parse_hstore(util.u('"r\xe9sum\xe9"=>"\u2603"')),
+            {util.u("r\xe9sum\xe9"): util.u("\u2603")},
+        )
+
+    def test_serialize(self):
+        eq_(
+            self.serialize_hstore(
+                util.OrderedDict([("key1", "value1"), ("key2", None)])
+            ),
+            '"key1"=>"value1", "key2"=>NULL',
+        )
+
+    def test_serialize_empty(self):
+        eq_(self.serialize_hstore({}), "")
+
+    def test_serialize_slashes_and_quotes(self):
+        eq_(
+            self.serialize_hstore({'\\"a': '\\"1'}),
+            '"\\\\\\"a"=>"\\\\\\"1"',
+        )
+
+    def test_serialize_roundtrip(self):
+        value = {'\\"a': None, "b, c": "=>", util.u("\u2603"): '""'}
+        eq_(self.parse_hstore(self.serialize_hstore(value)), value)
+
+    def test_proc_array_flat(self):
+        eq_(self.proc_array([1, 2, 3], str, None, list), ["1", "2", "3"])
+
+    def test_proc_array_no_itemproc(self):
+        eq_(self.proc_array((1, 2, 3), None, None, list), [1, 2, 3])
+
+    def test_proc_array_nested(self):
+        eq_(
+            self.proc_array([[1, 2], [3, 4]], str, None, tuple),
+            (("1", "2"), ("3", "4")),
+        )
+
+    def test_proc_array_dimensions(self):
+        eq_(
+            self.proc_array([[[1]], [[2]]], str, 2, list),
+            [[str([1])], [str([2])]],
+        )
+
+    def test_proc_array_empty(self):
+        eq_(self.proc_array([], str, None, tuple), ())
+
+
+class PyHStoreParsingTest(_HStoreParsingTest):
+    @classmethod
+    def setup_class(cls):
+        from sqlalchemy.dialects.postgresql.hstore import _py_parse_hstore
+        from sqlalchemy.dialects.postgresql.hstore import (
+            _py_serialize_hstore,
+        )
+
+        cls.parse_hstore = staticmethod(_py_parse_hstore)
+        cls.serialize_hstore = staticmethod(_py_serialize_hstore)
+        cls.proc_array = postgresql.ARRAY(Integer)._proc_array
+
+
+class CHStoreParsingTest(_HStoreParsingTest):
+    __requires__ = ("cextensions",)
+
+    @classmethod
+    def setup_class(cls):
+        from sqlalchemy import cpgtypes
+
+        cls.parse_hstore = staticmethod(cpgtypes.parse_hstore)
+        cls.serialize_hstore = staticmethod(cpgtypes.serialize_hstore)
+        cls.proc_array = staticmethod(cpgtypes.proc_array)
+
+    def test_parse_malformed(self):
+        assert_raises(
+            ValueError, self.parse_hstore, '"key1"=>"value1", crap'
+        )
+
+    def test_serialize_not_a_string(self):
+        assert_raises(ValueError, self.serialize_hstore, {"key1": 5})
+
+
 class HStoreRoundTripTest(fixtures.TablesTest):
     __requires__ = ("hstore",)
     __dialect__ = "postgresql"
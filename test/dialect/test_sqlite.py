@@ -34,6 +34,7 @@ from sqlalchemy import types as sqltypes
 from sqlalchemy import UniqueConstraint
 from sqlalchemy import util
 from sqlalchemy.dialects.sqlite import base as sqlite
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.dialects.sqlite import pysqlite as pysqlite_dialect
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import make_url
@@ -1283,6 +1284,147 @@ class OnConflictDDLTest(fixtures.TestBase, AssertsCompiledSQL):
         )
 
 
+class OnConflictCompileTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = sqlite.dialect()
+
+    def setup(self):
+        self.table = Table(
+            "mytable",
+            MetaData(),
+            Column("myid", Integer, primary_key=True),
+            Column("name", String(128)),
+            Column("description", String(128)),
+        )
+
+    def test_do_nothing_no_target(self):
+        i = insert(self.table, values=dict(name="foo"))
+        self.assert_compile(
+            i.on_conflict_do_nothing(),
+            "INSERT INTO mytable (name) VALUES (?) ON CONFLICT DO NOTHING",
+        )
+
+    def test_do_nothing_index_elements_target(self):
+        i = insert(self.table, values=dict(name="foo"))
+        self.assert_compile(
+            i.on_conflict_do_nothing(index_elements=["myid"]),
+            "INSERT INTO mytable (name) VALUES (?) "
+            "ON CONFLICT (myid) DO NOTHING",
+        )
+
+    def test_do_update_set_clause_excluded(self):
+        i = insert(self.table, values=dict(myid=1, name="foo"))
+        i = i.on_conflict_do_update(
+            index_elements=[self.table.c.myid],
+            set_=dict(name=i.excluded.name, description="bar"),
+        )
+        self.assert_compile(
+            i,
+            "INSERT INTO mytable (myid, name) VALUES (?, ?) "
+            "ON CONFLICT (myid) DO UPDATE SET name = excluded.name, "
+            "description = ?",
+        )
+
+    def test_do_update_index_where_and_where(self):
+        i = insert(self.table, values=dict(myid=1, name="foo"))
+        i = i.on_conflict_do_update(
+            index_elements=[self.table.c.name],
+            index_where=self.table.c.description != "x",
+            set_=dict(name=i.excluded.name),
+            where=self.table.c.name != "bar",
+        )
+        self.assert_compile(
+            i,
+            "INSERT INTO mytable (myid, name) VALUES (?, ?) "
+            "ON CONFLICT (name) WHERE description != 'x' "
+            "DO UPDATE SET name = excluded.name "
+            "WHERE mytable.name != ?",
+        )
+
+    def test_do_update_requires_target(self):
+        i = insert(self.table, values=dict(name="foo"))
+        assert_raises_message(
+            ValueError,
+            "index_elements must be specified unless DO NOTHING",
+            i.on_conflict_do_update,
+            set_=dict(name="bar"),
+        )
+
+    def test_do_update_requires_set(self):
+        i = insert(self.table, values=dict(name="foo"))
+        assert_raises_message(
+            ValueError,
+            "set parameter must be a non-empty dictionary",
+            i.on_conflict_do_update,
+            index_elements=["myid"],
+        )
+
+
+class OnConflictTest(fixtures.TablesTest):
+    __only_on__ = ("sqlite >= 3.24.0",)
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "users",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(50)),
+            Column("login_email", String(50)),
+            UniqueConstraint("login_email"),
+        )
+
+    def test_on_conflict_do_nothing(self):
+        users = self.tables.users
+
+        with testing.db.connect() as conn:
+            conn.execute(users.insert(), dict(id=1, name="name1"))
+            result = conn.execute(
+                insert(users).on_conflict_do_nothing(),
+                dict(id=1, name="name2"),
+            )
+            eq_(result.rowcount, 0)
+            eq_(
+                conn.execute(users.select()).fetchall(),
+                [(1, "name1", None)],
+            )
+
+    def test_on_conflict_do_update_executemany(self):
+        users = self.tables.users
+
+        with testing.db.connect() as conn:
+            conn.execute(users.insert(), dict(id=1, name="name1"))
+            i = insert(users)
+            i = i.on_conflict_do_update(
+                index_elements=[users.c.id], set_=dict(name=i.excluded.name)
+            )
+            conn.execute(
+                i, [dict(id=1, name="name2"), dict(id=2, name="name3")]
+            )
+            eq_(
+                conn.execute(users.select().order_by(users.c.id)).fetchall(),
+                [(1, "name2", None), (2, "name3", None)],
+            )
+
+    def test_on_conflict_do_update_unique_constraint(self):
+        users = self.tables.users
+
+        with testing.db.connect() as conn:
+            conn.execute(
+                users.insert(), dict(id=1, name="name1", login_email="e1")
+            )
+            i = insert(users)
+            i = i.on_conflict_do_update(
+                index_elements=[users.c.login_email],
+                set_=dict(name=i.excluded.name),
+                where=users.c.name != "name1",
+            )
+            conn.execute(i, dict(id=2, name="name2", login_email="e1"))
+            eq_(
+                conn.execute(users.select()).fetchall(),
+                [(1, "name1", "e1")],
+            )
+
+
 class InsertTest(fixtures.TestBase, AssertsExecutionResults):
 
     """Tests inserts and autoincrement."""
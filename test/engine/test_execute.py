@@ -21,6 +21,7 @@ from sqlalchemy import TypeDecorator
 from sqlalchemy import util
 from sqlalchemy import VARCHAR
 from sqlalchemy.engine import default
+from sqlalchemy.engine import stats
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.sql import column
 from sqlalchemy.sql import literal
@@ -1037,6 +1038,414 @@ class CompiledCacheTest(fixtures.TestBase):
             eq_(conn.scalar(stmt), 1)
 
 
+class StructuralCompiledCacheTest(fixtures.TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "users",
+            metadata,
+            Column(
+                "user_id", INT, primary_key=True, test_needs_autoincrement=True
+            ),
+            Column("user_name", VARCHAR(20)),
+        )
+
+    @classmethod
+    def insert_data(cls):
+        cls.tables.users.insert().execute(
+            [
+                {"user_id": 1, "user_name": "u1"},
+                {"user_id": 2, "user_name": "u2"},
+                {"user_id": 3, "user_name": "u3"},
+            ]
+        )
+
+    def _engine(self):
+        eng = testing.db
+        eng.dialect._compiled_cache.clear()
+        return eng
+
+    def _stmt(self, name):
+        users = self.tables.users
+        ua = users.alias()
+        return select([ua.c.user_id]).where(ua.c.user_name == name)
+
+    def test_cache_on_structure(self):
+        eng = self._engine()
+
+        with eng.connect() as conn:
+            r1 = conn.execute(self._stmt("u1"))
+            eq_(r1.fetchall(), [(1,)])
+            r2 = conn.execute(self._stmt("u2"))
+            eq_(r2.fetchall(), [(2,)])
+
+        is_(r1.context.compiled, r2.context.compiled)
+        eq_(len(eng.dialect._compiled_cache), 1)
+
+    def test_invoked_statement(self):
+        eng = self._engine()
+
+        s1, s2 = self._stmt("u1"), self._stmt("u2")
+        with eng.connect() as conn:
+            r1 = conn.execute(s1)
+            r2 = conn.execute(s2)
+
+        is_(r1.context.invoked_statement, s1)
+        is_(r2.context.invoked_statement, s2)
+        is_(r2.context.compiled.statement, s1)
+
+    def test_result_columns_from_invoked_statement(self):
+        users = self.tables.users
+        eng = self._engine()
+
+        def go(name):
+            ua = users.alias()
+            expr = func.lower(ua.c.user_name).label(None)
+            stmt = select([ua.c.user_id, expr]).where(
+                ua.c.user_name == name
+            )
+            with eng.connect() as conn:
+                row = conn.execute(stmt).first()
+            return row[ua.c.user_id], row[expr]
+
+        eq_(go("u1"), (1, "u1"))
+        eq_(go("u3"), (3, "u3"))
+
+    def test_bindparam_values_per_statement(self):
+        users = self.tables.users
+        eng = self._engine()
+
+        def go(ids):
+            stmt = (
+                select([users.c.user_name])
+                .where(users.c.user_id.in_(bindparam("ids", expanding=True)))
+                .where(users.c.user_id != bindparam("x", ids[0]))
+                .order_by(users.c.user_id)
+            )
+            with eng.connect() as conn:
+                return conn.execute(stmt, ids=ids).fetchall()
+
+        eq_(go([1, 2, 3]), [("u2",), ("u3",)])
+        eq_(go([2, 3]), [("u3",)])
+        eq_(len(eng.dialect._compiled_cache), 1)
+
+    def test_limit_offset_in_key(self):
+        users = self.tables.users
+        eng = self._engine()
+
+        def go(limit, offset):
+            stmt = (
+                select([users.c.user_id])
+                .order_by(users.c.user_id)
+                .limit(limit)
+                .offset(offset)
+            )
+            with eng.connect() as conn:
+                return conn.execute(stmt).fetchall()
+
+        eq_(go(1, 0), [(1,)])
+        eq_(go(2, 1), [(2,), (3,)])
+        eq_(go(1, 2), [(3,)])
+
+    def test_values_not_cached(self):
+        users = self.tables.users
+        eng = self._engine()
+
+        with eng.connect() as conn:
+            conn.execute(users.insert().values(user_id=4, user_name="u4"))
+            conn.execute(users.insert().values(user_id=5, user_name="u5"))
+            eq_(len(eng.dialect._compiled_cache), 0)
+            eq_(
+                conn.execute(
+                    select([users.c.user_name])
+                    .where(users.c.user_id > 3)
+                    .order_by(users.c.user_id)
+                ).fetchall(),
+                [("u4",), ("u5",)],
+            )
+
+    def test_cache_disabled_by_size(self):
+        eng = testing_engine(options={"query_cache_size": 0})
+        is_(eng.dialect._compiled_cache, None)
+
+        stmt = select([literal(1)])
+        with eng.connect() as conn:
+            r1 = conn.execute(stmt)
+            r2 = conn.execute(stmt)
+            is_not_(r1.context.compiled, r2.context.compiled)
+
+    def test_cache_disabled_by_option(self):
+        eng = self._engine()
+
+        stmt = select([literal(1)])
+        with eng.connect() as conn:
+            conn = conn.execution_options(compiled_cache=None)
+            r1 = conn.execute(stmt)
+            r2 = conn.execute(stmt)
+            is_not_(r1.context.compiled, r2.context.compiled)
+        eq_(len(eng.dialect._compiled_cache), 0)
+
+
+class StatementStatsTest(fixtures.TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "users",
+            metadata,
+            Column(
+                "user_id", INT, primary_key=True, test_needs_autoincrement=True
+            ),
+            Column("user_name", VARCHAR(20)),
+        )
+
+    @classmethod
+    def insert_data(cls):
+        cls.tables.users.insert().execute(
+            [
+                {"user_id": 1, "user_name": "u1"},
+                {"user_id": 2, "user_name": "u2"},
+                {"user_id": 3, "user_name": "u3"},
+            ]
+        )
+
+    def _engine(self, size=500):
+        # an OptionEngine shares the database of testing.db
+        eng = testing.db.execution_options()
+        eng.statement_stats = stats.StatementStats(size)
+        return eng
+
+    def _stmt(self):
+        users = self.tables.users
+        return select([users.c.user_id]).order_by(users.c.user_id)
+
+    def test_create_engine(self):
+        eng = testing_engine(
+            options={"statement_stats": True, "statement_stats_size": 10}
+        )
+        eq_(eng.statement_stats.size, 10)
+
+        stmt = select([literal(1)])
+        with eng.connect() as conn:
+            eq_(conn.execute(stmt).scalar(), 1)
+
+        entry = eng.statement_stats.get(
+            stmt.compile(dialect=eng.dialect).string
+        )
+        eq_(entry.executions, 1)
+        eq_(entry.rows, 1)
+
+    def test_disabled(self):
+        eng = testing.db
+        is_(eng.statement_stats, None)
+
+        with eng.connect() as conn:
+            result = conn.execute(self._stmt())
+            assert "fetchall" not in result.__dict__
+            result.fetchall()
+
+    def test_phases(self):
+        users = self.tables.users
+        eng = self._engine()
+
+        stmt = select([users.c.user_name]).where(
+            users.c.user_id == bindparam("id")
+        )
+        with eng.connect() as conn:
+            for id_ in (1, 2, 3):
+                eq_(conn.execute(stmt, id=id_).fetchall(), [("u%d" % id_,)])
+
+        eq_(len(eng.statement_stats), 1)
+        entry = eng.statement_stats.get(
+            stmt.compile(dialect=eng.dialect).string
+        )
+        eq_(entry.executions, 3)
+        eq_(entry.rows, 3)
+        eq_(entry.cache_misses, 1)
+        eq_(entry.cache_hits, 2)
+        eq_(entry.compile.count, 1)
+        eq_(entry.execute.count, 3)
+        eq_(entry.fetch.count, 3)
+        eq_(entry.hydrate.count, 0)
+
+    def test_fetch_recorded_once_per_result(self):
+        eng = self._engine()
+
+        with eng.connect() as conn:
+            eq_([row[0] for row in conn.execute(self._stmt())], [1, 2, 3])
+            eq_(conn.execute(self._stmt()).scalar(), 1)
+
+            entry = eng.statement_stats.entries()[0]
+            eq_(entry.fetch.count, 2)
+            eq_(entry.rows, 4)
+
+            # not recorded until the result is exhausted or closed
+            result = conn.execute(self._stmt())
+            eq_(result.fetchmany(2), [(1,), (2,)])
+            eq_(result.fetchone(), (3,))
+            eq_(entry.fetch.count, 2)
+            result.close()
+
+        eq_(entry.executions, 3)
+        eq_(entry.fetch.count, 3)
+        eq_(entry.rows, 7)
+
+    def test_fetch_after_exhausted(self):
+        eng = self._engine()
+
+        with eng.connect() as conn:
+            result = conn.execute(self._stmt())
+            eq_(len(result.fetchall()), 3)
+            eq_(result.fetchall(), [])
+            eq_(result.fetchone(), None)
+            result.close()
+
+        entry = eng.statement_stats.entries()[0]
+        eq_(entry.fetch.count, 1)
+        eq_(entry.rows, 3)
+
+    def test_fetch_columnar(self):
+        eng = self._engine()
+
+        with eng.connect() as conn:
+            eq_(conn.execute(self._stmt()).fetch_columnar(), [[1, 2, 3]])
+
+        entry = eng.statement_stats.entries()[0]
+        eq_(entry.fetch.count, 1)
+        eq_(entry.rows, 3)
+
+    def test_dml_not_fetched(self):
+        users = self.tables.users
+        eng = self._engine()
+
+        with eng.connect() as conn:
+            conn.execute(users.update().values(user_name="x"))
+
+        entry = eng.statement_stats.entries()[0]
+        eq_(entry.executions, 1)
+        eq_(entry.fetch.count, 0)
+
+    def test_expanding_in_one_entry(self):
+        users = self.tables.users
+        eng = self._engine()
+
+        stmt = select([users.c.user_id]).where(
+            users.c.user_id.in_(bindparam("ids", expanding=True))
+        )
+        with eng.connect() as conn:
+            conn.execute(stmt, ids=[1, 2]).fetchall()
+            conn.execute(stmt, ids=[1, 2, 3]).fetchall()
+
+        eq_(len(eng.statement_stats), 1)
+        entry = eng.statement_stats.entries()[0]
+        eq_(entry.executions, 2)
+        eq_(entry.rows, 5)
+
+    def test_string_statement(self):
+        eng = self._engine()
+
+        with eng.connect() as conn:
+            conn.execute("select user_id from users").fetchall()
+
+        entry = eng.statement_stats.get("select user_id from users")
+        eq_(entry.executions, 1)
+        eq_(entry.rows, 3)
+        eq_(entry.cache_hits + entry.cache_misses, 0)
+
+    def test_option_engine_shares_stats(self):
+        eng = self._engine()
+        opt_eng = eng.execution_options(foo="bar")
+        is_(opt_eng.statement_stats, eng.statement_stats)
+
+        with opt_eng.connect() as conn:
+            conn.execute(self._stmt()).fetchall()
+        eq_(len(eng.statement_stats), 1)
+
+    def test_size(self):
+        users = self.tables.users
+        eng = self._engine(size=2)
+
+        with eng.connect() as conn:
+            for i in range(10):
+                conn.execute(
+                    select([users.c.user_id]).limit(i + 1)
+                ).fetchall()
+
+        eq_(eng.statement_stats.size, 2)
+        assert len(eng.statement_stats) <= 3
+
+    def test_top_clear(self):
+        users = self.tables.users
+        eng = self._engine()
+
+        with eng.connect() as conn:
+            conn.execute(self._stmt()).fetchall()
+            conn.execute(users.update().values(user_name="x"))
+
+        top = eng.statement_stats.top("fetch")
+        eq_(len(top), 2)
+        eq_(top[0].rows, 3)
+
+        assert_raises_message(
+            ValueError,
+            "Unknown phase 'bogus'",
+            eng.statement_stats.top,
+            "bogus",
+        )
+
+        eng.statement_stats.clear()
+        eq_(len(eng.statement_stats), 0)
+
+    def test_as_dict(self):
+        eng = self._engine()
+
+        with eng.connect() as conn:
+            conn.execute(self._stmt()).fetchall()
+
+        (d,) = eng.statement_stats.as_dict().values()
+        eq_(d["executions"], 1)
+        eq_(d["rows"], 3)
+        eq_(d["fetch"]["count"], 1)
+        eq_(d["hydrate"]["count"], 0)
+        is_(d["hydrate"]["mean"], None)
+
+
+class HistogramTest(fixtures.TestBase):
+    def test_empty(self):
+        h = stats.Histogram()
+        eq_(h.count, 0)
+        is_(h.mean, None)
+        is_(h.percentile(50), None)
+        eq_(h.buckets, [])
+
+    def test_add(self):
+        h = stats.Histogram()
+        for value in (0.000005, 0.00003, 0.00003, 0.001, 100):
+            h.add(value)
+
+        eq_(h.count, 5)
+        eq_(h.min, 0.000005)
+        eq_(h.max, 100)
+        eq_(
+            h.buckets,
+            [(0.00001, 1), (0.00004, 2), (0.00128, 1), (None, 1)],
+        )
+
+    def test_percentile(self):
+        h = stats.Histogram()
+        for i in range(99):
+            h.add(0.00003)
+        h.add(0.5)
+
+        # the upper bound of the bucket is returned
+        eq_(h.percentile(50), 0.00004)
+        eq_(h.percentile(99), 0.00004)
+        eq_(h.percentile(100), 0.5)
+
+
 class MockStrategyTest(fixtures.TestBase):
     def _engine_fixture(self):
         buf = util.StringIO()
@@ -1,4 +1,5 @@
 import collections
+import contextlib
 import random
 import threading
 import time
@@ -23,6 +24,7 @@ from sqlalchemy.testing.mock import Mock
 from sqlalchemy.testing.mock import patch
 from sqlalchemy.testing.util import gc_collect
 from sqlalchemy.testing.util import lazy_gc
+from sqlalchemy.util import queue as sqla_queue
 
 
 join_timeout = 10
@@ -1636,6 +1638,462 @@ class QueuePoolTest(PoolTestBase):
         pc1.close()
 
 
+class AffinityQueuePoolTest(PoolTestBase):
+    def _fixture(self, **kw):
+        dbapi = MockDBAPI()
+        return (
+            dbapi,
+            pool.AffinityQueuePool(
+                creator=lambda: dbapi.connect("foo.db"), **kw
+            ),
+        )
+
+    def _status(self, p):
+        return (p.size(), p.checkedin(), p.overflow(), p.checkedout())
+
+    def test_status(self):
+        dbapi, p = self._fixture(pool_size=2, max_overflow=-1)
+
+        c1, c2, c3 = p.connect(), p.connect(), p.connect()
+        eq_(self._status(p), (2, 0, 1, 3))
+
+        c1.close()
+        c2.close()
+        eq_(self._status(p), (2, 2, 1, 1))
+
+        # the pool is full, so the overflow connection is closed
+        dbapi_conn = c3.connection
+        c3.close()
+        eq_(self._status(p), (2, 2, 0, 0))
+        is_true(dbapi_conn.closed)
+        eq_(dbapi.connect.call_count, 3)
+
+    def test_lifo(self):
+        dbapi, p = self._fixture(pool_size=3)
+
+        c1, c2, c3 = p.connect(), p.connect(), p.connect()
+        conns = [c.connection for c in (c1, c2, c3)]
+        c1.close()
+        c2.close()
+        c3.close()
+
+        for i in range(3):
+            c = p.connect()
+            is_(c.connection, conns[2])
+            c.close()
+
+        c1, c2 = p.connect(), p.connect()
+        is_(c1.connection, conns[2])
+        is_(c2.connection, conns[1])
+        c1.close()
+        c2.close()
+
+    @testing.requires.threading_with_mock
+    def test_thread_affinity(self):
+        dbapi, p = self._fixture(pool_size=3)
+
+        c1 = p.connect()
+        c1_dbapi = c1.connection
+        c1.close()
+
+        def checkout():
+            c2 = p.connect()
+            c3 = p.connect()
+            c3.close()
+            c2.close()
+
+        # another thread checks in connections after this one did
+        th = threading.Thread(target=checkout)
+        th.start()
+        th.join(join_timeout)
+        eq_(p.checkedin(), 2)
+
+        # this thread still gets the connection it last used back
+        c1 = p.connect()
+        is_(c1.connection, c1_dbapi)
+        c1.close()
+
+    def test_affinity_connection_in_use(self):
+        dbapi, p = self._fixture(pool_size=3)
+
+        c1 = p.connect()
+        c2 = p.connect()
+        c1_dbapi = c1.connection
+        c1.close()
+
+        # the connection last checked in by this thread is checked out
+        # again; the next checkout falls back to the stack
+        c1 = p.connect()
+        is_(c1.connection, c1_dbapi)
+        c2_dbapi = c2.connection
+        c2.close()
+        c3 = p.connect()
+        is_(c3.connection, c2_dbapi)
+
+        c4 = p.connect()
+        is_not_(c4.connection, c1_dbapi)
+        is_not_(c4.connection, c2_dbapi)
+
+    @testing.requires.threading_with_mock
+    def test_concurrent_put_at_capacity(self):
+        """test of two puts which both append to a queue with room for
+        one more item, only one fails."""
+
+        class Item(object):
+            pass
+
+        cond = threading.Condition()
+        local = threading.local()
+
+        def wait_for_other_thread(counter):
+            with cond:
+                counter[0] += 1
+                cond.notify_all()
+                while counter[0] < 2:
+                    cond.wait(join_timeout)
+
+        appended, measured = [0], [0]
+
+        class Deque(collections.deque):
+            def __len__(self):
+                if getattr(local, "measured", False):
+                    return collections.deque.__len__(self)
+                local.measured = True
+
+                # both putting threads have appended, then both see the
+                # queue overflowing, before either proceeds
+                wait_for_other_thread(appended)
+                length = collections.deque.__len__(self)
+                wait_for_other_thread(measured)
+                return length
+
+        q = sqla_queue.AffinityQueue(2)
+        q.queue = Deque([Item()])
+        items = [Item(), Item()]
+        results = []
+
+        def put(item):
+            try:
+                q.put(item)
+            except sqla_queue.Full:
+                results.append("full")
+            else:
+                results.append("put")
+
+        threads = [threading.Thread(target=put, args=(i,)) for i in items]
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join(join_timeout)
+
+        eq_(sorted(results), ["full", "put"])
+        eq_(collections.deque.__len__(q.queue), 2)
+
+    def test_timeout(self):
+        dbapi, p = self._fixture(pool_size=1, max_overflow=0, timeout=0.1)
+        c1 = p.connect()  # noqa
+        assert_raises(tsa.exc.TimeoutError, p.connect)
+
+    @testing.requires.threading_with_mock
+    def test_waiter_notified(self):
+        dbapi, p = self._fixture(pool_size=1, max_overflow=0, timeout=5)
+        c1 = p.connect()
+        c1_dbapi = c1.connection
+        checked_out = []
+
+        def checkout():
+            c2 = p.connect()
+            checked_out.append(c2.connection)
+            c2.close()
+
+        th = threading.Thread(target=checkout)
+        th.start()
+        time.sleep(0.1)
+        eq_(checked_out, [])
+
+        c1.close()
+        th.join(join_timeout)
+        eq_(checked_out, [c1_dbapi])
+
+    @testing.requires.threading_with_mock
+    @testing.requires.timing_intensive
+    def test_many_threads(self):
+        dbapi, p = self._fixture(pool_size=3, max_overflow=2, timeout=10)
+        peak = [0]
+        mutex = threading.Lock()
+
+        def whammy():
+            for i in range(50):
+                c = p.connect()
+                with mutex:
+                    peak[0] = max(peak[0], p.checkedout())
+                time.sleep(0.001)
+                c.close()
+
+        threads = [threading.Thread(target=whammy) for i in range(20)]
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join(join_timeout)
+
+        assert peak[0] <= 5
+        eq_(p.checkedout(), 0)
+        assert p.checkedin() <= 3
+
+    def test_events(self):
+        dbapi, p = self._fixture(pool_size=2)
+        canary = []
+
+        @event.listens_for(p, "checkout")
+        def checkout(*arg):
+            canary.append("checkout")
+
+        @event.listens_for(p, "checkin")
+        def checkin(*arg):
+            canary.append("checkin")
+
+        c1 = p.connect()
+        c1.close()
+        c1 = p.connect()
+        c1.close()
+        eq_(canary, ["checkout", "checkin", "checkout", "checkin"])
+
+    def test_recreate(self):
+        dbapi, p = self._fixture(pool_size=4, max_overflow=2, timeout=7)
+        p2 = p.recreate()
+        assert isinstance(p2, pool.AffinityQueuePool)
+        eq_(p2.size(), 4)
+        eq_(p2._max_overflow, 2)
+        eq_(p2.timeout(), 7)
+
+    def test_dispose(self):
+        dbapi, p = self._fixture(pool_size=2)
+        c1, c2 = p.connect(), p.connect()
+        conns = [c1.connection, c2.connection]
+        c1.close()
+        c2.close()
+
+        p.dispose()
+        eq_(p.checkedin(), 0)
+        assert all(c.closed for c in conns)
+
+        c3 = p.connect()
+        assert c3.connection not in conns
+
+
+class AdaptiveQueuePoolTest(PoolTestBase):
+    def _fixture(self, **kw):
+        dbapi = MockDBAPI()
+        return (
+            dbapi,
+            pool.AdaptiveQueuePool(
+                creator=lambda: dbapi.connect("foo.db"), **kw
+            ),
+        )
+
+    @contextlib.contextmanager
+    def _clock(self, now):
+        clock = Mock(time=Mock(side_effect=lambda: now[0]))
+        with patch("sqlalchemy.pool.impl.time", clock):
+            yield
+
+    def test_limit(self):
+        dbapi, p = self._fixture(pool_size=1, max_overflow=1, timeout=0.1)
+        c1, c2 = p.connect(), p.connect()  # noqa
+        assert_raises(tsa.exc.TimeoutError, p.connect)
+        eq_(p.checkedout(), 2)
+        eq_(p.size(), 2)
+        eq_(p.overflow(), 0)
+
+    def test_idle_timeout(self):
+        now = [0]
+
+        with self._clock(now):
+            dbapi, p = self._fixture(
+                pool_size=1,
+                max_overflow=5,
+                idle_timeout=10,
+                adjust_interval=0,
+            )
+            c1, c2, c3 = p.connect(), p.connect(), p.connect()
+            dbapi_conns = [c.connection for c in (c1, c2, c3)]
+            eq_(p.size(), 3)
+
+            c3.close()
+            c2.close()
+            c1.close()
+
+            # demand has gone down, however the connections beyond the
+            # target size haven't been idle long enough to be closed
+            eq_(p.size(), 1)
+            eq_(p.checkedin(), 3)
+            eq_(p.overflow(), 2)
+
+            now[0] = 5
+            c1 = p.connect()
+            is_(c1.connection, dbapi_conns[0])
+            eq_(p.checkedin(), 2)
+
+            now[0] = 11
+            c1.close()
+
+        eq_(p.checkedin(), 1)
+        eq_(p.overflow(), 0)
+        eq_([c.closed for c in dbapi_conns], [False, True, True])
+        eq_(p.stats()["idle_closed"], 2)
+
+    def test_adjust_interval(self):
+        now = [0]
+
+        with self._clock(now):
+            dbapi, p = self._fixture(
+                pool_size=2,
+                max_overflow=5,
+                min_size=2,
+                idle_timeout=0,
+                adjust_interval=100,
+            )
+            conns = [p.connect() for i in range(4)]
+            eq_(p.size(), 4)
+            for c in conns:
+                c.close()
+
+            # the peak within the interval is retained
+            eq_(p.size(), 4)
+            eq_(p.checkedin(), 4)
+
+            now[0] = 101
+            c1 = p.connect()
+            eq_(p.size(), 4)
+
+            now[0] = 202
+            c1.close()
+
+        # the target shrinks to the peak within the last interval, bounded
+        # by min_size
+        eq_(p.size(), 2)
+        eq_(p.checkedin(), 2)
+        eq_(dbapi.connect.call_count, 4)
+
+    def test_stats(self):
+        dbapi, p = self._fixture(pool_size=2, max_overflow=2)
+        stats = p.stats()
+        eq_(stats["connections"], 0)
+        is_(stats["max_connection_age"], None)
+
+        c1, c2, c3 = p.connect(), p.connect(), p.connect()  # noqa
+        c3.close()
+        c1.close()
+        c1 = p.connect()
+
+        stats = p.stats()
+        eq_(
+            dict(
+                (k, stats[k])
+                for k in (
+                    "size",
+                    "connections",
+                    "checkedout",
+                    "peak_checkedout",
+                    "checkouts",
+                    "connects",
+                    "idle_closed",
+                )
+            ),
+            {
+                "size": 3,
+                "connections": 3,
+                "checkedout": 2,
+                "peak_checkedout": 3,
+                "checkouts": 4,
+                "connects": 3,
+                "idle_closed": 0,
+            },
+        )
+        assert stats["wait_time"] >= stats["max_wait_time"] >= 0
+        assert stats["max_connection_age"] >= stats["avg_connection_age"]
+
+    def test_events(self):
+        dbapi, p = self._fixture(
+            pool_size=1, max_overflow=1, idle_timeout=0, adjust_interval=0
+        )
+        canary = []
+
+        @event.listens_for(p, "checkout")
+        def checkout(*arg):
+            canary.append("checkout")
+
+        @event.listens_for(p, "checkin")
+        def checkin(*arg):
+            canary.append("checkin")
+
+        @event.listens_for(p, "close")
+        def close(*arg):
+            canary.append("close")
+
+        c1, c2 = p.connect(), p.connect()
+        c2.close()
+        c1.close()
+        eq_(
+            canary,
+            ["checkout", "checkout", "checkin", "checkin", "close"],
+        )
+
+    def test_recreate(self):
+        dbapi, p = self._fixture(
+            pool_size=3,
+            max_overflow=4,
+            min_size=2,
+            idle_timeout=5,
+            adjust_interval=6,
+            timeout=7,
+        )
+        p2 = p.recreate()
+        assert isinstance(p2, pool.AdaptiveQueuePool)
+        eq_(
+            (
+                p2.size(),
+                p2._max_size,
+                p2._min_size,
+                p2._idle_timeout,
+                p2._adjust_interval,
+                p2.timeout(),
+            ),
+            (3, 7, 2, 5, 6, 7),
+        )
+
+    def test_dispose(self):
+        dbapi, p = self._fixture(pool_size=1, max_overflow=2)
+        c1, c2 = p.connect(), p.connect()
+        c1.close()
+        c2.close()
+        eq_(p.size(), 2)
+
+        p.dispose()
+        eq_(p.size(), 1)
+        eq_(p.checkedin(), 0)
+        eq_(p.stats()["connections"], 0)
+
+    def test_create_engine_args(self):
+        e = tsa.create_engine(
+            "sqlite://",
+            poolclass=pool.AdaptiveQueuePool,
+            pool_size=3,
+            pool_min_size=2,
+            pool_idle_timeout=5,
+            pool_adjust_interval=6,
+        )
+        eq_(
+            (
+                e.pool.size(),
+                e.pool._min_size,
+                e.pool._idle_timeout,
+                e.pool._adjust_interval,
+            ),
+            (3, 2, 5, 6),
+        )
+
+
 class ResetOnReturnTest(PoolTestBase):
     def _fixture(self, **kw):
         dbapi = Mock()
@@ -1,7 +1,12 @@
+import os
+import shutil
+import tempfile
+import threading
 import unicodedata
 
 import sqlalchemy as sa
 from sqlalchemy import DefaultClause
+from sqlalchemy import event
 from sqlalchemy import FetchedValue
 from sqlalchemy import ForeignKey
 from sqlalchemy import Index
@@ -13,9 +18,11 @@ from sqlalchemy import sql
 from sqlalchemy import String
 from sqlalchemy import testing
 from sqlalchemy import UniqueConstraint
+from sqlalchemy.engine.reflection import ReflectionCache
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import AssertsCompiledSQL
+from sqlalchemy.testing import AssertsExecutionResults
 from sqlalchemy.testing import ComparesTables
 from sqlalchemy.testing import config
 from sqlalchemy.testing import engines
@@ -2265,3 +2272,290 @@ class ColumnEventsTest(fixtures.RemovesEvents, fixtures.TestBase):
             eq_(str(table.c.x.server_default.arg), "1")
 
         self._do_test("x", {"default": my_default}, assert_text_of_one)
+
+
+class BulkReflectionTest(fixtures.TablesTest, AssertsExecutionResults):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "parent",
+            metadata,
+            Column("id", sa.Integer, primary_key=True),
+            Column("name", sa.String(20), nullable=False),
+            UniqueConstraint("name", name="uq_parent_name"),
+            test_needs_fk=True,
+        )
+        Table(
+            "child",
+            metadata,
+            Column("id", sa.Integer, primary_key=True),
+            Column("parent_id", sa.Integer, ForeignKey("parent.id")),
+            Column("data", sa.String(20)),
+            Index("ix_child_data", "data"),
+            test_needs_fk=True,
+        )
+
+    def _columns(self, col_defs):
+        return [
+            (col["name"], str(col["type"]), col["nullable"])
+            for col in col_defs
+        ]
+
+    def test_multi_matches_single(self):
+        insp = inspect(testing.db)
+        names = ["parent", "child"]
+
+        multi = insp.get_multi_columns(filter_names=names)
+        eq_(set(multi), set(names))
+        for name in names:
+            eq_(
+                self._columns(multi[name]),
+                self._columns(insp.get_columns(name)),
+            )
+
+        for kind in ("pk_constraint", "foreign_keys", "indexes"):
+            multi = getattr(insp, "get_multi_%s" % kind)(filter_names=names)
+            for name in names:
+                eq_(multi[name], getattr(insp, "get_%s" % kind)(name))
+
+    @testing.requires.unique_constraint_reflection
+    def test_multi_unique_constraints(self):
+        insp = inspect(testing.db)
+        multi = insp.get_multi_unique_constraints(
+            filter_names=["parent", "child"]
+        )
+        eq_(
+            [uc["column_names"] for uc in multi["parent"]],
+            [
+                uc["column_names"]
+                for uc in insp.get_unique_constraints("parent")
+            ],
+        )
+
+    def test_multi_all_tables(self):
+        insp = inspect(testing.db)
+        multi = insp.get_multi_pk_constraint()
+        eq_(multi["parent"]["constrained_columns"], ["id"])
+        eq_(multi["child"]["constrained_columns"], ["id"])
+
+    def test_multi_filter_names(self):
+        insp = inspect(testing.db)
+        eq_(
+            list(
+                insp.get_multi_columns(filter_names=["child", "nonexistent"])
+            ),
+            ["child"],
+        )
+        eq_(insp.get_multi_columns(filter_names=[]), {})
+
+    def test_prefetch(self):
+        insp = inspect(testing.db)
+        insp.prefetch(["parent", "child"])
+
+        child = Table("child", MetaData())
+
+        def go():
+            insp.reflecttable(child, None)
+
+        self.assert_sql_count(testing.db, go, 0)
+        eq_([c.name for c in child.c], ["id", "parent_id", "data"])
+        eq_(
+            [c.name for c in child.metadata.tables["parent"].c],
+            ["id", "name"],
+        )
+        is_true(
+            child.c.parent_id.references(child.metadata.tables["parent"].c.id)
+        )
+
+    def test_prefetch_kwargs_mismatch(self):
+        insp = inspect(testing.db)
+        insp.prefetch(["parent"])
+
+        self.assert_sql_count(
+            testing.db,
+            lambda: insp.get_pk_constraint("parent"),
+            0,
+        )
+
+        with mock.patch.object(
+            insp.dialect, "get_pk_constraint", return_value={}
+        ) as get_pk_constraint:
+            insp.get_pk_constraint("parent", some_option=True)
+        eq_(len(get_pk_constraint.mock_calls), 1)
+
+    def test_metadata_reflect(self):
+        m = MetaData()
+        with mock.patch.object(
+            testing.db.dialect,
+            "get_multi_columns",
+            side_effect=testing.db.dialect.get_multi_columns,
+        ) as get_multi_columns, mock.patch.object(
+            testing.db.dialect,
+            "get_columns",
+            side_effect=testing.db.dialect.get_columns,
+        ) as get_columns:
+            m.reflect(testing.db, only=["parent", "child"])
+
+        eq_(
+            [
+                kw["filter_names"]
+                for args, kw in get_multi_columns.call_args_list
+            ],
+            [["parent", "child"]],
+        )
+        if type(testing.db.dialect).get_multi_columns is not (
+            sa.engine.default.DefaultDialect.get_multi_columns
+        ):
+            # the dialect retrieves columns for all tables at once
+            eq_(get_columns.mock_calls, [])
+        eq_(set(m.tables), set(["parent", "child"]))
+        is_true(
+            m.tables["child"].c.parent_id.references(
+                m.tables["parent"].c.id
+            )
+        )
+
+
+class ReflectionCacheTest(fixtures.TestBase, AssertsExecutionResults):
+    __only_on__ = ("sqlite", "postgresql")
+    __backend__ = True
+
+    def setup(self):
+        self.directory = tempfile.mkdtemp()
+        self.metadata = MetaData()
+        Table(
+            "parent",
+            self.metadata,
+            Column("id", sa.Integer, primary_key=True),
+            Column("name", sa.String(20)),
+        )
+        Table(
+            "child",
+            self.metadata,
+            Column("id", sa.Integer, primary_key=True),
+            Column("parent_id", sa.Integer, ForeignKey("parent.id")),
+        )
+        self.metadata.create_all(testing.db)
+
+    def teardown(self):
+        self.metadata.drop_all(testing.db)
+        shutil.rmtree(self.directory)
+
+    def _reflect(self):
+        self.reflected = m = MetaData()
+        m.reflect(
+            testing.db,
+            only=["parent", "child"],
+            reflection_cache=ReflectionCache(self.directory),
+        )
+        return m
+
+    def test_unchanged_tables_from_cache(self):
+        self._reflect()
+
+        # table names and table versions
+        self.assert_sql_count(testing.db, self._reflect, 2)
+        m = self.reflected
+        eq_([c.name for c in m.tables["parent"].c], ["id", "name"])
+        is_true(
+            m.tables["child"].c.parent_id.references(
+                m.tables["parent"].c.id
+            )
+        )
+
+    def test_changed_table_reflected(self):
+        self._reflect()
+
+        with testing.db.connect() as conn:
+            conn.execute("ALTER TABLE parent ADD COLUMN extra INTEGER")
+        self.metadata.tables["parent"].append_column(
+            Column("extra", sa.Integer)
+        )
+
+        m = self._reflect()
+        eq_([c.name for c in m.tables["parent"].c], ["id", "name", "extra"])
+
+        self.assert_sql_count(testing.db, self._reflect, 2)
+        eq_(
+            [c.name for c in self.reflected.tables["parent"].c],
+            ["id", "name", "extra"],
+        )
+
+    def test_unreadable_cache_ignored(self):
+        self._reflect()
+        for name in os.listdir(self.directory):
+            with open(os.path.join(self.directory, name), "wb") as file_:
+                file_.write(b"garbage")
+
+        m = self._reflect()
+        eq_([c.name for c in m.tables["parent"].c], ["id", "name"])
+
+        self.assert_sql_count(testing.db, self._reflect, 2)
+
+
+class ParallelReflectionTest(fixtures.TestBase):
+    __only_on__ = "sqlite"
+
+    def setup(self):
+        self.directory = tempfile.mkdtemp()
+        self.engine = engines.testing_engine(
+            "sqlite:///%s" % os.path.join(self.directory, "test.db")
+        )
+        metadata = MetaData()
+        for i in range(10):
+            Table(
+                "t%d" % i,
+                metadata,
+                Column("id", sa.Integer, primary_key=True),
+                Column(
+                    "prev_id",
+                    sa.Integer,
+                    ForeignKey("t%d.id" % (i - 1)) if i else None,
+                ),
+                Column("data", sa.String(20), index=True),
+            )
+        metadata.create_all(self.engine)
+        self.expected = metadata
+
+    def teardown(self):
+        self.engine.dispose()
+        shutil.rmtree(self.directory)
+
+    def test_reflect(self):
+        threads = set()
+
+        @event.listens_for(self.engine, "before_cursor_execute")
+        def go(*arg):
+            threads.add(threading.current_thread())
+
+        m = MetaData()
+        m.reflect(self.engine, max_workers=3)
+        eq_(len(threads), 4)
+
+        eq_(set(m.tables), set(self.expected.tables))
+        for name, table in self.expected.tables.items():
+            reflected = m.tables[name]
+            eq_([c.name for c in reflected.c], [c.name for c in table.c])
+            eq_(
+                [idx.name for idx in reflected.indexes],
+                [idx.name for idx in table.indexes],
+            )
+            eq_(
+                [fk.target_fullname for fk in reflected.foreign_keys],
+                [fk.target_fullname for fk in table.foreign_keys],
+            )
+
+    def test_error_propagated(self):
+        with mock.patch.object(
+            self.engine.dialect,
+            "get_multi_indexes",
+            side_effect=sa.exc.OperationalError("stmt", {}, Exception()),
+        ):
+            assert_raises(
+                sa.exc.OperationalError,
+                MetaData().reflect,
+                self.engine,
+                max_workers=2,
+            )
@@ -0,0 +1,314 @@
+import asyncio
+
+from sqlalchemy import Column
+from sqlalchemy import exc
+from sqlalchemy import func
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import pool
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy.engine import default
+from sqlalchemy.engine import url
+from sqlalchemy.ext.asyncio import AsyncResult
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.testing import assert_raises_message
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_false
+from sqlalchemy.testing import is_true
+from sqlalchemy.testing.asyncio import async_test
+from sqlalchemy.testing.mock import Mock
+from sqlalchemy.util.concurrency import await_only
+from sqlalchemy.util.concurrency import greenlet_spawn
+
+
+class ConcurrencyTest(fixtures.TestBase):
+    __requires__ = ("greenlet",)
+
+    async def _some_async_function(self, value):
+        await asyncio.sleep(0)
+        return value * 2
+
+    def _some_sync_function(self, value):
+        return await_only(self._some_async_function(value)) + 1
+
+    @async_test
+    async def test_await_only_in_greenlet(self):
+        eq_(await greenlet_spawn(self._some_sync_function, 5), 11)
+
+    def test_await_only_no_greenlet(self):
+        coro = self._some_async_function(5)
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "greenlet_spawn has not been called",
+            await_only,
+            coro,
+        )
+        coro.close()
+
+    @async_test
+    async def test_exception_propagates_to_greenlet(self):
+        async def raises():
+            await asyncio.sleep(0)
+            raise ValueError("some error")
+
+        def go():
+            try:
+                await_only(raises())
+            except ValueError as err:
+                return "caught %s" % err
+
+        eq_(await greenlet_spawn(go), "caught some error")
+
+    @async_test
+    async def test_exception_propagates_from_greenlet(self):
+        def go():
+            await_only(asyncio.sleep(0))
+            raise ValueError("some error")
+
+        try:
+            await greenlet_spawn(go)
+        except ValueError as err:
+            eq_(str(err), "some error")
+        else:
+            assert False, "ValueError not raised"
+
+
+class AsyncAdaptedQueuePoolTest(fixtures.TestBase):
+    __requires__ = ("greenlet",)
+
+    def _pool_fixture(self, **kw):
+        return pool.AsyncAdaptedQueuePool(
+            Mock(side_effect=lambda: Mock()), **kw
+        )
+
+    @async_test
+    async def test_timeout(self):
+        p = self._pool_fixture(pool_size=1, max_overflow=0, timeout=0.1)
+
+        c1 = await greenlet_spawn(p.connect)
+        dbapi_conn = c1.connection
+
+        try:
+            await greenlet_spawn(p.connect)
+        except exc.TimeoutError:
+            pass
+        else:
+            assert False, "TimeoutError not raised"
+
+        c1.close()
+        c2 = await greenlet_spawn(p.connect)
+        is_(c2.connection, dbapi_conn)
+
+    @async_test
+    async def test_waiter_yields_to_event_loop(self):
+        p = self._pool_fixture(pool_size=1, max_overflow=0, timeout=5)
+        canary = []
+
+        c1 = await greenlet_spawn(p.connect)
+
+        async def checkin_later():
+            await asyncio.sleep(0.05)
+            canary.append("checkin")
+            c1.close()
+
+        def checkout():
+            c2 = p.connect()
+            canary.append("checkout")
+            c2.close()
+
+        await asyncio.gather(greenlet_spawn(checkout), checkin_later())
+        eq_(canary, ["checkin", "checkout"])
+        eq_(p.checkedout(), 0)
+
+    def test_async_dialect_default_pool(self):
+        class AsyncDialect(default.DefaultDialect):
+            is_async = True
+
+        is_(
+            AsyncDialect.get_pool_class(url.make_url("foo://")),
+            pool.AsyncAdaptedQueuePool,
+        )
+        is_(
+            default.DefaultDialect.get_pool_class(url.make_url("foo://")),
+            pool.QueuePool,
+        )
+
+
+class AsyncEngineTest(fixtures.TestBase):
+    __requires__ = ("aiosqlite",)
+
+    def setup(self):
+        self.metadata = MetaData()
+        self.users = Table(
+            "users",
+            self.metadata,
+            Column("user_id", Integer, primary_key=True),
+            Column("user_name", String(20)),
+        )
+        self.engine = create_async_engine("sqlite+aiosqlite://")
+
+    def teardown(self):
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self.engine.dispose())
+        finally:
+            loop.close()
+
+    async def _fixture_data(self):
+        async with self.engine.begin() as conn:
+            await conn.run_sync(self.metadata.create_all)
+            await conn.execute(
+                self.users.insert(),
+                [
+                    {"user_id": i, "user_name": "name%d" % i}
+                    for i in range(1, 20)
+                ],
+            )
+
+    async def _count(self, conn):
+        return await conn.scalar(
+            select([func.count()]).select_from(self.users)
+        )
+
+    def test_create_async_engine_requires_async_dialect(self):
+        assert_raises_message(
+            exc.ArgumentError,
+            "The asyncio extension requires an async driver to be used. "
+            "The loaded 'pysqlite' is not async.",
+            create_async_engine,
+            "sqlite://",
+        )
+
+    def test_pool_class(self):
+        assert isinstance(self.engine.pool, pool.StaticPool)
+
+        file_engine = create_async_engine("sqlite+aiosqlite:///file.db")
+        is_(file_engine.pool.__class__, pool.NullPool)
+
+    @async_test
+    async def test_connection_not_started(self):
+        conn = self.engine.connect()
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "AsyncConnection context has not been started",
+            conn.begin,
+        )
+        is_true(conn.closed)
+
+    @async_test
+    async def test_connect_await(self):
+        conn = await self.engine.connect()
+        is_false(conn.closed)
+        await conn.close()
+        is_true(conn.closed)
+
+    @async_test
+    async def test_execute(self):
+        await self._fixture_data()
+
+        async with self.engine.connect() as conn:
+            result = await conn.execute(
+                select([self.users.c.user_name])
+                .where(self.users.c.user_id.in_([2, 3]))
+                .order_by(self.users.c.user_id)
+            )
+            eq_(result.fetchall(), [("name2",), ("name3",)])
+
+            eq_(
+                await conn.scalar(select([func.count(self.users.c.user_id)])),
+                19,
+            )
+
+    @async_test
+    async def test_begin_commits(self):
+        await self._fixture_data()
+
+        async with self.engine.begin() as conn:
+            await conn.execute(self.users.delete())
+
+        async with self.engine.connect() as conn:
+            eq_(await self._count(conn), 0)
+
+    @async_test
+    async def test_begin_rolls_back_on_error(self):
+        await self._fixture_data()
+
+        async def go():
+            async with self.engine.begin() as conn:
+                await conn.execute(self.users.delete())
+                raise ValueError("some error")
+
+        try:
+            await go()
+        except ValueError:
+            pass
+        else:
+            assert False, "ValueError not raised"
+
+        async with self.engine.connect() as conn:
+            eq_(await self._count(conn), 19)
+
+    @async_test
+    async def test_transaction_rollback(self):
+        await self._fixture_data()
+
+        async with self.engine.connect() as conn:
+            trans = await conn.begin()
+            is_true(conn.in_transaction())
+            await conn.execute(self.users.delete())
+            await trans.rollback()
+            is_false(conn.in_transaction())
+
+            eq_(await self._count(conn), 19)
+
+    @async_test
+    async def test_stream(self):
+        await self._fixture_data()
+
+        async with self.engine.connect() as conn:
+            result = await conn.stream(
+                select([self.users]).order_by(self.users.c.user_id)
+            )
+            assert isinstance(result, AsyncResult)
+            is_true(result._real_result.context._is_server_side)
+            eq_(result.keys(), ["user_id", "user_name"])
+
+            eq_(await result.fetchone(), (1, "name1"))
+            eq_(len(await result.fetchmany(3)), 3)
+
+            rows = []
+            async for row in result:
+                rows.append(row)
+            eq_([row.user_id for row in rows], list(range(5, 20)))
+
+    @async_test
+    async def test_stream_partitions(self):
+        await self._fixture_data()
+
+        async with self.engine.connect() as conn:
+            result = await conn.stream(
+                select([self.users]).order_by(self.users.c.user_id)
+            )
+
+            eq_(
+                [len(partition) async for partition in result.partitions(5)],
+                [5, 5, 5, 4],
+            )
+            eq_(await result.fetchall(), [])
+
+    @async_test
+    async def test_stream_scalar(self):
+        await self._fixture_data()
+
+        async with self.engine.connect() as conn:
+            result = await conn.stream(
+                select([self.users.c.user_name]).order_by(
+                    self.users.c.user_id
+                )
+            )
+            eq_(await result.scalar(), "name1")
+            is_true(result.closed)
@@ -0,0 +1,218 @@
+import asyncio
+
+from sqlalchemy import Column
+from sqlalchemy import exc
+from sqlalchemy import ForeignKey
+from sqlalchemy import func
+from sqlalchemy import Integer
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import selectinload
+from sqlalchemy.testing import assert_raises_message
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing.asyncio import async_test
+
+
+class AsyncSessionTest(fixtures.TestBase):
+    __requires__ = ("aiosqlite",)
+
+    def setup(self):
+        Base = declarative_base()
+
+        class User(Base):
+            __tablename__ = "users"
+
+            id = Column(Integer, primary_key=True)
+            name = Column(String(30))
+            addresses = relationship("Address", order_by="Address.id")
+
+        class Address(Base):
+            __tablename__ = "addresses"
+
+            id = Column(Integer, primary_key=True)
+            user_id = Column(ForeignKey("users.id"))
+            email_address = Column(String(50))
+
+        self.Base = Base
+        self.User = User
+        self.Address = Address
+        self.engine = create_async_engine("sqlite+aiosqlite://")
+
+    def teardown(self):
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self.engine.dispose())
+        finally:
+            loop.close()
+
+    async def _fixture_data(self):
+        User, Address = self.User, self.Address
+
+        async with self.engine.begin() as conn:
+            await conn.run_sync(self.Base.metadata.create_all)
+
+        async with AsyncSession(self.engine) as session:
+            session.add_all(
+                [
+                    User(
+                        id=7,
+                        name="jack",
+                        addresses=[Address(email_address="jack@bean.com")],
+                    ),
+                    User(
+                        id=8,
+                        name="ed",
+                        addresses=[
+                            Address(email_address="ed@wood.com"),
+                            Address(email_address="ed@bettyboop.com"),
+                        ],
+                    ),
+                ]
+            )
+            await session.commit()
+
+    @async_test
+    async def test_get(self):
+        await self._fixture_data()
+
+        async with AsyncSession(self.engine) as session:
+            u1 = await session.get(self.User, 7)
+            eq_(u1.name, "jack")
+
+            is_(await session.get(self.User, 12), None)
+
+    @async_test
+    async def test_execute_and_scalar(self):
+        await self._fixture_data()
+        users = self.User.__table__
+
+        async with AsyncSession(self.engine) as session:
+            result = await session.execute(
+                select([users.c.name]).order_by(users.c.id)
+            )
+            eq_(result.fetchall(), [("jack",), ("ed",)])
+
+            eq_(await session.scalar(select([func.count(users.c.id)])), 2)
+
+    @async_test
+    async def test_stream(self):
+        await self._fixture_data()
+        addresses = self.Address.__table__
+
+        async with AsyncSession(self.engine) as session:
+            result = await session.stream(
+                select([addresses.c.email_address]).order_by(addresses.c.id)
+            )
+            eq_(
+                [row.email_address async for row in result],
+                ["jack@bean.com", "ed@wood.com", "ed@bettyboop.com"],
+            )
+
+    @async_test
+    async def test_run_sync_lazyload(self):
+        await self._fixture_data()
+
+        def go(session):
+            u1 = session.query(self.User).filter_by(name="ed").one()
+            return [a.email_address for a in u1.addresses]
+
+        async with AsyncSession(self.engine) as session:
+            eq_(
+                await session.run_sync(go),
+                ["ed@wood.com", "ed@bettyboop.com"],
+            )
+
+    @async_test
+    async def test_run_sync_eagerload(self):
+        await self._fixture_data()
+
+        def go(session):
+            return (
+                session.query(self.User)
+                .options(selectinload(self.User.addresses))
+                .order_by(self.User.id)
+                .all()
+            )
+
+        async with AsyncSession(self.engine) as session:
+            users = await session.run_sync(go)
+
+            # collections are loaded, so no IO is required
+            eq_([len(u.addresses) for u in users], [1, 2])
+
+    @async_test
+    async def test_lazyload_outside_greenlet(self):
+        await self._fixture_data()
+
+        async with AsyncSession(self.engine) as session:
+            u1 = await session.get(self.User, 7)
+
+            assert_raises_message(
+                exc.InvalidRequestError,
+                "greenlet_spawn has not been called",
+                getattr,
+                u1,
+                "addresses",
+            )
+
+    @async_test
+    async def test_flush_rollback(self):
+        await self._fixture_data()
+
+        async with AsyncSession(self.engine) as session:
+            session.add(self.User(id=9, name="fred"))
+            await session.flush()
+            eq_(
+                await session.scalar(select([func.count(self.User.id)])), 3
+            )
+            await session.rollback()
+            eq_(
+                await session.scalar(select([func.count(self.User.id)])), 2
+            )
+
+    @async_test
+    async def test_refresh_after_commit(self):
+        await self._fixture_data()
+
+        async with AsyncSession(self.engine) as session:
+            u1 = await session.get(self.User, 7)
+            u1.name = "jack2"
+            await session.commit()
+
+            await session.refresh(u1)
+            eq_(u1.name, "jack2")
+
+    @async_test
+    async def test_expire_on_commit_false(self):
+        await self._fixture_data()
+
+        async with AsyncSession(
+            self.engine, expire_on_commit=False
+        ) as session:
+            u1 = await session.get(self.User, 7)
+            u1.name = "jack2"
+            await session.commit()
+
+            eq_(u1.name, "jack2")
+
+    @async_test
+    async def test_delete_merge(self):
+        await self._fixture_data()
+
+        async with AsyncSession(self.engine) as session:
+            u1 = await session.get(self.User, 8)
+            await session.delete(u1)
+            await session.commit()
+
+            is_(await session.get(self.User, 8), None)
+
+            u2 = await session.merge(self.User(id=7, name="jack3"))
+            await session.commit()
+            await session.refresh(u2)
+            eq_(u2.name, "jack3")
@@ -0,0 +1,707 @@
+from sqlalchemy import Column
+from sqlalchemy import event
+from sqlalchemy import Integer
+from sqlalchemy import JSON
+from sqlalchemy import select
+from sqlalchemy import Table
+from sqlalchemy import testing
+from sqlalchemy.ext.cache import CacheRegion
+from sqlalchemy.ext.cache import CachingQuery
+from sqlalchemy.ext.cache import MemcachedBackend
+from sqlalchemy.ext.cache import MemoryBackend
+from sqlalchemy.ext.cache import NO_VALUE
+from sqlalchemy.ext.cache import SecondLevelCache
+from sqlalchemy.ext.mutable import MutableDict
+from sqlalchemy.orm import class_mapper
+from sqlalchemy.orm import mapper
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.testing import assert_raises_message
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_not_
+from sqlalchemy.testing import ne_
+from sqlalchemy.testing.assertsql import CompiledSQL
+from sqlalchemy.testing.mock import patch
+from test.orm import _fixtures
+
+
+class MockMemcacheClient(object):
+    """Stands in for a memcached client, enforcing memcached's key and
+    value restrictions."""
+
+    def __init__(self):
+        self._data = {}
+
+    def _check_key(self, key):
+        assert isinstance(key, str) and len(key) <= 250
+        assert not any(c.isspace() for c in key)
+
+    def get(self, key):
+        self._check_key(key)
+        return self._data.get(key)
+
+    def get_multi(self, keys):
+        return dict(
+            (key, self._data[key]) for key in keys if key in self._data
+        )
+
+    def set(self, key, value, expire=0):
+        self._check_key(key)
+        assert isinstance(value, bytes)
+        self._data[key] = value
+        return True
+
+    def set_multi(self, mapping, expire=0):
+        for key, value in mapping.items():
+            self.set(key, value, expire)
+        return []
+
+    def delete(self, key):
+        self._check_key(key)
+        self._data.pop(key, None)
+
+    def delete_multi(self, keys):
+        for key in keys:
+            self.delete(key)
+
+
+class BackendTest(fixtures.TestBase):
+    def _test_backend(self, backend):
+        eq_(backend.get("k1"), NO_VALUE)
+        backend.set("k1", {"x": 5}, None)
+        backend.set("k2", (1, 2), None)
+        eq_(backend.get("k1"), {"x": 5})
+        eq_(
+            backend.get_multi(["k2", "k3", "k1"]),
+            [(1, 2), NO_VALUE, {"x": 5}],
+        )
+        backend.delete_multi(["k1", "k3"])
+        eq_(backend.get("k1"), NO_VALUE)
+        eq_(backend.get("k2"), (1, 2))
+        backend.set_multi({"k1": [1], "k3": "v3"}, None)
+        eq_(backend.get_multi(["k1", "k3"]), [[1], "v3"])
+
+    def test_memory_backend(self):
+        self._test_backend(MemoryBackend())
+
+    def test_memcached_backend(self):
+        self._test_backend(MemcachedBackend(MockMemcacheClient()))
+
+    def test_memory_values_copied(self):
+        backend = MemoryBackend()
+        value = {"x": [5]}
+        backend.set("k1", value, None)
+        value["x"].append(6)
+        v1 = backend.get("k1")
+        eq_(v1, {"x": [5]})
+        v1["x"].append(7)
+        eq_(backend.get("k1"), {"x": [5]})
+
+    def test_memory_expiration(self):
+        backend = MemoryBackend()
+        with patch("sqlalchemy.ext.cache.time.time", return_value=100):
+            backend.set("k1", "v1", 10)
+            backend.set("k2", "v2", None)
+        with patch("sqlalchemy.ext.cache.time.time", return_value=105):
+            eq_(backend.get("k1"), "v1")
+        with patch("sqlalchemy.ext.cache.time.time", return_value=110):
+            eq_(backend.get("k1"), NO_VALUE)
+            eq_(backend.get("k2"), "v2")
+
+    def test_memory_size(self):
+        backend = MemoryBackend(size=10)
+        for i in range(50):
+            backend.set("k%d" % i, i, None)
+        assert len(backend._cache) < 50
+        eq_(backend.get("k49"), 49)
+
+    def test_region_default_expiration(self):
+        eq_(CacheRegion().expiration_time, 3600)
+        eq_(CacheRegion(expiration_time=None).expiration_time, None)
+
+    def test_region_prefix(self):
+        backend = MemoryBackend()
+        r1 = CacheRegion(backend, key_prefix="a:")
+        r2 = CacheRegion(backend, key_prefix="b:")
+        r1.set("k", 1)
+        eq_(r1.get("k"), 1)
+        eq_(r2.get("k"), NO_VALUE)
+        eq_(backend.get("a:k"), 1)
+
+
+class SecondLevelCacheTest(_fixtures.FixtureTest):
+    run_inserts = "each"
+
+    def _backend(self):
+        return MemoryBackend()
+
+    def setup(self):
+        super(SecondLevelCacheTest, self).setup()
+        self.Session = sessionmaker(testing.db, query_cls=CachingQuery)
+        self.cache = SecondLevelCache(
+            CacheRegion(self._backend()), session_factory=self.Session
+        )
+
+    def teardown(self):
+        self.cache.dispose()
+        super(SecondLevelCacheTest, self).teardown()
+
+    @classmethod
+    def setup_mappers(cls):
+        User, Address = cls.classes.User, cls.classes.Address
+        users, addresses = cls.tables.users, cls.tables.addresses
+        mapper(User, users)
+        mapper(Address, addresses, properties={"user": relationship(User)})
+
+    def _session(self):
+        return self.Session()
+
+    def test_get_cached(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+
+        s1 = self._session()
+        u1 = s1.query(User).get(7)
+        eq_(u1.name, "jack")
+        s1.close()
+
+        s2 = self._session()
+
+        def go():
+            u2 = s2.query(User).get(7)
+            is_not_(u2, u1)
+            eq_(u2.name, "jack")
+            is_(s2.query(User).get(7), u2)
+            assert u2 in s2
+            assert u2 not in s2.dirty
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_get_uncached_class(self):
+        User = self.classes.User
+
+        s1 = self._session()
+        s1.query(User).get(7)
+        s1.close()
+
+        s2 = self._session()
+        self.assert_sql_count(testing.db, lambda: s2.query(User).get(7), 1)
+
+    def test_many_to_one_lazyload(self):
+        User, Address = self.classes.User, self.classes.Address
+        self.cache.cache_class(User)
+
+        s1 = self._session()
+        s1.query(User).get(8)
+        s1.close()
+
+        s2 = self._session()
+        a1 = s2.query(Address).get(2)
+
+        def go():
+            eq_(a1.user.name, "ed")
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_modified_object_restored(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+
+        s1 = self._session()
+        s1.query(User).get(7)
+        s1.close()
+
+        s2 = self._session()
+        u2 = s2.query(User).get(7)
+        u2.name = "jack2"
+        s2.commit()
+
+        s3 = self._session()
+        eq_(s3.query(User).get(7).name, "jack2")
+
+    def test_flush_invalidates(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+
+        s1 = self._session()
+        u1 = s1.query(User).get(7)
+        s1.close()
+
+        s2 = self._session()
+        u1 = s2.query(User).get(7)
+        u1.name = "newname"
+        s2.flush()
+
+        # another session doesn't see the cached row, and doesn't cache
+        # the row it loads; the transaction above is still in progress
+        s3 = self._session()
+        self.assert_sql_count(testing.db, lambda: s3.query(User).get(7), 1)
+        s3.close()
+
+        s2.commit()
+
+        s4 = self._session()
+        eq_(s4.query(User).get(7).name, "newname")
+
+    def test_delete_invalidates(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+
+        s1 = self._session()
+        s1.query(User).get(10)
+        s1.close()
+
+        s2 = self._session()
+        s2.delete(s2.query(User).get(10))
+        s2.commit()
+
+        s3 = self._session()
+        is_(s3.query(User).get(10), None)
+
+    def test_touched_not_cached_within_transaction(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+
+        s1 = self._session()
+        u1 = s1.query(User).get(7)
+        u1.name = "jack2"
+        s1.flush()
+        s1.expire_all()
+        eq_(s1.query(User).get(7).name, "jack2")
+        s1.rollback()
+
+        s2 = self._session()
+        eq_(s2.query(User).get(7).name, "jack")
+
+    def test_identity_map_takes_precedence(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+
+        s1 = self._session()
+        s1.query(User).get(7)
+        s1.close()
+
+        s2 = self._session()
+        u2 = s2.query(User).filter_by(id=7).one()
+        is_(s2.query(User).get(7), u2)
+
+    def test_populate_existing_bypasses(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+
+        s1 = self._session()
+        s1.query(User).get(7)
+        s1.close()
+
+        s2 = self._session()
+        self.assert_sql_count(
+            testing.db, lambda: s2.query(User).populate_existing().get(7), 1
+        )
+
+    def test_query_cached(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+
+        s1 = self._session()
+        q = s1.query(User).filter(User.id > 7).order_by(User.id).from_cache()
+        eq_([u.name for u in q], ["ed", "fred", "chuck"])
+        s1.close()
+
+        s2 = self._session()
+
+        def go():
+            q = (
+                s2.query(User)
+                .filter(User.id > 7)
+                .order_by(User.id)
+                .from_cache()
+            )
+            eq_([u.name for u in q], ["ed", "fred", "chuck"])
+
+        self.assert_sql_count(testing.db, go, 0)
+
+        # different parameters are cached separately
+        self.assert_sql_count(
+            testing.db,
+            lambda: eq_(
+                s2.query(User).filter(User.id > 8).from_cache().count(), 2
+            ),
+            1,
+        )
+
+    def test_query_invalidated_by_insert(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+
+        s1 = self._session()
+        eq_(s1.query(User).from_cache().count(), 4)
+        eq_(len(s1.query(User).from_cache().all()), 4)
+        s1.add(User(id=11, name="new"))
+        s1.commit()
+
+        s2 = self._session()
+        eq_(len(s2.query(User).from_cache().all()), 5)
+
+    def test_query_not_cached_without_from_cache(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+
+        s1 = self._session()
+        s1.query(User).all()
+        s1.close()
+
+        s2 = self._session()
+        self.assert_sql_count(testing.db, lambda: s2.query(User).all(), 1)
+
+    def test_query_falls_back_on_missing_rows(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+
+        s1 = self._session()
+        s1.query(User).order_by(User.id).from_cache().all()
+        s1.close()
+
+        self.cache.region.delete_multi(
+            [self.cache._row_key(class_mapper(User), (8,))]
+        )
+
+        s2 = self._session()
+        self.assert_sql_count(
+            testing.db,
+            lambda: eq_(
+                [
+                    u.id
+                    for u in s2.query(User).order_by(User.id).from_cache()
+                ],
+                [7, 8, 9, 10],
+            ),
+            1,
+        )
+
+    def test_invalidate(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+
+        s1 = self._session()
+        u1 = s1.query(User).get(7)
+        s1.query(User).from_cache().all()
+        self.cache.invalidate(u1)
+        s1.close()
+
+        s2 = self._session()
+        self.assert_sql_count(testing.db, lambda: s2.query(User).get(7), 1)
+        self.assert_sql_count(
+            testing.db, lambda: s2.query(User).from_cache().all(), 1
+        )
+
+    def test_invalidate_queries(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+
+        s1 = self._session()
+        s1.query(User).from_cache().all()
+        self.cache.invalidate_queries(User)
+        s1.close()
+
+        s2 = self._session()
+        self.assert_sql_execution(
+            testing.db,
+            lambda: s2.query(User).from_cache().all(),
+            CompiledSQL(
+                "SELECT users.id AS users_id, users.name AS users_name "
+                "FROM users"
+            ),
+        )
+
+    def test_cache_class_twice(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+        self.cache.cache_class(User)
+
+        other = SecondLevelCache(session_factory=self.Session)
+        try:
+            assert_raises_message(
+                ValueError,
+                "Class User is already cached by another SecondLevelCache",
+                other.cache_class,
+                User,
+            )
+        finally:
+            other.dispose()
+
+    def test_dispose(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+
+        s1 = self._session()
+        s1.query(User).get(7)
+        self.cache.dispose()
+        assert not event.contains(
+            self.Session, "after_flush", self.cache._after_flush
+        )
+        assert not event.contains(User, "load", self.cache._on_load)
+        s1.close()
+
+        s2 = self._session()
+        self.assert_sql_count(testing.db, lambda: s2.query(User).get(7), 1)
+        s2.close()
+
+        other = SecondLevelCache(session_factory=self.Session)
+        try:
+            other.cache_class(User)
+        finally:
+            other.dispose()
+
+    def test_untracked_session_not_cached(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+
+        s1 = Session(testing.db, query_cls=CachingQuery)
+        s1.query(User).get(7)
+        s1.close()
+
+        s2 = self._session()
+        self.assert_sql_count(testing.db, lambda: s2.query(User).get(7), 1)
+
+    def test_row_not_stored_after_invalidation(self):
+        """a session which began its transaction before another session
+        invalidated a row doesn't store the row it loads afterwards, as it
+        may reflect the state prior to the change."""
+
+        User = self.classes.User
+        self.cache.cache_class(User)
+
+        s1 = self._session()
+        s1.connection()
+
+        s2 = self._session()
+        s2.query(User).get(7).name = "jack2"
+        s2.commit()
+
+        s1.query(User).get(7)
+        s1.query(User).filter(User.id > 7).from_cache().all()
+        s1.close()
+
+        s3 = self._session()
+        self.assert_sql_count(testing.db, lambda: s3.query(User).get(7), 1)
+        self.assert_sql_count(
+            testing.db,
+            lambda: s3.query(User).filter(User.id > 7).from_cache().all(),
+            1,
+        )
+
+    def test_row_removed_when_invalidated_during_store(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+        base_mapper = class_mapper(User)
+
+        s1 = self._session()
+        s1.connection()
+        version = self.cache._snapshot(s1, base_mapper)[0]
+
+        region = self.cache.region
+        get = region.get
+
+        def invalidate_then_get(key):
+            if key == self.cache._version_key(base_mapper):
+                self.cache.invalidate_class(User)
+            return get(key)
+
+        with patch.object(region, "get", invalidate_then_get):
+            s1.query(User).get(7)
+        s1.close()
+
+        ne_(region.get(self.cache._version_key(base_mapper)), version)
+        eq_(region.get(self.cache._row_key(base_mapper, (7,))), NO_VALUE)
+
+    def test_rows_stored_once_per_query(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+        base_mapper = class_mapper(User)
+        region = self.cache.region
+        version_key = self.cache._version_key(base_mapper)
+
+        s1 = self._session()
+        s1.connection()
+        with patch.object(
+            region, "set_multi", wraps=region.set_multi
+        ) as set_multi, patch.object(
+            region, "get", wraps=region.get
+        ) as get_:
+            eq_(len(s1.query(User).all()), 4)
+        s1.close()
+
+        eq_(set_multi.call_count, 1)
+        eq_(len(set_multi.call_args[0][0]), 4)
+        eq_(
+            len([c for c in get_.mock_calls if c[1] == (version_key,)]), 1
+        )
+
+        s2 = self._session()
+        self.assert_sql_count(
+            testing.db,
+            lambda: [s2.query(User).get(id_) for id_ in (7, 8, 9, 10)],
+            0,
+        )
+
+    def test_query_update_invalidates(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+
+        s1 = self._session()
+        s1.query(User).get(7)
+        s1.close()
+
+        s2 = self._session()
+        s2.query(User).filter(User.id == 7).update(
+            {"name": "jack2"}, synchronize_session=False
+        )
+        s2.commit()
+
+        s3 = self._session()
+        eq_(s3.query(User).get(7).name, "jack2")
+
+    def test_query_delete_invalidates(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+
+        s1 = self._session()
+        s1.query(User).get(10)
+        eq_(s1.query(User).from_cache().count(), 4)
+        s1.close()
+
+        s2 = self._session()
+        s2.query(User).filter(User.id == 10).delete(
+            synchronize_session=False
+        )
+        s2.commit()
+
+        s3 = self._session()
+        is_(s3.query(User).get(10), None)
+        eq_(s3.query(User).from_cache().count(), 3)
+
+    def test_session_execute_invalidates(self):
+        User = self.classes.User
+        users = self.tables.users
+        self.cache.cache_class(User)
+
+        s1 = self._session()
+        s1.query(User).get(7)
+        s1.close()
+
+        s2 = self._session()
+        s2.execute(
+            users.update().where(users.c.id == 7).values(name="jack2")
+        )
+
+        # the session itself no longer makes use of cached rows
+        eq_(s2.query(User).get(7).name, "jack2")
+        s2.commit()
+
+        s3 = self._session()
+        eq_(s3.query(User).get(7).name, "jack2")
+
+    def test_invalidate_class(self):
+        User = self.classes.User
+        self.cache.cache_class(User)
+
+        s1 = self._session()
+        s1.query(User).get(7)
+        s1.close()
+
+        self.cache.invalidate_class(User)
+
+        s2 = self._session()
+        self.assert_sql_count(testing.db, lambda: s2.query(User).get(7), 1)
+
+
+class MemcachedSecondLevelCacheTest(SecondLevelCacheTest):
+    def _backend(self):
+        return MemcachedBackend(MockMemcacheClient())
+
+
+class MutableValueTest(fixtures.MappedTest):
+    __requires__ = ("json_type",)
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "foo",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", JSON),
+            Column("mdata", MutableDict.as_mutable(JSON)),
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class Foo(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        mapper(cls.classes.Foo, cls.tables.foo)
+
+    @classmethod
+    def insert_data(cls):
+        testing.db.execute(
+            cls.tables.foo.insert(),
+            dict(id=1, data={"k": "v"}, mdata={"k": "v"}),
+        )
+
+    def setup(self):
+        super(MutableValueTest, self).setup()
+        self.Session = sessionmaker(testing.db, query_cls=CachingQuery)
+        self.cache = SecondLevelCache(
+            CacheRegion(MemoryBackend()), session_factory=self.Session
+        )
+        self.cache.cache_class(self.classes.Foo)
+
+    def teardown(self):
+        self.cache.dispose()
+        super(MutableValueTest, self).teardown()
+
+    def test_in_place_change_not_shared(self):
+        Foo = self.classes.Foo
+
+        s1 = self.Session()
+        f1 = s1.query(Foo).get(1)
+        f1.data["k"] = "dirty-unflushed"
+
+        s2 = self.Session()
+        f2 = s2.query(Foo).get(1)
+        eq_(f2.data, {"k": "v"})
+        f2.data["k"] = "dirty-unflushed-2"
+
+        s3 = self.Session()
+        eq_(s3.query(Foo).get(1).data, {"k": "v"})
+
+        s1.close()
+        s2.close()
+        s3.close()
+
+    def test_mutable_restored(self):
+        Foo = self.classes.Foo
+
+        s1 = self.Session()
+        s1.query(Foo).get(1)
+        s1.close()
+
+        s2 = self.Session()
+        self.assert_sql_count(testing.db, lambda: s2.query(Foo).get(1), 0)
+        f2 = s2.query(Foo).get(1)
+        assert isinstance(f2.mdata, MutableDict)
+        assert f2 not in s2.dirty
+
+        f2.mdata["k"] = "v2"
+        assert f2 in s2.dirty
+        s2.commit()
+        s2.close()
+
+        eq_(
+            testing.db.scalar(select([self.tables.foo.c.mdata])),
+            {"k": "v2"},
+        )
@@ -1,9 +1,11 @@
 import datetime
 import os
+import threading
 
 from sqlalchemy import Column
 from sqlalchemy import DateTime
 from sqlalchemy import event
+from sqlalchemy import exc
 from sqlalchemy import Float
 from sqlalchemy import ForeignKey
 from sqlalchemy import inspect
@@ -25,6 +27,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import SingletonThreadPool
 from sqlalchemy.sql import operators
+from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import provision
@@ -39,6 +42,7 @@ class ShardTest(object):
     __requires__ = ("sqlite",)
 
     schema = None
+    max_workers = None
 
     def setUp(self):
         global db1, db2, db3, db4, weather_locations, weather_reports
@@ -136,6 +140,7 @@ class ShardTest(object):
             shard_chooser=shard_chooser,
             id_chooser=id_chooser,
             query_chooser=query_chooser,
+            max_workers=cls.max_workers,
         )
 
     @classmethod
@@ -407,6 +412,148 @@ class ShardTest(object):
         for t in temps:
             assert inspect(t).deleted is (t.temperature >= 80)
 
+    def test_order_by_merge(self):
+        sess = self._fixture_data()
+
+        eq_(
+            [loc.id for loc in sess.query(WeatherLocation).order_by(
+                WeatherLocation.id
+            )],
+            [1, 2, 3, 4, 5, 6, 7],
+        )
+        eq_(
+            [
+                (loc.continent, loc.id)
+                for loc in sess.query(WeatherLocation).order_by(
+                    WeatherLocation.continent.desc(), WeatherLocation.id
+                )
+            ],
+            [
+                ("South America", 6),
+                ("South America", 7),
+                ("North America", 2),
+                ("North America", 3),
+                ("Europe", 4),
+                ("Europe", 5),
+                ("Asia", 1),
+            ],
+        )
+        eq_(
+            sess.query(Report.temperature)
+            .order_by(Report.temperature.desc())
+            .all(),
+            [(85.0,), (80.0,), (75.0,)],
+        )
+
+    def test_order_by_merge_nulls(self):
+        sess = self._fixture_data()
+        beijing = WeatherLocation("Asia", "Beijing")
+        beijing.reports.append(Report(None))
+        sess.add(beijing)
+        sess.commit()
+
+        eq_(
+            [
+                t
+                for t, in sess.query(Report.temperature).order_by(
+                    Report.temperature
+                )
+            ],
+            [None, 75.0, 80.0, 85.0],
+        )
+        eq_(
+            [
+                t
+                for t, in sess.query(Report.temperature).order_by(
+                    Report.temperature.nullslast()
+                )
+            ],
+            [75.0, 80.0, 85.0, None],
+        )
+        eq_(
+            [
+                t
+                for t, in sess.query(Report.temperature).order_by(
+                    Report.temperature.desc().nullsfirst()
+                )
+            ],
+            [None, 85.0, 80.0, 75.0],
+        )
+
+    def test_limit_offset(self):
+        sess = self._fixture_data()
+
+        q = sess.query(WeatherLocation).order_by(WeatherLocation.id.desc())
+        eq_([loc.id for loc in q.limit(3)], [7, 6, 5])
+        eq_([loc.id for loc in q.offset(2).limit(3)], [5, 4, 3])
+        eq_([loc.id for loc in q.offset(5)], [2, 1])
+        eq_(q.first().id, 7)
+
+        # without ORDER BY, the LIMIT applies to the overall result
+        eq_(len(sess.query(WeatherLocation).limit(3).all()), 3)
+
+    def test_limit_pushed_to_shards(self):
+        sess = self._fixture_data()
+
+        # engines may be proxies for each other, so collect distinct
+        # executions
+        statements = {}
+
+        def before_cursor_execute(
+            conn, cursor, stmt, params, context, executemany
+        ):
+            statements[context] = params
+
+        for db in (db1, db2, db3, db4):
+            event.listen(db, "before_cursor_execute", before_cursor_execute)
+        try:
+            eq_(
+                [
+                    loc.id
+                    for loc in sess.query(WeatherLocation)
+                    .order_by(WeatherLocation.id)
+                    .offset(1)
+                    .limit(2)
+                ],
+                [2, 3],
+            )
+        finally:
+            for db in (db1, db2, db3, db4):
+                event.remove(
+                    db, "before_cursor_execute", before_cursor_execute
+                )
+
+        eq_(len(statements), 4)
+        for params in statements.values():
+            eq_(params[-2:], (3, 0))
+
+    def test_unresolvable_order_by(self):
+        sess = self._fixture_data()
+
+        # the ORDER BY can't be evaluated in Python; results are
+        # returned in shard order, LIMIT is applied per shard
+        eq_(
+            [
+                loc.id
+                for loc in sess.query(WeatherLocation)
+                .order_by(WeatherLocation.id % 7)
+                .limit(1)
+            ],
+            [2, 1, 4, 7],
+        )
+
+    def test_stream_results(self):
+        sess = self._fixture_data()
+
+        result = iter(
+            sess.query(WeatherLocation)
+            .order_by(WeatherLocation.id)
+            .yield_per(1)
+        )
+        eq_(next(result).id, 1)
+        eq_(next(result).id, 2)
+        eq_([loc.id for loc in result], [3, 4, 5, 6, 7])
+
 
 class DistinctEngineShardTest(ShardTest, fixtures.TestBase):
     def _init_dbs(self):
@@ -436,6 +583,62 @@ class DistinctEngineShardTest(ShardTest, fixtures.TestBase):
             os.remove("shard%d_%s.db" % (i, provision.FOLLOWER_IDENT))
 
 
+class ParallelShardTest(DistinctEngineShardTest):
+    max_workers = 4
+
+    def _init_dbs(self):
+        # the id generator relies upon db1 using the same connection
+        # as the Session within a single thread
+        self.dbs = [
+            testing_engine(
+                "sqlite:///shard%d_%s.db" % (i, provision.FOLLOWER_IDENT),
+                options=dict(
+                    connect_args={"check_same_thread": False},
+                    poolclass=SingletonThreadPool if i == 1 else None,
+                ),
+            )
+            for i in range(1, 5)
+        ]
+        return self.dbs
+
+    def test_shards_executed_in_threads(self):
+        sess = self._fixture_data()
+
+        threads = set()
+
+        def before_cursor_execute(
+            conn, cursor, stmt, params, context, executemany
+        ):
+            threads.add(threading.current_thread())
+
+        for db in self.dbs:
+            event.listen(db, "before_cursor_execute", before_cursor_execute)
+        try:
+            eq_(len(sess.query(WeatherLocation).all()), 7)
+            sess.query(Report).update(
+                {"temperature": Report.temperature + 1},
+                synchronize_session=False,
+            )
+        finally:
+            for db in self.dbs:
+                event.remove(
+                    db, "before_cursor_execute", before_cursor_execute
+                )
+
+        assert threading.current_thread() not in threads
+        assert len(threads) > 1
+
+    def test_error_in_shard(self):
+        sess = self._fixture_data()
+        sess.execute("DROP TABLE weather_reports", shard_id="europe")
+
+        assert_raises_message(
+            exc.OperationalError,
+            "no such table",
+            sess.query(Report).all,
+        )
+
+
 class AttachedFileShardTest(ShardTest, fixtures.TestBase):
     schema = "changeme"
 
@@ -5,7 +5,9 @@ from sqlalchemy import event
 from sqlalchemy import ForeignKey
 from sqlalchemy import func
 from sqlalchemy import Integer
+from sqlalchemy import JSON
 from sqlalchemy import String
+from sqlalchemy import testing
 from sqlalchemy import util
 from sqlalchemy.ext.mutable import MutableComposite
 from sqlalchemy.ext.mutable import MutableDict
@@ -23,6 +25,7 @@ from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import mock
+from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
 from sqlalchemy.testing.util import picklers
@@ -964,6 +967,199 @@ class MutableColumnCopyJSONTest(_MutableDictTestBase, fixtures.MappedTest):
         self._test_non_mutable()
 
 
+class _PartialUpdateDict(MutableDict):
+    json_partial_updates = True
+
+
+class _PartialUpdateList(MutableList):
+    json_partial_updates = True
+
+
+class MutableJSONPartialUpdateTest(fixtures.MappedTest):
+    __requires__ = ("json_type",)
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "foo",
+            metadata,
+            Column(
+                "id", Integer, primary_key=True, test_needs_autoincrement=True
+            ),
+            Column(
+                "data", _PartialUpdateDict.as_mutable(JSON(none_as_null=True))
+            ),
+            Column("items", _PartialUpdateList.as_mutable(JSON)),
+            Column("plain", MutableDict.as_mutable(JSON)),
+        )
+
+    @classmethod
+    def setup_mappers(cls):
+        mapper(Foo, cls.tables.foo)
+
+    def _fixture(self, data=None):
+        sess = Session()
+        sess.add(
+            Foo(
+                data=data if data is not None else {"a": 1, "b": "x"},
+                items=[1, 2],
+                plain={"a": 1},
+            )
+        )
+        sess.commit()
+        return sess, sess.query(Foo).one()
+
+    def _changes(self, f1):
+        return (
+            f1.data._sa_json_changes(f1),
+            f1.items._sa_json_changes(f1),
+        )
+
+    def test_changes_logged(self):
+        sess, f1 = self._fixture()
+        eq_(self._changes(f1), ([], []))
+
+        f1.data["a"] = 5
+        f1.data.update(d=6)
+        f1.data.setdefault("e", "x")
+        del f1.data["b"]
+        f1.items.append("x")
+        f1.items.extend([3])
+        eq_(
+            self._changes(f1),
+            (
+                [
+                    ("set", "a", 5),
+                    ("set", "d", 6),
+                    ("set", "e", "x"),
+                    ("delete", "b"),
+                ],
+                [("append", ["x", 3])],
+            ),
+        )
+
+        sess.flush()
+        f1.data["f"] = 7
+        f1.items.append(4)
+        eq_(self._changes(f1), ([("set", "f", 7)], [("append", [4])]))
+
+    def test_not_logged_by_default(self):
+        sess, f1 = self._fixture()
+
+        f1.plain["a"] = 5
+        eq_(f1.plain._sa_json_changes(f1), None)
+
+    def test_flush_expires_values(self):
+        sess, f1 = self._fixture()
+
+        f1.data["a"] = 5
+        f1.data.pop("b")
+        f1.items += [3, 4]
+        sess.flush()
+
+        assert "data" not in f1.__dict__
+        assert "items" not in f1.__dict__
+        eq_(f1.data, {"a": 5})
+        eq_(f1.items, [1, 2, 3, 4])
+
+        f1.data["b"] = None
+        f1.items.append(5)
+        sess.commit()
+        eq_(f1.data, {"a": 5, "b": None})
+        eq_(f1.items, [1, 2, 3, 4, 5])
+
+    def test_none_value_none_as_null(self):
+        sess, f1 = self._fixture()
+
+        f1.data["a"] = None
+        sess.commit()
+        eq_(f1.data, {"a": None, "b": "x"})
+
+    def test_nested_container_writes_full_value(self):
+        sess, f1 = self._fixture({"a": 1, "b": {"c": 2}})
+
+        f1.data["a"] = 5
+        f1.data["b"]["c"] = 3
+        eq_(f1.data._sa_json_changes(f1), None)
+
+        f1.items.append([3])
+        eq_(f1.items._sa_json_changes(f1), None)
+
+        sess.commit()
+        eq_(f1.data, {"a": 5, "b": {"c": 3}})
+        eq_(f1.items, [1, 2, [3]])
+
+    def test_new_value_not_logged(self):
+        sess, f1 = self._fixture()
+
+        f1.data = {"q": 1}
+        f1.data["r"] = 2
+        eq_(f1.data._sa_json_changes(f1), None)
+
+        sess.flush()
+        f1.data["s"] = 3
+        eq_(f1.data._sa_json_changes(f1), [("set", "s", 3)])
+
+        sess.commit()
+        eq_(f1.data, {"q": 1, "r": 2, "s": 3})
+
+    def test_flag_modified_discards_log(self):
+        sess, f1 = self._fixture()
+
+        f1.data["a"] = 5
+        attributes.flag_modified(f1, "data")
+        eq_(f1.data._sa_json_changes(f1), None)
+
+        sess.commit()
+        eq_(f1.data, {"a": 5, "b": "x"})
+
+    def test_list_change_discards_log(self):
+        sess, f1 = self._fixture()
+
+        f1.items.append(3)
+        f1.items.insert(0, 0)
+        eq_(f1.items._sa_json_changes(f1), None)
+
+        sess.commit()
+        eq_(f1.items, [0, 1, 2, 3])
+
+    def test_non_string_key(self):
+        sess, f1 = self._fixture()
+
+        f1.data[5] = "five"
+        eq_(f1.data._sa_json_changes(f1), None)
+
+    @testing.only_on("sqlite")
+    def test_update_statement(self):
+        sess, f1 = self._fixture()
+
+        f1.data["a"] = 5
+        del f1.data["b"]
+        f1.items.append(3)
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE foo SET data=json_remove(json_set(foo.data, "
+                ":json_set_1, json(:param_1)), :json_remove_1), "
+                "items=json_insert(foo.items, :json_insert_1, "
+                "json(:param_2)) WHERE foo.id = :foo_id",
+                [
+                    {
+                        "json_set_1": '$."a"',
+                        "param_1": 5,
+                        "json_remove_1": '$."b"',
+                        "json_insert_1": "$[#]",
+                        "param_2": 3,
+                        "foo_id": f1.id,
+                    }
+                ],
+            ),
+        )
+
+
 class MutableColumnCopyArrayTest(_MutableListTestBase, fixtures.MappedTest):
     __requires__ = ("array_type",)
 
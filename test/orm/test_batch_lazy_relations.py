@@ -0,0 +1,236 @@
+import pickle
+
+from sqlalchemy import inspect
+from sqlalchemy import testing
+from sqlalchemy.orm import batchload
+from sqlalchemy.orm import create_session
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import mapper
+from sqlalchemy.orm import relationship
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import is_
+from sqlalchemy.testing.assertsql import CompiledSQL
+from sqlalchemy.testing.util import gc_collect
+from test.orm import _fixtures
+
+
+class BatchLazyTest(_fixtures.FixtureTest):
+    run_inserts = "once"
+    run_deletes = None
+
+    def _user_address_fixture(self, lazy="batch", addresses_lazy="select"):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+
+        mapper(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    Address, lazy=lazy, order_by=addresses.c.id
+                )
+            },
+        )
+        mapper(
+            Address,
+            addresses,
+            properties={"user": relationship(User, lazy=addresses_lazy)},
+        )
+        return User, Address
+
+    def test_o2m(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        users = sess.query(User).order_by(User.id).all()
+
+        def go():
+            for u in users:
+                u.addresses
+
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL(
+                "SELECT addresses.user_id AS addresses_user_id, "
+                "addresses.id AS addresses_id, "
+                "addresses.email_address AS addresses_email_address "
+                "FROM addresses WHERE addresses.user_id IN "
+                "([EXPANDING_primary_keys]) "
+                "ORDER BY addresses.user_id, addresses.id",
+                [{"primary_keys": [7, 8, 9, 10]}],
+            ),
+        )
+        eq_(users, self.static.user_address_result)
+
+    def test_o2m_option(self):
+        User, Address = self._user_address_fixture(lazy="select")
+        sess = create_session()
+        users = (
+            sess.query(User)
+            .options(batchload(User.addresses))
+            .order_by(User.id)
+            .all()
+        )
+
+        def go():
+            eq_(users, self.static.user_address_result)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_m2o(self):
+        User, Address = self._user_address_fixture(
+            lazy="select", addresses_lazy="batch"
+        )
+        sess = create_session()
+        addresses = sess.query(Address).order_by(Address.id).all()
+
+        def go():
+            eq_([a.user.id for a in addresses], [7, 8, 8, 8, 9])
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_m2o_identity_map(self):
+        User, Address = self._user_address_fixture(
+            lazy="select", addresses_lazy="batch"
+        )
+        sess = create_session()
+        addresses = sess.query(Address).order_by(Address.id).all()
+        u8 = sess.query(User).get(8)
+
+        def go():
+            is_(addresses[1].user, u8)
+
+        self.assert_sql_count(testing.db, go, 0)
+
+        def go():
+            eq_([a.user.id for a in addresses], [7, 8, 8, 8, 9])
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_separate_queries(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        u7 = sess.query(User).get(7)
+        u8, u9 = sess.query(User).filter(User.id.in_([8, 9])).all()
+
+        self.assert_sql_count(testing.db, lambda: u7.addresses, 1)
+        assert "addresses" not in u8.__dict__
+
+        self.assert_sql_count(testing.db, lambda: u8.addresses, 1)
+        assert "addresses" in u9.__dict__
+
+    def test_existing_instances_join_group(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        u7 = sess.query(User).get(7)
+        users = sess.query(User).order_by(User.id).all()
+        is_(users[0], u7)
+
+        self.assert_sql_count(testing.db, lambda: users[1].addresses, 1)
+        assert "addresses" in u7.__dict__
+
+    def test_unreferenced_instances_not_loaded(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        users = sess.query(User).order_by(User.id).all()
+        u7, u9 = users[0], users[2]
+        del users
+        gc_collect()
+
+        self.assert_sql_execution(
+            testing.db,
+            lambda: u7.addresses,
+            CompiledSQL(
+                "SELECT addresses.user_id AS addresses_user_id, "
+                "addresses.id AS addresses_id, "
+                "addresses.email_address AS addresses_email_address "
+                "FROM addresses WHERE addresses.user_id IN "
+                "([EXPANDING_primary_keys]) "
+                "ORDER BY addresses.user_id, addresses.id",
+                [{"primary_keys": [7, 9]}],
+            ),
+        )
+        eq_([a.id for a in u9.addresses], [5])
+
+    def test_detached_instances_not_loaded(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        users = sess.query(User).order_by(User.id).all()
+        sess.expunge(users[1])
+
+        self.assert_sql_count(testing.db, lambda: users[0].addresses, 1)
+        assert "addresses" not in users[1].__dict__
+        assert "addresses" in users[2].__dict__
+
+    def test_loaded_values_not_overwritten(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        users = sess.query(User).order_by(User.id).all()
+
+        def go():
+            users[2].addresses = []
+
+        # the old collection is loaded for history, along with the others
+        self.assert_sql_count(testing.db, go, 1)
+
+        def go():
+            users[0].addresses.remove(users[0].addresses[0])
+            sess.query(User).all()
+
+        self.assert_sql_count(testing.db, go, 1)
+        eq_(users[0].addresses, [])
+        eq_(users[2].addresses, [])
+        eq_([a.id for a in users[1].addresses], [2, 3, 4])
+
+    def test_nested_options(self):
+        User, Address = self._user_address_fixture(lazy="select")
+        sess = create_session()
+        users = (
+            sess.query(User)
+            .options(batchload(User.addresses).joinedload(Address.user))
+            .order_by(User.id)
+            .all()
+        )
+
+        def go():
+            for u in users:
+                for a in u.addresses:
+                    is_(a.user, u)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_joinedload_from_batch(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        addresses = (
+            sess.query(Address)
+            .options(joinedload(Address.user))
+            .order_by(Address.id)
+            .all()
+        )
+
+        def go():
+            eq_(
+                [len(a.user.addresses) for a in addresses], [1, 3, 3, 3, 1]
+            )
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_pickled_loader(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        users = sess.query(User).order_by(User.id).all()
+
+        state = inspect(users[1])
+        loader = pickle.loads(pickle.dumps(state.callables["addresses"]))
+        eq_(loader.refs, [])
+        state.callables["addresses"] = loader
+
+        # without the other instances, loads singly
+        self.assert_sql_count(testing.db, lambda: users[1].addresses, 1)
+        eq_([a.id for a in users[1].addresses], [2, 3, 4])
+        assert "addresses" not in users[0].__dict__
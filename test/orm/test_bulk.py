@@ -1,10 +1,13 @@
+from sqlalchemy import exc as sa_exc
 from sqlalchemy import FetchedValue
 from sqlalchemy import ForeignKey
+from sqlalchemy import inspect
 from sqlalchemy import Integer
 from sqlalchemy import String
 from sqlalchemy import testing
 from sqlalchemy.orm import mapper
 from sqlalchemy.orm import Session
+from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import mock
@@ -790,3 +793,183 @@ class BulkInheritanceTest(BulkTest, fixtures.MappedTest):
                 ],
             ),
         )
+
+    @testing.requires.native_upsert
+    def test_bulk_merge_joined_inh(self):
+        Person, Engineer, Manager, Boss = self.classes(
+            "Person", "Engineer", "Manager", "Boss"
+        )
+
+        s = Session()
+        s.add(Boss(person_id=1, name="b1", status="s1", golf_swing="g1"))
+        s.commit()
+
+        s.bulk_merge_mappings(
+            Boss,
+            [
+                dict(
+                    person_id=1, boss_id=1, name="b1new", golf_swing="g1new"
+                ),
+                dict(
+                    person_id=2,
+                    boss_id=2,
+                    name="b2",
+                    type="boss",
+                    status="s2",
+                    golf_swing="g2",
+                ),
+            ],
+        )
+        s.commit()
+
+        eq_(
+            s.query(Boss).order_by(Boss.person_id).all(),
+            [
+                Boss(
+                    person_id=1, name="b1new", status="s1", golf_swing="g1new"
+                ),
+                Boss(person_id=2, name="b2", status="s2", golf_swing="g2"),
+            ],
+        )
+
+
+class BulkMergeTest(BulkTest, _fixtures.FixtureTest):
+    __requires__ = ("native_upsert",)
+    __backend__ = True
+
+    @classmethod
+    def setup_mappers(cls):
+        User, Order = cls.classes("User", "Order")
+        u, o = cls.tables("users", "orders")
+
+        mapper(User, u)
+        mapper(Order, o)
+
+    def _insert_users(self):
+        User, = self.classes("User")
+
+        s = Session()
+        s.add_all([User(id=1, name="u1"), User(id=2, name="u2")])
+        s.commit()
+
+    def test_bulk_merge(self):
+        User, = self.classes("User")
+        self._insert_users()
+
+        s = Session()
+        s.bulk_merge_mappings(
+            User,
+            [
+                {"id": 1, "name": "u1new"},
+                {"id": 3, "name": "u3"},
+                {"id": 2, "name": "u2new"},
+            ],
+        )
+        s.commit()
+
+        eq_(
+            s.query(User.id, User.name).order_by(User.id).all(),
+            [(1, "u1new"), (2, "u2new"), (3, "u3")],
+        )
+
+    def test_bulk_merge_batches_by_keys(self):
+        Order, = self.classes("Order")
+
+        s = Session()
+        s.add(Order(id=1, description="o1", isopen=1))
+        s.commit()
+
+        def go():
+            s.bulk_merge_mappings(
+                Order,
+                [
+                    {"id": 1, "description": "o1new"},
+                    {"id": 2, "description": "o2", "isopen": 1},
+                    {"id": 3, "description": "o3"},
+                    {"id": 4, "description": "o4", "isopen": 0},
+                ],
+            )
+
+        self.assert_sql_count(testing.db, go, 2)
+        s.commit()
+
+        eq_(
+            s.query(Order.id, Order.description, Order.isopen)
+            .order_by(Order.id)
+            .all(),
+            [(1, "o1new", 1), (2, "o2", 1), (3, "o3", None), (4, "o4", 0)],
+        )
+
+    def test_bulk_merge_renders_nulls(self):
+        Order, = self.classes("Order")
+
+        s = Session()
+        s.add(Order(id=1, description="o1"))
+        s.commit()
+
+        s.bulk_merge_mappings(Order, [{"id": 1, "description": None}])
+        s.commit()
+
+        eq_(s.query(Order.description).scalar(), None)
+
+    def test_bulk_merge_primary_key_only(self):
+        Order, = self.classes("Order")
+
+        s = Session()
+        s.add(Order(id=1, description="o1"))
+        s.commit()
+
+        s.bulk_merge_mappings(Order, [{"id": 1}, {"id": 2}])
+        s.commit()
+
+        eq_(
+            s.query(Order.id, Order.description).order_by(Order.id).all(),
+            [(1, "o1"), (2, None)],
+        )
+
+    def test_bulk_merge_requires_primary_key(self):
+        User, = self.classes("User")
+
+        s = Session()
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "Primary key values for table 'users' are required",
+            s.bulk_merge_mappings,
+            User,
+            [{"id": 1, "name": "u1"}, {"name": "u2"}],
+        )
+
+    def test_bulk_merge_identity_map_untouched(self):
+        User, = self.classes("User")
+        self._insert_users()
+
+        s = Session()
+        u1 = s.query(User).get(1)
+        s.bulk_merge_mappings(User, [{"id": 1, "name": "u1new"}])
+        eq_(u1.__dict__["name"], "u1")
+
+    def test_bulk_merge_refresh(self):
+        User, = self.classes("User")
+        self._insert_users()
+
+        s = Session()
+        u1, u2 = s.query(User).order_by(User.id).all()
+        u2.name = "u2pending"
+
+        s.bulk_merge_mappings(
+            User,
+            [{"id": 1, "name": "u1new"}, {"id": 2, "name": "u2new"}],
+            refresh=True,
+        )
+
+        eq_(u1.__dict__["name"], "u1new")
+        assert "name" not in inspect(u1).committed_state
+        assert u1 not in s.dirty
+
+        # pending changes are retained, and flushed
+        eq_(u2.name, "u2pending")
+        s.commit()
+        eq_(
+            s.query(User.id, User.name).order_by(User.id).all(),
+            [(1, "u1new"), (2, "u2pending")],
+        )
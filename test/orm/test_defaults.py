@@ -229,7 +229,16 @@ class ComputedDefaultsOnUpdateTest(fixtures.MappedTest):
             eq_(t1.bar, 5 + 42)
             eq_(t2.bar, 10 + 42)
 
-        if eager and testing.db.dialect.implicit_returning:
+        if eager and testing.db.dialect.insert_executemany_returning:
+            asserter.assert_(
+                CompiledSQL(
+                    "INSERT INTO test (id, foo) VALUES (%(id)s, %(foo)s) "
+                    "RETURNING test.id, test.bar",
+                    [{"foo": 5, "id": 1}, {"foo": 10, "id": 2}],
+                    dialect="postgresql",
+                )
+            )
+        elif eager and testing.db.dialect.implicit_returning:
             asserter.assert_(
                 CompiledSQL(
                     "INSERT INTO test (id, foo) VALUES (%(id)s, %(foo)s) "
@@ -1,5 +1,7 @@
 from sqlalchemy import exc
 from sqlalchemy import select
+from sqlalchemy import testing
+from sqlalchemy.engine.stats import StatementStats
 from sqlalchemy.orm import aliased
 from sqlalchemy.orm import loading
 from sqlalchemy.orm import Session
@@ -52,6 +54,21 @@ class InstancesTest(_fixtures.FixtureTest):
             q.from_statement(stmt).all,
         )
 
+    def test_statement_stats(self):
+        User = self.classes.User
+
+        eng = testing.db.execution_options()
+        eng.statement_stats = StatementStats()
+        s = Session(eng)
+
+        eq_(len(s.query(User).all()), 4)
+        eq_(len(s.query(User).yield_per(1).all()), 4)
+
+        (entry,) = eng.statement_stats.entries()
+        eq_(entry.executions, 2)
+        eq_(entry.rows, 8)
+        eq_(entry.hydrate.count, 2)
+
 
 class MergeResultTest(_fixtures.FixtureTest):
     run_setup_mappers = "once"
@@ -2,6 +2,7 @@
 
 import logging
 import logging.handlers
+import pickle
 
 import sqlalchemy as sa
 from sqlalchemy import ForeignKey
@@ -27,6 +28,7 @@ from sqlalchemy.orm import mapper
 from sqlalchemy.orm import reconstructor
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import Session
+from sqlalchemy.orm import state as statelib
 from sqlalchemy.orm import synonym
 from sqlalchemy.orm.persistence import _sort_states
 from sqlalchemy.testing import assert_raises
@@ -35,6 +37,7 @@ from sqlalchemy.testing import AssertsCompiledSQL
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import pickleable
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
@@ -3850,3 +3853,126 @@ class MagicNamesTest(fixtures.MappedTest):
                 maps,
                 properties={reserved: maps.c.state},
             )
+
+
+class CompactStateTest(_fixtures.FixtureTest):
+    run_inserts = "once"
+    run_deletes = None
+
+    def _fixture(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users, compact_state=True)
+        return User
+
+    def test_state_class(self):
+        User = self._fixture()
+
+        u1 = User()
+        state = attributes.instance_state(u1)
+        is_(state.__class__, statelib.CompactInstanceState)
+        is_(state.committed_state, statelib._EMPTY_COMMITTED_STATE)
+        is_(state.expired_attributes, util.EMPTY_SET)
+
+        u1.name = "u1"
+        eq_(state.committed_state, {"name": attributes.NO_VALUE})
+        is_(
+            attributes.instance_state(User()).committed_state,
+            statelib._EMPTY_COMMITTED_STATE,
+        )
+
+    def test_unmodified_load_shares_collections(self):
+        User = self._fixture()
+
+        sess = Session()
+        users = sess.query(User).order_by(User.id).all()
+        eq_(len(users), 4)
+        for u in users:
+            state = attributes.instance_state(u)
+            is_(state.committed_state, statelib._EMPTY_COMMITTED_STATE)
+            is_(state.expired_attributes, util.EMPTY_SET)
+            is_(state.persistent, True)
+            eq_(state.key, (User, (u.id,), None))
+
+    def test_modify_and_rollback(self):
+        User = self._fixture()
+
+        sess = Session()
+        u1 = sess.query(User).get(7)
+        u1.name = "jack2"
+        state = attributes.instance_state(u1)
+        eq_(state.committed_state, {"name": "jack"})
+        eq_(
+            attributes.get_history(u1, "name"), (["jack2"], (), ["jack"])
+        )
+        assert u1 in sess.dirty
+        sess.flush()
+        eq_(state.committed_state, {})
+
+        sess.rollback()
+        eq_(u1.name, "jack")
+
+    def test_expire(self):
+        User = self._fixture()
+
+        sess = Session()
+        u1 = sess.query(User).get(7)
+        sess.expire(u1, ["name"])
+        eq_(
+            attributes.instance_state(u1).expired_attributes, set(["name"])
+        )
+        eq_(u1.name, "jack")
+        eq_(attributes.instance_state(u1).expired_attributes, set())
+
+        sess.expire_all()
+        assert "name" not in u1.__dict__
+        eq_(u1.name, "jack")
+
+    def test_deferred(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(
+            User,
+            users,
+            properties={"name": deferred(users.c.name)},
+            compact_state=True,
+        )
+
+        sess = Session()
+        u1 = sess.query(User).get(8)
+        assert "name" not in u1.__dict__
+        eq_(u1.name, "ed")
+
+    def test_make_transient(self):
+        User = self._fixture()
+
+        sess = Session()
+        u1 = sess.query(User).get(7)
+        sa.orm.make_transient(u1)
+        state = attributes.instance_state(u1)
+        is_(state.key, None)
+        is_(state.transient, True)
+
+    def test_pickle(self):
+        users = self.tables.users
+
+        mapper(pickleable.User, users, compact_state=True)
+
+        sess = Session()
+        u1 = sess.query(pickleable.User).get(7)
+        u2 = sess.query(pickleable.User).get(8)
+        u1.name = "jack2"
+        sess.expire(u2, ["name"])
+
+        u1, u2 = pickle.loads(pickle.dumps([u1, u2]))
+        s1, s2 = attributes.instance_state(u1), attributes.instance_state(u2)
+        is_(s1.__class__, statelib.CompactInstanceState)
+        eq_(s1.key, (pickleable.User, (7,), None))
+        eq_(s1.committed_state, {"name": "jack"})
+        is_(s1.modified, True)
+        is_(s1.expired_attributes, util.EMPTY_SET)
+        eq_(s2.expired_attributes, set(["name"]))
+
+        sess2 = Session()
+        sess2.add(u2)
+        eq_(u2.name, "ed")
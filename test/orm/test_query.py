@@ -17,6 +17,7 @@ from sqlalchemy import func
 from sqlalchemy import insert
 from sqlalchemy import inspect
 from sqlalchemy import Integer
+from sqlalchemy import lambda_stmt
 from sqlalchemy import literal
 from sqlalchemy import literal_column
 from sqlalchemy import MetaData
@@ -4053,6 +4054,65 @@ class YieldTest(_fixtures.FixtureTest):
 
         self.assert_sql_count(testing.db, go, 1)
 
+    def test_partitions(self):
+        self._eagerload_mappings()
+
+        User = self.classes.User
+        sess = create_session()
+
+        partitions = sess.query(User).order_by(User.id).partitions(3)
+
+        eq_(len(sess.identity_map), 0)
+        eq_([u.id for u in next(partitions)], [7, 8, 9])
+        eq_([u.id for u in next(partitions)], [10])
+        assert_raises(StopIteration, next, partitions)
+
+    def test_partitions_from_yield_per(self):
+        self._eagerload_mappings()
+
+        User = self.classes.User
+        sess = create_session()
+
+        q = sess.query(User.id).order_by(User.id).yield_per(2)
+        eq_(
+            [[row.id for row in p] for p in q.partitions()],
+            [[7, 8], [9, 10]],
+        )
+
+    def test_partitions_no_size(self):
+        self._eagerload_mappings()
+
+        User = self.classes.User
+        sess = create_session()
+
+        assert_raises_message(
+            sa_exc.ArgumentError,
+            "A partition size must be passed to Query.partitions\\(\\) "
+            "when Query.yield_per\\(\\) is not in effect",
+            sess.query(User).partitions,
+        )
+
+    def test_partitions_selectinload(self):
+        self._eagerload_mappings(addresses_lazy="selectin")
+
+        User = self.classes.User
+        sess = create_session()
+
+        q = sess.query(User).order_by(User.id)
+
+        def go():
+            eq_(
+                [
+                    [(u.id, len(u.addresses)) for u in partition]
+                    for partition in q.partitions(2)
+                ],
+                [[(7, 1), (8, 3)], [(9, 1), (10, 0)]],
+            )
+
+        # one SELECT for the users, and an IN load of addresses
+        # for each partition
+        self.assert_sql_count(testing.db, go, 3)
+
 
 class HintsTest(QueryTest, AssertsCompiledSQL):
     __dialect__ = "default"
@@ -4217,6 +4277,25 @@ class TextTest(QueryTest, AssertsCompiledSQL):
             [User(id=7), User(id=8), User(id=9), User(id=10)],
         )
 
+    def test_via_lambda_stmt(self):
+        User = self.classes.User
+        users = self.tables.users
+        s = create_session()
+
+        def go(name):
+            return (
+                s.query(User)
+                .from_statement(
+                    lambda_stmt(
+                        lambda: select([users]).where(users.c.name == name)
+                    )
+                )
+                .all()
+            )
+
+        eq_(go("jack"), [User(id=7)])
+        eq_(go("ed"), [User(id=8)])
+
     def test_via_textasfrom_from_statement(self):
         User = self.classes.User
         s = create_session()
@@ -5737,3 +5816,162 @@ class QueryClsTest(QueryTest):
 
     def test_fn_m2o_lazyload(self):
         self._test_m2o_lazyload(self._fn_fixture)
+
+
+class SeekTest(QueryTest, AssertsCompiledSQL):
+    __dialect__ = "default"
+
+    def _assert_pages(self, q, page_size=2):
+        expected = q.seek().all()
+        result = []
+        token = None
+        while True:
+            rows = q.seek(token).limit(page_size).all()
+            if not rows:
+                break
+            result.extend(rows)
+            token = q.seek_token(rows[-1])
+        eq_(result, expected)
+        return result
+
+    def test_single_entity(self):
+        Address = self.classes.Address
+        sess = create_session()
+        result = self._assert_pages(
+            sess.query(Address).order_by(Address.email_address.desc())
+        )
+        eq_(
+            [a.email_address for a in result],
+            [
+                "jack@bean.com",
+                "fred@fred.com",
+                "ed@wood.com",
+                "ed@lala.com",
+                "ed@bettyboop.com",
+            ],
+        )
+
+    def test_column_entities(self):
+        User = self.classes.User
+        sess = create_session()
+        result = self._assert_pages(
+            sess.query(User.name, User.id).order_by(User.name)
+        )
+        eq_(
+            result,
+            [("chuck", 10), ("ed", 8), ("fred", 9), ("jack", 7)],
+        )
+
+    def test_multiple_entities(self):
+        User, Address = self.classes.User, self.classes.Address
+        sess = create_session()
+        result = self._assert_pages(
+            sess.query(User, Address)
+            .join(User.addresses)
+            .order_by(User.name.desc(), Address.id)
+        )
+        eq_(
+            [(u.id, a.id) for u, a in result],
+            [(7, 1), (9, 5), (8, 2), (8, 3), (8, 4)],
+        )
+
+    def test_aliased_entity(self):
+        User = self.classes.User
+        ua = aliased(User)
+        sess = create_session()
+        result = self._assert_pages(
+            sess.query(ua).order_by(ua.name.desc()), page_size=3
+        )
+        eq_([u.id for u in result], [7, 9, 8, 10])
+
+    def test_joinedload_limit(self):
+        User = self.classes.User
+        sess = create_session()
+        q = (
+            sess.query(User)
+            .options(joinedload(User.addresses))
+            .order_by(User.name.desc())
+        )
+        result = self._assert_pages(q, page_size=1)
+        eq_(
+            [(u.id, [a.id for a in u.addresses]) for u in result],
+            [(7, [1]), (9, [5]), (8, [2, 3, 4]), (10, [])],
+        )
+
+    def test_compile(self):
+        User = self.classes.User
+        q = create_session().query(User.id).order_by(User.name)
+        token = q._keyset_ordering().token(["ed", 8])
+        self.assert_compile(
+            q.seek(token),
+            "SELECT users.id AS users_id FROM users "
+            "WHERE users.name >= :name_1 AND (users.name > :name_2 "
+            "OR users.name = :name_3 AND users.id > :id_1) "
+            "ORDER BY users.name, users.id",
+            checkparams={
+                "name_1": "ed",
+                "name_2": "ed",
+                "name_3": "ed",
+                "id_1": 8,
+            },
+        )
+
+    def test_nullable_requires_nulls_ordering(self):
+        Address = self.classes.Address
+        q = create_session().query(Address).order_by(Address.user_id)
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "ORDER BY expression addresses.user_id may be NULL",
+            q.seek,
+        )
+
+    def test_no_unique_key(self):
+        User, Address = self.classes.User, self.classes.Address
+        q = (
+            create_session()
+            .query(User.name, Address.email_address)
+            .join(User.addresses)
+            .order_by(User.name)
+        )
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "Can't determine a unique key",
+            q.seek,
+        )
+
+    def test_seek_token_requires_columns(self):
+        User, Address = self.classes.User, self.classes.Address
+        q = (
+            create_session()
+            .query(User)
+            .join(User.addresses)
+            .order_by(Address.email_address, User.id)
+        )
+        user = q.seek().first()
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "ORDER BY expression addresses.email_address is not present "
+            "in the rows of this Query",
+            q.seek_token,
+            user,
+        )
+
+    def test_seek_after_limit(self):
+        User = self.classes.User
+        q = create_session().query(User).order_by(User.name).limit(2)
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            r"Query.seek\(\) being called on a Query which already has "
+            "LIMIT or OFFSET applied",
+            q.seek,
+        )
+
+    def test_bad_token(self):
+        User = self.classes.User
+        q = create_session().query(User).order_by(User.name)
+        assert_raises_message(
+            sa_exc.ArgumentError,
+            "Invalid keyset pagination token",
+            q.seek,
+            "abc",
+        )
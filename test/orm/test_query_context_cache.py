@@ -0,0 +1,189 @@
+from sqlalchemy import bindparam
+from sqlalchemy import event
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import mapper
+from sqlalchemy.orm import Query
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import subqueryload
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import mock
+from test.orm import _fixtures
+
+
+class QueryContextCacheTest(_fixtures.FixtureTest):
+    run_inserts = "once"
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        User, Address = cls.classes.User, cls.classes.Address
+        users, addresses = cls.tables.users, cls.tables.addresses
+
+        mapper(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    Address, order_by=addresses.c.id, backref="user"
+                )
+            },
+        )
+        mapper(Address, addresses)
+
+    def _compile_counter(self):
+        canary = mock.Mock()
+        real_compile_context = Query._compile_context
+
+        def _compile_context(*arg, **kw):
+            canary()
+            return real_compile_context(*arg, **kw)
+
+        return (
+            canary,
+            mock.patch.object(Query, "_compile_context", _compile_context),
+        )
+
+    def _run(self, fn, values, compiles, session=None):
+        canary, patch = self._compile_counter()
+        sess = session or Session()
+        results = []
+        with patch:
+            for value in values:
+                results.append(fn(sess, value))
+        eq_(canary.call_count, compiles)
+        return results
+
+    def test_bound_values(self):
+        User = self.classes.User
+
+        results = self._run(
+            lambda sess, id_: [
+                u.id
+                for u in sess.query(User)
+                .filter(User.id > id_)
+                .order_by(User.id)
+            ],
+            [7, 8, 9, 8],
+            1,
+        )
+        eq_(results, [[8, 9, 10], [9, 10], [10], [9, 10]])
+
+    def test_named_bound_values(self):
+        User = self.classes.User
+
+        results = self._run(
+            lambda sess, name: [
+                u.id
+                for u in sess.query(User)
+                .filter(User.name == bindparam("name"))
+                .params(name=name)
+            ],
+            ["jack", "ed", "fred"],
+            1,
+        )
+        eq_(results, [[7], [8], [9]])
+
+    def test_joinedload(self):
+        User = self.classes.User
+
+        results = self._run(
+            lambda sess, id_: [
+                (u.id, [a.id for a in u.addresses])
+                for u in sess.query(User)
+                .options(joinedload(User.addresses))
+                .filter(User.id == id_)
+            ],
+            [7, 8, 9],
+            1,
+        )
+        eq_(results, [[(7, [1])], [(8, [2, 3, 4])], [(9, [5])]])
+
+    def test_column_entities(self):
+        User = self.classes.User
+
+        results = self._run(
+            lambda sess, id_: sess.query(User.id, User.name + "x")
+            .filter(User.id == id_)
+            .all(),
+            [7, 8],
+            1,
+        )
+        eq_(results, [[(7, "jackx")], [(8, "edx")]])
+
+    def test_different_structure(self):
+        User = self.classes.User
+
+        results = self._run(
+            lambda sess, limit: [
+                u.id for u in sess.query(User).order_by(User.id).limit(limit)
+            ],
+            [1, 2, 1],
+            2,
+        )
+        eq_(results, [[7], [7, 8], [7]])
+
+    def test_subqueryload_not_cached(self):
+        User = self.classes.User
+
+        self._run(
+            lambda sess, id_: sess.query(User)
+            .options(subqueryload(User.addresses))
+            .filter(User.id == id_)
+            .all(),
+            [7, 8],
+            # the subquery eager loader compiles its own queries each time
+            6,
+        )
+
+    def test_aliased_filter_not_cached(self):
+        User = self.classes.User
+
+        self._run(
+            lambda sess, id_: sess.query(User)
+            .join("addresses", aliased=True)
+            .filter_by(id=id_)
+            .all(),
+            [1, 2],
+            2,
+        )
+
+    def test_aliased_entity(self):
+        User = self.classes.User
+        ua = aliased(User)
+
+        results = self._run(
+            lambda sess, id_: [
+                u.id for u in sess.query(ua).filter(ua.id == id_)
+            ],
+            [7, 8],
+            1,
+        )
+        eq_(results, [[7], [8]])
+
+    def test_before_compile_not_cached(self):
+        User = self.classes.User
+
+        @event.listens_for(Query, "before_compile", retval=True)
+        def before_compile(query):
+            return query
+
+        try:
+            self._run(
+                lambda sess, id_: sess.query(User).filter_by(id=id_).all(),
+                [7, 8],
+                2,
+            )
+        finally:
+            event.remove(Query, "before_compile", before_compile)
+
+    def test_disabled_with_enable_baked_queries(self):
+        User = self.classes.User
+
+        self._run(
+            lambda sess, id_: sess.query(User).filter_by(id=id_).all(),
+            [7, 8],
+            2,
+            session=Session(enable_baked_queries=False),
+        )
@@ -1779,6 +1779,7 @@ class SessionInterface(fixtures.TestBase):
             - set(
                 [
                     "bulk_update_mappings",
+                    "bulk_merge_mappings",
                     "bulk_insert_mappings",
                     "bulk_save_objects",
                 ]
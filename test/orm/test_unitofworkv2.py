@@ -8,6 +8,7 @@ from sqlalchemy import Integer
 from sqlalchemy import JSON
 from sqlalchemy import literal
 from sqlalchemy import select
+from sqlalchemy import Sequence
 from sqlalchemy import String
 from sqlalchemy import testing
 from sqlalchemy import text
@@ -25,6 +26,7 @@ from sqlalchemy.testing import config
 from sqlalchemy.testing import engines
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
 from sqlalchemy.testing.assertsql import AllOf
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.mock import Mock
@@ -738,6 +740,87 @@ class RudimentaryFlushTest(UOWTest):
         u1.addresses
         self._assert_uow_size(sess, 6)
 
+    def test_independent_mappers_not_sorted(self):
+        users, User, keywords, Keyword = (
+            self.tables.users,
+            self.classes.User,
+            self.tables.keywords,
+            self.classes.Keyword,
+        )
+
+        mapper(User, users)
+        mapper(Keyword, keywords)
+        sess = create_session()
+        u1 = User(name="u1")
+        k1 = Keyword(name="k1")
+        sess.add_all([u1, k1])
+        sess.flush()
+
+        sess.delete(u1)
+        sess.add_all([User(name="u2"), Keyword(name="k2")])
+
+        uow = self._get_test_uow(sess)
+        uow._generate_actions()
+        is_(uow.independent_mappers, True)
+
+        with patch.object(unitofwork, "topological", Mock(spec=[])):
+            self.assert_sql_execution(
+                testing.db,
+                sess.flush,
+                AllOf(
+                    CompiledSQL(
+                        "INSERT INTO users (name) VALUES (:name)",
+                        {"name": "u2"},
+                    ),
+                    CompiledSQL(
+                        "INSERT INTO keywords (name) VALUES (:name)",
+                        {"name": "k2"},
+                    ),
+                ),
+                CompiledSQL(
+                    "DELETE FROM users WHERE users.id = :id",
+                    lambda ctx: {"id": u1.id},
+                ),
+            )
+
+    def test_independent_mappers_rowswitch(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+        sess = create_session()
+        u1 = User(id=1, name="u1")
+        sess.add(u1)
+        sess.flush()
+
+        sess.delete(u1)
+        sess.add(User(id=1, name="u2"))
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE users SET name=:name WHERE users.id = :users_id",
+                {"users_id": 1, "name": "u2"},
+            ),
+        )
+
+    def test_dependent_mappers_not_independent(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+
+        mapper(User, users, properties={"addresses": relationship(Address)})
+        mapper(Address, addresses)
+        sess = create_session()
+        sess.add(User(name="u1", addresses=[Address(email_address="a1")]))
+
+        uow = self._get_test_uow(sess)
+        uow._generate_actions()
+        is_(uow.independent_mappers, False)
+
 
 class SingleCycleTest(UOWTest):
     def teardown(self):
@@ -2148,6 +2231,13 @@ class EagerDefaultsTest(fixtures.MappedTest):
             Column("bar", Integer, server_onupdate=FetchedValue()),
         )
 
+        Table(
+            "test3",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("foo", Integer, Sequence("test3_foo_seq")),
+        )
+
     @classmethod
     def setup_classes(cls):
         class Thing(cls.Basic):
@@ -2156,6 +2246,9 @@ class EagerDefaultsTest(fixtures.MappedTest):
         class Thing2(cls.Basic):
             pass
 
+        class Thing3(cls.Basic):
+            pass
+
     @classmethod
     def setup_mappers(cls):
         Thing = cls.classes.Thing
@@ -2166,6 +2259,10 @@ class EagerDefaultsTest(fixtures.MappedTest):
 
         mapper(Thing2, cls.tables.test2, eager_defaults=True)
 
+        Thing3 = cls.classes.Thing3
+
+        mapper(Thing3, cls.tables.test3, eager_defaults=True)
+
     def test_insert_defaults_present(self):
         Thing = self.classes.Thing
         s = Session()
@@ -2248,6 +2345,42 @@ class EagerDefaultsTest(fixtures.MappedTest):
 
         self.assert_sql_count(testing.db, go, 0)
 
+    @testing.requires.insert_executemany_returning
+    @testing.requires.sequences
+    def test_insert_defaults_matched_by_pk(self):
+        """test rows returned by a batched INSERT are matched to objects
+        by primary key, not by position."""
+
+        Thing3 = self.classes.Thing3
+        test3 = self.tables.test3
+        s = Session()
+
+        things = [Thing3(id=i) for i in (5, 3, 1, 4, 2)]
+        s.add_all(things)
+
+        execution_ctx_cls = testing.db.dialect.execution_ctx_cls
+        setup_crud_result_proxy = execution_ctx_cls._setup_crud_result_proxy
+
+        def reverse_returned_rows(context):
+            result = setup_crud_result_proxy(context)
+            if context._returned_defaults_rows:
+                context._returned_defaults_rows.reverse()
+            return result
+
+        with patch.object(
+            execution_ctx_cls,
+            "_setup_crud_result_proxy",
+            reverse_returned_rows,
+        ):
+            s.flush()
+
+        eq_(
+            sorted((t.id, t.foo) for t in things),
+            s.execute(
+                select([test3.c.id, test3.c.foo]).order_by(test3.c.id)
+            ).fetchall(),
+        )
+
     def test_insert_defaults_nonpresent(self):
         Thing = self.classes.Thing
         s = Session()
@@ -2256,7 +2389,18 @@ class EagerDefaultsTest(fixtures.MappedTest):
 
         s.add_all([t1, t2])
 
-        if testing.db.dialect.implicit_returning:
+        if testing.db.dialect.insert_executemany_returning:
+            self.assert_sql_execution(
+                testing.db,
+                s.commit,
+                CompiledSQL(
+                    "INSERT INTO test (id) VALUES (%(id)s) "
+                    "RETURNING test.id, test.foo",
+                    [{"id": 1}, {"id": 2}],
+                    dialect="postgresql",
+                ),
+            )
+        elif testing.db.dialect.implicit_returning:
             self.assert_sql_execution(
                 testing.db,
                 s.commit,
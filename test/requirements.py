@@ -477,6 +477,13 @@ class DefaultRequirements(SuiteRequirements):
     def indexes_with_expressions(self):
         return only_on(["postgresql", "sqlite>=3.9.0"])
 
+    @property
+    def native_upsert(self):
+        """target dialect supports an INSERT..ON CONFLICT style upsert,
+        as used by Session.bulk_merge_mappings()"""
+
+        return only_on(["postgresql>=9.5", "mysql", "sqlite>=3.24.0"])
+
     @property
     def temp_table_names(self):
         """target dialect supports listing of temporary table names"""
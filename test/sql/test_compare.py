@@ -0,0 +1,196 @@
+from sqlalchemy import and_
+from sqlalchemy import bindparam
+from sqlalchemy import case
+from sqlalchemy import cast
+from sqlalchemy import Column
+from sqlalchemy import column
+from sqlalchemy import exists
+from sqlalchemy import func
+from sqlalchemy import Integer
+from sqlalchemy import literal_column
+from sqlalchemy import MetaData
+from sqlalchemy import or_
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import table
+from sqlalchemy import text
+from sqlalchemy import tuple_
+from sqlalchemy import union
+from sqlalchemy.sql import ColumnElement
+from sqlalchemy.sql.elements import Null
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_not_
+from sqlalchemy.testing import ne_
+
+
+meta = MetaData()
+
+table_a = Table(
+    "a", meta, Column("a", Integer, primary_key=True), Column("b", String)
+)
+
+table_b = Table(
+    "b", meta, Column("a", Integer, primary_key=True), Column("b", String)
+)
+
+table_c = table("c", column("x"), column("y"))
+
+
+class CacheKeyTest(fixtures.TestBase):
+    _fixtures = [
+        lambda: (
+            table_a.c.a,
+            table_b.c.a,
+            table_a.c.b,
+            table_c.c.x,
+            column("a"),
+            column("a", Integer),
+        ),
+        lambda: (
+            table_a.c.a == 5,
+            table_a.c.a == table_b.c.a,
+            table_a.c.a > 5,
+            table_a.c.a.in_([5, 6]),
+            table_a.c.a.in_([5, 6, 7]),
+            table_a.c.a.in_(bindparam("x", expanding=True)),
+            table_a.c.b.like("x"),
+            table_a.c.b.like("x", escape="\\"),
+        ),
+        lambda: (
+            and_(table_a.c.a == 5, table_a.c.b == "x"),
+            or_(table_a.c.a == 5, table_a.c.b == "x"),
+            tuple_(table_a.c.a, table_a.c.b),
+            case([(table_a.c.a == 5, "x")], else_="y"),
+            cast(table_a.c.a, String),
+            cast(table_a.c.a, String(20)),
+        ),
+        lambda: (
+            func.count(table_a.c.a),
+            func.max(table_a.c.a),
+            func.count(table_a.c.a).over(order_by=table_a.c.b),
+            func.count(table_a.c.a).filter(table_a.c.b == "x"),
+        ),
+        lambda: (
+            select([table_a.c.a]),
+            select([table_a.c.a, table_a.c.b]),
+            select([table_a.c.a]).where(table_a.c.b == "x"),
+            select([table_a.c.a]).order_by(table_a.c.b),
+            select([table_a.c.a]).group_by(table_a.c.b),
+            select([table_a.c.a]).limit(5),
+            select([table_a.c.a]).limit(6),
+            select([table_a.c.a]).distinct(),
+            select([table_a.c.a]).apply_labels(),
+            select([table_a.c.a]).with_for_update(),
+            select([table_a.c.a]).select_from(
+                table_a.join(table_b, table_a.c.a == table_b.c.a)
+            ),
+            select([table_a.c.a]).select_from(
+                table_a.outerjoin(table_b, table_a.c.a == table_b.c.a)
+            ),
+            select([table_a.c.a]).where(exists().where(table_b.c.a == 5)),
+            union(select([table_a.c.a]), select([table_b.c.a])),
+            select([table_a.alias().c.a]),
+            select([table_a.c.a.label("x")]),
+            select([table_a.c.a.label("y")]),
+        ),
+        lambda: (
+            table_a.insert(),
+            table_a.insert().return_defaults(),
+            table_a.update(),
+            table_a.update().where(table_a.c.a == 5),
+            table_a.delete(),
+            table_a.delete().where(table_a.c.a == 5),
+        ),
+        lambda: (
+            text("select a from a"),
+            text("select b from a"),
+            text("select a from a where a=:x"),
+        ),
+    ]
+
+    def test_cache_key_equal(self):
+        for fixture in self._fixtures:
+            for a, b in zip(fixture(), fixture()):
+                key_a = a._generate_cache_key()
+                key_b = b._generate_cache_key()
+                is_not_(key_a, None)
+                eq_(key_a.key, key_b.key)
+                eq_(hash(key_a.key), hash(key_b.key))
+
+    def test_cache_key_unequal(self):
+        for fixture in self._fixtures:
+            keys = [elem._generate_cache_key().key for elem in fixture()]
+            for idx, key in enumerate(keys):
+                for other in keys[idx + 1 :]:
+                    ne_(key, other)
+
+    def test_bind_values_not_in_key(self):
+        s1 = select([table_a.c.a]).where(table_a.c.b == "x")
+        s2 = select([table_a.c.a]).where(table_a.c.b == "y")
+
+        k1, k2 = s1._generate_cache_key(), s2._generate_cache_key()
+        eq_(k1.key, k2.key)
+        eq_([b.value for b in k1.bindparams], ["x"])
+        eq_([b.value for b in k2.bindparams], ["y"])
+
+    def test_anon_names_normalized(self):
+        def stmt():
+            a1 = table_a.alias()
+            return select([a1.c.a, func.count(a1.c.b).label(None)]).where(
+                a1.c.a == 5
+            )
+
+        eq_(stmt()._generate_cache_key().key, stmt()._generate_cache_key().key)
+
+    def test_repeated_element(self):
+        a1 = table_a.alias()
+        a2 = table_a.alias()
+
+        # the same alias twice vs. two different aliases
+        s1 = select([a1.c.a, a1.c.b])
+        s2 = select([a1.c.a, a2.c.b])
+        ne_(s1._generate_cache_key().key, s2._generate_cache_key().key)
+
+    def test_table_version(self):
+        t = Table("t", MetaData(), Column("x", Integer))
+        k1 = select([t.c.x])._generate_cache_key().key
+
+        t.append_column(Column("y", Integer))
+        k2 = select([t.c.x])._generate_cache_key().key
+        ne_(k1, k2)
+
+    def test_uncacheable_values(self):
+        is_(table_a.insert().values(a=5)._generate_cache_key(), None)
+        is_(
+            table_a.update().values(b="x")._generate_cache_key(),
+            None,
+        )
+
+    def test_uncacheable_hints(self):
+        is_(
+            select([table_a.c.a])
+            .with_hint(table_a, "some hint")
+            ._generate_cache_key(),
+            None,
+        )
+
+    def test_uncacheable_subclass(self):
+        class MyThing(ColumnElement):
+            __visit_name__ = "null"
+
+        class MyCachedThing(Null):
+            inherit_cache = True
+
+        is_(MyThing._cache_key_traversal, None)
+        is_(select([MyThing()])._generate_cache_key(), None)
+
+        is_not_(select([MyCachedThing()])._generate_cache_key(), None)
+
+    def test_literal_column_keyed_on_text(self):
+        ne_(
+            select([literal_column("x")])._generate_cache_key().key,
+            select([literal_column("y")])._generate_cache_key().key,
+        )
@@ -36,6 +36,7 @@ from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_not_
+from sqlalchemy.testing import mock
 
 
 A = B = t1 = t2 = t3 = table1 = table2 = table3 = table4 = None
@@ -1691,6 +1692,105 @@ class ClauseAdapterTest(fixtures.TestBase, AssertsCompiledSQL):
         is_(l3._order_by_label_element, l3)
         eq_(l3._allow_label_resolve, False)
 
+    def test_unmodified_elements_shared(self):
+        t1alias = t1.alias("t1alias")
+        vis = sql_util.ClauseAdapter(t1alias)
+
+        modified = t1.c.col1 == bindparam("x")
+        unmodified = t2.c.col2 == t2.c.col3 + bindparam("y")
+        expr = and_(modified, unmodified)
+
+        adapted = vis.traverse(expr)
+        is_not_(adapted, expr)
+        is_not_(adapted.clauses[0], modified)
+        is_(adapted.clauses[0].left, t1alias.c.col1)
+        is_(adapted.clauses[0].right, modified.right)
+        is_(adapted.clauses[1], unmodified)
+
+        self.assert_compile(
+            adapted,
+            "t1alias.col1 = :x AND table2.col2 = table2.col3 + :y",
+        )
+        self.assert_compile(
+            expr, "table1.col1 = :x AND table2.col2 = table2.col3 + :y"
+        )
+
+    def test_unique_bindparam_copied(self):
+        vis = sql_util.ClauseAdapter(t1.alias("t1alias"))
+
+        unmodified = t2.c.col2 == 5
+        expr = and_(t2.c.col1 == t2.c.col3, unmodified)
+
+        adapted = vis.traverse(expr)
+        is_(adapted.clauses[0], expr.clauses[0])
+        is_not_(adapted.clauses[1], unmodified)
+        is_not_(adapted.clauses[1].right.key, unmodified.right.key)
+
+    def test_unmodified_root_copied(self):
+        vis = sql_util.ClauseAdapter(t1.alias("t1alias"))
+
+        expr = t2.c.col1 == t2.c.col2
+        adapted = vis.traverse(expr)
+        is_not_(adapted, expr)
+        is_(adapted.left, t2.c.col1)
+
+    def test_unmodified_select_copied(self):
+        vis = sql_util.ClauseAdapter(t1.alias("t1alias"))
+
+        unmodified = (
+            select([t2.c.col1]).where(t2.c.col2 == t2.c.col3).as_scalar()
+        )
+        expr = and_(t2.c.col1 == t2.c.col2, t2.c.col3 == unmodified)
+
+        adapted = vis.traverse(expr)
+        is_(adapted.clauses[0], expr.clauses[0])
+        is_not_(adapted.clauses[1], expr.clauses[1])
+        is_not_(adapted.clauses[1].right, unmodified)
+
+    def test_replacement_traverse_copies_by_default(self):
+        expr = and_(t2.c.col1 == t2.c.col3, t2.c.col2 == bindparam("x"))
+
+        copied = visitors.replacement_traverse(expr, {}, lambda elem: None)
+        is_not_(copied.clauses[0], expr.clauses[0])
+        is_not_(copied.clauses[1], expr.clauses[1])
+
+        shared = visitors.replacement_traverse(
+            expr, {"share_unmodified": True}, lambda elem: None
+        )
+        is_not_(shared, expr)
+        is_(shared.clauses[0], expr.clauses[0])
+        is_(shared.clauses[1], expr.clauses[1])
+
+    def test_anonymized_label_copied(self):
+        vis = sql_util.ClauseAdapter(
+            t1.alias("t1alias"), anonymize_labels=True
+        )
+
+        label = t2.c.col1.label("foo")
+        adapted = vis.traverse(and_(t2.c.col2 == 5, label))
+        is_not_(adapted.clauses[1], label)
+        is_not_(adapted.clauses[1].name, "foo")
+
+    def test_replacements_memoized(self):
+        t1alias = t1.alias("t1alias")
+        vis = sql_util.ClauseAdapter(t1alias)
+
+        expr = and_(t1.c.col1 == 5, t1.c.col2 == t2.c.col2)
+
+        with mock.patch.object(
+            vis, "_corresponding_column", wraps=vis._corresponding_column
+        ) as corresponding:
+            first = vis.traverse(expr)
+            count = corresponding.call_count
+            second = vis.traverse(expr)
+            eq_(corresponding.call_count, count)
+
+        for adapted in (first, second):
+            self.assert_compile(
+                adapted,
+                "t1alias.col1 = :col1_1 AND t1alias.col2 = table2.col2",
+            )
+
 
 class SpliceJoinsTest(fixtures.TestBase, AssertsCompiledSQL):
     __dialect__ = "default"
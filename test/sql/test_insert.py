@@ -25,6 +25,7 @@ from sqlalchemy.testing import AssertsCompiledSQL
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
 
 
 class _InsertTestBase(object):
@@ -1444,3 +1445,96 @@ class MultirowTest(_InsertTestBase, fixtures.TablesTest, AssertsCompiledSQL):
             "SQL expression is required",
             table.insert().values(values).compile,
         )
+
+
+class InsertManyValuesTest(_InsertTestBase, fixtures.TablesTest):
+    def _imv(self, stmt, dialect, **kw):
+        return stmt.compile(dialect=dialect, **kw)._insertmanyvalues
+
+    def test_named(self):
+        table1 = self.tables.mytable
+
+        imv = self._imv(table1.insert(), postgresql.dialect())
+        eq_(
+            imv.statement_prefix + imv.single_values_expr,
+            "INSERT INTO mytable (myid, name, description) VALUES "
+            "(%(myid)s, %(name)s, %(description)s)",
+        )
+        eq_(imv.statement_suffix, "")
+        eq_(imv.bind_names, ("myid", "name", "description"))
+        eq_(
+            "__5".join(imv.values_template_parts),
+            "(%(myid__5)s, %(name__5)s, %(description__5)s)",
+        )
+
+    def test_positional(self):
+        table1 = self.tables.mytable
+
+        imv = self._imv(table1.insert(), sqlite.dialect())
+        eq_(imv.single_values_expr, "(?, ?, ?)")
+        eq_(imv.bind_names, ("myid", "name", "description"))
+        is_(imv.values_template_parts, None)
+
+    def test_returning_suffix(self):
+        table1 = self.tables.myothertable
+
+        imv = self._imv(
+            table1.insert().returning(table1.c.otherid), postgresql.dialect()
+        )
+        eq_(imv.single_values_expr, "(%(otherid)s, %(othername)s)")
+        eq_(imv.statement_suffix, " RETURNING myothertable.otherid")
+
+    def test_name_is_prefix_of_other_name(self):
+        t = table("t", column("x"), column("x_1"))
+
+        imv = self._imv(t.insert(), default.DefaultDialect())
+        eq_(
+            "__0".join(imv.values_template_parts),
+            "(:x__0, :x_1__0)",
+        )
+
+    def test_bind_outside_of_values(self):
+        table1 = self.tables.mytable
+
+        stmt = (
+            table1.insert()
+            .values(name=bindparam("n"))
+            .returning(func.lower(bindparam("q")))
+        )
+        is_(self._imv(stmt, postgresql.dialect()), None)
+
+    def test_not_for_insert_from_select(self):
+        table1 = self.tables.mytable
+
+        stmt = table1.insert().from_select(
+            ["myid"], select([table1.c.myid])
+        )
+        is_(self._imv(stmt, postgresql.dialect()), None)
+
+    def test_not_for_multi_values(self):
+        table1 = self.tables.mytable
+
+        stmt = table1.insert().values([{"myid": 1}, {"myid": 2}])
+        is_(self._imv(stmt, postgresql.dialect()), None)
+
+    def test_not_for_on_duplicate_key(self):
+        table1 = self.tables.mytable
+
+        stmt = (
+            mysql.insert(table1)
+            .values(myid=1, name="n")
+            .on_duplicate_key_update(name="n2")
+        )
+        is_(self._imv(stmt, mysql.dialect()), None)
+
+    def test_not_for_numeric_paramstyle(self):
+        table1 = self.tables.mytable
+
+        dialect = default.DefaultDialect(paramstyle="numeric")
+        is_(self._imv(table1.insert(), dialect), None)
+
+    def test_not_for_nested_insert(self):
+        table1 = self.tables.mytable
+
+        stmt = table1.insert().values(myid=1).returning(table1.c.myid).cte()
+        is_(self._imv(select([stmt.c.myid]), postgresql.dialect()), None)
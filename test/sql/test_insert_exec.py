@@ -1,20 +1,28 @@
+import contextlib
+
 from sqlalchemy import and_
+from sqlalchemy import create_engine
+from sqlalchemy import event
 from sqlalchemy import exc
 from sqlalchemy import ForeignKey
 from sqlalchemy import func
 from sqlalchemy import INT
 from sqlalchemy import Integer
 from sqlalchemy import MetaData
+from sqlalchemy import select
 from sqlalchemy import Sequence
 from sqlalchemy import sql
 from sqlalchemy import String
 from sqlalchemy import testing
+from sqlalchemy import util
 from sqlalchemy import VARCHAR
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import engines
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import mock
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
 
@@ -505,3 +513,196 @@ class TableInsertTest(fixtures.TablesTest):
             (1, "data", 5),
             inserted_primary_key=[],
         )
+
+
+class InsertManyValuesTest(fixtures.TablesTest):
+    __requires__ = ("insertmanyvalues",)
+    __backend__ = True
+
+    run_deletes = "each"
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "data",
+            metadata,
+            Column(
+                "id", Integer, primary_key=True, test_needs_autoincrement=True
+            ),
+            Column("x", String(50)),
+            Column("y", Integer, default=5),
+        )
+
+    @contextlib.contextmanager
+    def _conn_fixture(self, **dialect_attrs):
+        canary = []
+
+        with testing.db.connect() as conn:
+
+            @event.listens_for(conn, "before_cursor_execute")
+            def before_cursor_execute(
+                conn, cursor, statement, parameters, context, executemany
+            ):
+                canary.append((statement, parameters, executemany))
+
+            with mock.patch.multiple(conn.dialect, **dialect_attrs):
+                yield conn, canary
+
+    def _rows(self, count):
+        return [{"x": "d%d" % i} for i in range(count)]
+
+    def _assert_data(self, conn, count):
+        data = self.tables.data
+        eq_(
+            conn.execute(
+                select([data.c.x, data.c.y]).order_by(data.c.id)
+            ).fetchall(),
+            [("d%d" % i, 5) for i in range(count)],
+        )
+
+    def test_batches(self):
+        data = self.tables.data
+
+        with self._conn_fixture(insertmanyvalues_page_size=3) as (
+            conn,
+            canary,
+        ):
+            result = conn.execute(data.insert(), self._rows(7))
+
+        eq_([executemany for _, _, executemany in canary], [False] * 3)
+        eq_([len(parameters) for _, parameters, _ in canary], [6, 6, 2])
+        eq_(result.rowcount, 7)
+        self._assert_data(testing.db, 7)
+
+    def test_batch_size_limited_by_max_parameters(self):
+        data = self.tables.data
+
+        with self._conn_fixture(insertmanyvalues_max_parameters=5) as (
+            conn,
+            canary,
+        ):
+            conn.execute(data.insert(), self._rows(5))
+
+        # two parameters per row; two rows per batch
+        eq_([len(parameters) for _, parameters, _ in canary], [4, 4, 2])
+        self._assert_data(testing.db, 5)
+
+    def test_single_row_not_batched(self):
+        data = self.tables.data
+
+        with self._conn_fixture(insertmanyvalues_page_size=3) as (
+            conn,
+            canary,
+        ):
+            conn.execute(data.insert(), self._rows(1))
+
+        eq_(
+            [statement for statement, _, _ in canary],
+            [
+                util.text_type(
+                    data.insert().compile(testing.db, column_keys=["x"])
+                )
+            ],
+        )
+        self._assert_data(testing.db, 1)
+
+    def test_disabled(self):
+        data = self.tables.data
+
+        with self._conn_fixture(use_insertmanyvalues=False) as (
+            conn,
+            canary,
+        ):
+            conn.execute(data.insert(), self._rows(7))
+
+        eq_([executemany for _, _, executemany in canary], [True])
+        self._assert_data(testing.db, 7)
+
+    def test_page_size_argument(self):
+        assert_raises_message(
+            exc.ArgumentError,
+            "insertmanyvalues_page_size must be a positive integer",
+            engines.testing_engine,
+            options={"insertmanyvalues_page_size": 0},
+        )
+
+    @testing.requires.insert_executemany_returning
+    def test_return_defaults_rows(self):
+        data = self.tables.data
+
+        with self._conn_fixture(insertmanyvalues_page_size=2) as (
+            conn,
+            canary,
+        ):
+            result = conn.execute(
+                data.insert().return_defaults(data.c.y), self._rows(5)
+            )
+
+        eq_(len(canary), 3)
+        ids = testing.db.execute(
+            select([data.c.id]).order_by(data.c.id)
+        ).fetchall()
+        rows = result.context._returned_defaults_rows
+        eq_(sorted(row[data.c.id] for row in rows), [id_ for id_, in ids])
+        eq_([row[data.c.y] for row in rows], [5] * 5)
+
+    @testing.requires.insert_executemany_returning
+    def test_explicit_returning(self):
+        data = self.tables.data
+
+        with self._conn_fixture(insertmanyvalues_page_size=2) as (
+            conn,
+            canary,
+        ):
+            result = conn.execute(
+                data.insert().returning(data.c.x, data.c.y), self._rows(5)
+            )
+            rows = result.fetchall()
+
+        eq_(len(canary), 3)
+        eq_(rows, [("d%d" % i, 5) for i in range(5)])
+
+
+class InsertManyValuesFallbackTest(fixtures.TestBase):
+    def _engine_fixture(self):
+        dbapi = mock.Mock(paramstyle="pyformat", __version__="2.8.4")
+        dbapi.connect.return_value.cursor.return_value.description = None
+        return (
+            dbapi,
+            create_engine(
+                "postgresql+psycopg2://",
+                module=dbapi,
+                _initialize=False,
+                implicit_returning=True,
+                use_insertmanyvalues=True,
+            ),
+        )
+
+    def test_return_defaults_not_renderable_as_batch(self):
+        """an INSERT with return_defaults() that can't be rendered as
+        "insertmanyvalues" is sent to executemany() without RETURNING."""
+
+        t = Table(
+            "t",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("x", String(50)),
+            Column("y", Integer, server_default="5"),
+        )
+        dbapi, eng = self._engine_fixture()
+        assert eng.dialect.insert_executemany_returning
+
+        stmt = postgresql.insert(t).on_conflict_do_nothing().return_defaults()
+        with eng.connect() as conn:
+            conn.execute(stmt, [{"x": "d1"}, {"x": "d2"}])
+
+        eq_(
+            dbapi.connect.return_value.cursor.return_value.mock_calls,
+            [
+                mock.call.executemany(
+                    "INSERT INTO t (x) VALUES (%(x)s) ON CONFLICT DO NOTHING",
+                    ({"x": "d1"}, {"x": "d2"}),
+                ),
+                mock.call.close(),
+            ],
+        )
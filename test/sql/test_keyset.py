@@ -0,0 +1,271 @@
+import datetime
+import decimal
+import uuid
+
+from sqlalchemy import Column
+from sqlalchemy import exc
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import testing
+from sqlalchemy.sql import keyset
+from sqlalchemy.testing import assert_raises_message
+from sqlalchemy.testing import AssertsCompiledSQL
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import fixtures
+
+
+class _KeysetFixture(object):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "items",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(20), nullable=False),
+            Column("score", Integer),
+        )
+
+
+class KeysetCompileTest(
+    _KeysetFixture, fixtures.TablesTest, AssertsCompiledSQL
+):
+    __dialect__ = "default"
+
+    run_setup_bind = None
+
+    run_create_tables = None
+
+    def _token(self, stmt, values):
+        return stmt._keyset_ordering().token(values)
+
+    def test_first_page_adds_primary_key(self):
+        items = self.tables.items
+        stmt = select([items.c.id]).order_by(items.c.name)
+        self.assert_compile(
+            stmt.seek(),
+            "SELECT items.id FROM items ORDER BY items.name, items.id",
+        )
+
+    def test_primary_key_present(self):
+        items = self.tables.items
+        stmt = select([items.c.id]).order_by(items.c.id.desc())
+        self.assert_compile(
+            stmt.seek(self._token(stmt, [5])),
+            "SELECT items.id FROM items WHERE items.id <= :id_1 "
+            "AND items.id < :id_2 ORDER BY items.id DESC",
+            checkparams={"id_1": 5, "id_2": 5},
+        )
+
+    def test_mixed_directions(self):
+        items = self.tables.items
+        stmt = select([items.c.id]).order_by(items.c.name.desc())
+        self.assert_compile(
+            stmt.seek(self._token(stmt, ["n1", 5])),
+            "SELECT items.id FROM items WHERE items.name <= :name_1 "
+            "AND (items.name < :name_2 OR items.name = :name_3 "
+            "AND items.id > :id_1) ORDER BY items.name DESC, items.id",
+            checkparams={
+                "name_1": "n1",
+                "name_2": "n1",
+                "name_3": "n1",
+                "id_1": 5,
+            },
+        )
+
+    def test_nullslast(self):
+        items = self.tables.items
+        stmt = select([items.c.id]).order_by(items.c.score.nullslast())
+        self.assert_compile(
+            stmt.seek(self._token(stmt, [3, 5])),
+            "SELECT items.id FROM items WHERE items.score > :score_1 "
+            "OR items.score IS NULL OR items.score = :score_2 "
+            "AND items.id > :id_1 ORDER BY items.score NULLS LAST, items.id",
+            checkparams={"score_1": 3, "score_2": 3, "id_1": 5},
+        )
+
+    def test_nullslast_null_value(self):
+        items = self.tables.items
+        stmt = select([items.c.id]).order_by(items.c.score.nullslast())
+        self.assert_compile(
+            stmt.seek(self._token(stmt, [None, 5])),
+            "SELECT items.id FROM items WHERE items.score IS NULL "
+            "AND items.id > :id_1 ORDER BY items.score NULLS LAST, items.id",
+            checkparams={"id_1": 5},
+        )
+
+    def test_nullsfirst_null_value(self):
+        items = self.tables.items
+        stmt = select([items.c.id]).order_by(
+            items.c.score.desc().nullsfirst()
+        )
+        self.assert_compile(
+            stmt.seek(self._token(stmt, [None, 5])),
+            "SELECT items.id FROM items WHERE items.score IS NOT NULL "
+            "OR items.score IS NULL AND items.id > :id_1 "
+            "ORDER BY items.score DESC NULLS FIRST, items.id",
+            checkparams={"id_1": 5},
+        )
+
+    def test_nullable_requires_nulls_ordering(self):
+        items = self.tables.items
+        stmt = select([items.c.id]).order_by(items.c.score)
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "ORDER BY expression items.score may be NULL",
+            stmt.seek,
+        )
+
+    def test_label_name_not_supported(self):
+        items = self.tables.items
+        stmt = select([items.c.name.label("n")]).order_by("n")
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "Can't use ORDER BY label name 'n' for keyset pagination",
+            stmt.seek,
+        )
+
+    def test_no_unique_key(self):
+        items = self.tables.items
+        other = Table(
+            "other", MetaData(), Column("id", Integer, primary_key=True)
+        )
+        stmt = select([items.c.id, other.c.id]).order_by(items.c.name)
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "Can't determine a unique key",
+            stmt.seek,
+        )
+
+    def test_invalid_token(self):
+        items = self.tables.items
+        stmt = select([items.c.id]).order_by(items.c.name)
+        assert_raises_message(
+            exc.ArgumentError,
+            "Invalid keyset pagination token",
+            stmt.seek,
+            "not a token",
+        )
+
+    def test_token_from_other_ordering(self):
+        items = self.tables.items
+        stmt = select([items.c.id]).order_by(items.c.name)
+        token = self._token(stmt, ["n1", 5])
+        assert_raises_message(
+            exc.ArgumentError,
+            "Keyset pagination token does not correspond to the ORDER BY",
+            select([items.c.id]).order_by(items.c.name.desc()).seek,
+            token,
+        )
+
+    def test_token_values_roundtrip(self):
+        values = [
+            None,
+            True,
+            5,
+            1.5,
+            u"some name",
+            b"\x00\xff",
+            decimal.Decimal("10.25"),
+            uuid.UUID("12345678123456781234567812345678"),
+            datetime.date(2019, 11, 5),
+            datetime.time(10, 15, 30, 500),
+            datetime.timedelta(days=2, seconds=10),
+            datetime.datetime(2019, 11, 5, 10, 15, 30, 500),
+            datetime.datetime(
+                2019, 11, 5, 10, 15, tzinfo=keyset._FixedOffset(-300)
+            ),
+        ]
+        items = self.tables.items
+        ordering = keyset.KeysetOrdering(
+            [items.c.id] * len(values), [[items.c.id]]
+        )
+        eq_(ordering.values(ordering.token(values)), values)
+
+    def test_token_unsupported_value(self):
+        items = self.tables.items
+        stmt = select([items.c.id]).order_by(items.c.name)
+        assert_raises_message(
+            exc.ArgumentError,
+            "Can't encode value of type object in a keyset pagination token",
+            self._token,
+            stmt,
+            [object(), 5],
+        )
+
+
+class KeysetRoundTripTest(_KeysetFixture, fixtures.TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def insert_data(cls):
+        scores = [None, 1, 2, 2, 3]
+        testing.db.execute(
+            cls.tables.items.insert(),
+            [
+                {
+                    "id": i,
+                    "name": "n%d" % (i % 4),
+                    "score": scores[i % len(scores)],
+                }
+                for i in range(1, 31)
+            ],
+        )
+
+    def _assert_pages(self, stmt, page_size=4):
+        with testing.db.connect() as conn:
+            expected = conn.execute(stmt.seek()).fetchall()
+            result = []
+            token = None
+            while True:
+                rows = conn.execute(
+                    stmt.seek(token).limit(page_size)
+                ).fetchall()
+                if not rows:
+                    break
+                result.extend(rows)
+                token = stmt.seek_token(rows[-1])
+        eq_(len(expected), 30)
+        eq_(result, expected)
+
+    def test_ascending(self):
+        items = self.tables.items
+        self._assert_pages(select([items]).order_by(items.c.name))
+
+    def test_mixed_directions(self):
+        items = self.tables.items
+        self._assert_pages(
+            select([items]).order_by(items.c.name.desc(), items.c.id)
+        )
+
+    @testing.requires.nullsordering
+    def test_nulls_last(self):
+        items = self.tables.items
+        self._assert_pages(
+            select([items]).order_by(
+                items.c.name.desc(), items.c.score.nullslast()
+            )
+        )
+
+    @testing.requires.nullsordering
+    def test_nulls_first(self):
+        items = self.tables.items
+        self._assert_pages(
+            select([items]).order_by(
+                items.c.score.desc().nullsfirst(), items.c.name
+            )
+        )
+
+    def test_seek_token_requires_columns(self):
+        items = self.tables.items
+        stmt = select([items.c.name]).order_by(items.c.name)
+        with testing.db.connect() as conn:
+            row = conn.execute(stmt.seek().limit(1)).first()
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "ORDER BY expression items.id is not present in the row",
+            stmt.seek_token,
+            row,
+        )
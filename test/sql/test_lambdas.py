@@ -0,0 +1,343 @@
+from sqlalchemy import and_
+from sqlalchemy import exc
+from sqlalchemy import Integer
+from sqlalchemy import lambda_stmt
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import table
+from sqlalchemy import testing
+from sqlalchemy.sql import column
+from sqlalchemy.sql import lambdas
+from sqlalchemy.testing import assert_raises_message
+from sqlalchemy.testing import AssertsCompiledSQL
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing.mock import Mock
+from sqlalchemy.testing.schema import Column
+from sqlalchemy.testing.schema import Table
+
+
+t1 = table("t1", column("q"), column("p"))
+
+
+class LambdaElementTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = "default"
+
+    def _canary(self):
+        return Mock(side_effect=lambda stmt: stmt)
+
+    def test_select_whereclause(self):
+        def go(x, y):
+            return lambda_stmt(
+                lambda: select([t1]).where(and_(t1.c.q == x, t1.c.p == y))
+            )
+
+        self.assert_compile(
+            go(5, 10),
+            "SELECT t1.q, t1.p FROM t1 WHERE t1.q = :x_1 AND t1.p = :y_1",
+            checkparams={"x_1": 5, "y_1": 10},
+        )
+        self.assert_compile(
+            go(12, 18),
+            "SELECT t1.q, t1.p FROM t1 WHERE t1.q = :x_1 AND t1.p = :y_1",
+            checkparams={"x_1": 12, "y_1": 18},
+        )
+
+    def test_lambda_invoked_once(self):
+        canary = self._canary()
+
+        def go(x):
+            return lambda_stmt(
+                lambda: canary(select([t1]).where(t1.c.q == x))
+            )
+
+        s1, s2, s3 = go(5), go(7), go(5)
+        k1, k2, k3 = [s._generate_cache_key() for s in (s1, s2, s3)]
+        eq_(len(canary.mock_calls), 1)
+
+        eq_(k1.key, k2.key)
+        eq_([bp.value for bp in k2.bindparams], [7])
+        is_(k3, k1)
+
+        self.assert_compile(
+            s2,
+            "SELECT t1.q, t1.p FROM t1 WHERE t1.q = :x_1",
+            checkparams={"x_1": 7},
+        )
+
+    def test_add_criteria(self):
+        canary = self._canary()
+
+        def go(x, y=None):
+            stmt = lambda_stmt(lambda: canary(select([t1.c.q])))
+            stmt = stmt.add_criteria(lambda s: s.where(t1.c.q == x))
+            if y is not None:
+                stmt += lambda s: s.where(t1.c.p > y)
+            return stmt
+
+        for x, y in [(1, None), (2, 5), (3, None), (4, 6)]:
+            if y is None:
+                self.assert_compile(
+                    go(x, y),
+                    "SELECT t1.q FROM t1 WHERE t1.q = :x_1",
+                    checkparams={"x_1": x},
+                )
+            else:
+                self.assert_compile(
+                    go(x, y),
+                    "SELECT t1.q FROM t1 "
+                    "WHERE t1.q = :x_1 AND t1.p > :y_1",
+                    checkparams={"x_1": x, "y_1": y},
+                )
+
+        # the lambdas are invoked once for each combination
+        eq_(len(canary.mock_calls), 2)
+
+    def test_non_literal_values_are_keyed(self):
+        canary = self._canary()
+        t2 = table("t2", column("q"))
+
+        def go(tab, descending):
+            return lambda_stmt(
+                lambda: canary(
+                    select([tab.c.q]).order_by(
+                        tab.c.q.desc() if descending else tab.c.q
+                    )
+                )
+            )
+
+        for tab, descending, expected in [
+            (t1, True, "SELECT t1.q FROM t1 ORDER BY t1.q DESC"),
+            (t1, False, "SELECT t1.q FROM t1 ORDER BY t1.q"),
+            (t2, True, "SELECT t2.q FROM t2 ORDER BY t2.q DESC"),
+            (t1, True, "SELECT t1.q FROM t1 ORDER BY t1.q DESC"),
+        ]:
+            self.assert_compile(go(tab, descending), expected)
+        eq_(len(canary.mock_calls), 3)
+
+    def test_object_attribute_raises(self):
+        class Holder(object):
+            pass
+
+        h = Holder()
+        h.id = 5
+
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "Closure variable named 'h' inside of lambda callable .* does "
+            "not refer to a SQL element",
+            lambda_stmt(
+                lambda: select([t1.c.q]).where(t1.c.q == h.id)
+            ).compile,
+        )
+
+        def go(x):
+            return lambda_stmt(lambda: select([t1.c.q]).where(t1.c.q == x))
+
+        for value in (5, 6):
+            h.id = value
+            id_ = h.id
+            self.assert_compile(
+                go(id_),
+                "SELECT t1.q FROM t1 WHERE t1.q = :x_1",
+                checkparams={"x_1": value},
+            )
+
+    def test_self_raises(self):
+        class Repo(object):
+            def __init__(self, uid):
+                self.uid = uid
+
+            def get(self):
+                return lambda_stmt(
+                    lambda: select([t1.c.q]).where(t1.c.q == self.uid)
+                )
+
+        repo = Repo(5)
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "Closure variable named 'self' inside of lambda callable",
+            repo.get().compile,
+        )
+        assert not any(
+            repo in key for key in list(lambdas._closure_per_cache_key)
+        )
+
+    def test_default_argument_raises(self):
+        obj = object()
+
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "Default argument named 'o' inside of lambda callable",
+            lambda_stmt(lambda o=obj: select([t1.c.q])).compile,
+        )
+
+    def test_unhashable_value_not_cached(self):
+        canary = self._canary()
+
+        def go(values):
+            return lambda_stmt(
+                lambda: canary(select([t1]).where(t1.c.q.in_(values)))
+            )
+
+        self.assert_compile(
+            go([1, 2]),
+            "SELECT t1.q, t1.p FROM t1 WHERE t1.q IN (:q_1, :q_2)",
+            checkparams={"q_1": 1, "q_2": 2},
+        )
+        self.assert_compile(
+            go([3]),
+            "SELECT t1.q, t1.p FROM t1 WHERE t1.q IN (:q_1)",
+            checkparams={"q_1": 3},
+        )
+        eq_(len(canary.mock_calls), 2)
+
+    def test_value_used_in_python_not_cached(self):
+        canary = self._canary()
+
+        def go(x):
+            return lambda_stmt(
+                lambda: canary(select([t1]).where(t1.c.q == "%s%%" % x))
+            )
+
+        self.assert_compile(
+            go("a"),
+            "SELECT t1.q, t1.p FROM t1 WHERE t1.q = :q_1",
+            checkparams={"q_1": "a%"},
+        )
+        self.assert_compile(
+            go("b"),
+            "SELECT t1.q, t1.p FROM t1 WHERE t1.q = :q_1",
+            checkparams={"q_1": "b%"},
+        )
+
+        # invoked once with tracked values, then with the actual
+        # values for each statement
+        eq_(len(canary.mock_calls), 3)
+        is_(go("c")._entry, lambdas._UNCACHEABLE)
+
+    def test_bound_values_take_column_type(self):
+        t2 = table("t2", column("q", Integer), column("p", String))
+
+        def go(x, y):
+            return lambda_stmt(
+                lambda: select([t2]).where(t2.c.q == x).where(t2.c.p == y)
+            )
+
+        stmt = go(5, "five")
+        eq_(
+            [
+                bp.type._type_affinity
+                for bp in stmt._generate_cache_key().bindparams
+            ],
+            [Integer, String],
+        )
+
+    def test_execution_options_and_attributes(self):
+        stmt = lambda_stmt(lambda: t1.insert())
+        eq_(stmt.get_execution_options(), {"autocommit": True})
+        is_(stmt.table, t1)
+
+        stmt = stmt.execution_options(foo="bar")
+        eq_(
+            stmt.get_execution_options(), {"autocommit": True, "foo": "bar"}
+        )
+
+    def test_lambda_must_return_statement(self):
+        assert_raises_message(
+            exc.ArgumentError,
+            "Lambda passed to lambda_stmt\\(\\) or add_criteria\\(\\) must "
+            "return an executable SQL statement; got 5",
+            lambda: lambda_stmt(lambda: 5).compile(),
+        )
+
+    def test_not_callable(self):
+        assert_raises_message(
+            exc.ArgumentError,
+            "lambda_stmt\\(\\) and add_criteria\\(\\) accept a callable",
+            lambda_stmt,
+            select([t1]),
+        )
+
+
+class LambdaExecutionTest(fixtures.TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "users",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(30)),
+        )
+
+    @classmethod
+    def insert_data(cls):
+        users = cls.tables.users
+        with testing.db.connect() as conn:
+            conn.execute(
+                users.insert(),
+                [
+                    {"id": 1, "name": "jack"},
+                    {"id": 2, "name": "ed"},
+                    {"id": 3, "name": "wendy"},
+                ],
+            )
+
+    def test_select(self):
+        users = self.tables.users
+
+        def go(conn, name):
+            stmt = lambda_stmt(
+                lambda: select([users.c.id]).where(users.c.name == name)
+            )
+            return conn.execute(stmt).scalar()
+
+        with testing.db.connect() as conn:
+            eq_(go(conn, "jack"), 1)
+            eq_(go(conn, "ed"), 2)
+            eq_(go(conn, "wendy"), 3)
+
+    def test_compiled_for_new_values(self):
+        """A statement cached by a lambda is compiled for the first time
+        with values other than those it was built with."""
+
+        users = self.tables.users
+
+        def go(id_):
+            return lambda_stmt(
+                lambda: select([users.c.name]).where(users.c.id == id_)
+            )
+
+        go(3)
+
+        with testing.db.connect() as conn:
+            uncached = conn.execution_options(compiled_cache=None)
+            eq_(uncached.execute(go(1)).scalar(), "jack")
+            eq_(uncached.execute(go(2)).scalar(), "ed")
+
+            eq_(conn.execute(go(2)).scalar(), "ed")
+            eq_(conn.execute(go(1)).scalar(), "jack")
+
+    def test_update(self):
+        users = self.tables.users
+
+        def go(conn, id_, name):
+            stmt = lambda_stmt(
+                lambda: users.update()
+                .where(users.c.id == id_)
+                .values(name=name)
+            )
+            return conn.execute(stmt)
+
+        with testing.db.connect() as conn:
+            eq_(go(conn, 1, "jack2").rowcount, 1)
+            eq_(go(conn, 2, "ed2").rowcount, 1)
+            eq_(
+                conn.execute(
+                    select([users.c.name]).order_by(users.c.id)
+                ).fetchall(),
+                [("jack2",), ("ed2",), ("wendy",)],
+            )
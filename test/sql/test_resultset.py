@@ -1,3 +1,4 @@
+import array
 from contextlib import contextmanager
 import operator
 
@@ -33,6 +34,7 @@ from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import in_
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import le_
+from sqlalchemy.testing import mock
 from sqlalchemy.testing import ne_
 from sqlalchemy.testing import not_in_
 from sqlalchemy.testing.mock import Mock
@@ -1120,6 +1122,79 @@ class ResultProxyTest(fixtures.TablesTest):
         )
         assert isinstance(row, collections_abc.Sequence)
 
+    def test_rowproxy_make_rows(self):
+        from sqlalchemy.engine import RowProxy
+
+        parent = object()
+        keymap = {
+            "a": (str.upper, None, 0),
+            0: (str.upper, None, 0),
+            "b": (None, None, 1),
+            1: (None, None, 1),
+        }
+        rows = RowProxy._make_rows(
+            parent, [("x", 1), ("y", 2)], [str.upper, None], keymap
+        )
+        eq_([type(row) for row in rows], [RowProxy, RowProxy])
+        eq_(rows, [("X", 1), ("Y", 2)])
+        eq_([(row["a"], row["b"]) for row in rows], [("X", 1), ("Y", 2)])
+        is_(rows[0]._parent, parent)
+
+        class MyRow(RowProxy):
+            def __init__(self, parent, row, processors, keymap):
+                super(MyRow, self).__init__(
+                    parent, tuple(reversed(row)), processors, keymap
+                )
+
+        rows = MyRow._make_rows(parent, [(1, "x")], [str.upper, None], keymap)
+        eq_([type(row) for row in rows], [MyRow])
+        eq_(rows, [("X", 1)])
+
+    def test_rowproxy_processes_value_once(self):
+        """test the C and pure Python rows both retain processed values,
+        so that repeated access returns the same object."""
+
+        from sqlalchemy.engine import RowProxy
+
+        processor = Mock(side_effect=lambda value: {"value": value})
+        keymap = {
+            "a": (processor, None, 0),
+            0: (processor, None, 0),
+            -1: (processor, None, 0),
+        }
+        parent = Mock(_processors=[processor], _keymap=keymap)
+        row = RowProxy._make_rows(parent, [(5,)], [processor], keymap)[0]
+
+        eq_(processor.mock_calls, [])
+        eq_(row["a"], {"value": 5})
+        is_(row[0], row["a"])
+        is_(row[-1], row["a"])
+        is_(row.a, row["a"])
+        eq_(processor.mock_calls, [mock.call(5)])
+
+        # iteration and slices process the values again
+        eq_(list(row), [{"value": 5}])
+        eq_(row[0:1], ({"value": 5},))
+        eq_(processor.mock_calls, [mock.call(5)] * 3)
+
+        # a new underlying row discards the processed values
+        row.__setstate__({"_parent": parent, "_row": (7,)})
+        eq_(row["a"], {"value": 7})
+        eq_(processor.mock_calls, [mock.call(5)] * 3 + [mock.call(7)])
+
+    def test_columns_from_rows(self):
+        processor = Mock(side_effect=lambda value: value * 2)
+
+        eq_(
+            _result._columns_from_rows(
+                [(1, "a"), (2, "b"), (3, "c")], [processor, None]
+            ),
+            [[2, 4, 6], ["a", "b", "c"]],
+        )
+        eq_(processor.mock_calls, [mock.call(1), mock.call(2), mock.call(3)])
+
+        eq_(_result._columns_from_rows([], [processor, None]), [[], []])
+
     @testing.provide_metadata
     def test_rowproxy_getitem_indexes_compiled(self):
         values = Table(
@@ -1747,6 +1822,72 @@ class AlternateResultProxyTest(fixtures.TablesTest):
     def test_basic_buffered_column_result_proxy(self):
         self._test_proxy(_result.BufferedColumnResultProxy)
 
+    def test_columnar_plain(self):
+        self._test_columnar(_result.ResultProxy)
+
+    def test_columnar_buffered_row(self):
+        self._test_columnar(_result.BufferedRowResultProxy)
+
+    def test_columnar_fully_buffered(self):
+        self._test_columnar(_result.FullyBufferedResultProxy)
+
+    def test_columnar_buffered_column(self):
+        self._test_columnar(_result.BufferedColumnResultProxy)
+
+    def _test_columnar(self, cls):
+        class MyType(TypeDecorator):
+            impl = String()
+
+            def process_result_value(self, value, dialect):
+                return "HI " + value
+
+        table = self.tables.test
+        stmt = select(
+            [table.c.x, type_coerce(table.c.y, MyType())]
+        ).order_by(table.c.x)
+
+        with self._proxy_fixture(cls):
+            r = self.engine.execute(stmt)
+            eq_(
+                r.fetch_columnar(3),
+                [[1, 2, 3], ["HI t_1", "HI t_2", "HI t_3"]],
+            )
+            eq_(r.fetchone(), (4, "HI t_4"))
+            eq_(
+                r.fetch_columnar(),
+                [list(range(5, 12)), ["HI t_%d" % i for i in range(5, 12)]],
+            )
+
+            eq_(r.fetch_columnar(), [[], []])
+            eq_(r.fetch_columnar(2), [[], []])
+            r.close()
+
+            assert_raises_message(
+                sa_exc.ResourceClosedError,
+                "object is closed",
+                r.fetch_columnar,
+            )
+
+    def test_columns_as_arrays(self):
+        table = self.tables.test
+        r = self.engine.execute(select([table]).order_by(table.c.x))
+
+        x, y = r.columns_as_arrays(["q", None], 5)
+        eq_(x, array.array("q", range(1, 6)))
+        eq_(y, ["t_%d" % i for i in range(1, 6)])
+
+        assert_raises_message(
+            sa_exc.ArgumentError,
+            "Got 1 typecodes for a result with 2 columns",
+            r.columns_as_arrays,
+            ["q"],
+        )
+
+        # rows aren't consumed by a mismatched call
+        x, y = r.columns_as_arrays(["q", None])
+        eq_(x, array.array("q", range(6, 12)))
+        r.close()
+
     def test_resultprocessor_plain(self):
         self._test_result_processor(_result.ResultProxy, False)
 